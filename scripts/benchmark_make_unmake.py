@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark copy-make versus make/unmake tree walks for the board game engines.
+
+Counts every node of the game tree to a fixed depth (a "perft" walk) twice per
+engine: once copying the board for every child, the way the AIs used to search,
+and once in place with ``push_move``/``pop_move``. Both walks visit the same
+nodes, so the nodes-per-second ratio is the saving from not copying.
+
+Usage:
+    python scripts/benchmark_make_unmake.py
+    python scripts/benchmark_make_unmake.py --games checkers othello --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from games_collection.core.architecture.events import EventBus
+from games_collection.core.game_engine import GameEngine
+from games_collection.games.paper.checkers import CheckersGame
+from games_collection.games.paper.connect_four import ConnectFourGame
+from games_collection.games.paper.mancala import MancalaGame
+from games_collection.games.paper.othello import OthelloGame
+from games_collection.games.paper.pentago import PentagoGame
+
+# Engine factory and perft depth for each game.
+GAMES: Dict[str, Tuple[Callable[[], GameEngine], int]] = {
+    "checkers": (CheckersGame, 5),
+    "connect_four": (lambda: ConnectFourGame(event_bus=EventBus()), 5),
+    "mancala": (MancalaGame, 6),
+    "othello": (OthelloGame, 6),
+    "pentago": (PentagoGame, 2),
+}
+
+
+def _copy_game(game: GameEngine) -> GameEngine:
+    """Return a copy of ``game`` with its own board, as copy-make search needs."""
+    clone = copy.copy(game)
+    board = getattr(game, "_board")
+    clone._board = [row[:] for row in board] if isinstance(board[0], list) else list(board)  # type: ignore[attr-defined]
+    clone._undo_stack = []  # type: ignore[attr-defined]
+    return clone
+
+
+def perft_copy(game: GameEngine, depth: int) -> int:
+    """Count nodes to ``depth``, copying the game for every child."""
+    if depth == 0 or game.is_game_over():
+        return 1
+    nodes = 1
+    for move in game.get_valid_moves():
+        child = _copy_game(game)
+        child.push_move(move)
+        nodes += perft_copy(child, depth - 1)
+    return nodes
+
+
+def perft_push(game: GameEngine, depth: int) -> int:
+    """Count nodes to ``depth``, making and unmaking moves on one game."""
+    if depth == 0 or game.is_game_over():
+        return 1
+    nodes = 1
+    for move in game.get_valid_moves():
+        game.push_move(move)
+        nodes += perft_push(game, depth - 1)
+        game.pop_move()
+    return nodes
+
+
+def _best_rate(walk: Callable[[GameEngine, int], int], factory: Callable[[], GameEngine], depth: int, repeats: int) -> Tuple[int, float]:
+    """Return the node count and the best nodes per second over ``repeats`` walks."""
+    best = 0.0
+    nodes = 0
+    for _ in range(repeats):
+        game = factory()
+        start = time.perf_counter()
+        nodes = walk(game, depth)
+        best = max(best, nodes / (time.perf_counter() - start))
+    return nodes, best
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print a nodes-per-second table for each engine."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", nargs="+", choices=sorted(GAMES), default=sorted(GAMES))
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'game':<13} {'depth':>5} {'nodes':>9} {'copy-make':>13} {'make/unmake':>13} {'speedup':>8}")
+    for name in args.games:
+        factory, depth = GAMES[name]
+        nodes, copy_rate = _best_rate(perft_copy, factory, depth, args.repeats)
+        pushed_nodes, push_rate = _best_rate(perft_push, factory, depth, args.repeats)
+        if pushed_nodes != nodes:
+            raise AssertionError(f"{name}: walks disagree ({nodes} vs {pushed_nodes} nodes)")
+        print(f"{name:<13} {depth:>5} {nodes:>9} {copy_rate:>9.0f} n/s {push_rate:>9.0f} n/s {push_rate / copy_rate:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark in-process versus pooled poker equity simulation.
+
+Runs ``estimate_win_rate`` at increasing simulation counts, once in-process and
+once on a warm :class:`SimulationPool`, and reports the smallest count from
+which the pool is consistently at least 5% faster. Use the result to tune
+``simulation_pool.PARALLEL_THRESHOLD`` for a deployment machine.
+
+Usage:
+    python scripts/benchmark_poker_pool.py
+    python scripts/benchmark_poker_pool.py --backend numpy --workers 4 --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from games_collection.games.card.common.cards import Card, Suit
+from games_collection.games.card.poker.poker import Player, estimate_win_rate
+from games_collection.games.card.poker.simulation_pool import SimulationPool
+
+SIMULATION_COUNTS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+MIN_SPEEDUP = 1.05
+
+
+def _time_run(players: list[Player], simulations: int, backend: str, workers: int, pool: Optional[SimulationPool], repeats: int) -> float:
+    """Return the best wall-clock time of ``repeats`` equity estimates."""
+    hero = players[0]
+    board = [Card("2", Suit.DIAMONDS), Card("7", Suit.CLUBS), Card("9", Suit.HEARTS)]
+    best = float("inf")
+    for seed in range(repeats):
+        start = time.perf_counter()
+        estimate_win_rate(
+            hero=hero,
+            players=players,
+            community_cards=board,
+            simulations=simulations,
+            rng=random.Random(seed),
+            max_workers=workers,
+            backend=backend,
+            pool=pool,
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print a timing table and the crossover point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=("python", "numpy"), default="python")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--opponents", type=int, default=2)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    hero = Player(name="Hero")
+    hero.hole_cards = [Card("A", Suit.SPADES), Card("K", Suit.SPADES)]
+    players = [hero] + [Player(name=f"Villain {index + 1}") for index in range(args.opponents)]
+
+    print(f"backend={args.backend} workers={args.workers} opponents={args.opponents}")
+    if (os.cpu_count() or 1) < 2:
+        print("Only one CPU is available, so pooled runs execute in-process.")
+    print(f"{'sims':>8} {'in-process':>12} {'pooled':>12} {'speedup':>8}")
+    crossover = None
+    with SimulationPool(args.workers, min_parallel_simulations=0) as pool:
+        # Warm the workers so start-up cost is not charged to the first row.
+        _time_run(players, 256, args.backend, args.workers, pool, 1)
+        for simulations in SIMULATION_COUNTS:
+            serial = _time_run(players, simulations, args.backend, 1, None, args.repeats)
+            pooled = _time_run(players, simulations, args.backend, args.workers, pool, args.repeats)
+            print(f"{simulations:>8} {serial * 1e3:>10.2f}ms {pooled * 1e3:>10.2f}ms {serial / pooled:>7.2f}x")
+            if serial / pooled < MIN_SPEEDUP:
+                crossover = None
+            elif crossover is None:
+                crossover = simulations
+
+    if crossover is None:
+        print("The pool was not consistently faster than in-process simulation at these sizes.")
+    else:
+        print(f"Parallelism pays off from about {crossover} simulations.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
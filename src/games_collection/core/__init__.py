@@ -26,7 +26,7 @@ from .ai_enhancements import (
     ReinforcementLearningConfig,
     TrainableEnvironment,
 )
-from .ai_strategy import AIStrategy, HeuristicStrategy, MinimaxStrategy, RandomStrategy
+from .ai_strategy import AIStrategy, HeuristicStrategy, MCTSStrategy, MinimaxStrategy, RandomStrategy
 from .architecture.engine import GameEngine, GamePhase, GameState
 from .architecture.events import Event, EventBus, EventHandler, FunctionEventHandler, GameEventType, get_global_event_bus, set_global_event_bus
 from .architecture.observer import Observable, Observer, PropertyObservable
@@ -114,6 +114,7 @@ __all__ = [
     "AIStrategy",
     "RandomStrategy",
     "MinimaxStrategy",
+    "MCTSStrategy",
     "HeuristicStrategy",
     "ReinforcementLearningAgent",
     "ReinforcementLearningConfig",
@@ -9,10 +9,14 @@ The key components are:
 - `AIStrategy`: An abstract base class that defines the common interface for
   all AI strategies.
 - `RandomStrategy`: A simple strategy that selects moves randomly.
-- `MinimaxStrategy`: A placeholder for a minimax-based strategy, suitable for
-  perfect-play games.
+- `MinimaxStrategy`: An iterative deepening alpha-beta search with a
+  transposition table, suitable for perfect-play games.
+- `MCTSStrategy`: A Monte Carlo tree search with UCT selection for games whose
+  branching factor makes minimax impractical.
 - `HeuristicStrategy`: A strategy that uses a heuristic function to evaluate
   and select the best move.
+- `difficulty_preset` and `check_backend`: Helpers that game AIs use to look
+  up their named difficulty settings and validate their search backend.
 
 This modular approach makes it easy to add new AI behaviors and to configure
 different difficulty levels for computer-controlled opponents.
@@ -20,16 +24,18 @@ different difficulty levels for computer-controlled opponents.
 
 from __future__ import annotations
 
+import math
 import os
 import random
 import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import Callable, Generator, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+from typing import Any, Callable, Dict, Generator, Generic, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
 
 import cProfile
 import pstats
@@ -79,6 +85,30 @@ def _profiling_session(label: str) -> Generator[None, None, None]:
             stats.print_stats(25)
 
 
+def difficulty_preset(presets: Mapping[str, Dict[str, Any]], difficulty: str, game: str) -> Dict[str, Any]:
+    """Return the keyword settings ``presets`` lists for ``difficulty``.
+
+    Names are matched case-insensitively so menus can pass their labels
+    straight through.
+
+    Raises:
+        ValueError: If ``difficulty`` is not one of the presets for ``game``.
+    """
+
+    try:
+        return dict(presets[difficulty.lower()])
+    except KeyError:
+        raise ValueError(f"Unknown {game} difficulty {difficulty!r}; expected one of {sorted(presets)}") from None
+
+
+def check_backend(backend: str, backends: Sequence[str], game: str) -> None:
+    """Raise ``ValueError`` unless ``backend`` names one of the search ``backends`` of ``game``'s AI."""
+
+    if backend not in backends:
+        expected = ", ".join(repr(name) for name in backends)
+        raise ValueError(f"Unknown {game} AI backend {backend!r}; expected one of {expected}")
+
+
 class AIStrategy(ABC, Generic[MoveType, StateType]):
     """Abstract base class for AI strategies.
 
@@ -189,15 +219,48 @@ class RandomStrategy(AIStrategy[MoveType, StateType]):
             return self.rng.choice(valid_moves)
 
 
+# Transposition table bound flags: the stored value is exact, a lower bound
+# (the node failed high) or an upper bound (the node failed low).
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+# Move-ordering priorities for the table move and killer moves; history
+# scores fill in below them.
+_TABLE_MOVE_PRIORITY = float("inf")
+_KILLER_PRIORITY = 1e12
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the wall-clock budget is exhausted."""
+
+
 class MinimaxStrategy(AIStrategy[MoveType, StateType]):
     """A minimax-based strategy for perfect play in two-player games.
 
-    This strategy is intended to use the minimax algorithm, optionally enhanced
-    with alpha-beta pruning, to find the optimal move in zero-sum games like
-    Tic-Tac-Toe or Checkers.
-
-    Note: The current implementation is a placeholder and selects moves
-          randomly. It needs to be extended with the actual minimax logic.
+    The search is iterative deepening alpha-beta: it searches to depth one,
+    two, ... up to ``max_depth`` and, when ``time_budget`` is set, returns the
+    best move of the deepest iteration that finished in time. Each iteration
+    orders moves using the previous one:
+
+    - root moves are tried best-first by their last scores;
+    - inner nodes try the best move stored in the transposition table first
+      (the principal variation), then killer moves that caused a cutoff at the
+      same ply, then moves by their history score.
+
+    The transposition table is keyed by ``state_key_fn`` and stores each
+    result with the depth searched and whether it is exact or a lower/upper
+    bound, so results cut off by alpha-beta are only reused where they are
+    valid. It is a bounded LRU kept across calls to :meth:`select_move`; call
+    :meth:`clear_cache` when the evaluation changes meaning. Without a
+    ``state_key_fn`` the search runs without a table.
+
+    States are scored from the perspective of the player choosing at the
+    root, which is the maximizing side.
+
+    With an ``undo_fn`` the search runs make/unmake style on a single mutable
+    state: ``transition_fn`` applies a move in place (for example with
+    :meth:`GameEngine.push_move`) and returns the state, and ``undo_fn``
+    reverts the last move after its subtree is searched, so no node copies
+    the state.
     """
 
     def __init__(
@@ -210,6 +273,9 @@ class MinimaxStrategy(AIStrategy[MoveType, StateType]):
         move_generator: Optional[Callable[[StateType], Iterable[MoveType]]] = None,
         is_terminal_fn: Optional[Callable[[StateType], bool]] = None,
         state_key_fn: Optional[Callable[[StateType], Hashable]] = None,
+        undo_fn: Optional[Callable[[StateType], None]] = None,
+        time_budget: Optional[float] = None,
+        table_size: int = 200_000,
         rng: Optional[random.Random] = None,
     ) -> None:
         """Initialize the minimax strategy.
@@ -220,9 +286,24 @@ class MinimaxStrategy(AIStrategy[MoveType, StateType]):
             evaluation_fn: An optional function to evaluate non-terminal
                            states, which is necessary for games that are too
                            complex to search to the end.
+            transition_fn: Returns the state reached by playing a move.
+            move_generator: Returns the moves available in a state.
+            is_terminal_fn: Returns whether a state ends the game.
+            state_key_fn: Returns a hashable key identifying a state; enables
+                          the transposition table.
+            undo_fn: Reverts the most recent in-place ``transition_fn``
+                     call; enables make/unmake search.
+            time_budget: Optional wall-clock limit in seconds for one
+                         decision. Depth one is always completed.
+            table_size: The maximum number of transposition table entries.
             rng: An optional random number generator for tie-breaking.
+
+        Raises:
+            ValueError: If `table_size` is not a positive integer.
         """
         super().__init__(rng)
+        if table_size <= 0:
+            raise ValueError("table_size must be a positive integer")
         self.max_depth = max_depth
         self.alpha_beta = alpha_beta
         self.evaluation_fn = evaluation_fn
@@ -230,21 +311,31 @@ class MinimaxStrategy(AIStrategy[MoveType, StateType]):
         self.move_generator = move_generator
         self.is_terminal_fn = is_terminal_fn
         self.state_key_fn = state_key_fn
-        self._memo: dict[Tuple[Hashable, int, bool], float] = {}
+        self.undo_fn = undo_fn
+        self.time_budget = time_budget
+        self.table_size = table_size
+        self.last_depth = 0
+        # (state key, maximizing) -> (depth, value, flag, best move)
+        self._table: OrderedDict[Tuple[Hashable, bool], Tuple[int, float, int, Optional[MoveType]]] = OrderedDict()
+        self._killers: List[List[MoveType]] = []
+        self._history: dict[Hashable, float] = {}
+        self._deadline: Optional[float] = None
+        self._nodes = 0
 
     def select_move(
         self,
         valid_moves: List[MoveType],
         game_state: StateType,
     ) -> MoveType:
-        """Select the best move using the minimax algorithm.
+        """Select the best move using iterative deepening minimax.
 
         Args:
             valid_moves: A list of all valid moves to choose from.
             game_state: The current state of the game.
 
         Returns:
-            The move with the highest minimax value.
+            One of the moves with the highest minimax value at the deepest
+            completed depth.
 
         Raises:
             ValueError: If `valid_moves` is empty.
@@ -252,22 +343,53 @@ class MinimaxStrategy(AIStrategy[MoveType, StateType]):
         if not valid_moves:
             raise ValueError("No valid moves available")
 
-        self._memo.clear()
+        self._killers = []
+        self._history.clear()
+        start = time.perf_counter()
+        ordered = list(valid_moves)
         scored_moves: List[Tuple[MoveType, float]] = []
         with self.profile_move("MinimaxStrategy.select_move"):
-            for move in valid_moves:
-                score = self._evaluate_branch(game_state, move)
-                scored_moves.append((move, score))
+            for depth in range(1, max(self.max_depth, 1) + 1):
+                # Depth one is always completed so there is a move to return.
+                self._deadline = start + self.time_budget if self.time_budget is not None and depth > 1 else None
+                try:
+                    scores = self._search_root(game_state, ordered, depth)
+                except _SearchTimeout:
+                    break
+                scored_moves = list(zip(ordered, scores))
+                self.last_depth = depth
+                ranked = sorted(range(len(ordered)), key=lambda index: -scores[index])
+                ordered = [ordered[index] for index in ranked]
+        self._deadline = None
         best_score = max(score for _, score in scored_moves)
         best_moves = [move for move, score in scored_moves if score == best_score]
         return self.rng.choice(best_moves)
 
-    def _evaluate_branch(self, state: StateType, move: MoveType) -> float:
-        next_state = self._transition(state, move)
-        depth = max(self.max_depth - 1, 0)
-        if depth == 0:
-            return self._evaluate_state(next_state)
-        return self._minimax(next_state, depth, float("-inf"), float("inf"), False)
+    def clear_cache(self) -> None:
+        """Forget every transposition table entry."""
+        self._table.clear()
+
+    def _search_root(self, state: StateType, moves: List[MoveType], depth: int) -> List[float]:
+        """Score every root move at ``depth``; moves tying the best stay exact."""
+        best = float("-inf")
+        scores = []
+        for move in moves:
+            child = self._transition(state, move)
+            try:
+                if depth == 1:
+                    score = self._evaluate_state(child)
+                else:
+                    # A window just below the best score keeps equal moves exact
+                    # for tie-breaking while worse moves are cut off early.
+                    alpha = math.nextafter(best, float("-inf")) if self.alpha_beta else float("-inf")
+                    score = self._minimax(child, depth - 1, alpha, float("inf"), False, 1)
+            finally:
+                # Also unwinds in-place moves when a timeout aborts the search.
+                if self.undo_fn is not None:
+                    self.undo_fn(child)
+            scores.append(score)
+            best = max(best, score)
+        return scores
 
     def _minimax(
         self,
@@ -276,50 +398,100 @@ class MinimaxStrategy(AIStrategy[MoveType, StateType]):
         alpha: float,
         beta: float,
         maximizing: bool,
+        ply: int = 0,
     ) -> float:
-        cache_key = self._cache_key(state, depth, maximizing)
-        if cache_key is not None and cache_key in self._memo:
-            return self._memo[cache_key]
+        self._nodes += 1
+        if self._deadline is not None and not self._nodes & 63 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        key = self._cache_key(state, maximizing)
+        table_move: Optional[MoveType] = None
+        if key is not None:
+            entry = self._table.get(key)
+            if entry is not None:
+                self._table.move_to_end(key)
+                entry_depth, value, flag, table_move = entry
+                if entry_depth >= depth:
+                    if flag == _EXACT:
+                        return value
+                    if flag == _LOWER and value >= beta:
+                        return value
+                    if flag == _UPPER and value <= alpha:
+                        return value
+
         if depth == 0 or self._is_terminal(state):
             score = self._evaluate_state(state)
-        elif maximizing:
-            score = self._maximize(state, depth, alpha, beta)
-        else:
-            score = self._minimize(state, depth, alpha, beta)
-        if cache_key is not None:
-            self._memo[cache_key] = score
-        return score
+            self._store(key, depth, score, _EXACT, None)
+            return score
 
-    def _maximize(self, state: StateType, depth: int, alpha: float, beta: float) -> float:
         moves = list(self._moves(state))
         if not moves:
-            return self._evaluate_state(state)
-        best = float("-inf")
-        for move in moves:
-            child = self._transition(state, move)
-            score = self._minimax(child, depth - 1, alpha, beta, False)
-            best = max(best, score)
-            if self.alpha_beta:
-                alpha = max(alpha, best)
-                if beta <= alpha:
-                    break
-        return best
+            score = self._evaluate_state(state)
+            self._store(key, depth, score, _EXACT, None)
+            return score
 
-    def _minimize(self, state: StateType, depth: int, alpha: float, beta: float) -> float:
-        moves = list(self._moves(state))
-        if not moves:
-            return self._evaluate_state(state)
-        best = float("inf")
-        for move in moves:
+        original_alpha, original_beta = alpha, beta
+        best = float("-inf") if maximizing else float("inf")
+        best_move: Optional[MoveType] = None
+        for move in self._order_moves(moves, table_move, ply):
             child = self._transition(state, move)
-            score = self._minimax(child, depth - 1, alpha, beta, True)
-            best = min(best, score)
-            if self.alpha_beta:
+            try:
+                score = self._minimax(child, depth - 1, alpha, beta, not maximizing, ply + 1)
+            finally:
+                if self.undo_fn is not None:
+                    self.undo_fn(child)
+            if maximizing and score > best:
+                best, best_move = score, move
+                alpha = max(alpha, best)
+            elif not maximizing and score < best:
+                best, best_move = score, move
                 beta = min(beta, best)
-                if beta <= alpha:
-                    break
+            if self.alpha_beta and beta <= alpha:
+                self._record_cutoff(move, depth, ply)
+                break
+
+        if best <= original_alpha:
+            flag = _UPPER
+        elif best >= original_beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._store(key, depth, best, flag, best_move)
         return best
 
+    def _order_moves(self, moves: List[MoveType], table_move: Optional[MoveType], ply: int) -> List[MoveType]:
+        """Order moves: table move, then killers at ``ply``, then by history score."""
+        killers = self._killers[ply] if ply < len(self._killers) else []
+
+        def priority(move: MoveType) -> float:
+            if table_move is not None and move == table_move:
+                return _TABLE_MOVE_PRIORITY
+            if move in killers:
+                return _KILLER_PRIORITY
+            return self._history.get(move, 0.0) if isinstance(move, Hashable) else 0.0
+
+        return sorted(moves, key=priority, reverse=True)
+
+    def _record_cutoff(self, move: MoveType, depth: int, ply: int) -> None:
+        """Remember a move that caused a beta cutoff as a killer and in the history."""
+        while len(self._killers) <= ply:
+            self._killers.append([])
+        killers = self._killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        if isinstance(move, Hashable):
+            self._history[move] = self._history.get(move, 0.0) + depth * depth
+
+    def _store(self, key: Optional[Tuple[Hashable, bool]], depth: int, value: float, flag: int, move: Optional[MoveType]) -> None:
+        """Record a search result in the bounded transposition table."""
+        if key is None:
+            return
+        self._table[key] = (depth, value, flag, move)
+        self._table.move_to_end(key)
+        if len(self._table) > self.table_size:
+            self._table.popitem(last=False)
+
     def _transition(self, state: StateType, move: MoveType) -> StateType:
         if self.transition_fn is not None:
             return self.transition_fn(state, move)
@@ -350,10 +522,10 @@ class MinimaxStrategy(AIStrategy[MoveType, StateType]):
             return float(getattr(state, "evaluate")())
         return 0.0
 
-    def _cache_key(self, state: StateType, depth: int, maximizing: bool) -> Optional[Tuple[Hashable, int, bool]]:
+    def _cache_key(self, state: StateType, maximizing: bool) -> Optional[Tuple[Hashable, bool]]:
         if self.state_key_fn is None:
             return None
-        return self.state_key_fn(state), depth, maximizing
+        return self.state_key_fn(state), maximizing
 
     def evaluate_move(
         self,
@@ -378,6 +550,301 @@ class MinimaxStrategy(AIStrategy[MoveType, StateType]):
         return 0.0
 
 
+class _MCTSNode:
+    """A search tree node whose statistics are scored for ``player``, who played ``move``."""
+
+    __slots__ = ("move", "parent", "player", "state", "untried", "children", "visits", "reward")
+
+    def __init__(self, move: Any, parent: Optional["_MCTSNode"], player: Hashable, state: Any, untried: List[Any]) -> None:
+        self.move = move
+        self.parent = parent
+        self.player = player
+        self.state = state
+        self.untried = untried
+        self.children: List[_MCTSNode] = []
+        self.visits = 0
+        self.reward = 0.0
+
+
+def _root_statistics(root: _MCTSNode, valid_moves: List[Any]) -> List[Tuple[int, float]]:
+    """Return ``(visits, reward)`` for each of ``valid_moves``, in order."""
+    index = {id(move): position for position, move in enumerate(valid_moves)}
+    statistics = [(0, 0.0)] * len(valid_moves)
+    for child in root.children:
+        statistics[index[id(child.move)]] = (child.visits, child.reward)
+    return statistics
+
+
+def _mcts_worker(strategy: "MCTSStrategy", state: Any, valid_moves: List[Any], seed: int) -> Tuple[List[Tuple[int, float]], int]:
+    """Grow one independent tree in a worker process for root-parallel search."""
+    strategy.rng = random.Random(seed)
+    root = strategy._search(valid_moves, state)
+    return _root_statistics(root, valid_moves), strategy.last_iterations
+
+
+class MCTSStrategy(AIStrategy[MoveType, StateType]):
+    """Monte Carlo tree search with UCT selection.
+
+    Each iteration walks down the tree choosing children by the UCT bound
+    ``reward / visits + exploration * sqrt(ln(parent visits) / visits)``,
+    expands one untried move, plays the game out to the end and backs the
+    result up the path. The root move visited most often is played, so no
+    evaluation function is needed; this suits games whose branching factor
+    makes minimax impractical.
+
+    Rewards lie in ``[0, 1]`` (1 for a win, 0.5 for a draw) and are scored
+    for a player as returned by ``player_fn``. Games are assumed to be
+    two-player and zero-sum, so the other side scores ``1 - reward``. The
+    player to move need not alternate, which covers games with extra turns.
+
+    Tree states are never mutated: ``transition_fn`` must return a new state.
+    Playouts repeatedly apply ``rollout_policy`` (a uniformly random move by
+    default) with ``transition_fn``; a ``rollout_fn``, or a subclass
+    overriding :meth:`_rollout`, can instead play out on a compact scratch
+    copy of the state without allocating per move.
+
+    With ``workers`` above one the search is root-parallel: each worker
+    process grows an independent tree from the same root with its own seed
+    and the root visit counts are summed. The strategy is pickled into the
+    workers, so its callables must be module-level functions (or methods of
+    a subclass). The worker processes start with the first parallel decision
+    and are reused for later ones until :meth:`shutdown`; strategies can also
+    be used as context managers.
+    """
+
+    def __init__(
+        self,
+        iterations: Optional[int] = 1000,
+        *,
+        time_budget: Optional[float] = None,
+        exploration: float = math.sqrt(2),
+        transition_fn: Optional[Callable[[StateType, MoveType], StateType]] = None,
+        move_generator: Optional[Callable[[StateType], Iterable[MoveType]]] = None,
+        is_terminal_fn: Optional[Callable[[StateType], bool]] = None,
+        player_fn: Optional[Callable[[StateType], Hashable]] = None,
+        reward_fn: Optional[Callable[[StateType, Hashable], float]] = None,
+        rollout_policy: Optional[Callable[[List[MoveType], StateType, random.Random], MoveType]] = None,
+        rollout_fn: Optional[Callable[[StateType, Hashable, random.Random], float]] = None,
+        workers: int = 1,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Initialize the Monte Carlo tree search strategy.
+
+        Args:
+            iterations: The number of playouts per decision, or None to run
+                        until ``time_budget`` expires.
+            time_budget: Optional wall-clock limit in seconds for one
+                         decision. At least one playout is always run.
+            exploration: The UCT exploration constant.
+            transition_fn: Returns the new state reached by playing a move.
+            move_generator: Returns the moves available in a state.
+            is_terminal_fn: Returns whether a state ends the game.
+            player_fn: Returns the player to move in a state.
+            reward_fn: Scores a finished game in ``[0, 1]`` for a player.
+            rollout_policy: Picks the next playout move from the legal moves.
+            rollout_fn: Plays a state out and returns the reward for a
+                        player, replacing the default playout loop.
+            workers: The number of processes for root-parallel search.
+            rng: An optional random number generator.
+
+        Raises:
+            ValueError: If neither a playout count nor a time budget is set,
+                        or if `iterations` or `workers` is not positive.
+        """
+        super().__init__(rng)
+        if iterations is None and time_budget is None:
+            raise ValueError("MCTSStrategy needs iterations or a time_budget")
+        if iterations is not None and iterations <= 0:
+            raise ValueError("iterations must be a positive integer")
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer")
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.transition_fn = transition_fn
+        self.move_generator = move_generator
+        self.is_terminal_fn = is_terminal_fn
+        self.player_fn = player_fn
+        self.reward_fn = reward_fn
+        self.rollout_policy = rollout_policy
+        self.rollout_fn = rollout_fn
+        self.workers = workers
+        self.last_iterations = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def select_move(
+        self,
+        valid_moves: List[MoveType],
+        game_state: StateType,
+    ) -> MoveType:
+        """Select the root move visited most often by the search.
+
+        Args:
+            valid_moves: A list of all valid moves to choose from.
+            game_state: The current state of the game.
+
+        Returns:
+            The most visited move; ties go to the higher total reward.
+
+        Raises:
+            ValueError: If `valid_moves` is empty.
+        """
+        if not valid_moves:
+            raise ValueError("No valid moves available")
+        if len(valid_moves) == 1:
+            return valid_moves[0]
+
+        with self.profile_move("MCTSStrategy.select_move"):
+            if self.workers > 1:
+                statistics = self._parallel_statistics(valid_moves, game_state)
+            else:
+                statistics = _root_statistics(self._search(valid_moves, game_state), valid_moves)
+        best = max(statistics)
+        return self.rng.choice([move for move, entry in zip(valid_moves, statistics) if entry == best])
+
+    def _search(self, valid_moves: List[MoveType], state: StateType) -> _MCTSNode:
+        """Grow a tree from ``state`` and return its root."""
+        root_player = self._player(state)
+        root = _MCTSNode(None, None, None, state, list(valid_moves))
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        iterations = 0
+        while self.iterations is None or iterations < self.iterations:
+            if deadline is not None and iterations and time.perf_counter() > deadline:
+                break
+            node = root
+            # Selection: descend through fully expanded nodes.
+            while not node.untried and node.children:
+                node = self._select_child(node)
+            # Expansion: add one random untried move.
+            if node.untried:
+                untried = node.untried
+                index = self.rng.randrange(len(untried))
+                untried[index], untried[-1] = untried[-1], untried[index]
+                move = untried.pop()
+                state = self._transition(node.state, move)
+                moves = [] if self._is_terminal(state) else list(self._moves(state))
+                child = _MCTSNode(move, node, self._player(node.state), state, moves)
+                node.children.append(child)
+                node = child
+            # Simulation and backpropagation.
+            reward = self._rollout(node.state, root_player)
+            while node is not None:
+                node.visits += 1
+                if node.player is not None:
+                    node.reward += reward if node.player == root_player else 1.0 - reward
+                node = node.parent
+            iterations += 1
+        self.last_iterations = iterations
+        return root
+
+    def _select_child(self, node: _MCTSNode) -> _MCTSNode:
+        """Return the child with the highest UCT bound."""
+        scale = self.exploration * math.sqrt(math.log(node.visits))
+        best_child = node.children[0]
+        best_bound = float("-inf")
+        for child in node.children:
+            bound = child.reward / child.visits + scale / math.sqrt(child.visits)
+            if bound > best_bound:
+                best_child, best_bound = child, bound
+        return best_child
+
+    def _parallel_statistics(self, valid_moves: List[MoveType], state: StateType) -> List[Tuple[int, float]]:
+        """Sum the root statistics of independent trees grown in worker processes."""
+        seeds = [self.rng.randrange(2**32) for _ in range(self.workers)]
+        count = self.workers
+        try:
+            pool = self._ensure_executor()
+            results = list(pool.map(_mcts_worker, [self] * count, [state] * count, [valid_moves] * count, seeds))
+        except KeyboardInterrupt:  # pragma: no cover - propagate interrupts
+            raise
+        except Exception:
+            # A broken pool (e.g. a killed worker) should not cost the move;
+            # drop it and search in this process instead.
+            self.shutdown()
+            return _root_statistics(self._search(valid_moves, state), valid_moves)
+        totals = [(0, 0.0)] * len(valid_moves)
+        for statistics, _ in results:
+            totals = [(visits + more_visits, reward + more_reward) for (visits, reward), (more_visits, more_reward) in zip(totals, statistics)]
+        self.last_iterations = sum(iterations for _, iterations in results)
+        return totals
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes if they are not running yet."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes. They restart lazily if the strategy is reused."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "MCTSStrategy[MoveType, StateType]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers receive a copy of the strategy; the pool stays with the parent.
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def _rollout(self, state: StateType, player: Hashable) -> float:
+        """Play ``state`` out to the end and return the reward for ``player``."""
+        if self.rollout_fn is not None:
+            return self.rollout_fn(state, player, self.rng)
+        while not self._is_terminal(state):
+            moves = list(self._moves(state))
+            if not moves:
+                break
+            if self.rollout_policy is not None:
+                move = self.rollout_policy(moves, state, self.rng)
+            else:
+                move = self.rng.choice(moves)
+            state = self._transition(state, move)
+        return self._reward(state, player)
+
+    def _transition(self, state: StateType, move: MoveType) -> StateType:
+        if self.transition_fn is not None:
+            return self.transition_fn(state, move)
+        if hasattr(state, "apply_move"):
+            return getattr(state, "apply_move")(move)
+        raise ValueError("MCTSStrategy requires a transition_fn or state.apply_move")
+
+    def _moves(self, state: StateType) -> Iterable[MoveType]:
+        if self.move_generator is not None:
+            return self.move_generator(state)
+        if hasattr(state, "get_valid_moves"):
+            return getattr(state, "get_valid_moves")()
+        raise ValueError("MCTSStrategy requires a move_generator or state.get_valid_moves")
+
+    def _is_terminal(self, state: StateType) -> bool:
+        if self.is_terminal_fn is not None:
+            return self.is_terminal_fn(state)
+        if hasattr(state, "is_terminal"):
+            return bool(getattr(state, "is_terminal")())
+        if hasattr(state, "is_game_over"):
+            return bool(getattr(state, "is_game_over")())
+        return False
+
+    def _player(self, state: StateType) -> Hashable:
+        if self.player_fn is not None:
+            return self.player_fn(state)
+        if hasattr(state, "get_current_player"):
+            return getattr(state, "get_current_player")()
+        raise ValueError("MCTSStrategy requires a player_fn or state.get_current_player")
+
+    def _reward(self, state: StateType, player: Hashable) -> float:
+        if self.reward_fn is not None:
+            return self.reward_fn(state, player)
+        if hasattr(state, "reward"):
+            return float(getattr(state, "reward")(player))
+        raise ValueError("MCTSStrategy requires a reward_fn or state.reward")
+
+
 class HeuristicStrategy(AIStrategy[MoveType, StateType]):
     """A strategy that selects moves based on a heuristic evaluation.
 
@@ -5,9 +5,10 @@ This module provides pre-defined scenarios and puzzles for practicing game skill
 
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 
 class DifficultyLevel(str, Enum):
@@ -455,6 +456,51 @@ def _sudoku_builder(
     return _build
 
 
+# Challenge level, logical grade and the techniques that grade calls for.
+_SUDOKU_GRADED_CHALLENGES: Tuple[Tuple[DifficultyLevel, str, str], ...] = (
+    (DifficultyLevel.BEGINNER, "easy", "needs nothing beyond naked and hidden singles"),
+    (DifficultyLevel.INTERMEDIATE, "medium", "calls for pointing pairs, box/line reductions or naked and hidden pairs"),
+    (DifficultyLevel.ADVANCED, "hard", "calls for triples, X-wings or XY-wings"),
+    (DifficultyLevel.EXPERT, "expert", "resists every pattern short of a swordfish or trying candidates"),
+)
+
+
+def _graded_sudoku_builder(grade: str) -> Callable[..., Any]:
+    """Create a builder serving puzzles of ``grade`` from the bundled puzzle bank.
+
+    The builder's optional ``seed`` picks the puzzle, so the daily scheduler
+    can serve the same one all day; without the bank it generates one.
+    """
+
+    def _build(seed: Optional[int] = None) -> Any:
+        from games_collection.games.paper.sudoku.bank import load_puzzle_bank
+        from games_collection.games.paper.sudoku.sudoku import SudokuGenerator
+
+        rng = random.Random(seed)
+        bank = load_puzzle_bank()
+        if bank is not None and bank.count(grade):
+            return bank.puzzle(grade, seed if seed is not None else rng.randrange(bank.count(grade)))
+        return SudokuGenerator(rng=rng).generate(grade)
+
+    return _build
+
+
+def generate_sudoku_builders(
+    count: int,
+    difficulty: str,
+    *,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> List[Callable[[], Any]]:
+    """Generate ``count`` fresh puzzles in parallel and wrap each in a Sudoku builder."""
+
+    from games_collection.games.paper.sudoku.sudoku import SudokuGenerator
+
+    generator = SudokuGenerator(rng=random.Random(seed))
+    puzzles = generator.generate_batch(count, difficulty, workers=workers)
+    return [_sudoku_builder(puzzle.starting_board, puzzle.solution, puzzle.difficulty) for puzzle in puzzles]
+
+
 def create_sudoku_challenges() -> ChallengePack:
     """Create Sudoku challenge pack covering all difficulty levels."""
 
@@ -619,6 +665,24 @@ def create_sudoku_challenges() -> ChallengePack:
         )
     )
 
+    for level, grade, skills in _SUDOKU_GRADED_CHALLENGES:
+        pack.add_challenge(
+            Challenge(
+                id=f"sudoku_graded_{grade}",
+                title=f"Graded {grade.title()} Sudoku",
+                description=f"A puzzle from the graded bank that {skills}.",
+                difficulty=level,
+                initial_state={"grade": grade},
+                goal="Complete the puzzle without guessing where logic will do.",
+                validate=lambda puzzle: getattr(puzzle, "is_solved", lambda: False)(),
+                metadata={
+                    "game_id": "sudoku",
+                    "build_puzzle": _graded_sudoku_builder(grade),
+                    "daily_seed": True,
+                },
+            )
+        )
+
     return pack
 
 
@@ -0,0 +1,52 @@
+"""Dense indexing of bounded count vectors for precomputed game tables.
+
+Several endgame databases store one entry per way of spreading a few pieces
+over a fixed number of slots: stones over Kalah pits, checkers over the
+backgammon home board. :class:`CountRanking` maps each such vector of counts to
+a dense index in the combinatorial number system, so a table needs no gaps and
+no hashing.
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence
+
+
+class CountRanking:
+    """Rank vectors of ``slots`` non-negative counts whose sum is at most a bound.
+
+    A vector with total at most ``n`` is padded with a final "slack" count up to
+    exactly ``n``, which makes the vectors compositions of ``n`` into
+    ``slots + 1`` parts; there are C(n + slots, slots) of them.
+    """
+
+    def __init__(self, slots: int, limit: int) -> None:
+        """Precompute binomials for vectors of ``slots`` counts totalling up to ``limit``."""
+        self.slots = slots
+        self.limit = limit
+        # _binomial[k][n] is C(n + k, k), the number of compositions of n into k + 1 parts.
+        self._binomial: List[List[int]] = [[1] * (limit + 1)]
+        for k in range(1, slots + 1):
+            row = [1]
+            for n in range(1, limit + 1):
+                row.append(row[-1] + self._binomial[k - 1][n])
+            self._binomial.append(row)
+
+    def count(self, bound: int) -> int:
+        """Return how many vectors have a total of at most ``bound``."""
+        return self._binomial[self.slots][bound]
+
+    def rank(self, counts: Sequence[int], bound: int) -> int:
+        """Return the index of ``counts`` in ``range(self.count(bound))``."""
+        binomial = self._binomial
+        index = 0
+        remaining = bound
+        for position in range(self.slots):
+            column = binomial[self.slots - position]
+            count = counts[position]
+            index += column[remaining] - column[remaining - count]
+            remaining -= count
+        return index
+
+
+__all__ = ["CountRanking"]
@@ -7,7 +7,7 @@ import pathlib
 import random
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from games_collection.core.challenges import Challenge, ChallengeManager, ChallengePack, DifficultyLevel
 from games_collection.core.profile import get_default_profile_dir
@@ -34,6 +34,21 @@ class DailyChallengeSelection:
         difficulty_label = self.challenge.difficulty.value.title()
         return f"{self.pack.name}: {self.challenge.title} ({difficulty_label})"
 
+    def build_puzzle(self) -> Optional[Any]:
+        """Return the challenge's puzzle, or ``None`` if it does not build one.
+
+        Challenges marked ``daily_seed`` in their metadata draw from a bank,
+        so their builder is seeded with the date and everyone gets the same
+        puzzle all day.
+        """
+
+        builder = self.challenge.metadata.get("build_puzzle")
+        if not callable(builder):
+            return None
+        if self.challenge.metadata.get("daily_seed"):
+            return builder(self.target_date.toordinal())
+        return builder()
+
 
 class DailyChallengeScheduler:
     """Select and persist a daily challenge using deterministic rotation."""
@@ -214,6 +214,42 @@ class GameEngine(ABC, Generic[MoveType, PlayerType]):
         """
         return move in self.get_valid_moves()
 
+    def push_move(self, move: MoveType) -> None:
+        """Apply a move in place and remember how to undo it.
+
+        This is the "make" half of the optional make/unmake protocol used by
+        search-based AIs. Unlike `make_move`, it does not validate the move
+        or emit events, and it records an undo entry so `pop_move` can restore
+        the previous state exactly. Searching with `push_move`/`pop_move`
+        avoids copying the board at every node.
+
+        Calls must be balanced: pop every pushed move before calling
+        `make_move` or `reset` again.
+
+        Args:
+            move: A move that is valid in the current state.
+
+        Raises:
+            NotImplementedError: If the engine does not support the protocol.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support push_move/pop_move")
+
+    def pop_move(self) -> MoveType:
+        """Undo the most recent `push_move` and return the move it applied.
+
+        Returns:
+            The move that was undone.
+
+        Raises:
+            IndexError: If there is no pushed move to undo.
+            NotImplementedError: If the engine does not support the protocol.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support push_move/pop_move")
+
+    def supports_push_pop(self) -> bool:
+        """Return whether the engine implements `push_move` and `pop_move`."""
+        return type(self).push_move is not GameEngine.push_move
+
     def get_state_representation(self) -> Any:
         """Get a serializable representation of the current game state.
 
@@ -14,6 +14,7 @@ from enum import Enum
 from typing import Callable, Iterable, Optional
 
 from games_collection.games.card.common.cards import Card, Deck, Suit
+from games_collection.games.card.common.hand_mask import HandMask
 
 
 class BidSuit(Enum):
@@ -679,15 +680,15 @@ class BridgeGame:
             ``True`` if the card can legally be played, otherwise ``False``.
         """
 
-        if card not in player.hand:
-            return False
+        return card in self._playable_mask(player)
+
+    def _playable_mask(self, player: BridgePlayer) -> HandMask:
+        """Return the cards in ``player``'s hand that may legally be played."""
+
+        hand = HandMask.from_cards(player.hand)
         if not self.current_trick:
-            return True
-        if self.lead_suit is None:
-            return True
-        if any(hand_card.suit == self.lead_suit for hand_card in player.hand):
-            return card.suit == self.lead_suit
-        return True
+            return hand
+        return hand.follow_suit(self.lead_suit)
 
     def play_card(self, player: BridgePlayer, card: Card) -> None:
         """Play a card into the current trick.
@@ -757,7 +758,7 @@ class BridgeGame:
             A list of cards that may legally be played.
         """
 
-        return [card for card in player.hand if self.is_valid_play(player, card)]
+        return self._playable_mask(player).filter(player.hand)
 
     def _lead_card_strategy(self, player: BridgePlayer, valid_cards: list[Card]) -> Card:
         """Select a leading card using a simple heuristic."""
@@ -2,6 +2,8 @@
 
 # Provide convenient access to the core card primitives for consumers of the
 # ``games_collection.games.card.common`` package.
-from .cards import Card, Deck, Suit, format_cards, parse_card
+from .cards import COMPACT_CARDS, Card, CompactCard, Deck, Suit, card_from_id, card_id, format_cards, parse_card
+from .hand_mask import HandMask
+from .melds import MeldSolver
 
-__all__ = ["Card", "Deck", "Suit", "format_cards", "parse_card"]
+__all__ = ["COMPACT_CARDS", "Card", "CompactCard", "Deck", "HandMask", "MeldSolver", "Suit", "card_from_id", "card_id", "format_cards", "parse_card"]
@@ -9,6 +9,9 @@ card games. The module includes:
 - ``RANK_TO_VALUE``: A dictionary mapping each rank to a numerical value.
 - ``Card``: A dataclass representing a single playing card with a rank and suit.
 - ``Deck``: A class for a deck of cards, with methods for shuffling and dealing.
+- ``CompactCard``: An interned, ``__slots__``-based card with precomputed integer
+  attributes for hot loops, plus ``card_id``/``card_from_id`` adapters between
+  ``Card`` objects and integer card ids.
 - ``parse_card``: A function to create a ``Card`` from a two-character string (e.g., "KH" for King of Hearts).
 - ``format_cards``: A utility function to format a collection of cards into a readable string.
 
@@ -113,17 +116,124 @@ class Card:
         """
         return RANK_TO_VALUE[self.rank]
 
+    @property
+    def id(self) -> int:
+        """Integer id of the card in ``0..51`` (see :func:`card_id`)."""
+        return _CARD_IDS[self]
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        """Return a string representation of the card (e.g., "K♠")."""
+        return f"{self.rank}{self.suit.value}"
+
+
+# SUITS fixes the suit order used by integer card ids.
+SUITS: Tuple[Suit, ...] = tuple(Suit)
+
+# CARD_TABLE holds one shared ``Card`` per id. Ids are ``value * 4 + suit index``
+# so that ``id >> 2`` is the rank value and ``id & 3`` the suit index.
+CARD_TABLE: Tuple[Card, ...] = tuple(Card(rank, suit) for rank in RANKS for suit in SUITS)
+_CARD_IDS = {card: index for index, card in enumerate(CARD_TABLE)}
+
+# The conventional new-deck order (suit by suit) expressed as card ids.
+STANDARD_DECK_IDS: Tuple[int, ...] = tuple(value * len(SUITS) + suit for suit in range(len(SUITS)) for value in range(len(RANKS)))
+
+
+def card_id(card: Card) -> int:
+    """Return the integer id (``0``–``51``) of a standard card."""
+    return _CARD_IDS[card]
+
+
+def card_from_id(identifier: int) -> Card:
+    """Return the shared :class:`Card` instance for ``identifier``."""
+    return CARD_TABLE[identifier]
+
+
+class CompactCard:
+    """An interned, allocation-free view of a standard card.
+
+    Exactly 52 instances exist, one per card id, available through
+    :data:`COMPACT_CARDS` or :meth:`from_id`. Every attribute a hot loop might
+    need is precomputed, so reading them costs a slot access rather than a
+    dictionary lookup. Because instances are interned, identity comparison is
+    equivalent to equality.
+
+    Attributes:
+        id (int): Card id ``value * 4 + suit_index``.
+        rank (str): Rank character, as on :class:`Card`.
+        suit (Suit): Suit of the card.
+        value (int): Rank value, as :attr:`Card.value`.
+        suit_index (int): Position of the suit in :data:`SUITS`.
+        bit (int): ``1 << id``; OR these together to build card-set bitmasks.
+        card (Card): The equivalent shared :class:`Card` instance.
+
+    Example:
+        >>> ace = CompactCard.from_card(Card('A', Suit.SPADES))
+        >>> ace.value, ace.suit_index, ace is COMPACT_CARDS[ace.id]
+        (12, 3, True)
+    """
+
+    __slots__ = ("id", "rank", "suit", "value", "suit_index", "bit", "card")
+
+    def __init__(self, identifier: int) -> None:
+        """Create the compact card for ``identifier``; use :meth:`from_id` instead."""
+        card = CARD_TABLE[identifier]
+        self.id = identifier
+        self.rank = card.rank
+        self.suit = card.suit
+        self.value = identifier >> 2
+        self.suit_index = identifier & 3
+        self.bit = 1 << identifier
+        self.card = card
+
+    @staticmethod
+    def from_id(identifier: int) -> "CompactCard":
+        """Return the interned compact card for ``identifier``."""
+        return COMPACT_CARDS[identifier]
+
+    @staticmethod
+    def from_card(card: Card) -> "CompactCard":
+        """Return the interned compact card equivalent to ``card``."""
+        return COMPACT_CARDS[_CARD_IDS[card]]
+
+    def __index__(self) -> int:
+        """Allow compact cards to index lookup tables directly."""
+        return self.id
+
+    def __reduce__(self):
+        """Unpickle to the interned instance rather than a copy."""
+        return CompactCard.from_id, (self.id,)
+
+    def __repr__(self) -> str:  # pragma: no cover - trivial
+        """Return a debug representation (e.g., ``CompactCard('K♠')``)."""
+        return f"CompactCard({str(self)!r})"
+
     def __str__(self) -> str:  # pragma: no cover - trivial
         """Return a string representation of the card (e.g., "K♠")."""
         return f"{self.rank}{self.suit.value}"
 
 
+COMPACT_CARDS: Tuple[CompactCard, ...] = tuple(CompactCard(identifier) for identifier in range(len(CARD_TABLE)))
+
+
+def to_compact(cards: Iterable[Card]) -> list[CompactCard]:
+    """Convert standard cards to their compact equivalents."""
+    return [COMPACT_CARDS[_CARD_IDS[card]] for card in cards]
+
+
+def from_compact(cards: Iterable[CompactCard]) -> list[Card]:
+    """Convert compact cards back to shared :class:`Card` instances."""
+    return [card.card for card in cards]
+
+
 @dataclass
 class Deck:
     """A mutable deck of playing cards.
 
     A ``Deck`` is initialized with a standard 52-card set unless an existing
     list of cards is provided. It supports shuffling and dealing operations.
+    The default cards are the shared instances from :data:`CARD_TABLE`, so
+    building a deck never allocates new ``Card`` objects. Decks can also be
+    built from, and dealt as, integer card ids.
 
     Attributes:
         cards (list[Card]): The list of cards currently in the deck.
@@ -144,7 +254,22 @@ class Deck:
         """Initialize the deck with a standard 52-card set if it's empty."""
         # If no cards are provided, create a standard 52-card deck.
         if not self.cards:
-            self.cards = [Card(rank, suit) for suit in Suit for rank in RANKS]
+            self.cards = [CARD_TABLE[identifier] for identifier in STANDARD_DECK_IDS]
+
+    @classmethod
+    def from_ids(cls, identifiers: Iterable[int]) -> "Deck":
+        """Build a deck whose top-to-bottom order follows ``identifiers``.
+
+        Args:
+            identifiers: Card ids, e.g. a row of a NumPy deal array.
+
+        Returns:
+            A deck holding the shared card instances for those ids.
+        """
+        cards = [CARD_TABLE[identifier] for identifier in identifiers]
+        if not cards:
+            raise ValueError("A deck built from ids needs at least one card")
+        return cls(cards)
 
     def shuffle(self, *, rng=None) -> None:
         """Shuffle the deck in place.
@@ -187,6 +312,18 @@ class Deck:
         dealt, self.cards = self.cards[:count], self.cards[count:]
         return dealt
 
+    def deal_ids(self, count: int = 1) -> list[int]:
+        """Remove ``count`` cards from the top of the deck and return their ids.
+
+        Raises:
+            ValueError: As for :meth:`deal`.
+        """
+        return [_CARD_IDS[card] for card in self.deal(count)]
+
+    def ids(self) -> list[int]:
+        """Return the ids of the cards remaining in the deck, top first."""
+        return [_CARD_IDS[card] for card in self.cards]
+
     def __iter__(self) -> Iterator[Card]:  # pragma: no cover - trivial
         """Return an iterator over the cards in the deck."""
         yield from self.cards
@@ -266,11 +403,20 @@ def format_cards(cards: Iterable[Card]) -> str:
 
 
 __all__ = [
+    "CARD_TABLE",
+    "COMPACT_CARDS",
     "Card",
+    "CompactCard",
     "Deck",
     "Suit",
+    "SUITS",
     "RANKS",
     "RANK_TO_VALUE",
+    "STANDARD_DECK_IDS",
+    "card_from_id",
+    "card_id",
     "format_cards",
+    "from_compact",
     "parse_card",
+    "to_compact",
 ]
@@ -0,0 +1,173 @@
+"""Bitmask card sets for fast trick-taking legality checks.
+
+Trick-taking engines ask the same questions over and over: does this hand hold
+the lead suit, which cards may follow, what is the highest card of a suit?
+Answering them by scanning a ``list[Card]`` costs a pass over the hand per
+question, and ``get_valid_plays`` used to ask once per card.
+
+A :class:`HandMask` stores a set of standard cards as a single integer, one bit
+per card id (see :func:`~games_collection.games.card.common.cards.card_id`).
+Because ids are ``value * 4 + suit index``, each suit occupies every fourth bit
+and bits are ordered by rank, so:
+
+- suit membership is one ``&`` with :data:`SUIT_MASKS`;
+- follow-suit filtering is one ``&`` plus a fallback to the whole hand;
+- the highest and lowest card of a suit are the top and bottom set bits.
+
+Masks are immutable and hashable, which also makes them suitable as keys in
+card-play search. They hold *sets*: games with duplicate cards such as
+Pinochle can still use them for legality, then map the result back onto the
+hand with :meth:`HandMask.filter`, which keeps every copy.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional
+
+from .cards import CARD_TABLE, Card, Suit
+
+# One bit per card id, in id order.
+_CARD_BITS: dict[Card, int] = {card: 1 << index for index, card in enumerate(CARD_TABLE)}
+
+# Bits of every card of a suit: the suit index repeated every fourth bit.
+SUIT_MASKS: dict[Suit, int] = {suit: sum(1 << (value * 4 + index) for value in range(len(CARD_TABLE) // 4)) for index, suit in enumerate(Suit)}
+
+FULL_MASK = (1 << len(CARD_TABLE)) - 1
+
+
+def card_bit(card: Card) -> int:
+    """Return the single-bit mask of ``card``."""
+    return _CARD_BITS[card]
+
+
+class HandMask:
+    """An immutable set of standard cards packed into one integer.
+
+    Example:
+        >>> hand = HandMask.from_cards([Card('2', Suit.CLUBS), Card('K', Suit.CLUBS), Card('A', Suit.HEARTS)])
+        >>> hand.has_suit(Suit.SPADES), str(hand.highest(Suit.CLUBS))
+        (False, 'K♣')
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: int = 0) -> None:
+        """Wrap ``bits``, an integer with one bit per card id."""
+        self.bits = bits
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[Card]) -> "HandMask":
+        """Build a mask from ``cards``; duplicates collapse to one bit."""
+        bits = 0
+        for card in cards:
+            bits |= _CARD_BITS[card]
+        return cls(bits)
+
+    @classmethod
+    def from_ids(cls, identifiers: Iterable[int]) -> "HandMask":
+        """Build a mask from integer card ids."""
+        bits = 0
+        for identifier in identifiers:
+            bits |= 1 << identifier
+        return cls(bits)
+
+    # ------------------------------------------------------------------
+    # Set operations
+    # ------------------------------------------------------------------
+    def with_card(self, card: Card) -> "HandMask":
+        """Return a copy of the mask with ``card`` added."""
+        return HandMask(self.bits | _CARD_BITS[card])
+
+    def without_card(self, card: Card) -> "HandMask":
+        """Return a copy of the mask with ``card`` removed."""
+        return HandMask(self.bits & ~_CARD_BITS[card])
+
+    def __or__(self, other: "HandMask") -> "HandMask":
+        return HandMask(self.bits | other.bits)
+
+    def __and__(self, other: "HandMask") -> "HandMask":
+        return HandMask(self.bits & other.bits)
+
+    def __sub__(self, other: "HandMask") -> "HandMask":
+        return HandMask(self.bits & ~other.bits)
+
+    def __contains__(self, card: object) -> bool:
+        bit = _CARD_BITS.get(card) if isinstance(card, Card) else None
+        return bit is not None and bool(self.bits & bit)
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __iter__(self) -> Iterator[Card]:
+        """Yield the cards in ascending id order (lowest rank first)."""
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield CARD_TABLE[low.bit_length() - 1]
+            bits ^= low
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, HandMask) and self.bits == other.bits
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:  # pragma: no cover - trivial
+        return f"HandMask({' '.join(str(card) for card in self)})"
+
+    # ------------------------------------------------------------------
+    # Trick-taking queries
+    # ------------------------------------------------------------------
+    def has_suit(self, suit: Suit) -> bool:
+        """Return whether the mask holds any card of ``suit``."""
+        return bool(self.bits & SUIT_MASKS[suit])
+
+    def only_suit(self, suit: Suit) -> bool:
+        """Return whether every card in the mask belongs to ``suit``."""
+        return not self.bits & ~SUIT_MASKS[suit]
+
+    def suit(self, suit: Suit) -> "HandMask":
+        """Return the cards of ``suit``."""
+        return HandMask(self.bits & SUIT_MASKS[suit])
+
+    def count_suit(self, suit: Suit) -> int:
+        """Return how many cards of ``suit`` the mask holds."""
+        return bin(self.bits & SUIT_MASKS[suit]).count("1")
+
+    def follow_suit(self, lead_suit: Optional[Suit]) -> "HandMask":
+        """Return the cards that may follow ``lead_suit`` under follow-suit rules.
+
+        That is the cards of the lead suit when any are held, and otherwise the
+        whole mask. ``None`` (no lead yet) also returns the whole mask.
+        """
+        if lead_suit is None:
+            return self
+        in_suit = self.bits & SUIT_MASKS[lead_suit]
+        return HandMask(in_suit) if in_suit else self
+
+    def highest(self, suit: Optional[Suit] = None) -> Optional[Card]:
+        """Return the highest-ranked card, optionally restricted to ``suit``.
+
+        Ties in rank across suits resolve to the later suit in :class:`Suit`.
+        """
+        bits = self.bits if suit is None else self.bits & SUIT_MASKS[suit]
+        return CARD_TABLE[bits.bit_length() - 1] if bits else None
+
+    def lowest(self, suit: Optional[Suit] = None) -> Optional[Card]:
+        """Return the lowest-ranked card, optionally restricted to ``suit``.
+
+        Ties in rank across suits resolve to the earlier suit in :class:`Suit`.
+        """
+        bits = self.bits if suit is None else self.bits & SUIT_MASKS[suit]
+        return CARD_TABLE[(bits & -bits).bit_length() - 1] if bits else None
+
+    def filter(self, cards: Iterable[Card]) -> list[Card]:
+        """Return the members of ``cards`` that are in the mask, keeping order and duplicates."""
+        bits = self.bits
+        return [card for card in cards if bits & _CARD_BITS[card]]
+
+
+__all__ = ["FULL_MASK", "SUIT_MASKS", "HandMask", "card_bit"]
@@ -0,0 +1,222 @@
+"""Bitmask meld solver for rummy-style games.
+
+Rummy variants need the same answer again and again: which sets (three or four
+cards of a rank) and runs (three or more consecutive cards of a suit) leave the
+least deadwood? Trying every combination of candidate melds is exponential in
+the number of candidates, and the AI asks once for every possible discard and
+draw.
+
+:class:`MeldSolver` instead stores a hand as a card-id bitmask (see
+:mod:`games_collection.games.card.common.hand_mask`) and searches over the
+*remaining cards*: the lowest remaining card either becomes deadwood or starts
+one of the few melds that contain it. Because ids are ``value * 4 + suit
+index``, that card is always the lowest card of its run, so the branches are
+cheap to enumerate. Sub-results are memoized by mask, which turns the search
+into dynamic programming over sub-hands, and two bounds prune it:
+
+- cards that cannot belong to any meld are deadwood in every plan and are
+  stripped before searching;
+- leaving a card as deadwood costs at least its own value, so that branch is
+  skipped once a meld branch already does better.
+
+The memo is a bounded LRU shared by every call on the same solver. Consecutive
+turns differ by a card or two, so most sub-hands of the next query have already
+been solved.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+from .cards import CARD_TABLE, RANKS, Card
+from .hand_mask import card_bit
+
+_RANK_COUNT = len(RANKS)
+
+# Whether a rank's four suit bits hold at least three cards.
+_SET_RANKS = [bin(nibble).count("1") >= 3 for nibble in range(16)]
+
+
+@dataclass(frozen=True)
+class MeldPlan:
+    """The best meld arrangement found for a set of cards.
+
+    Attributes:
+        melds: One card-id bitmask per meld, ordered by their lowest card.
+        deadwood: Bitmask of the cards left out of every meld.
+        deadwood_points: Total value of the deadwood cards.
+    """
+
+    melds: tuple[int, ...]
+    deadwood: int
+    deadwood_points: int
+
+    @property
+    def meld_cards(self) -> list[list[Card]]:
+        """Return each meld's cards in ascending id order."""
+        return [mask_to_cards(meld) for meld in self.melds]
+
+    @property
+    def deadwood_cards(self) -> list[Card]:
+        """Return the deadwood cards in ascending id order."""
+        return mask_to_cards(self.deadwood)
+
+
+def mask_to_cards(mask: int) -> list[Card]:
+    """Return the cards of ``mask`` in ascending id order."""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(CARD_TABLE[low.bit_length() - 1])
+        mask ^= low
+    return cards
+
+
+def cards_to_mask(cards: Iterable[Card]) -> int:
+    """Return the bitmask of ``cards``, raising :class:`ValueError` on duplicates."""
+    mask = 0
+    for card in cards:
+        bit = card_bit(card)
+        if mask & bit:
+            raise ValueError(f"Duplicate card {card} cannot be melded from a single deck.")
+        mask |= bit
+    return mask
+
+
+def _melds_with_lowest(mask: int, card: int) -> list[int]:
+    """Return every meld in ``mask`` whose lowest card id is ``card``, longest runs first."""
+    value, suit = divmod(card, 4)
+    melds = []
+
+    # Runs: ``card`` is the bottom of any run through it, so extend upwards.
+    run = 1 << card
+    length = 1
+    for higher in range(value + 1, _RANK_COUNT):
+        bit = 1 << (higher * 4 + suit)
+        if not mask & bit:
+            break
+        run |= bit
+        length += 1
+        if length >= 3:
+            melds.append(run)
+    melds.reverse()
+
+    # Sets: ``card`` plus two or three higher suits of the same rank.
+    partners = [1 << (value * 4 + other) for other in range(suit + 1, 4) if mask >> (value * 4 + other) & 1]
+    if len(partners) == 3:
+        melds.insert(0, (1 << card) | partners[0] | partners[1] | partners[2])
+    for first in range(len(partners)):
+        for second in range(first + 1, len(partners)):
+            melds.append((1 << card) | partners[first] | partners[second])
+    return melds
+
+
+class MeldSolver:
+    """Minimize deadwood over sets and runs for a fixed card-value table.
+
+    Every three- or four-card subset of a rank counts as a set, so a
+    four-of-a-kind can lend one card to a run. Runs rank aces high, matching
+    :data:`~games_collection.games.card.common.cards.RANK_TO_VALUE`. When plans
+    tie on deadwood the one with more melds wins.
+
+    Example:
+        >>> solver = MeldSolver(tuple(range(2, 15)))
+        >>> plan = solver.solve(parse_card(code) for code in "4H 5H 6H 7C 7D 7H 9S".split())
+        >>> plan.deadwood_points
+        9
+    """
+
+    def __init__(self, values: Sequence[int], *, cache_size: int = 50_000) -> None:
+        """Create a solver.
+
+        Args:
+            values: Deadwood value of each rank, in :data:`RANKS` order.
+            cache_size: Maximum number of sub-hand results to remember.
+        """
+        if len(values) != _RANK_COUNT:
+            raise ValueError(f"Expected {_RANK_COUNT} rank values, got {len(values)}.")
+        self.values = tuple(values)
+        self.cache_size = cache_size
+        self._card_values = [self.values[card >> 2] for card in range(len(CARD_TABLE))]
+        # mask -> (deadwood points, meld count, meld taken with the lowest card or 0)
+        self._cache: OrderedDict[int, tuple[int, int, int]] = OrderedDict()
+
+    def value(self, card: Card) -> int:
+        """Return the deadwood value of ``card``."""
+        return self._card_values[card_bit(card).bit_length() - 1]
+
+    def solve(self, cards: Iterable[Card]) -> MeldPlan:
+        """Return the plan with the least deadwood for ``cards``."""
+        return self.solve_mask(cards_to_mask(cards))
+
+    def solve_mask(self, mask: int) -> MeldPlan:
+        """Return the plan with the least deadwood for a card-id bitmask."""
+        # Bottoms of three-card runs sit four and eight bits below their peers.
+        bottoms = mask & mask >> 4 & mask >> 8
+        meldable = bottoms | bottoms << 4 | bottoms << 8
+        for value in range(_RANK_COUNT):
+            if _SET_RANKS[mask >> (value * 4) & 15]:
+                meldable |= 15 << (value * 4) & mask
+
+        melds = []
+        deadwood = mask & ~meldable
+        remaining = meldable
+        while remaining:
+            _, _, meld = self._best(remaining)
+            if meld:
+                melds.append(meld)
+                remaining ^= meld
+            else:
+                low = remaining & -remaining
+                deadwood |= low
+                remaining ^= low
+        points = sum(self._card_values[card.bit_length() - 1] for card in _bits(deadwood))
+        return MeldPlan(tuple(melds), deadwood, points)
+
+    def _best(self, mask: int) -> tuple[int, int, int]:
+        """Return ``(deadwood, meld count, first meld)`` for ``mask``, memoized."""
+        if not mask:
+            return (0, 0, 0)
+        cache = self._cache
+        cached = cache.get(mask)
+        if cached is not None:
+            cache.move_to_end(mask)
+            return cached
+
+        low = mask & -mask
+        card = low.bit_length() - 1
+        best_deadwood, best_count, best_meld = None, 0, 0
+        for meld in _melds_with_lowest(mask, card):
+            deadwood, count, _ = self._best(mask ^ meld)
+            if best_deadwood is None or deadwood < best_deadwood or (deadwood == best_deadwood and count + 1 > best_count):
+                best_deadwood, best_count, best_meld = deadwood, count + 1, meld
+
+        card_value = self._card_values[card]
+        if best_deadwood is None or best_deadwood >= card_value:
+            deadwood, count, _ = self._best(mask ^ low)
+            deadwood += card_value
+            if best_deadwood is None or deadwood < best_deadwood or (deadwood == best_deadwood and count > best_count):
+                best_deadwood, best_count, best_meld = deadwood, count, 0
+
+        result = (best_deadwood, best_count, best_meld)
+        cache[mask] = result
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """Forget every remembered sub-hand."""
+        self._cache.clear()
+
+
+def _bits(mask: int) -> Iterable[int]:
+    """Yield the single-bit masks set in ``mask``."""
+    while mask:
+        low = mask & -mask
+        yield low
+        mask ^= low
+
+
+__all__ = ["MeldPlan", "MeldSolver", "cards_to_mask", "mask_to_cards"]
@@ -0,0 +1,394 @@
+"""Determinized Monte Carlo card-play search for trick-taking games.
+
+The single-ply heuristics used by the trick-taking engines only look at the
+current trick. This module implements *perfect information Monte Carlo*
+(PIMC) search instead:
+
+1. **Determinize**: deal the cards the searching player cannot see to the other
+   seats, consistent with everything observed so far: hand sizes, suits a
+   player is known to be void in (they failed to follow suit) and cards known
+   to sit in a particular hand (for example cards passed in Hearts).
+2. **Roll out**: in each sampled deal, try every legal card and play the rest
+   of the hand out with a fast game-specific policy.
+3. **Aggregate**: average each candidate's payoff across samples and pick the
+   best card.
+
+Everything runs on the integer card ids and bitmasks of
+:mod:`~games_collection.games.card.common.hand_mask`, so a rollout never
+allocates ``Card`` objects. Game rules and payoffs are supplied by a
+:class:`TrickRules` subclass; Hearts and Spades define theirs next to their
+engines.
+
+Search effort is bounded both by a sample count and by a per-move time budget
+(:class:`SearchSettings`). Samples can be spread across worker processes, each
+running an independently seeded stream under the same budget.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+from games_collection.core.ai_strategy import difficulty_preset
+
+from .hand_mask import SUIT_MASKS
+
+# Suit masks indexed by card-id suit index (``card_id & 3``).
+SUIT_BITS: tuple[int, ...] = tuple(SUIT_MASKS.values())
+
+# Attempts at a constraint-respecting deal before void constraints are dropped.
+_DEAL_ATTEMPTS = 50
+
+
+def popcount(bits: int) -> int:
+    """Return the number of cards in a bitmask."""
+    return bin(bits).count("1")
+
+
+def highest(bits: int) -> int:
+    """Return the card id of the highest-ranked card in a non-empty mask."""
+    return bits.bit_length() - 1
+
+
+def lowest(bits: int) -> int:
+    """Return the card id of the lowest-ranked card in a non-empty mask."""
+    return (bits & -bits).bit_length() - 1
+
+
+def mask_cards(bits: int) -> list[int]:
+    """Return the card ids in ``bits`` in ascending order."""
+    cards = []
+    while bits:
+        low = bits & -bits
+        cards.append(low.bit_length() - 1)
+        bits ^= low
+    return cards
+
+
+@dataclass(frozen=True)
+class SearchSettings:
+    """Effort limits for one card-play decision.
+
+    Attributes:
+        samples: Maximum number of determinized deals to evaluate.
+        time_budget: Wall-clock budget per decision, in seconds. At least one
+            sample is always evaluated.
+        workers: Worker processes to spread samples across. ``None`` uses every
+            available CPU and ``1`` keeps the search in-process.
+    """
+
+    samples: int = 32
+    time_budget: float = 0.25
+    workers: Optional[int] = 1
+
+    @classmethod
+    def for_difficulty(cls, difficulty: str) -> "SearchSettings":
+        """Build settings from a :data:`SEARCH_DIFFICULTIES` entry; unknown names raise ``ValueError``."""
+        return cls(**difficulty_preset(SEARCH_DIFFICULTIES, difficulty, "trick search"))
+
+
+# Deals sampled per card and seconds allowed per decision; only the hard preset
+# spreads its samples over worker processes.
+SEARCH_DIFFICULTIES: dict[str, dict[str, Any]] = {
+    "easy": {"samples": 8, "time_budget": 0.05},
+    "medium": {"samples": 32, "time_budget": 0.25},
+    "hard": {"samples": 128, "time_budget": 1.0, "workers": None},
+}
+
+
+@dataclass
+class TrickState:
+    """A fully specified (determinized) trick-taking position.
+
+    Attributes:
+        hands: Card mask held by each seat.
+        won: Card mask captured in tricks by each seat.
+        tricks: Number of tricks taken by each seat.
+        trick: ``(seat, card id)`` pairs played to the current trick.
+        leader: Seat that leads (or led) the current trick.
+        broken: Whether the restricted lead suit has been broken.
+        first_trick: Whether the current trick is the first of the hand.
+    """
+
+    hands: list[int]
+    won: list[int]
+    tricks: list[int]
+    trick: list[tuple[int, int]] = field(default_factory=list)
+    leader: int = 0
+    broken: bool = False
+    first_trick: bool = False
+
+    @property
+    def to_play(self) -> int:
+        """Seat whose turn it is."""
+        return (self.leader + len(self.trick)) % len(self.hands)
+
+    def copy(self) -> "TrickState":
+        """Return an independent copy of the position."""
+        return TrickState(list(self.hands), list(self.won), list(self.tricks), list(self.trick), self.leader, self.broken, self.first_trick)
+
+
+@dataclass
+class Observation:
+    """What the searching seat knows about the cards it cannot see.
+
+    Attributes:
+        unseen: Cards that are neither in the searcher's hand nor played.
+        hand_sizes: Number of cards held by each seat.
+        voids: Per-seat bitmask of suit indices the seat is known to lack.
+        known: Per-seat mask of unseen cards known to be in that seat's hand.
+    """
+
+    unseen: int
+    hand_sizes: list[int]
+    voids: list[int]
+    known: list[int]
+
+
+class TrickRules:
+    """Rules, rollout policy and payoff of a trick-taking game.
+
+    Subclasses set the class attributes and implement :meth:`rollout_card` and
+    :meth:`payoff`. Instances are sent to worker processes, so they must be
+    picklable.
+
+    Attributes:
+        trump: Suit index of the trump suit, or ``None``.
+        restricted_lead: Suit index that may not be led until broken unless
+            nothing else is held, or ``None``.
+        breaking_cards: Cards whose play breaks the restricted suit.
+        opening_card: Card id that must lead the first trick, or ``None``.
+        first_trick_forbidden: Cards that may not be discarded on the first
+            trick while the player holds anything else.
+    """
+
+    trump: Optional[int] = None
+    restricted_lead: Optional[int] = None
+    breaking_cards: int = 0
+    opening_card: Optional[int] = None
+    first_trick_forbidden: int = 0
+
+    def legal(self, state: TrickState, seat: int) -> int:
+        """Return the mask of cards ``seat`` may play."""
+        hand = state.hands[seat]
+        if not state.trick:
+            if state.first_trick and self.opening_card is not None:
+                # A determinized deal may hand the opening card elsewhere;
+                # never leave the leader without a move.
+                return hand & (1 << self.opening_card) or hand
+            if self.restricted_lead is not None and not state.broken:
+                return hand & ~SUIT_BITS[self.restricted_lead] or hand
+            return hand
+        in_suit = hand & SUIT_BITS[state.trick[0][1] & 3]
+        if in_suit:
+            return in_suit
+        if state.first_trick and self.first_trick_forbidden:
+            return hand & ~self.first_trick_forbidden or hand
+        return hand
+
+    def trick_winner(self, trick: Sequence[tuple[int, int]]) -> tuple[int, int]:
+        """Return the ``(seat, card id)`` currently winning ``trick``."""
+        lead = trick[0][1] & 3
+        best_seat, best_card = trick[0]
+        best_trump = best_card & 3 == self.trump
+        for seat, card in trick[1:]:
+            suit = card & 3
+            if suit == self.trump:
+                if not best_trump or card > best_card:
+                    best_seat, best_card, best_trump = seat, card, True
+            elif not best_trump and suit == lead and card > best_card:
+                best_seat, best_card = seat, card
+        return best_seat, best_card
+
+    def play(self, state: TrickState, card: int) -> None:
+        """Play ``card`` for the seat to move, resolving the trick when complete."""
+        seat = state.to_play
+        bit = 1 << card
+        state.hands[seat] &= ~bit
+        state.trick.append((seat, card))
+        if bit & self.breaking_cards:
+            state.broken = True
+        if len(state.trick) == len(state.hands):
+            winner, _ = self.trick_winner(state.trick)
+            for _, played in state.trick:
+                state.won[winner] |= 1 << played
+            state.tricks[winner] += 1
+            state.trick = []
+            state.leader = winner
+            state.first_trick = False
+
+    def rollout_card(self, state: TrickState, seat: int, legal: int, rng: random.Random) -> int:
+        """Choose the card ``seat`` plays during a rollout. Defaults to random."""
+        return rng.choice(mask_cards(legal))
+
+    def payoff(self, state: TrickState, seat: int) -> float:
+        """Return the value of a finished hand from ``seat``'s perspective."""
+        raise NotImplementedError
+
+    def rollout(self, state: TrickState, rng: random.Random) -> None:
+        """Play ``state`` out to the end of the hand in place."""
+        while any(state.hands):
+            seat = state.to_play
+            self.play(state, self.rollout_card(state, seat, self.legal(state, seat), rng))
+
+
+def deal_hidden(observation: Observation, searcher: int, own_hand: int, rng: random.Random) -> list[int]:
+    """Deal the unseen cards to the other seats, consistent with ``observation``.
+
+    Known cards are placed first; the rest go, most constrained first, to a
+    random seat with room that is not known to be void in the card's suit.
+    If repeated attempts cannot honour every void (which only happens when the
+    observations are inconsistent), voids are ignored.
+
+    Returns:
+        The hand mask of every seat, with ``own_hand`` at ``searcher``.
+    """
+    seats = [seat for seat in range(len(observation.hand_sizes)) if seat != searcher]
+    placed = 0
+    for seat in seats:
+        placed |= observation.known[seat]
+    free = mask_cards(observation.unseen & ~placed)
+
+    for attempt in range(_DEAL_ATTEMPTS + 1):
+        honour_voids = attempt < _DEAL_ATTEMPTS
+        hands = list(observation.known)
+        hands[searcher] = own_hand
+        room = {seat: observation.hand_sizes[seat] - popcount(observation.known[seat]) for seat in seats}
+
+        def eligible(card: int) -> list[int]:
+            return [seat for seat in seats if room[seat] > 0 and not (honour_voids and observation.voids[seat] >> (card & 3) & 1)]
+
+        rng.shuffle(free)
+        order = sorted(free, key=lambda card: len(eligible(card)))
+        for card in order:
+            options = eligible(card)
+            if not options:
+                break
+            seat = rng.choices(options, weights=[room[option] for option in options])[0]
+            hands[seat] |= 1 << card
+            room[seat] -= 1
+        else:
+            return hands
+    raise ValueError("Observed hand sizes do not match the unseen cards")
+
+
+def search_stream(
+    rules: TrickRules,
+    root: TrickState,
+    observation: Observation,
+    samples: int,
+    time_budget: float,
+    seed: int,
+) -> tuple[dict[int, float], int]:
+    """Evaluate up to ``samples`` determinizations of ``root``.
+
+    This is also the task function submitted to worker processes.
+
+    Returns:
+        The summed payoff of each candidate card and the number of samples
+        evaluated.
+    """
+    deadline = time.perf_counter() + time_budget
+    rng = random.Random(seed)
+    searcher = root.to_play
+    candidates = mask_cards(rules.legal(root, searcher))
+    totals = dict.fromkeys(candidates, 0.0)
+    completed = 0
+    while completed < samples and (completed == 0 or time.perf_counter() < deadline):
+        deal = root.copy()
+        deal.hands = deal_hidden(observation, searcher, root.hands[searcher], rng)
+        for card in candidates:
+            line = deal.copy()
+            rules.play(line, card)
+            rules.rollout(line, rng)
+            totals[card] += rules.payoff(line, searcher)
+        completed += 1
+    return totals, completed
+
+
+class TrickSearch:
+    """PIMC card-play search with an optional, lazily started process pool.
+
+    The pool is created the first time a search runs with more than one
+    worker and is reused until :meth:`close`. Searches can also be used as
+    context managers.
+    """
+
+    def __init__(self, settings: Optional[SearchSettings] = None, *, rng: Optional[random.Random] = None) -> None:
+        """Create a search bound to ``settings`` without starting any workers."""
+        self.settings = settings or SearchSettings()
+        self.rng = rng or random.Random()
+        self._executor: Optional[Executor] = None
+
+    @property
+    def workers(self) -> int:
+        """Number of sample streams run per decision."""
+        return max(1, self.settings.workers or os.cpu_count() or 1)
+
+    def choose(self, rules: TrickRules, root: TrickState, observation: Observation) -> int:
+        """Return the card id with the best average payoff for the seat to move."""
+        legal = rules.legal(root, root.to_play)
+        if legal & (legal - 1) == 0:
+            return highest(legal)
+
+        samples = self.settings.samples
+        workers = min(self.workers, samples)
+        streams = [(samples * (index + 1) // workers - samples * index // workers, self.rng.getrandbits(64)) for index in range(workers)]
+        results = None
+        if workers > 1:
+            try:
+                executor = self._ensure_executor()
+                futures = [executor.submit(search_stream, rules, root, observation, count, self.settings.time_budget, seed) for count, seed in streams]
+                results = [future.result() for future in futures]
+            except KeyboardInterrupt:  # pragma: no cover - propagate interrupts
+                raise
+            except Exception:
+                # A broken pool should not cost the bot its move.
+                self.close()
+        if results is None:
+            results = [search_stream(rules, root, observation, self.settings.samples, self.settings.time_budget, streams[0][1])]
+
+        totals: dict[int, float] = {}
+        for stream_totals, _ in results:
+            for card, value in stream_totals.items():
+                totals[card] = totals.get(card, 0.0) + value
+        # Every stream evaluates every candidate per sample, so sums rank like averages.
+        return max(sorted(totals), key=totals.__getitem__)
+
+    def close(self) -> None:
+        """Stop the worker processes. The pool restarts lazily if reused."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _ensure_executor(self) -> Executor:
+        """Start the worker processes if they are not running yet."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def __enter__(self) -> "TrickSearch":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = [
+    "SEARCH_DIFFICULTIES",
+    "Observation",
+    "SearchSettings",
+    "TrickRules",
+    "TrickSearch",
+    "TrickState",
+    "deal_hidden",
+    "highest",
+    "lowest",
+    "mask_cards",
+    "popcount",
+    "search_stream",
+]
@@ -7,14 +7,13 @@ card to play during the pegging phase.
 
 from __future__ import annotations
 
+from collections import Counter
 from itertools import combinations
-from statistics import mean
+from math import comb
 from typing import Sequence
 
-MAX_STARTER_SAMPLES = 20
-MAX_CRIB_COMBOS = 200
-
 from games_collection.games.card.common.cards import Card
+from games_collection.games.card.cribbage import scoring
 from games_collection.games.card.cribbage.game import CribbageGame
 
 
@@ -23,12 +22,14 @@ def select_discards(hand: Sequence[Card], is_dealer: bool, deck_cards: Sequence[
 
     This function evaluates all possible pairs of cards to discard, calculating
     the expected score of the remaining hand and the expected value of the
-    crib (either positive or negative, depending on who is the dealer).
+    crib (either positive or negative, depending on who is the dealer). Both
+    expectations are exact: every starter and every pair of opponent discards
+    drawn from ``deck_cards`` is accounted for.
 
     Args:
         hand: The player's current 6-card hand.
         is_dealer: True if the player is the dealer.
-        deck_cards: The remaining cards in the deck to sample from.
+        deck_cards: The cards the player cannot see (the rest of the deck).
 
     Returns:
         A list containing the two cards selected for discard.
@@ -100,34 +101,67 @@ def choose_pegging_card(game: CribbageGame, player: int) -> Card | None:
 
 
 def _expected_hand_score(hand: Sequence[Card], deck_cards: Sequence[Card]) -> float:
-    """Calculate the expected score of a hand by sampling starter cards."""
+    """Calculate the exact expected score of a hand over every possible starter."""
     if not deck_cards:
         return 0.0
+    if len(hand) != 4:
+        return sum(CribbageGame.score_hand_static(hand, starter) for starter in deck_cards) / len(deck_cards)
 
-    starters = deck_cards[:MAX_STARTER_SAMPLES]
-    scores = [CribbageGame.score_hand_static(hand, starter) for starter in starters]
-    return mean(scores) if scores else 0.0
+    table = scoring.rank_scores()
+    key = scoring.rank_key(hand)
+    total = 0
+    for starter in deck_cards:
+        total += table[key + scoring.RANK_KEYS[starter.rank]] + scoring.flush_points(hand, starter, False) + scoring.nobs_points(hand, starter)
+    return total / len(deck_cards)
 
 
 def _expected_crib_score(discard: Sequence[Card], deck_cards: Sequence[Card]) -> float:
-    """Calculate the expected score of a crib by sampling opponent discards."""
-    if len(deck_cards) < 3:
-        return 0.0
-
-    crib_scores: list[float] = []
-    # To avoid performance issues, limit the number of combinations to check
-    combo_iter = combinations(deck_cards, 2)
-    for i, opp_discards in enumerate(combo_iter):
-        if i >= MAX_CRIB_COMBOS:
-            break
+    """Calculate the exact expected crib score over every starter and opponent discard.
 
-        remaining_deck = [c for c in deck_cards if c not in opp_discards]
-        starters = remaining_deck[:MAX_STARTER_SAMPLES]
-        if not starters:
-            continue
-
-        crib_cards = list(discard) + list(opp_discards)
-        for starter in starters:
-            crib_scores.append(CribbageGame.score_hand_static(crib_cards, starter, is_crib=True))
+    The opponent is assumed to discard any two of the remaining cards with
+    equal probability. Fifteens, pairs and runs only depend on ranks, so the
+    outcomes are grouped by the ranks of the starter and the opponent's pair;
+    flushes and nobs are counted from suit totals.
+    """
+    cards = len(deck_cards)
+    if cards < 3 or len(discard) != 2:
+        return 0.0
 
-    return mean(crib_scores) if crib_scores else 0.0
+    table = scoring.rank_scores()
+    base = scoring.rank_key(discard)
+    counts = Counter(card.rank for card in deck_cards)
+    ranks = sorted(counts, key=scoring.RANK_KEYS.__getitem__)
+
+    total = 0
+    for starter_rank in ranks:
+        starter_ways = counts[starter_rank]
+        counts[starter_rank] -= 1
+        starter_key = base + scoring.RANK_KEYS[starter_rank]
+        for index, first in enumerate(ranks):
+            first_count = counts[first]
+            if not first_count:
+                continue
+            pair_key = starter_key + scoring.RANK_KEYS[first]
+            if first_count > 1:
+                total += starter_ways * comb(first_count, 2) * table[pair_key + scoring.RANK_KEYS[first]]
+            for second in ranks[index + 1 :]:
+                if counts[second]:
+                    total += starter_ways * first_count * counts[second] * table[pair_key + scoring.RANK_KEYS[second]]
+        counts[starter_rank] += 1
+
+    suit_counts = Counter(card.suit for card in deck_cards)
+    first, second = discard
+    if first.suit == second.suit:
+        # A crib flush needs both opponent discards and the starter in the suit.
+        suited = suit_counts[first.suit]
+        total += 5 * suited * comb(max(suited - 1, 0), 2)
+    pairs = comb(cards - 1, 2)
+    for card in discard:
+        if card.rank == "J":
+            total += suit_counts[card.suit] * pairs
+    for card in deck_cards:
+        if card.rank == "J":
+            # Starter of the jack's suit (other than the jack) and a pair containing the jack.
+            total += (suit_counts[card.suit] - 1) * (cards - 2)
+
+    return total / (cards * pairs)
@@ -22,6 +22,7 @@ from random import Random
 from typing import Any, Optional, Sequence
 
 from games_collection.games.card.common.cards import RANK_TO_VALUE, Card, Deck
+from games_collection.games.card.cribbage import scoring
 
 
 class GamePhase(Enum):
@@ -273,7 +274,13 @@ class CribbageGame:
 
     @classmethod
     def score_hand_static(cls, hand: Sequence[Card], starter: Card, is_crib: bool = False) -> int:
-        """Calculate the score for a given hand and starter card."""
+        """Calculate the score for a given hand and starter card.
+
+        Regular four-card hands and cribs are scored with the precomputed
+        rank table in :mod:`.scoring`; other sizes are counted directly.
+        """
+        if len(hand) == 4:
+            return scoring.show_score(hand, starter, is_crib)
         all_cards = list(hand) + [starter]
         points = 0
         points += cls._score_fifteens(all_cards)
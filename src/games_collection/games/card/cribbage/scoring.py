@@ -0,0 +1,95 @@
+"""Table-driven scoring for cribbage shows.
+
+Fifteens, pairs and runs depend only on the *ranks* of the five cards in a
+show (four-card hand or crib plus the starter), never on their suits. There are
+only 6,175 distinct five-card rank multisets, so their combined score is
+precomputed once into :data:`RANK_SCORES`; flushes and nobs, the only
+suit-dependent items, are scored separately.
+
+A rank multiset is keyed by the sum of ``5 ** rank_index`` over its cards (no
+rank appears more than four times), so keys can be built incrementally: a
+hand's key plus the starter's :data:`RANK_KEYS` entry is the key of the show.
+"""
+
+from __future__ import annotations
+
+from itertools import combinations, combinations_with_replacement
+from typing import Sequence
+
+from games_collection.games.card.common.cards import RANKS, Card
+
+# Multiset key contribution of one card of each rank.
+RANK_KEYS: dict[str, int] = {rank: 5**index for index, rank in enumerate(RANKS)}
+
+# Pegging/fifteen value of each rank: ace is one, tens and faces are ten.
+PIP_VALUES: dict[str, int] = {rank: 1 if rank == "A" else min(10, index + 2) for index, rank in enumerate(RANKS)}
+
+_PAIR_POINTS = (0, 0, 2, 6, 12)
+
+# Combined fifteens, pairs and runs of every five-card rank multiset; see
+# :func:`rank_scores`.
+RANK_SCORES: dict[int, int] = {}
+
+
+def rank_key(cards: Sequence[Card]) -> int:
+    """Return the rank-multiset key of ``cards``."""
+    return sum(RANK_KEYS[card.rank] for card in cards)
+
+
+def _score_ranks(ranks: Sequence[int]) -> int:
+    """Score fifteens, pairs and runs for rank indices (ordered as :data:`RANKS`)."""
+    pips = [PIP_VALUES[RANKS[rank]] for rank in ranks]
+    points = 0
+    for size in range(2, len(pips) + 1):
+        points += 2 * sum(1 for combo in combinations(pips, size) if sum(combo) == 15)
+
+    for rank in set(ranks):
+        points += _PAIR_POINTS[ranks.count(rank)]
+
+    # Longest chain of consecutive distinct ranks, counted once.
+    distinct = sorted(set(ranks))
+    longest = current = 1
+    for previous, rank in zip(distinct, distinct[1:]):
+        current = current + 1 if rank == previous + 1 else 1
+        longest = max(longest, current)
+    if longest >= 3:
+        points += longest
+    return points
+
+
+def rank_scores() -> dict[int, int]:
+    """Return :data:`RANK_SCORES`, building it on first use."""
+    if not RANK_SCORES:
+        for ranks in combinations_with_replacement(range(len(RANKS)), 5):
+            if any(ranks.count(rank) > 4 for rank in set(ranks)):
+                continue
+            RANK_SCORES[sum(5**rank for rank in ranks)] = _score_ranks(ranks)
+    return RANK_SCORES
+
+
+def flush_points(hand: Sequence[Card], starter: Card, is_crib: bool) -> int:
+    """Score a flush: four for a hand flush, five when the starter matches.
+
+    A crib only scores a flush when all five cards share a suit.
+    """
+    if len(hand) < 4:
+        return 0
+    suit = hand[0].suit
+    if any(card.suit != suit for card in hand):
+        return 0
+    if starter.suit == suit:
+        return 5
+    return 0 if is_crib else 4
+
+
+def nobs_points(hand: Sequence[Card], starter: Card) -> int:
+    """Score one for holding the jack of the starter's suit."""
+    return 1 if any(card.rank == "J" and card.suit == starter.suit for card in hand) else 0
+
+
+def show_score(hand: Sequence[Card], starter: Card, is_crib: bool = False) -> int:
+    """Score a four-card hand or crib with its starter via the lookup table."""
+    return rank_scores()[rank_key(hand) + RANK_KEYS[starter.rank]] + flush_points(hand, starter, is_crib) + nobs_points(hand, starter)
+
+
+__all__ = ["PIP_VALUES", "RANK_KEYS", "RANK_SCORES", "flush_points", "nobs_points", "rank_key", "rank_scores", "show_score"]
@@ -21,6 +21,7 @@ from random import Random
 from typing import Optional
 
 from games_collection.games.card.common.cards import RANK_TO_VALUE, Card, Suit
+from games_collection.games.card.common.hand_mask import SUIT_MASKS, HandMask, card_bit
 
 
 class GamePhase(Enum):
@@ -212,10 +213,10 @@ class EuchreGame:
             return self.hands[player]
 
         lead_suit = self._get_effective_suit(self.current_trick[0][1])
-        can_follow_suit = any(self._get_effective_suit(c) == lead_suit for c in self.hands[player])
+        following = HandMask.from_cards(self.hands[player]).bits & self._effective_suit_mask(lead_suit)
 
-        if can_follow_suit:
-            return [c for c in self.hands[player] if self._get_effective_suit(c) == lead_suit]
+        if following:
+            return HandMask(following).filter(self.hands[player])
         return self.hands[player]
 
     def _determine_trick_winner(self) -> int:
@@ -253,6 +254,14 @@ class EuchreGame:
                 return self.trump
         return card.suit
 
+    def _effective_suit_mask(self, suit: Suit) -> int:
+        """Get the card bits whose effective suit is ``suit``, moving the left bower to trump."""
+        mask = SUIT_MASKS[suit]
+        if self.trump:
+            left_bower = card_bit(Card("J", self._get_same_color_suit(self.trump)))
+            mask = mask | left_bower if suit == self.trump else mask & ~left_bower
+        return mask
+
     def _get_same_color_suit(self, suit: Suit) -> Optional[Suit]:
         """Get the other suit of the same color."""
         return {Suit.CLUBS: Suit.SPADES, Suit.SPADES: Suit.CLUBS, Suit.HEARTS: Suit.DIAMONDS, Suit.DIAMONDS: Suit.HEARTS}.get(suit)
@@ -12,7 +12,9 @@ from enum import Enum, auto
 from random import Random
 from typing import Optional, Sequence
 
-from games_collection.games.card.common.cards import Card, Deck
+from games_collection.games.card.common.cards import RANKS, Card, Deck, Suit
+from games_collection.games.card.common.hand_mask import card_bit
+from games_collection.games.card.common.melds import MeldSolver
 
 
 class MeldType(Enum):
@@ -115,94 +117,22 @@ def _deadwood_value(card: Card) -> int:
     return int(card.rank)
 
 
-def _generate_set_melds(cards: Sequence[Card]) -> list[Meld]:
-    """Generate all set melds (three or four of a kind)."""
-
-    by_rank: dict[str, list[Card]] = {}
-    for card in cards:
-        by_rank.setdefault(card.rank, []).append(card)
-
-    melds: list[Meld] = []
-    for group in by_rank.values():
-        if len(group) >= 3:
-            meld_cards = tuple(sorted(group, key=lambda c: c.suit.value))
-            melds.append(Meld(MeldType.SET, meld_cards))
-    return melds
-
-
-def _generate_run_melds(cards: Sequence[Card]) -> list[Meld]:
-    """Generate all run melds (three or more consecutive cards of one suit)."""
-
-    by_suit: dict[str, list[Card]] = {}
-    for card in cards:
-        by_suit.setdefault(card.suit.value, []).append(card)
-
-    melds: list[Meld] = []
-    for suit_cards in by_suit.values():
-        suit_cards.sort(key=lambda c: c.value)
-        run: list[Card] = []
-        for card in suit_cards:
-            if not run or card.value == run[-1].value + 1:
-                run.append(card)
-            elif card.value == run[-1].value:
-                # Skip duplicate ranks within the same suit.
-                continue
-            else:
-                if len(run) >= 3:
-                    melds.extend(Meld(MeldType.RUN, tuple(run[i:j])) for i in range(0, len(run) - 2) for j in range(i + 3, len(run) + 1))
-                run = [card]
-        if len(run) >= 3:
-            melds.extend(Meld(MeldType.RUN, tuple(run[i:j])) for i in range(0, len(run) - 2) for j in range(i + 3, len(run) + 1))
-    return melds
-
-
-def _generate_melds(cards: Sequence[Card]) -> list[Meld]:
-    """Return all potential melds from the given cards."""
-
-    return _generate_set_melds(cards) + _generate_run_melds(cards)
+# One solver, and so one cache of solved sub-hands, shared by every game.
+_MELD_SOLVER = MeldSolver([_deadwood_value(Card(rank, Suit.CLUBS)) for rank in RANKS])
 
 
 def _best_meld_plan(cards: Sequence[Card]) -> HandAnalysis:
     """Compute the meld grouping that minimizes deadwood for ``cards``."""
 
-    candidates = _generate_melds(cards)
-    ordered_cards = list(cards)
-    best_deadwood = float("inf")
-    best_melds: tuple[Meld, ...] = tuple()
-    best_deadwood_cards: tuple[Card, ...] = tuple()
-
-    def search(index: int, used: set[Card], chosen: list[Meld]) -> None:
-        nonlocal best_deadwood, best_melds, best_deadwood_cards
-        if index == len(candidates):
-            deadwood_cards = tuple(card for card in ordered_cards if card not in used)
-            deadwood = sum(_deadwood_value(card) for card in deadwood_cards)
-            if deadwood < best_deadwood or (deadwood == best_deadwood and len(chosen) > len(best_melds)):
-                best_deadwood = deadwood
-                best_melds = tuple(chosen)
-                best_deadwood_cards = deadwood_cards
-            return
-
-        search(index + 1, used, chosen)
-
-        meld = candidates[index]
-        if any(card in used for card in meld.cards):
-            return
-
-        for card in meld.cards:
-            used.add(card)
-        chosen.append(meld)
-        search(index + 1, used, chosen)
-        chosen.pop()
-        for card in meld.cards:
-            used.remove(card)
-
-    search(0, set(), [])
-
-    if best_deadwood == float("inf"):
-        deadwood_cards = tuple(ordered_cards)
-        return HandAnalysis(tuple(), deadwood_cards, sum(_deadwood_value(card) for card in deadwood_cards))
-
-    return HandAnalysis(best_melds, best_deadwood_cards, int(best_deadwood))
+    plan = _MELD_SOLVER.solve(cards)
+    melds = []
+    for meld_cards in plan.meld_cards:
+        if meld_cards[0].rank == meld_cards[-1].rank:
+            melds.append(Meld(MeldType.SET, tuple(sorted(meld_cards, key=lambda c: c.suit.value))))
+        else:
+            melds.append(Meld(MeldType.RUN, tuple(meld_cards)))
+    deadwood_cards = tuple(card for card in cards if plan.deadwood & card_bit(card))
+    return HandAnalysis(tuple(melds), deadwood_cards, plan.deadwood_points)
 
 
 def _can_layoff(card: Card, meld: Meld) -> bool:
@@ -419,4 +349,24 @@ class GinRummyGame:
         """Return the winner of the game, if any."""
         return max(self.players, key=lambda p: p.score) if self.is_game_over() else None
 
-    # ... (AI helper methods can be documented here)
+    def _discard_options(self, cards: Sequence[Card], keep: Optional[Card] = None) -> list[tuple[int, Card]]:
+        """Return ``(deadwood after discarding, card)`` for each card that may be discarded."""
+        options = []
+        for card in cards:
+            if card == keep:
+                continue
+            remaining = list(cards)
+            remaining.remove(card)
+            options.append((_best_meld_plan(remaining).deadwood_total, card))
+        return options
+
+    def suggest_discard(self, player: GinRummyPlayer) -> Card:
+        """Return the discard that leaves the least deadwood, shedding high cards on ties."""
+        _, card = min(self._discard_options(player.hand), key=lambda option: (option[0], -_deadwood_value(option[1])))
+        return card
+
+    def should_draw_discard(self, player: GinRummyPlayer, card: Card) -> bool:
+        """Return whether taking ``card`` and discarding another would lower the player's deadwood."""
+        current = self.analyze_hand(player.hand).deadwood_total
+        options = self._discard_options(player.hand + [card], keep=card)
+        return bool(options) and min(deadwood for deadwood, _ in options) < current
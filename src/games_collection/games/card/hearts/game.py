@@ -9,7 +9,8 @@ Key Features:
 - A rotating card passing phase (left, right, across, none).
 - Trick-taking gameplay with standard follow-suit rules.
 - Detection and scoring for "shooting the moon."
-- A basic AI that attempts to avoid taking penalty points.
+- A basic AI that attempts to avoid taking penalty points, and an optional
+  search-based mode that plays out sampled deals (see :mod:`.search`).
 """
 
 from __future__ import annotations
@@ -18,7 +19,10 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Iterable, Optional, Sequence
 
-from games_collection.games.card.common.cards import Card, Deck, Suit
+from games_collection.games.card.common.cards import Card, Deck, Suit, card_from_id
+from games_collection.games.card.common.hand_mask import SUIT_MASKS, HandMask, card_bit
+from games_collection.games.card.common.trick_search import SearchSettings, TrickSearch
+from games_collection.games.card.hearts.search import build_search_position
 
 
 class PassDirection(Enum):
@@ -32,6 +36,7 @@ class PassDirection(Enum):
 
 TWO_OF_CLUBS = Card("2", Suit.CLUBS)
 QUEEN_OF_SPADES = Card("Q", Suit.SPADES)
+PENALTY_MASK = SUIT_MASKS[Suit.HEARTS] | card_bit(QUEEN_OF_SPADES)
 
 
 @dataclass(eq=False)
@@ -91,12 +96,14 @@ class HeartsGame:
     trick-taking, and scoring.
     """
 
-    def __init__(self, players: list[HeartsPlayer], *, rng=None):
+    def __init__(self, players: list[HeartsPlayer], *, rng=None, search: Optional[SearchSettings] = None):
         """Initialize a Hearts game.
 
         Args:
             players: List of 4 players
             rng: Optional random number generator
+            search: Optional search settings. When given, AI card play uses
+                determinized Monte Carlo search instead of the heuristic.
         """
         if len(players) != 4:
             raise ValueError("Hearts requires exactly 4 players")
@@ -115,6 +122,8 @@ class HeartsGame:
         self.last_round_scores: dict[str, int] = {}
         self.last_round_events: dict[str, str] = {}
         self.pass_history: list[dict[str, list[Card]]] = []
+        self.round_passes: dict[str, list[Card]] = {}
+        self.card_search = TrickSearch(search, rng=rng) if search is not None else None
 
     def deal_cards(self) -> None:
         """Deal all 52 cards evenly to 4 players (13 each)."""
@@ -133,6 +142,7 @@ class HeartsGame:
         self._current_trick_leader = None
         self.trick_number = 0
         self.hearts_broken = False
+        self.round_passes = {}
 
         # Clear hands and tricks
         for player in self.players:
@@ -208,6 +218,7 @@ class HeartsGame:
         # Record the pass for history purposes
         pass_snapshot = {player.name: list(cards) for player, cards in temp_passes.items()}
         self.pass_history.append(pass_snapshot)
+        self.round_passes = pass_snapshot
 
     def find_starting_player(self) -> HeartsPlayer:
         """Find the player with the 2 of Clubs (starts the game).
@@ -242,30 +253,30 @@ class HeartsGame:
         Returns:
             True if the play is valid, False otherwise.
         """
-        if card not in player.hand:
-            return False
+        return card in self._playable_mask(player)
 
+    def _playable_mask(self, player: HeartsPlayer) -> HandMask:
+        """Return the cards in ``player``'s hand that may legally be played."""
+        hand = HandMask.from_cards(player.hand)
         is_first_trick = self.trick_number == 0
 
         # Leading a trick
         if not self.current_trick:
             if is_first_trick:
-                return card == TWO_OF_CLUBS
-            if card.suit == Suit.HEARTS and not (self.hearts_broken or player.has_only_hearts()):
-                return False
-            return True
+                return HandMask(hand.bits & card_bit(TWO_OF_CLUBS))
+            if self.hearts_broken or hand.only_suit(Suit.HEARTS):
+                return hand
+            return HandMask(hand.bits & ~SUIT_MASKS[Suit.HEARTS])
 
         # Following a trick: must follow suit if possible
-        if self.lead_suit and player.has_suit(self.lead_suit):
-            return card.suit == self.lead_suit
+        if self.lead_suit and hand.has_suit(self.lead_suit):
+            return hand.suit(self.lead_suit)
 
-        # Out of suit: additional first trick restrictions
-        if is_first_trick:
-            if self._is_penalty_card(card):
-                safe_cards = [c for c in player.hand if not self._is_penalty_card(c)]
-                return not safe_cards
+        # Out of suit: no penalty cards on the first trick unless nothing else is held
+        if is_first_trick and hand.bits & ~PENALTY_MASK:
+            return HandMask(hand.bits & ~PENALTY_MASK)
 
-        return True
+        return hand
 
     def play_card(self, player: HeartsPlayer, card: Card) -> None:
         """Play a card to the current trick.
@@ -392,7 +403,7 @@ class HeartsGame:
         Returns:
             List of valid cards to play.
         """
-        return [card for card in player.hand if self.is_valid_play(player, card)]
+        return self._playable_mask(player).filter(player.hand)
 
     def select_cards_to_pass(self, player: HeartsPlayer) -> list[Card]:
         """AI logic to select 3 cards to pass.
@@ -464,6 +475,9 @@ class HeartsGame:
         if len(valid_cards) == 1:
             return valid_cards[0]
 
+        if self.card_search is not None:
+            return self._search_card_to_play(player)
+
         # Leading a trick: favour safe, low cards from non-penalty suits
         if not self.current_trick:
             return self._select_lead_card(valid_cards)
@@ -488,6 +502,15 @@ class HeartsGame:
 
         return max(valid_cards, key=lambda c: (c.value, c.suit.value))
 
+    def _search_card_to_play(self, player: HeartsPlayer) -> Card:
+        """Pick a card by determinized Monte Carlo search."""
+        return card_from_id(self.card_search.choose(*build_search_position(self, player)))
+
+    def close(self) -> None:
+        """Release the search worker processes, if any were started."""
+        if self.card_search is not None:
+            self.card_search.close()
+
     @staticmethod
     def _select_lead_card(valid_cards: Iterable[Card]) -> Card:
         """Pick a low-risk lead from the available valid cards."""
@@ -0,0 +1,121 @@
+"""Search-based card play for Hearts.
+
+Adapts a :class:`~games_collection.games.card.hearts.game.HeartsGame` to the
+determinized search in :mod:`games_collection.games.card.common.trick_search`:
+:func:`build_search_position` extracts what the player to move can observe,
+including suits opponents have shown out of and the cards the player passed
+this round, and :class:`HeartsRules` supplies the rollout policy and payoff.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+from games_collection.games.card.common.cards import Card, Suit, card_id
+from games_collection.games.card.common.hand_mask import HandMask
+from games_collection.games.card.common.trick_search import (
+    SUIT_BITS,
+    Observation,
+    TrickRules,
+    TrickState,
+    highest,
+    lowest,
+    popcount,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from games_collection.games.card.hearts.game import HeartsGame, HeartsPlayer
+
+_HEARTS = list(Suit).index(Suit.HEARTS)
+_QUEEN_OF_SPADES = card_id(Card("Q", Suit.SPADES))
+_PENALTY = SUIT_BITS[_HEARTS] | 1 << _QUEEN_OF_SPADES
+_MOON = 26
+
+# Seat offsets of the pass recipient for each direction name.
+_PASS_OFFSETS = {"LEFT": 1, "RIGHT": -1, "ACROSS": 2}
+
+
+class HeartsRules(TrickRules):
+    """No trumps, hearts break on hearts or the queen of spades, and the two of
+    clubs opens the hand."""
+
+    restricted_lead = _HEARTS
+    breaking_cards = _PENALTY
+    opening_card = card_id(Card("2", Suit.CLUBS))
+    first_trick_forbidden = _PENALTY
+
+    def rollout_card(self, state: TrickState, seat: int, legal: int, rng: random.Random) -> int:
+        """Duck under the winning card when possible and dump penalties when void."""
+        if not state.trick:
+            suits = [suit for suit in range(4) if legal & SUIT_BITS[suit]]
+            return lowest(legal & SUIT_BITS[rng.choice(suits)])
+        lead = state.trick[0][1] & 3
+        in_suit = legal & SUIT_BITS[lead]
+        if in_suit:
+            _, winning = self.trick_winner(state.trick)
+            below = in_suit & ((1 << winning) - 1)
+            if below:
+                return highest(below)
+            if len(state.trick) == len(state.hands) - 1:
+                return highest(in_suit)
+            return lowest(in_suit)
+        if legal & (1 << _QUEEN_OF_SPADES):
+            return _QUEEN_OF_SPADES
+        hearts = legal & SUIT_BITS[_HEARTS]
+        return highest(hearts or legal)
+
+    def payoff(self, state: TrickState, seat: int) -> float:
+        """Return the average opponent penalty minus the seat's own, moon included."""
+        points = [popcount(won & SUIT_BITS[_HEARTS]) + (13 if won >> _QUEEN_OF_SPADES & 1 else 0) for won in state.won]
+        if _MOON in points:
+            points = [0 if value == _MOON else _MOON for value in points]
+        others = [value for index, value in enumerate(points) if index != seat]
+        return sum(others) / len(others) - points[seat]
+
+
+def build_search_position(game: HeartsGame, player: HeartsPlayer) -> tuple[HeartsRules, TrickState, Observation]:
+    """Describe the position as seen by ``player``, who must be the one to act."""
+    seats = {member.name: index for index, member in enumerate(game.players)}
+    searcher = game.players.index(player)
+    count = len(game.players)
+
+    won = [HandMask.from_cards(member.tricks_won).bits for member in game.players]
+    trick = [(game.players.index(member), card_id(card)) for member, card in game.current_trick]
+    played = 0
+    for bits in won:
+        played |= bits
+    for _, card in trick:
+        played |= 1 << card
+
+    voids = [0] * count
+    tricks = [(record.cards[0][1].suit, [(seats[name], card) for name, card in record.cards]) for record in game.trick_history]
+    if game.current_trick:
+        tricks.append((game.current_trick[0][1].suit, [(game.players.index(member), card) for member, card in game.current_trick]))
+    for lead_suit, cards in tricks:
+        for seat, card in cards:
+            if card.suit != lead_suit:
+                voids[seat] |= 1 << list(Suit).index(lead_suit)
+
+    own = HandMask.from_cards(player.hand).bits
+    unseen = ((1 << 52) - 1) & ~own & ~played
+    known = [0] * count
+    passed = game.round_passes.get(player.name)
+    offset = _PASS_OFFSETS.get(game.get_pass_direction().name)
+    if passed and offset is not None:
+        known[(searcher + offset) % count] = HandMask.from_cards(passed).bits & unseen
+
+    state = TrickState(
+        hands=[own if seat == searcher else 0 for seat in range(count)],
+        won=won,
+        tricks=[len(member.tricks_won) // count for member in game.players],
+        trick=trick,
+        leader=trick[0][0] if trick else searcher,
+        broken=game.hearts_broken,
+        first_trick=game.trick_number == 0,
+    )
+    observation = Observation(unseen=unseen, hand_sizes=[len(member.hand) for member in game.players], voids=voids, known=known)
+    return HeartsRules(), state, observation
+
+
+__all__ = ["HeartsRules", "build_search_position"]
@@ -12,6 +12,7 @@ from random import Random
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from games_collection.games.card.common.cards import Card, Deck, Suit, format_cards
+from games_collection.games.card.common.hand_mask import HandMask
 
 # Constants for Pinochle card ranks, trick strength, and point values.
 PINOCHLE_RANKS: Tuple[str, ...] = ("A", "T", "K", "Q", "J", "9")
@@ -298,13 +299,11 @@ class PinochleGame:
         """Check if a card is a valid play for the current player."""
         if self.current_player_index is None or self.players[self.current_player_index] is not player:
             return False
-        if card not in player.hand:
-            return False
-        if not self.current_trick or not self.lead_suit:
-            return True
-        if player.has_suit(self.lead_suit):
-            return card.suit == self.lead_suit
-        return True
+        # Hands hold duplicate cards, but legality only depends on which cards are present.
+        hand = HandMask.from_cards(player.hand)
+        if not self.current_trick:
+            return card in hand
+        return card in hand.follow_suit(self.lead_suit)
 
     def play_card(self, card: Card) -> None:
         """Play a card into the current trick."""
@@ -0,0 +1,145 @@
+"""Batched Monte Carlo equity backend built on NumPy.
+
+``estimate_win_rate`` historically dealt every simulation into a Python tuple
+and ranked each hand with :func:`poker_core.best_hand`. This module deals all
+simulations at once as an integer array of card ids, scores every hero and
+opponent hand with array lookups into the :mod:`hand_strength` tables and
+reduces wins and ties with array operations.
+
+NumPy is an optional dependency. When it is missing :data:`NUMPY_AVAILABLE` is
+``False`` and callers fall back to the pure Python evaluator.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+from . import hand_strength
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+# Rows dealt per array batch. Keeps peak memory flat for very large runs.
+BATCH_SIZE = 4096
+
+_TABLES: Optional[tuple] = None
+
+
+def _tables() -> tuple:
+    """Return the evaluator lookup tables converted to NumPy arrays."""
+    global _TABLES
+    if _TABLES is None:
+        hand_strength._ensure_tables()
+        keys = np.fromiter(hand_strength.RANK_TABLE.keys(), dtype=np.int64, count=len(hand_strength.RANK_TABLE))
+        values = np.fromiter(hand_strength.RANK_TABLE.values(), dtype=np.int32, count=len(hand_strength.RANK_TABLE))
+        order = np.argsort(keys)
+        _TABLES = (
+            np.asarray(hand_strength.CARD_RANK_KEYS, dtype=np.int64),
+            # Card ids are distinct, so summing these bits packs all four
+            # per-suit rank masks into one integer.
+            np.asarray(hand_strength.CARD_SUIT_BITS, dtype=np.int64),
+            np.asarray(hand_strength.FLUSH_TABLE, dtype=np.int32),
+            keys[order],
+            values[order],
+        )
+    return _TABLES
+
+
+def _strengths(keys: "np.ndarray", suit_masks: "np.ndarray") -> "np.ndarray":
+    """Resolve rank keys and packed suit masks into hand strengths."""
+    _, _, flush_table, sorted_keys, sorted_values = _tables()
+    strengths = sorted_values[np.searchsorted(sorted_keys, keys)]
+    for suit in range(4):
+        # With at most seven cards any flush outranks the best non-flush hand.
+        np.maximum(strengths, flush_table[(suit_masks >> (13 * suit)) & 0x1FFF], out=strengths)
+    return strengths
+
+
+def evaluate_batch(cards: "np.ndarray") -> "np.ndarray":
+    """Score many hands at once.
+
+    Args:
+        cards: An integer array of shape ``(n, k)`` holding ``k`` distinct card
+            ids (five to seven) per row.
+
+    Returns:
+        An ``int32`` array of ``n`` strengths comparable with
+        :func:`hand_strength.evaluate`.
+    """
+    rank_keys, suit_bits = _tables()[:2]
+    return _strengths(rank_keys[cards].sum(axis=1), suit_bits[cards].sum(axis=1))
+
+
+def simulate_equity(
+    hero_ids: Sequence[int],
+    board_ids: Sequence[int],
+    opponent_count: int,
+    simulations: int,
+    seed: int,
+) -> tuple[int, int]:
+    """Run ``simulations`` random deals and count hero wins and ties.
+
+    Args:
+        hero_ids: Card ids of the hero's hole cards.
+        board_ids: Card ids already on the board.
+        opponent_count: Number of opponents holding two random cards each.
+        simulations: Number of deals to evaluate.
+        seed: Seed for the NumPy generator; identical seeds give identical
+            results.
+
+    Returns:
+        A ``(wins, ties)`` tuple.
+    """
+    known = set(hero_ids) | set(board_ids)
+    pool = np.array([card for card in range(52) if card not in known], dtype=np.int64)
+    needed_board = max(0, 5 - len(board_ids))
+    dealt = 2 * opponent_count + needed_board
+    if dealt > len(pool):
+        raise ValueError("Not enough cards remaining to deal every opponent.")
+
+    generator = np.random.default_rng(seed)
+    rank_keys, suit_bits = _tables()[:2]
+    known_board = np.asarray(tuple(board_ids), dtype=np.int64)
+    board_key = int(rank_keys[known_board].sum())
+    board_mask = int(suit_bits[known_board].sum())
+    hero = np.asarray(tuple(hero_ids), dtype=np.int64)
+    hero_key = int(rank_keys[hero].sum())
+    hero_mask = int(suit_bits[hero].sum())
+
+    wins = 0
+    ties = 0
+    remaining = simulations
+    while remaining > 0:
+        rows = min(BATCH_SIZE, remaining)
+        remaining -= rows
+
+        # Sorting random keys yields an independent uniform permutation per row.
+        deals = pool[np.argsort(generator.random((rows, len(pool))), axis=1)[:, :dealt]]
+
+        # The shared board is scored once per deal and reused for every seat.
+        runout = deals[:, 2 * opponent_count :]
+        shared_key = rank_keys[runout].sum(axis=1) + board_key
+        shared_mask = suit_bits[runout].sum(axis=1) + board_mask
+
+        hero_strength = _strengths(shared_key + hero_key, shared_mask + hero_mask)
+        best_opponent = np.zeros(rows, dtype=np.int32)
+        for seat in range(opponent_count):
+            first = deals[:, 2 * seat]
+            second = deals[:, 2 * seat + 1]
+            seat_strength = _strengths(
+                shared_key + rank_keys[first] + rank_keys[second],
+                shared_mask + suit_bits[first] + suit_bits[second],
+            )
+            np.maximum(best_opponent, seat_strength, out=best_opponent)
+
+        wins += int(np.count_nonzero(hero_strength > best_opponent))
+        ties += int(np.count_nonzero(hero_strength == best_opponent))
+    return wins, ties
+
+
+__all__ = ["BATCH_SIZE", "NUMPY_AVAILABLE", "evaluate_batch", "simulate_equity"]
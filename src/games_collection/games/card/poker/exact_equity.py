@@ -0,0 +1,142 @@
+"""Exact equity by exhaustive enumeration of the remaining outcomes.
+
+On the turn and river so few cards remain unseen that every runout and every
+combination of opponent holdings can be enumerated outright. That is both
+faster and noise-free compared with Monte Carlo sampling at the simulation
+counts our bots use.
+
+The enumeration works with :mod:`hand_strength` evaluation states. The hero's
+hole cards plus the known board are accumulated once, each runout adds its
+cards to that shared state, and every opponent holding only adds its two hole
+cards to the runout's board state.
+
+For each runout the enumerator counts the unordered sets of disjoint opponent
+holdings in which every opponent is beaten (a win) or in which the best
+opponent exactly matches the hero (a tie). One or two opponents are counted in
+closed form; larger fields are enumerated directly, which
+:func:`enumeration_cost` accounts for.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from itertools import combinations
+from math import comb, factorial
+from typing import Sequence
+
+from . import hand_strength
+
+# Default budget, in hand evaluations, below which ``estimate_win_rate`` swaps
+# sampling for exact enumeration. A turn against one or two opponents (~46k
+# evaluations) fits; flops, and turns against three or more opponents, do not.
+EXACT_THRESHOLD = 50_000
+
+
+def enumeration_cost(board_size: int, opponent_count: int, known_cards: int = 2) -> int:
+    """Estimate the hand evaluations needed to enumerate equity exactly.
+
+    Args:
+        board_size: Number of community cards already dealt.
+        opponent_count: Number of opponents still in the hand.
+        known_cards: Cards known to the hero besides the board (hole cards).
+
+    Returns:
+        The approximate number of hand evaluations (or holding combinations for
+        three or more opponents) that :func:`exact_equity` will perform.
+    """
+    unseen = 52 - known_cards - board_size
+    runout_size = 5 - board_size
+    runouts = comb(unseen, runout_size)
+    remaining = unseen - runout_size
+    if opponent_count <= 2:
+        return runouts * (1 + comb(remaining, 2))
+    return runouts * _holding_sets(remaining, opponent_count)
+
+
+def _holding_sets(cards: int, opponent_count: int) -> int:
+    """Return how many ways ``opponent_count`` unordered hands can come from ``cards``."""
+    holdings = 1
+    for seat in range(opponent_count):
+        holdings *= comb(cards - 2 * seat, 2)
+    return holdings // factorial(opponent_count)
+
+
+def _count_disjoint_sets(hands: Sequence[tuple[int, int]], size: int) -> int:
+    """Count unordered sets of ``size`` pairwise disjoint two-card ``hands``."""
+    if size == 1:
+        return len(hands)
+    if size == 2:
+        # Two distinct hands overlap in at most one card, so subtract every
+        # pair of hands that shares a card.
+        degrees = Counter(card for hand in hands for card in hand)
+        return comb(len(hands), 2) - sum(comb(degree, 2) for degree in degrees.values())
+
+    def extend(start: int, used: frozenset, remaining: int) -> int:
+        if remaining == 0:
+            return 1
+        total = 0
+        for index in range(start, len(hands)):
+            first, second = hands[index]
+            if first in used or second in used:
+                continue
+            total += extend(index + 1, used | {first, second}, remaining - 1)
+        return total
+
+    return extend(0, frozenset(), size)
+
+
+def exact_equity(hero_ids: Sequence[int], board_ids: Sequence[int], opponent_count: int) -> tuple[int, int, int]:
+    """Enumerate every runout and opponent holding to compute exact equity.
+
+    Args:
+        hero_ids: Card ids of the hero's hole cards.
+        board_ids: Card ids already on the board.
+        opponent_count: Number of opponents holding unknown cards.
+
+    Returns:
+        ``(wins, ties, total)`` counted over all equally likely outcomes, so the
+        hero's equity is ``(wins + ties / 2) / total``.
+    """
+    known = set(hero_ids) | set(board_ids)
+    unseen = [card for card in range(52) if card not in known]
+    runout_size = 5 - len(board_ids)
+    if runout_size < 0:
+        raise ValueError("The board cannot hold more than five cards.")
+    if runout_size + 2 * opponent_count > len(unseen):
+        raise ValueError("Not enough cards remaining to deal every opponent.")
+
+    board_state = hand_strength.accumulate(board_ids)
+    hero_state = hand_strength.accumulate(hero_ids, *board_state)
+    evaluate_state = hand_strength.evaluate_state
+    rank_keys = hand_strength.CARD_RANK_KEYS
+    suit_bits = hand_strength.CARD_SUIT_BITS
+
+    wins = 0
+    ties = 0
+    for runout in combinations(unseen, runout_size):
+        hero_key, hero_mask = hand_strength.accumulate(runout, *hero_state)
+        hero_strength = evaluate_state(hero_key, hero_mask)
+        board_key, board_mask = hand_strength.accumulate(runout, *board_state)
+
+        dealt = set(runout)
+        beaten: list[tuple[int, int]] = []
+        not_ahead: list[tuple[int, int]] = []
+        for hand in combinations([card for card in unseen if card not in dealt], 2):
+            first, second = hand
+            strength = evaluate_state(
+                board_key + rank_keys[first] + rank_keys[second],
+                board_mask | suit_bits[first] | suit_bits[second],
+            )
+            if strength < hero_strength:
+                beaten.append(hand)
+                not_ahead.append(hand)
+            elif strength == hero_strength:
+                not_ahead.append(hand)
+
+        runout_wins = _count_disjoint_sets(beaten, opponent_count)
+        wins += runout_wins
+        ties += _count_disjoint_sets(not_ahead, opponent_count) - runout_wins
+    return wins, ties, comb(len(unseen), runout_size) * _holding_sets(len(unseen) - runout_size, opponent_count)
+
+
+__all__ = ["EXACT_THRESHOLD", "enumeration_cost", "exact_equity"]
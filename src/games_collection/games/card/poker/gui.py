@@ -458,7 +458,10 @@ def launch_gui(match: PokerMatch, *, rng: Optional[random.Random] = None) -> Non
     """
     root = tk.Tk()
     PokerGUI(root, match, rng=rng)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        match.close()
 
 
 __all__ = ["PokerGUI", "launch_gui"]
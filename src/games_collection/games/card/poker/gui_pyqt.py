@@ -481,7 +481,10 @@ def launch_gui(match: PokerMatch, *, rng: Optional[random.Random] = None) -> int
     app = QApplication.instance() or QApplication(sys.argv)
     window = PokerPyQtGUI(match, rng=rng)
     window.show()
-    return app.exec()
+    try:
+        return app.exec()
+    finally:
+        match.close()
 
 
 __all__ = ["PokerPyQtGUI", "launch_gui"]
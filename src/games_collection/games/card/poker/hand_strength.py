@@ -0,0 +1,256 @@
+"""Table-driven poker hand evaluator operating on integer card ids.
+
+The object-oriented helpers in :mod:`poker_core` are pleasant to work with but
+expensive in hot loops: ranking a seven-card hand used to mean scoring all 21
+five-card combinations. This module evaluates 5, 6 or 7 cards in a single pass
+using two precomputed lookup tables, in the spirit of the Cactus Kev and
+"two plus two" evaluators:
+
+- **Flush table**: indexed by the 13-bit rank mask of a single suit. Entries are
+  non-zero only when the mask holds five or more ranks and contain the best
+  flush or straight flush that can be formed from them.
+- **Rank table**: keyed by the multiset of ranks in the hand, encoded as a sum of
+  ``5 ** rank`` terms (no rank can appear more than four times). Entries hold
+  the best non-flush hand for that multiset.
+
+With at most seven cards a hand holding a flush can never also hold a full house
+or four of a kind, so whenever a suit reaches five cards the flush table alone
+decides the result.
+
+A partially dealt hand can be summarised as a ``(key, suit_mask)`` *state*, where
+``suit_mask`` packs the four per-suit rank masks into 52 bits. States are built
+with :func:`accumulate`, extended card by card and scored with
+:func:`evaluate_state`, which lets callers such as the exact equity enumerator
+reuse the work done for shared board cards.
+
+Cards use the shared integer ids of
+:func:`~games_collection.games.card.common.cards.card_id`, ``rank * 4 + suit``,
+where ``rank`` is the card's
+:attr:`~games_collection.games.card.common.cards.Card.value` and ``suit`` is the
+position of the suit in :class:`~games_collection.games.card.common.cards.Suit`.
+Evaluation returns a single integer whose ordering matches
+:class:`~games_collection.games.card.poker.poker_core.HandRank`: the category
+lives in the high bits and up to five tie-breaking values follow as 4-bit
+nibbles.
+"""
+
+from __future__ import annotations
+
+from itertools import combinations
+from typing import Iterable, Sequence
+
+from ..common.cards import RANKS, Card, Suit, card_from_id, card_id
+
+# Category codes mirror ``poker_core.HandCategory`` so strengths can be decoded
+# without importing the object model.
+HIGH_CARD = 0
+ONE_PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+
+CATEGORY_SHIFT = 20
+
+# Number of tie-breaking values stored for each category.
+TIEBREAKER_LENGTHS: tuple[int, ...] = (5, 4, 3, 3, 1, 5, 2, 2, 1)
+
+_RANK_COUNT = len(RANKS)
+_SUIT_COUNT = len(Suit)
+_MASK_LIMIT = 1 << _RANK_COUNT
+_WHEEL_MASK = (1 << 12) | 0b1111
+
+# Per-card-id lookup arrays so the evaluation loop never touches ``Card``.
+CARD_RANK_KEYS: tuple[int, ...] = tuple(5 ** (card_id >> 2) for card_id in range(_RANK_COUNT * _SUIT_COUNT))
+CARD_RANK_BITS: tuple[int, ...] = tuple(1 << (card_id >> 2) for card_id in range(_RANK_COUNT * _SUIT_COUNT))
+CARD_SUIT_BITS: tuple[int, ...] = tuple(1 << ((card_id & 3) * _RANK_COUNT + (card_id >> 2)) for card_id in range(_RANK_COUNT * _SUIT_COUNT))
+
+# Lookup tables populated on first use; see :func:`_ensure_tables`.
+_STRAIGHT_HIGH: list[int] = []
+FLUSH_TABLE: list[int] = []
+RANK_TABLE: dict[int, int] = {}
+
+
+def evaluate(card_ids: Sequence[int]) -> int:
+    """Return the strength of the best five-card hand within ``card_ids``.
+
+    Args:
+        card_ids: Five to seven distinct card ids. Larger collections are
+            supported but fall back to scoring every seven-card subset.
+
+    Returns:
+        An integer strength; larger values are stronger hands.
+    """
+    if not RANK_TABLE:
+        _ensure_tables()
+    if len(card_ids) > 7:
+        return max(evaluate(subset) for subset in combinations(card_ids, 7))
+
+    key = 0
+    mask = 0
+    for card in card_ids:
+        key += CARD_RANK_KEYS[card]
+        mask |= CARD_SUIT_BITS[card]
+    return evaluate_state(key, mask)
+
+
+def accumulate(card_ids: Iterable[int], key: int = 0, mask: int = 0) -> tuple[int, int]:
+    """Add ``card_ids`` to an evaluation state and return the new ``(key, mask)``."""
+    for card in card_ids:
+        key += CARD_RANK_KEYS[card]
+        mask |= CARD_SUIT_BITS[card]
+    return key, mask
+
+
+def evaluate_state(key: int, mask: int) -> int:
+    """Return the strength of a five- to seven-card evaluation state."""
+    if not RANK_TABLE:
+        _ensure_tables()
+    return FLUSH_TABLE[mask & 0x1FFF] or FLUSH_TABLE[mask >> 13 & 0x1FFF] or FLUSH_TABLE[mask >> 26 & 0x1FFF] or FLUSH_TABLE[mask >> 39] or RANK_TABLE[key]
+
+
+def evaluate_cards(cards: Iterable[Card]) -> int:
+    """Convenience wrapper around :func:`evaluate` for :class:`Card` objects."""
+    return evaluate([card_id(card) for card in cards])
+
+
+def category_of(strength: int) -> int:
+    """Return the hand category code encoded in ``strength``."""
+    return strength >> CATEGORY_SHIFT
+
+
+def tiebreaker_of(strength: int) -> tuple[int, ...]:
+    """Decode the tie-breaking card values stored in ``strength``."""
+    length = TIEBREAKER_LENGTHS[strength >> CATEGORY_SHIFT]
+    return tuple((strength >> (16 - 4 * position)) & 0xF for position in range(length))
+
+
+def pack_strength(category: int, tiebreaker: Sequence[int]) -> int:
+    """Encode a category and its tie-breaking values as an integer strength."""
+    strength = category << CATEGORY_SHIFT
+    for position, value in enumerate(tiebreaker):
+        strength |= value << (16 - 4 * position)
+    return strength
+
+
+def straight_ranks(high: int) -> tuple[int, ...]:
+    """Return the five rank values of the straight whose top card is ``high``."""
+    if high == 3:  # The wheel: 5-4-3-2-A.
+        return (3, 2, 1, 0, 12)
+    return tuple(range(high, high - 5, -1))
+
+
+def _straight_high(mask: int) -> int:
+    """Return the top rank of the best straight in ``mask`` or ``-1``."""
+    for high in range(_RANK_COUNT - 1, 3, -1):
+        window = 0b11111 << (high - 4)
+        if mask & window == window:
+            return high
+    if mask & _WHEEL_MASK == _WHEEL_MASK:
+        return 3
+    return -1
+
+
+def _top_ranks(mask: int, count: int) -> list[int]:
+    """Return the ``count`` highest ranks present in ``mask``."""
+    ranks: list[int] = []
+    for rank in range(_RANK_COUNT - 1, -1, -1):
+        if mask >> rank & 1:
+            ranks.append(rank)
+            if len(ranks) == count:
+                break
+    return ranks
+
+
+def _multiset_strength(counts: Sequence[int]) -> int:
+    """Return the best non-flush strength for a rank multiset."""
+    descending = [rank for rank in range(_RANK_COUNT - 1, -1, -1) if counts[rank]]
+    quads = [rank for rank in descending if counts[rank] == 4]
+    trips = [rank for rank in descending if counts[rank] == 3]
+    pairs = [rank for rank in descending if counts[rank] == 2]
+
+    if quads:
+        quad = quads[0]
+        return pack_strength(FOUR_OF_A_KIND, (quad, next(rank for rank in descending if rank != quad)))
+
+    if trips and (len(trips) > 1 or pairs):
+        trip = trips[0]
+        return pack_strength(FULL_HOUSE, (trip, max(trips[1:] + pairs)))
+
+    mask = 0
+    for rank in descending:
+        mask |= 1 << rank
+    high = _STRAIGHT_HIGH[mask]
+    if high >= 0:
+        return pack_strength(STRAIGHT, (high,))
+
+    if trips:
+        trip = trips[0]
+        return pack_strength(THREE_OF_A_KIND, [trip] + [rank for rank in descending if rank != trip][:2])
+
+    if len(pairs) > 1:
+        high_pair, low_pair = pairs[:2]
+        kicker = next(rank for rank in descending if rank not in (high_pair, low_pair))
+        return pack_strength(TWO_PAIR, (high_pair, low_pair, kicker))
+
+    if pairs:
+        pair = pairs[0]
+        return pack_strength(ONE_PAIR, [pair] + [rank for rank in descending if rank != pair][:3])
+
+    return pack_strength(HIGH_CARD, descending[:5])
+
+
+def _rank_multisets(remaining: int, rank: int, counts: list[int], key: int = 0) -> Iterable[tuple[int, list[int]]]:
+    """Yield ``(key, counts)`` for every rank multiset of ``remaining`` cards at or below ``rank``."""
+    if remaining == 0:
+        yield key, counts
+        return
+    if rank < 0:
+        return
+    for count in range(min(4, remaining), -1, -1):
+        counts[rank] = count
+        yield from _rank_multisets(remaining - count, rank - 1, counts, key + count * 5**rank)
+    counts[rank] = 0
+
+
+def _ensure_tables() -> None:
+    """Populate the straight, flush and rank lookup tables once."""
+    if RANK_TABLE:
+        return
+
+    _STRAIGHT_HIGH[:] = [_straight_high(mask) for mask in range(_MASK_LIMIT)]
+
+    flush_table = [0] * _MASK_LIMIT
+    for mask in range(_MASK_LIMIT):
+        if bin(mask).count("1") < 5:
+            continue
+        high = _STRAIGHT_HIGH[mask]
+        if high >= 0:
+            flush_table[mask] = pack_strength(STRAIGHT_FLUSH, (high,))
+        else:
+            flush_table[mask] = pack_strength(FLUSH, _top_ranks(mask, 5))
+    FLUSH_TABLE[:] = flush_table
+
+    table: dict[int, int] = {}
+    for size in (5, 6, 7):
+        for key, counts in _rank_multisets(size, _RANK_COUNT - 1, [0] * _RANK_COUNT):
+            table[key] = _multiset_strength(counts)
+    RANK_TABLE.update(table)
+
+
+__all__ = [
+    "CATEGORY_SHIFT",
+    "accumulate",
+    "card_from_id",
+    "card_id",
+    "category_of",
+    "evaluate",
+    "evaluate_cards",
+    "evaluate_state",
+    "pack_strength",
+    "straight_ranks",
+    "tiebreaker_of",
+]
@@ -16,18 +16,19 @@ Key Components:
 from __future__ import annotations
 
 import argparse
-import itertools
-import math
 import os
 import random
-from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from itertools import combinations
 from typing import Iterable, Optional, Sequence
 
 from ..common.cards import Card, Deck, format_cards
+from . import equity, hand_strength
+from .exact_equity import EXACT_THRESHOLD, enumeration_cost, exact_equity
 from .poker_core import HandRank, best_hand
+from .preflop import load_preflop_table
+from .simulation_pool import SimulationPool, run_streams, simulation_streams
 
 
 class GameVariant(str, Enum):
@@ -230,32 +231,6 @@ class HandHistory:
         }
 
 
-# A pre-shuffled, full deck of cards for use in simulations.
-FULL_DECK: tuple[Card, ...] = tuple(Deck().cards)
-
-
-def _simulate_win_rate_batch(
-    hero_cards: tuple[Card, ...],
-    community_cards: tuple[Card, ...],
-    assignments: Sequence[tuple[tuple[tuple[Card, ...], ...], tuple[Card, ...]]],
-) -> tuple[int, int]:
-    """Evaluate a batch of simulations for the hero's win and tie counts."""
-
-    hero_hand = list(hero_cards)
-    base_board = list(community_cards)
-    wins = 0
-    ties = 0
-    for opponent_holes, board_extension in assignments:
-        board = base_board + list(board_extension)
-        hero_rank = best_hand(hero_hand + board)
-        best_opponent_rank = max(best_hand(list(hole) + board) for hole in opponent_holes)
-        if hero_rank > best_opponent_rank:
-            wins += 1
-        elif hero_rank == best_opponent_rank:
-            ties += 1
-    return wins, ties
-
-
 def fresh_deck(rng: random.Random | None = None) -> Deck:
     """Creates and shuffles a new deck of cards."""
     deck = Deck()
@@ -318,7 +293,9 @@ class PokerBot:
 
     This class uses the player's ``BotSkill`` profile and a Monte Carlo
     simulation (`estimate_win_rate`) to choose an appropriate action in a given
-    game state.
+    game state. Pre-flop Texas Hold'em decisions read the precomputed equity
+    table from :mod:`preflop`; later streets simulate on the table's shared
+    :class:`SimulationPool`.
     """
 
     def __init__(self, player: Player, skill: BotSkill, rng: random.Random) -> None:
@@ -333,14 +310,17 @@ class PokerBot:
         if self.player.chips == 0:
             return Action(ActionType.CHECK)
 
-        win_rate = estimate_win_rate(
-            hero=self.player,
-            players=[p for p in table.players if not p.folded],
-            community_cards=table.community_cards,
-            simulations=self.skill.simulations,
-            rng=self.rng,
-            max_workers=self.skill.max_workers,
-        )
+        win_rate = self._preflop_equity(table)
+        if win_rate is None:
+            win_rate = estimate_win_rate(
+                hero=self.player,
+                players=[p for p in table.players if not p.folded],
+                community_cards=table.community_cards,
+                simulations=self.skill.simulations,
+                rng=self.rng,
+                max_workers=self.skill.max_workers,
+                pool=table.simulation_pool,
+            )
 
         if self.rng.random() < self.skill.mistake_rate:
             return self._random_legal_action(table, to_call)
@@ -363,6 +343,16 @@ class PokerBot:
 
         return Action(ActionType.CALL, target_bet=table.current_bet)
 
+    def _preflop_equity(self, table: "PokerTable") -> Optional[float]:
+        """Return the tabulated pre-flop equity, or ``None`` to fall back to simulation."""
+        if table.stage != "pre-flop" or table.game_variant != GameVariant.TEXAS_HOLDEM or table.community_cards:
+            return None
+        preflop_table = load_preflop_table()
+        if preflop_table is None:
+            return None
+        opponents = sum(1 for p in table.players if p is not self.player and not p.folded)
+        return preflop_table.equity(self.player.hole_cards, opponents)
+
     def _bet_target(self, table: "PokerTable", pot_factor: float) -> int:
         """Calculate a target bet size, typically a fraction of the pot."""
         min_bet = max(table.min_raise_amount, table.big_blind)
@@ -392,7 +382,9 @@ class PokerTable:
     """Manages the state and progression of a single poker hand.
 
     This class handles the core game flow, including dealing cards, managing
-    betting rounds, posting blinds, and distributing the pot.
+    betting rounds, posting blinds, and distributing the pot. It also owns the
+    :class:`SimulationPool` shared by every bot seated at the table; the pool
+    only spawns processes once a simulation is large enough to benefit.
     """
 
     def __init__(
@@ -424,6 +416,7 @@ class PokerTable:
         self.min_raise_amount: int = self.big_blind
         self.last_actions: list[str] = []
         self._players_who_acted: set[int] = set()
+        self.simulation_pool = SimulationPool()
 
     def rotate_dealer(self) -> None:
         """Move the dealer button to the next player."""
@@ -643,13 +636,23 @@ def estimate_win_rate(
     simulations: int,
     rng: random.Random,
     max_workers: Optional[int] = None,
+    backend: str = "auto",
+    pool: Optional[SimulationPool] = None,
+    exact_threshold: Optional[int] = EXACT_THRESHOLD,
 ) -> float:
     """Estimate a player's win rate using Monte Carlo simulation.
 
     This function simulates the remainder of the hand multiple times to estimate
-    the hero's equity against their opponents. When multiple workers are
-    available, the simulation load is divided across processes to accelerate the
-    calculation while preserving deterministic behaviour for seeded RNGs.
+    the hero's equity against their opponents. The work is split into seeded
+    sub-streams (see :mod:`simulation_pool`) that deal their own cards, so the
+    result for a seeded RNG is identical whether the streams run in-process or
+    across worker processes. When NumPy is installed every stream is dealt and
+    scored at once by the vectorised :mod:`equity` backend.
+
+    When few cards remain unseen (typically on the turn or river) sampling is
+    skipped: if enumerating every runout and opponent holding is estimated to
+    cost no more than ``exact_threshold`` evaluations, the exact equity from
+    :mod:`exact_equity` is returned instead.
 
     Args:
         hero: The player whose win rate is being estimated.
@@ -659,6 +662,12 @@ def estimate_win_rate(
         rng: The random number generator to use.
         max_workers: Optional cap on the number of parallel workers. ``None``
             selects an appropriate value based on CPU availability.
+        backend: ``"numpy"``, ``"python"`` or ``"auto"`` (NumPy when available).
+        pool: Optional long-lived :class:`SimulationPool` to run on. Without
+            one, a temporary pool is created when more than one worker is
+            requested.
+        exact_threshold: Evaluation budget for exact enumeration. ``None``
+            always samples.
 
     Returns:
         The estimated win rate as a float between 0.0 and 1.0.
@@ -666,53 +675,48 @@ def estimate_win_rate(
 
     if simulations <= 0:
         raise ValueError("Number of simulations must be a positive integer.")
+    if backend not in {"auto", "numpy", "python"}:
+        raise ValueError(f"Unknown equity backend: {backend!r}")
+    if backend == "numpy" and not equity.NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for the vectorised equity backend but is not available.")
 
     active_opponents = [p for p in players if p is not hero and not p.folded]
     if not active_opponents:
         return 1.0
 
-    known_cards = set(hero.hole_cards) | set(community_cards)
-    deck_pool = [c for c in FULL_DECK if c not in known_cards]
-    needed_board = max(0, 5 - len(community_cards))
-
-    hero_cards = tuple(hero.hole_cards)
-    board_prefix = tuple(community_cards)
+    hero_cards = tuple(hand_strength.card_id(card) for card in hero.hole_cards)
+    board_prefix = tuple(hand_strength.card_id(card) for card in community_cards)
     opponent_count = len(active_opponents)
 
-    assignments: list[tuple[tuple[tuple[Card, ...], ...], tuple[Card, ...]]] = []
-    for _ in range(simulations):
-        rng.shuffle(deck_pool)
-        deck_iter = iter(deck_pool)
-        opponent_holes = tuple(tuple(itertools.islice(deck_iter, 2)) for _ in range(opponent_count))
-        board_extension = tuple(itertools.islice(deck_iter, needed_board))
-        assignments.append((opponent_holes, board_extension))
+    # The lookup tables score at most seven cards; larger hands (Omaha) fall
+    # back to the Python evaluator, which scores every seven-card subset.
+    table_sized = len(hero_cards) <= 2
+    if backend == "numpy" and not table_sized:
+        raise ValueError("The vectorised equity backend supports at most two hole cards.")
+    if backend == "auto":
+        backend = "numpy" if equity.NUMPY_AVAILABLE and table_sized else "python"
+
+    if exact_threshold is not None and table_sized:
+        cost = enumeration_cost(len(board_prefix), opponent_count, len(hero_cards))
+        if cost <= exact_threshold:
+            wins, ties, total = exact_equity(hero_cards, board_prefix, opponent_count)
+            return (wins + ties / 2) / total
+    streams = simulation_streams(simulations, rng.getrandbits(64), backend)
 
     available_cpus = os.cpu_count() or 1
     if max_workers is None:
         worker_cap = available_cpus
     else:
         worker_cap = max(1, max_workers)
-    worker_count = min(worker_cap, available_cpus, len(assignments))
+    worker_count = min(worker_cap, available_cpus, len(streams))
 
-    wins = 0
-    ties = 0
-
-    if worker_count <= 1:
-        wins, ties = _simulate_win_rate_batch(hero_cards, board_prefix, assignments)
+    if pool is not None:
+        wins, ties = pool.run(hero_cards, board_prefix, opponent_count, streams, backend=backend, workers=worker_count)
+    elif worker_count > 1:
+        with SimulationPool(worker_count, min_parallel_simulations=0) as temporary_pool:
+            wins, ties = temporary_pool.run(hero_cards, board_prefix, opponent_count, streams, backend=backend)
     else:
-        chunk_size = math.ceil(len(assignments) / worker_count)
-        chunks = [assignments[i : i + chunk_size] for i in range(0, len(assignments), chunk_size)]
-        try:
-            with ProcessPoolExecutor(max_workers=worker_count) as executor:
-                futures = [executor.submit(_simulate_win_rate_batch, hero_cards, board_prefix, chunk) for chunk in chunks]
-                for future in futures:
-                    chunk_wins, chunk_ties = future.result()
-                    wins += chunk_wins
-                    ties += chunk_ties
-        except KeyboardInterrupt:  # pragma: no cover - propagate interrupts
-            raise
-        except Exception:
-            wins, ties = _simulate_win_rate_batch(hero_cards, board_prefix, assignments)
+        wins, ties = run_streams(hero_cards, board_prefix, opponent_count, streams, backend)
 
     return (wins + ties / 2) / simulations
 
@@ -732,7 +736,9 @@ class PokerMatch:
     """A high-level controller for managing a series of poker hands.
 
     This class orchestrates the entire match, from initialization to playing
-    multiple hands and tracking player chip counts over time.
+    multiple hands and tracking player chip counts over time. Call
+    :meth:`close` (or use the match as a context manager) to stop the bots'
+    simulation workers once play is over.
     """
 
     def __init__(
@@ -771,6 +777,16 @@ class PokerMatch:
         self.hand_number = 0
         self.hand_histories: list[HandHistory] = []
 
+    def close(self) -> None:
+        """Shut down the table's simulation pool and its worker processes."""
+        self.table.simulation_pool.shutdown()
+
+    def __enter__(self) -> "PokerMatch":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def reset(self) -> None:
         """Reset the match to its initial state."""
         for p in self.players:
@@ -781,15 +797,18 @@ class PokerMatch:
     def play_cli(self) -> None:
         """Run the poker match using the command-line interface."""
         print(f"Welcome to {self.game_variant.value}!")
-        for i in range(1, self.rounds + 1):
-            if self.user.chips <= 0:
-                print("You are out of chips. Game over.")
-                break
-            print(f"\n--- Hand {i} ---")
-            result = self.play_hand_cli()
-            self._record_hand_history(i, result)
-            self._display_hand_result(result)
-            self.table.rotate_dealer()
+        try:
+            for i in range(1, self.rounds + 1):
+                if self.user.chips <= 0:
+                    print("You are out of chips. Game over.")
+                    break
+                print(f"\n--- Hand {i} ---")
+                result = self.play_hand_cli()
+                self._record_hand_history(i, result)
+                self._display_hand_result(result)
+                self.table.rotate_dealer()
+        finally:
+            self.close()
         self._display_player_statistics()
         self._save_hand_histories()
 
@@ -9,17 +9,19 @@ designed to be stateless, making it easy to test and integrate.
 The main entry point is the :func:`best_hand` function, which takes an iterable
 of cards and returns the strongest five-card hand that can be formed. The result
 is a :class:`HandRank` instance, which can be compared using standard ordering
-operators to determine the winning hand.
+operators to determine the winning hand. Scoring is delegated to the
+table-driven evaluator in :mod:`hand_strength`; callers in hot loops should use
+that module's integer strengths directly.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from itertools import combinations
 from typing import Iterable, Sequence, Tuple
 
 from ..common.cards import Card
+from . import hand_strength
 
 
 class HandCategory(int, Enum):
@@ -65,14 +67,34 @@ class HandRank:
         cards_str = " ".join(map(str, self.cards))
         return f"{category_name} ({cards_str})"
 
+    @property
+    def strength(self) -> int:
+        """Return the integer strength used by :mod:`hand_strength`."""
+        return hand_strength.pack_strength(self.category, self.tiebreaker)
+
+    @classmethod
+    def from_strength(cls, strength: int, cards: Iterable[Card]) -> "HandRank":
+        """Build a :class:`HandRank` for ``strength`` using cards drawn from ``cards``.
+
+        Args:
+            strength: An integer strength produced by :func:`hand_strength.evaluate`.
+            cards: The cards the strength was computed from.
+
+        Returns:
+            The equivalent ``HandRank`` with the five cards that form the hand.
+        """
+        category = HandCategory(hand_strength.category_of(strength))
+        tiebreaker = hand_strength.tiebreaker_of(strength)
+        return cls(category, tiebreaker, _select_hand_cards(category, tiebreaker, list(cards)))
+
 
 def best_hand(cards: Iterable[Card]) -> HandRank:
     """Return the best possible five-card hand from the provided cards.
 
     This function is essential for games like Texas Hold'em, where players choose
     the best five cards from a larger set (e.g., two hole cards and five community
-    cards). It iterates through all 5-card combinations and returns the one with
-    the highest rank.
+    cards). The cards are scored in a single pass by the lookup tables in
+    :mod:`hand_strength` and the result is wrapped in a :class:`HandRank`.
 
     Args:
         cards: An iterable of cards (typically 5 to 7).
@@ -84,8 +106,7 @@ def best_hand(cards: Iterable[Card]) -> HandRank:
     if len(card_list) < 5:
         raise ValueError("At least five cards are required to evaluate a hand")
 
-    # Generate all 5-card combinations and find the one with the maximum rank.
-    return max(rank_five_card_hand(combo) for combo in combinations(card_list, 5))
+    return HandRank.from_strength(hand_strength.evaluate_cards(card_list), card_list)
 
 
 def rank_five_card_hand(cards: Sequence[Card]) -> HandRank:
@@ -93,7 +114,8 @@ def rank_five_card_hand(cards: Sequence[Card]) -> HandRank:
 
     This function determines the rank of a given 5-card hand by checking for
     straights, flushes, pairs, etc., and constructs a `HandRank` object with the
-    appropriate category and tie-breaker values.
+    appropriate category and tie-breaker values. It is the readable reference
+    implementation that the table-driven evaluator is verified against.
 
     Args:
         cards: A sequence of exactly five cards.
@@ -183,3 +205,46 @@ def _straight_values(values: Tuple[int, ...]) -> int | None:
     is_straight = all(high - i == val for i, val in enumerate(unique_values))
 
     return high if is_straight else None
+
+
+def _select_hand_cards(category: HandCategory, tiebreaker: Tuple[int, ...], cards: Sequence[Card]) -> Tuple[Card, ...]:
+    """Pick the five cards from ``cards`` that realise a decoded hand strength.
+
+    Args:
+        category: The category of the hand.
+        tiebreaker: The tie-breaking values decoded from the strength.
+        cards: The cards the hand was evaluated from.
+
+    Returns:
+        The five cards forming the hand, sorted by descending value.
+    """
+    if category in (HandCategory.STRAIGHT, HandCategory.STRAIGHT_FLUSH):
+        needed = {value: 1 for value in hand_strength.straight_ranks(tiebreaker[0])}
+    elif category == HandCategory.FOUR_OF_A_KIND:
+        needed = {tiebreaker[0]: 4, tiebreaker[1]: 1}
+    elif category == HandCategory.FULL_HOUSE:
+        needed = {tiebreaker[0]: 3, tiebreaker[1]: 2}
+    elif category == HandCategory.THREE_OF_A_KIND:
+        needed = {tiebreaker[0]: 3, tiebreaker[1]: 1, tiebreaker[2]: 1}
+    elif category == HandCategory.TWO_PAIR:
+        needed = {tiebreaker[0]: 2, tiebreaker[1]: 2, tiebreaker[2]: 1}
+    elif category == HandCategory.ONE_PAIR:
+        needed = {tiebreaker[0]: 2, **{value: 1 for value in tiebreaker[1:]}}
+    else:
+        needed = {value: 1 for value in tiebreaker}
+
+    pool = list(cards)
+    if category in (HandCategory.FLUSH, HandCategory.STRAIGHT_FLUSH):
+        # Restrict the pool to the suit that holds every required value.
+        for suit in {card.suit for card in cards}:
+            suited = [card for card in cards if card.suit == suit]
+            if set(needed) <= {card.value for card in suited}:
+                pool = suited
+                break
+
+    selected = []
+    for card in pool:
+        if needed.get(card.value, 0) > 0:
+            needed[card.value] -= 1
+            selected.append(card)
+    return tuple(sorted(selected, key=lambda card: card.value, reverse=True))
@@ -0,0 +1,193 @@
+"""Precomputed pre-flop equity tables for Texas Hold'em bots.
+
+Before the flop there are only 169 strategically distinct starting hands:
+13 pocket pairs, 78 suited and 78 offsuit combinations. Their equity against
+``n`` random opponents never changes, so instead of running a Monte Carlo
+simulation on every pre-flop decision the bots look it up in a table generated
+offline by :func:`generate_tables`.
+
+The table ships as ``resources/preflop_equity.bin``:
+
+- an 8-byte header: the ``b"PFEQ"`` magic, a ``uint16`` format version and a
+  ``uint16`` holding the largest opponent count covered;
+- followed by one little-endian ``uint16`` per (opponent count, hand class),
+  storing equity scaled to ``0..65535``.
+
+:class:`PreflopTable` memory-maps the file so that loading is free and every
+lookup is a single unpack at a computed offset.
+
+Regenerate the resource with::
+
+    python -m games_collection.games.card.poker.preflop --simulations 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import random
+import struct
+from pathlib import Path
+from typing import Optional, Sequence
+
+from ..common.cards import RANKS, Card
+from . import equity
+from .simulation_pool import run_streams, simulation_streams
+
+HAND_CLASSES = len(RANKS) * len(RANKS)
+MAX_OPPONENTS = 9
+
+_MAGIC = b"PFEQ"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_ENTRY = struct.Struct("<H")
+_SCALE = 0xFFFF
+
+RESOURCE_PATH = Path(__file__).resolve().parent / "resources" / "preflop_equity.bin"
+
+
+def hand_class(first: Card, second: Card) -> int:
+    """Return the 0–168 class index of a two-card starting hand.
+
+    Classes form a 13×13 grid: pairs sit on the diagonal, suited hands at
+    ``high * 13 + low`` and offsuit hands at ``low * 13 + high``.
+    """
+    high, low = sorted((first.value, second.value), reverse=True)
+    if first.suit == second.suit or high == low:
+        return high * len(RANKS) + low
+    return low * len(RANKS) + high
+
+
+def class_label(index: int) -> str:
+    """Return the conventional label of a hand class (``"AKs"``, ``"72o"``, ``"TT"``)."""
+    row, column = divmod(index, len(RANKS))
+    if row == column:
+        return RANKS[row] * 2
+    if row > column:
+        return f"{RANKS[row]}{RANKS[column]}s"
+    return f"{RANKS[column]}{RANKS[row]}o"
+
+
+def _representative_ids(index: int) -> tuple[int, int]:
+    """Return card ids for one concrete hand belonging to class ``index``."""
+    row, column = divmod(index, len(RANKS))
+    if row >= column:
+        # Pairs and suited hands: clubs (+ diamonds for the pair).
+        return row * 4, column * 4 + (1 if row == column else 0)
+    return column * 4, row * 4 + 1
+
+
+class PreflopTable:
+    """Read-only, memory-mapped view over a pre-flop equity table file."""
+
+    def __init__(self, path: Path = RESOURCE_PATH) -> None:
+        """Map ``path`` into memory and validate its header.
+
+        Raises:
+            ValueError: If the file is not a pre-flop equity table.
+        """
+        with open(path, "rb") as handle:
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_opponents = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a version {_VERSION} pre-flop equity table")
+        if len(self._buffer) != _HEADER.size + max_opponents * HAND_CLASSES * _ENTRY.size:
+            self._buffer.close()
+            raise ValueError(f"{path} is truncated")
+        self.max_opponents = max_opponents
+
+    def equity(self, hole_cards: Sequence[Card], opponents: int) -> Optional[float]:
+        """Return the pre-flop equity of ``hole_cards`` against ``opponents``.
+
+        Returns ``None`` when the hand or opponent count is outside the table,
+        in which case callers should fall back to simulation.
+        """
+        if len(hole_cards) != 2 or not 1 <= opponents <= self.max_opponents:
+            return None
+        index = (opponents - 1) * HAND_CLASSES + hand_class(hole_cards[0], hole_cards[1])
+        (scaled,) = _ENTRY.unpack_from(self._buffer, _HEADER.size + index * _ENTRY.size)
+        return scaled / _SCALE
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._buffer.close()
+
+
+_DEFAULT_TABLE: Optional[PreflopTable] = None
+_DEFAULT_LOADED = False
+
+
+def load_preflop_table() -> Optional[PreflopTable]:
+    """Return the shared table bundled with the package, or ``None`` if missing."""
+    global _DEFAULT_TABLE, _DEFAULT_LOADED
+    if not _DEFAULT_LOADED:
+        _DEFAULT_LOADED = True
+        try:
+            _DEFAULT_TABLE = PreflopTable()
+        except (OSError, ValueError):
+            _DEFAULT_TABLE = None
+    return _DEFAULT_TABLE
+
+
+def generate_tables(simulations: int, *, seed: int = 0, max_opponents: int = MAX_OPPONENTS) -> list[list[float]]:
+    """Estimate pre-flop equity for every hand class and opponent count.
+
+    Args:
+        simulations: Monte Carlo samples per table entry.
+        seed: Base seed, making generation reproducible.
+        max_opponents: Largest opponent count to cover.
+
+    Returns:
+        ``max_opponents`` rows of ``HAND_CLASSES`` equities.
+    """
+    backend = "numpy" if equity.NUMPY_AVAILABLE else "python"
+    seeder = random.Random(seed)
+    rows = []
+    for opponents in range(1, max_opponents + 1):
+        row = []
+        for index in range(HAND_CLASSES):
+            streams = simulation_streams(simulations, seeder.getrandbits(64), backend)
+            wins, ties = run_streams(_representative_ids(index), (), opponents, streams, backend)
+            row.append((wins + ties / 2) / simulations)
+        rows.append(row)
+    return rows
+
+
+def write_tables(rows: Sequence[Sequence[float]], path: Path = RESOURCE_PATH) -> None:
+    """Serialise equity ``rows`` to ``path`` in the binary table format."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = bytearray(_HEADER.pack(_MAGIC, _VERSION, len(rows)))
+    for row in rows:
+        for value in row:
+            payload += _ENTRY.pack(round(min(max(value, 0.0), 1.0) * _SCALE))
+    path.write_bytes(bytes(payload))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover - offline tool
+    """Regenerate the bundled pre-flop equity table."""
+    parser = argparse.ArgumentParser(description="Generate the pre-flop equity table resource.")
+    parser.add_argument("--simulations", type=int, default=50_000, help="Samples per hand class and opponent count.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=RESOURCE_PATH)
+    args = parser.parse_args(argv)
+
+    rows = generate_tables(args.simulations, seed=args.seed)
+    write_tables(rows, args.output)
+    print(f"Wrote {len(rows)}×{HAND_CLASSES} equities to {args.output}")
+
+
+__all__ = [
+    "HAND_CLASSES",
+    "MAX_OPPONENTS",
+    "PreflopTable",
+    "class_label",
+    "generate_tables",
+    "hand_class",
+    "load_preflop_table",
+    "write_tables",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    main()
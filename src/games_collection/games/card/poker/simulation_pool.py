@@ -0,0 +1,198 @@
+"""Long-lived process pool for poker Monte Carlo equity estimation.
+
+Creating a :class:`~concurrent.futures.ProcessPoolExecutor` for every equity
+estimate, and pickling every dealt hand across the process boundary, costs more
+than the simulations themselves at the sample sizes our bots use. This module
+instead splits a simulation run into *sub-streams*: fixed-size slices of work,
+each identified by its own seed. Workers deal their own cards from those seeds,
+so only a handful of integers cross the process boundary.
+
+Because the stream layout depends only on the base seed, the simulation count
+and the backend, a run produces identical results whether its streams execute
+in-process or are spread across any number of workers.
+
+A :class:`SimulationPool` is started lazily on first use and kept alive for the
+lifetime of a :class:`~games_collection.games.card.poker.poker.PokerTable`, so
+every bot seated at the table shares the same warm workers.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, Sequence
+
+from . import equity, hand_strength
+
+# Simulations per sub-stream. The NumPy backend amortises its per-call overhead
+# over large batches, whereas pure Python streams are kept small so that even
+# modest runs can be spread across workers.
+STREAM_SIZES = {"python": 64, "numpy": 2048}
+
+# Runs smaller than this stay in-process; below it the inter-process round trip
+# costs more than it saves. ``scripts/benchmark_poker_pool.py`` measures the
+# crossover on a given machine.
+PARALLEL_THRESHOLD = 512
+
+Stream = tuple[int, int]
+
+
+def simulation_streams(simulations: int, seed: int, backend: str) -> list[Stream]:
+    """Split ``simulations`` into seeded ``(seed, count)`` sub-streams.
+
+    Args:
+        simulations: Total number of simulations to run.
+        seed: Base seed from which every stream seed is derived.
+        backend: ``"python"`` or ``"numpy"``; selects the stream size.
+
+    Returns:
+        The list of sub-streams covering all simulations.
+    """
+    size = STREAM_SIZES[backend]
+    seeder = random.Random(seed)
+    streams = []
+    for start in range(0, simulations, size):
+        streams.append((seeder.getrandbits(64), min(size, simulations - start)))
+    return streams
+
+
+def _run_python_stream(hero_ids: tuple[int, ...], board_ids: tuple[int, ...], opponent_count: int, seed: int, count: int) -> tuple[int, int]:
+    """Deal and score one sub-stream with the pure Python evaluator."""
+    known = set(hero_ids) | set(board_ids)
+    deck_pool = [card for card in range(52) if card not in known]
+    needed_board = max(0, 5 - len(board_ids))
+    dealt = 2 * opponent_count + needed_board
+    if dealt > len(deck_pool):
+        raise ValueError("Not enough cards remaining to deal every opponent.")
+
+    rng = random.Random(seed)
+    evaluate = hand_strength.evaluate
+    seats = range(0, 2 * opponent_count, 2)
+    wins = 0
+    ties = 0
+    for _ in range(count):
+        deal = rng.sample(deck_pool, dealt)
+        board = board_ids + tuple(deal[2 * opponent_count :])
+        hero_rank = evaluate(hero_ids + board)
+        best_opponent_rank = max(evaluate((deal[seat], deal[seat + 1]) + board) for seat in seats)
+        if hero_rank > best_opponent_rank:
+            wins += 1
+        elif hero_rank == best_opponent_rank:
+            ties += 1
+    return wins, ties
+
+
+def run_streams(
+    hero_ids: tuple[int, ...],
+    board_ids: tuple[int, ...],
+    opponent_count: int,
+    streams: Sequence[Stream],
+    backend: str,
+) -> tuple[int, int]:
+    """Execute ``streams`` in the current process and return ``(wins, ties)``.
+
+    This is also the task function submitted to pool workers.
+    """
+    wins = 0
+    ties = 0
+    for seed, count in streams:
+        if backend == "numpy":
+            stream_wins, stream_ties = equity.simulate_equity(hero_ids, board_ids, opponent_count, count, seed)
+        else:
+            stream_wins, stream_ties = _run_python_stream(hero_ids, board_ids, opponent_count, seed, count)
+        wins += stream_wins
+        ties += stream_ties
+    return wins, ties
+
+
+class SimulationPool:
+    """A lazily started, reusable process pool for equity sub-streams.
+
+    The executor is only created the first time a run is large enough to
+    benefit from parallelism, and it stays alive until :meth:`shutdown` is
+    called. Pools can also be used as context managers.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, *, min_parallel_simulations: int = PARALLEL_THRESHOLD) -> None:
+        """Initialise the pool without starting any worker processes.
+
+        Args:
+            max_workers: Upper bound on worker processes. ``None`` uses the
+                number of available CPUs.
+            min_parallel_simulations: Runs with fewer simulations than this are
+                executed in-process.
+        """
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.min_parallel_simulations = min_parallel_simulations
+        self._executor: Optional[Executor] = None
+
+    @property
+    def started(self) -> bool:
+        """Return ``True`` once worker processes have been launched."""
+        return self._executor is not None
+
+    def run(
+        self,
+        hero_ids: tuple[int, ...],
+        board_ids: tuple[int, ...],
+        opponent_count: int,
+        streams: Sequence[Stream],
+        *,
+        backend: str,
+        workers: Optional[int] = None,
+    ) -> tuple[int, int]:
+        """Execute ``streams`` and return the aggregated ``(wins, ties)``.
+
+        Args:
+            hero_ids: Card ids of the hero's hole cards.
+            board_ids: Card ids already on the board.
+            opponent_count: Number of opponents to deal in.
+            streams: Sub-streams produced by :func:`simulation_streams`.
+            backend: ``"python"`` or ``"numpy"``.
+            workers: Optional per-call cap on the workers used for this run.
+
+        Returns:
+            The number of hero wins and ties across all streams.
+        """
+        worker_count = min(workers or self.max_workers, self.max_workers, len(streams))
+        simulations = sum(count for _, count in streams)
+        if worker_count <= 1 or simulations < self.min_parallel_simulations:
+            return run_streams(hero_ids, board_ids, opponent_count, streams, backend)
+
+        # Deal streams round-robin so every worker gets a similar share.
+        tasks = [streams[index::worker_count] for index in range(worker_count)]
+        try:
+            executor = self._ensure_executor()
+            futures = [executor.submit(run_streams, hero_ids, board_ids, opponent_count, task, backend) for task in tasks]
+            results = [future.result() for future in futures]
+        except KeyboardInterrupt:  # pragma: no cover - propagate interrupts
+            raise
+        except Exception:
+            # A broken pool (e.g. a killed worker) should not cost the bot its
+            # decision; drop it and compute the answer locally.
+            self.shutdown()
+            return run_streams(hero_ids, board_ids, opponent_count, streams, backend)
+
+        return sum(wins for wins, _ in results), sum(ties for _, ties in results)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes. The pool restarts lazily if reused."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _ensure_executor(self) -> Executor:
+        """Start the worker processes if they are not running yet."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def __enter__(self) -> "SimulationPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+__all__ = ["PARALLEL_THRESHOLD", "STREAM_SIZES", "SimulationPool", "run_streams", "simulation_streams"]
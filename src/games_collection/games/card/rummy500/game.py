@@ -16,12 +16,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import lru_cache
 from itertools import combinations
 from random import Random
 from typing import Iterable, Optional, Sequence, Tuple
 
-from games_collection.games.card.common.cards import RANK_TO_VALUE, Card, Deck
+from games_collection.games.card.common.cards import RANK_TO_VALUE, RANKS, Card, Deck
+from games_collection.games.card.common.melds import MeldSolver
 
 
 class GamePhase(Enum):
@@ -40,6 +40,10 @@ def _sort_cards(cards: Iterable[Card]) -> list[Card]:
     return sorted(cards, key=lambda c: (RANK_TO_VALUE[c.rank], c.suit.value))
 
 
+# Aces score 15 and face cards 10; minimizing deadwood maximizes net meld points.
+_MELD_SOLVER = MeldSolver([15 if rank == "A" else 10 if rank in "TJQK" else int(rank) for rank in RANKS])
+
+
 @dataclass
 class Meld:
     """Representation of a meld on the table."""
@@ -294,51 +298,11 @@ class Rummy500Game:
             positive meld points and deadwood penalties respectively.
         """
 
-        canonical_start = self._canonical_cards(cards)
-
-        @lru_cache(maxsize=None)
-        def best_plan(card_tuple: Tuple[Card, ...]) -> tuple[
-            Tuple[Tuple[Card, ...], ...],
-            Tuple[Card, ...],
-            int,
-            int,
-        ]:
-            cards_list = list(card_tuple)
-            deadwood_points = sum(self._card_value(card) for card in cards_list)
-            best_melds: Tuple[Tuple[Card, ...], ...] = tuple()
-            best_deadwood: Tuple[Card, ...] = card_tuple
-            best_meld_points = 0
-            best_deadwood_points = deadwood_points
-            best_net = -deadwood_points
-
-            for meld in self._valid_meld_combinations(cards_list):
-                remaining = list(card_tuple)
-                for card in meld:
-                    remaining.remove(card)
-                remaining_tuple = self._canonical_cards(remaining)
-                sub_melds, sub_deadwood, sub_meld_points, sub_deadwood_points = best_plan(remaining_tuple)
-
-                meld_points = sum(self._card_value(card) for card in meld)
-                total_meld_points = sub_meld_points + meld_points
-                total_deadwood_points = sub_deadwood_points
-                net = total_meld_points - total_deadwood_points
-
-                if net > best_net or (
-                    net == best_net
-                    and (
-                        total_deadwood_points < best_deadwood_points or (total_deadwood_points == best_deadwood_points and total_meld_points > best_meld_points)
-                    )
-                ):
-                    best_net = net
-                    best_meld_points = total_meld_points
-                    best_deadwood_points = total_deadwood_points
-                    best_melds = sub_melds + (meld,)
-                    best_deadwood = sub_deadwood
-
-            return best_melds, best_deadwood, best_meld_points, best_deadwood_points
-
-        melds, deadwood, meld_points, deadwood_points = best_plan(canonical_start)
-        return [list(meld) for meld in melds], list(deadwood), meld_points, deadwood_points
+        plan = _MELD_SOLVER.solve(cards)
+        melds = [_sort_cards(meld) for meld in plan.meld_cards]
+        deadwood = _sort_cards(plan.deadwood_cards)
+        meld_points = sum(self._card_value(card) for meld in melds for card in meld)
+        return melds, deadwood, meld_points, plan.deadwood_points
 
     def available_melds(self, player: int) -> list[list[Card]]:
         """Return all melds available in the current player's hand."""
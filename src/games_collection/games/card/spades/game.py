@@ -3,6 +3,9 @@
 Spades is a trick-taking card game where spades are always trump. Players bid on
 how many tricks they expect to win, and partnerships try to meet their combined bid.
 Special bids include "nil" (zero tricks) for bonus points.
+
+AI card play uses a single-ply heuristic by default, or determinized Monte
+Carlo search when the game is created with search settings (see :mod:`.search`).
 """
 
 from __future__ import annotations
@@ -10,7 +13,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional
 
-from games_collection.games.card.common.cards import Card, Deck, Suit
+from games_collection.games.card.common.cards import Card, Deck, Suit, card_from_id
+from games_collection.games.card.common.hand_mask import SUIT_MASKS, HandMask, card_bit
+from games_collection.games.card.common.trick_search import SearchSettings, TrickSearch
+from games_collection.games.card.spades.search import build_search_position
+
+TWO_OF_CLUBS = Card("2", Suit.CLUBS)
 
 
 @dataclass
@@ -34,8 +42,16 @@ class SpadesPlayer:
 class SpadesGame:
     """Main engine for the Spades card game."""
 
-    def __init__(self, players: list[SpadesPlayer], *, rng=None, target_score: int = 500):
-        """Initialize a Spades game."""
+    def __init__(self, players: list[SpadesPlayer], *, rng=None, target_score: int = 500, search: Optional[SearchSettings] = None):
+        """Initialize a Spades game.
+
+        Args:
+            players: List of 4 players; seats 0/2 and 1/3 are partners.
+            rng: Optional random number generator.
+            target_score: Partnership score that ends the game.
+            search: Optional search settings. When given, AI card play uses
+                determinized Monte Carlo search instead of the heuristic.
+        """
         if len(players) != 4:
             raise ValueError("Spades requires exactly 4 players")
         self.players = players
@@ -59,6 +75,7 @@ class SpadesGame:
         self.bags = [0, 0]
         self.total_tricks_played = 0
         self._last_round_scores: Optional[dict[int, int]] = None
+        self.card_search = TrickSearch(search, rng=rng) if search is not None else None
 
     def deal_cards(self) -> None:
         """Deal all 52 cards evenly to 4 players."""
@@ -98,9 +115,8 @@ class SpadesGame:
 
     def _find_two_of_clubs_holder(self) -> int:
         """Locate the player who holds the two of clubs."""
-        target_card = Card("2", Suit.CLUBS)
         for idx, player in enumerate(self.players):
-            if target_card in player.hand:
+            if TWO_OF_CLUBS in player.hand:
                 return idx
         raise RuntimeError("Two of clubs not found after dealing")
 
@@ -121,23 +137,20 @@ class SpadesGame:
 
     def is_valid_play(self, player: SpadesPlayer, card: Card) -> bool:
         """Check if a card play is valid."""
-        if card not in player.hand:
-            return False
+        return card in self._playable_mask(player)
+
+    def _playable_mask(self, player: SpadesPlayer) -> HandMask:
+        """Return the cards in ``player``'s hand that may legally be played."""
         if self.current_player_index is not None and self.players[self.current_player_index] != player:
-            return False
+            return HandMask()
+        hand = HandMask.from_cards(player.hand)
         if not self.current_trick:
             if self.total_tricks_played == 0 and self.round_number == 1:
-                two_of_clubs = Card("2", Suit.CLUBS)
-                if card != two_of_clubs:
-                    return False
-            if card.suit == Suit.SPADES:
-                if self.spades_broken:
-                    return True
-                return all(c.suit == Suit.SPADES for c in player.hand)
-            return True
-        if self.lead_suit and player.has_suit(self.lead_suit):
-            return card.suit == self.lead_suit
-        return True
+                hand = HandMask(hand.bits & card_bit(TWO_OF_CLUBS))
+            if self.spades_broken or hand.only_suit(Suit.SPADES):
+                return hand
+            return HandMask(hand.bits & ~SUIT_MASKS[Suit.SPADES])
+        return hand.follow_suit(self.lead_suit)
 
     def play_card(self, player: SpadesPlayer, card: Card) -> None:
         """Play a card to the current trick."""
@@ -227,7 +240,7 @@ class SpadesGame:
 
     def get_valid_plays(self, player: SpadesPlayer) -> list[Card]:
         """Get all valid cards a player can play."""
-        return [card for card in player.hand if self.is_valid_play(player, card)]
+        return self._playable_mask(player).filter(player.hand)
 
     def suggest_bid(self, player: SpadesPlayer) -> int:
         """AI logic to suggest a bid."""
@@ -268,6 +281,8 @@ class SpadesGame:
         valid_cards = self.get_valid_plays(player)
         if len(valid_cards) == 1:
             return valid_cards[0]
+        if self.card_search is not None:
+            return card_from_id(self.card_search.choose(*build_search_position(self, player)))
         if not self.current_trick:
             non_spades = [c for c in valid_cards if c.suit != Suit.SPADES]
             if non_spades:
@@ -281,6 +296,11 @@ class SpadesGame:
             return max(non_spades, key=lambda c: c.value)
         return min(valid_cards, key=lambda c: c.value)
 
+    def close(self) -> None:
+        """Release the search worker processes, if any were started."""
+        if self.card_search is not None:
+            self.card_search.close()
+
     def is_game_over(self) -> bool:
         """Check whether a partnership has reached the target score."""
         return any(score >= self.target_score for score in self.team_scores)
@@ -0,0 +1,141 @@
+"""Search-based card play for Spades.
+
+Adapts a :class:`~games_collection.games.card.spades.game.SpadesGame` to the
+determinized search in :mod:`games_collection.games.card.common.trick_search`:
+:func:`build_search_position` extracts what the player to move can observe and
+:class:`SpadesRules` supplies a partnership-aware rollout policy and a payoff
+based on the round's bids.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from games_collection.games.card.common.cards import Card, Suit, card_id
+from games_collection.games.card.common.hand_mask import HandMask
+from games_collection.games.card.common.trick_search import (
+    SUIT_BITS,
+    Observation,
+    TrickRules,
+    TrickState,
+    highest,
+    lowest,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from games_collection.games.card.spades.game import SpadesGame, SpadesPlayer
+
+_SPADES = list(Suit).index(Suit.SPADES)
+
+
+class SpadesRules(TrickRules):
+    """Spades are trump and may not be led until broken.
+
+    Attributes:
+        bids: Each seat's bid (``None`` when unknown).
+        blind_nil: Whether each seat bid blind nil.
+    """
+
+    trump = _SPADES
+    restricted_lead = _SPADES
+    breaking_cards = SUIT_BITS[_SPADES]
+
+    def __init__(self, bids: Sequence[Optional[int]], blind_nil: Sequence[bool], *, opening: bool = False) -> None:
+        """Record the round's bids; ``opening`` requires the two of clubs lead."""
+        self.bids = tuple(bids)
+        self.blind_nil = tuple(blind_nil)
+        self.opening_card = card_id(Card("2", Suit.CLUBS)) if opening else None
+
+    def rollout_card(self, state: TrickState, seat: int, legal: int, rng: random.Random) -> int:
+        """Win cheaply unless partner is already winning, otherwise shed low cards."""
+        if not state.trick:
+            side_suits = [suit for suit in range(4) if suit != _SPADES and legal & SUIT_BITS[suit]]
+            if side_suits:
+                return highest(legal & SUIT_BITS[rng.choice(side_suits)])
+            return lowest(legal)
+        winner, winning = self.trick_winner(state.trick)
+        partner_winning = winner == (seat + 2) % len(state.hands)
+        in_suit = legal & SUIT_BITS[state.trick[0][1] & 3]
+        if in_suit:
+            if partner_winning or (winning & 3) != (state.trick[0][1] & 3):
+                return lowest(in_suit)
+            beaters = in_suit & ~((1 << (winning + 1)) - 1)
+            return lowest(beaters or in_suit)
+        trumps = legal & SUIT_BITS[_SPADES]
+        if trumps and not partner_winning:
+            if winning & 3 == _SPADES:
+                beaters = trumps & ~((1 << (winning + 1)) - 1)
+                if beaters:
+                    return lowest(beaters)
+            else:
+                return lowest(trumps)
+        return lowest(legal & ~trumps or legal)
+
+    def _team_score(self, state: TrickState, seats: Sequence[int]) -> int:
+        """Score one partnership's round, ignoring sandbag carry-over."""
+        score = 0
+        bid = 0
+        tricks = 0
+        for seat in seats:
+            if self.bids[seat] == 0:
+                bonus = 200 if self.blind_nil[seat] else 100
+                score += bonus if state.tricks[seat] == 0 else -bonus
+            else:
+                bid += self.bids[seat] or 0
+                tricks += state.tricks[seat]
+        if tricks >= bid:
+            return score + bid * 10 + (tricks - bid)
+        return score - bid * 10
+
+    def payoff(self, state: TrickState, seat: int) -> float:
+        """Return the seat's partnership score minus the opponents'."""
+        count = len(state.hands)
+        team = [seat, (seat + 2) % count]
+        opponents = [(seat + 1) % count, (seat + 3) % count]
+        return float(self._team_score(state, team) - self._team_score(state, opponents))
+
+
+def build_search_position(game: SpadesGame, player: SpadesPlayer) -> tuple[SpadesRules, TrickState, Observation]:
+    """Describe the position as seen by ``player``, who must be the one to act."""
+    searcher = game.players.index(player)
+    count = len(game.players)
+
+    tricks = [list(trick) for trick in game.trick_history]
+    if game.current_trick:
+        tricks.append(list(game.current_trick))
+    played = 0
+    voids = [0] * count
+    for cards in tricks:
+        lead_suit = cards[0][1].suit
+        for member, card in cards:
+            played |= 1 << card_id(card)
+            if card.suit != lead_suit:
+                voids[game.players.index(member)] |= 1 << list(Suit).index(lead_suit)
+
+    own = HandMask.from_cards(player.hand).bits
+    trick = [(game.players.index(member), card_id(card)) for member, card in game.current_trick]
+    state = TrickState(
+        hands=[own if seat == searcher else 0 for seat in range(count)],
+        won=[0] * count,
+        tricks=[member.tricks_won for member in game.players],
+        trick=trick,
+        leader=trick[0][0] if trick else searcher,
+        broken=game.spades_broken,
+        first_trick=game.total_tricks_played == 0,
+    )
+    observation = Observation(
+        unseen=((1 << 52) - 1) & ~own & ~played,
+        hand_sizes=[len(member.hand) for member in game.players],
+        voids=voids,
+        known=[0] * count,
+    )
+    rules = SpadesRules(
+        [member.bid for member in game.players],
+        [member.blind_nil for member in game.players],
+        opening=game.total_tricks_played == 0 and game.round_number == 1,
+    )
+    return rules, state, observation
+
+
+__all__ = ["SpadesRules", "build_search_position"]
@@ -6,5 +6,6 @@ Toggle-based puzzle game
 from __future__ import annotations
 
 from .lights_out import LightBulb, LightsOutGame
+from .solver import LightsOutSolver
 
-__all__ = ["LightsOutGame", "LightBulb"]
+__all__ = ["LightsOutGame", "LightBulb", "LightsOutSolver"]
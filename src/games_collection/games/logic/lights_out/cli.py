@@ -8,10 +8,12 @@ experience.
 
 The main loop handles user input for board size and move coordinates,
 updates the game state, and renders the board and telemetry data after
-each move until the puzzle is solved.
+each move until the puzzle is solved. Hints and the par move count come
+from the GF(2) solver.
 """
 
 from statistics import mean
+from typing import Callable, Mapping, Optional
 
 from .lights_out import LightBulb, LightsOutGame
 
@@ -50,6 +52,7 @@ def _prompt_for_integer(
     minimum: int,
     maximum: int,
     default: int,
+    commands: Optional[Mapping[str, Callable[[], None]]] = None,
 ) -> int:
     """Prompt the user for an integer within a specified range.
 
@@ -61,6 +64,7 @@ def _prompt_for_integer(
         minimum: The minimum acceptable value for the integer.
         maximum: The maximum acceptable value for the integer.
         default: The default value to return if the user enters nothing.
+        commands: Optional words that run an action and prompt again.
 
     Returns:
         The validated integer entered by the user.
@@ -69,6 +73,9 @@ def _prompt_for_integer(
         raw = input(message).strip()
         if not raw:
             return default
+        if commands and raw.lower() in commands:
+            commands[raw.lower()]()
+            continue
         try:
             value = int(raw)
         except ValueError:
@@ -91,11 +98,12 @@ def _render_board(game: LightsOutGame) -> None:
     Args:
         game: The LightsOutGame instance containing the board state.
     """
-    header = "    " + " ".join(str(i) for i in range(game.size))
+    width = len(str(game.size - 1))
+    header = " " * (width + 3) + " ".join(f"{i:>{width}}" for i in range(game.size))
     print(header)
     for r, row in enumerate(game.grid):
-        cells = " ".join(_render_bulb(bulb) for bulb in row)
-        print(f"  {r} {cells}")
+        cells = " ".join(f"{_render_bulb(bulb):>{width}}" for bulb in row)
+        print(f"  {r:>{width}} {cells}")
 
 
 def _print_telemetry(game: LightsOutGame) -> None:
@@ -119,6 +127,19 @@ def _print_telemetry(game: LightsOutGame) -> None:
     print(f"Average toggles per bulb: {avg_toggles:.1f} (max {max_toggles})")
 
 
+def _print_hint(game: LightsOutGame) -> None:
+    """Print the next fixture of a shortest solution.
+
+    Args:
+        game: The LightsOutGame instance to give a hint for.
+    """
+    hint = game.get_hint()
+    if hint is None:
+        print("No hint available.")
+    else:
+        print(f"Hint: toggle row {hint[0]}, column {hint[1]} ({game.get_min_moves()} moves left at best).")
+
+
 def main() -> None:
     """Run the main game loop for the Lights Out CLI.
 
@@ -134,12 +155,14 @@ def main() -> None:
 
     # Prompt the user for the desired board size and initialize the game.
     size = _prompt_for_integer(
-        "\nChoose board size (default 5, range 3-9): ",
+        "\nChoose board size (default 5, range 3-25): ",
         minimum=3,
-        maximum=9,
+        maximum=25,
         default=5,
     )
     game = LightsOutGame(size=size)
+    par = game.get_min_moves()
+    print(f"This board can be cleared in {par} moves.")
 
     # Main game loop. Continues until all lights are off.
     while not game.is_game_over():
@@ -152,10 +175,11 @@ def main() -> None:
 
         # Prompt the player for their next move.
         row = _prompt_for_integer(
-            "Row to toggle (0-indexed): ",
+            "Row to toggle (0-indexed, h for a hint): ",
             minimum=0,
             maximum=game.size - 1,
             default=0,
+            commands={"h": lambda: _print_hint(game), "hint": lambda: _print_hint(game)},
         )
         col = _prompt_for_integer(
             "Column to toggle (0-indexed): ",
@@ -171,6 +195,8 @@ def main() -> None:
     # Once the game is over, print the final results.
     print("\n" + "=" * 60)
     print(f"Puzzle solved in {game.moves} moves!")
+    if par is not None:
+        print(f"Par for this board was {par} moves ({game.moves - par:+d}).")
     print(f"Total simulated time: {game.total_time_seconds:.1f} seconds")
     print(f"Total energy consumed: {game.total_energy_kwh:.4f} kWh")
     print(f"Final room brightness: {game.calculate_room_brightness():.1f} lux")
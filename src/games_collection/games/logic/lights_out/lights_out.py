@@ -11,6 +11,11 @@ by generating scrambled boards from a solved state. The engine is designed
 to be independent of the user interface, making it suitable for use in
 both CLI and GUI applications.
 
+The on/off state of the board lives in bit-packed rows, one integer per row,
+so a toggle is three XORs and the GF(2) solver in :mod:`.solver` can work on
+the rows directly for hints, minimum move counts and boards with an exact
+minimum-move count. Only the bulbs around a toggle are re-simulated.
+
 Attributes:
     _NEIGHBOR_DELTAS: A tuple of coordinate offsets used to identify a
         bulb and its adjacent neighbors (up, down, left, right).
@@ -20,10 +25,12 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from games_collection.core.game_engine import GameEngine, GameState
 
+from .solver import solver_for
+
 # Deltas for finding neighbors, including the bulb itself (0,0).
 _NEIGHBOR_DELTAS: Tuple[Tuple[int, int], ...] = (
     (0, 0),  # The bulb itself
@@ -59,6 +66,27 @@ class LightBulb:
         self.toggle_count += 1
 
 
+class _GridBulb(LightBulb):
+    """A bulb on a game board whose on/off state is a bit of the board's rows."""
+
+    def __init__(self, rows: List[int], row: int, column: int) -> None:
+        self._rows = rows
+        self._row = row
+        self._mask = 1 << column
+        super().__init__(is_on=bool(rows[row] & self._mask))
+
+    @property  # type: ignore[override]
+    def is_on(self) -> bool:
+        return bool(self._rows[self._row] & self._mask)
+
+    @is_on.setter
+    def is_on(self, value: bool) -> None:
+        if value:
+            self._rows[self._row] |= self._mask
+        else:
+            self._rows[self._row] &= ~self._mask
+
+
 class LightsOutGame(GameEngine[Tuple[int, int], int]):
     """A Lights Out toggle puzzle with a physically-inspired simulation.
 
@@ -71,7 +99,10 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
 
     Attributes:
         size: The dimension of the square game grid.
-        grid: A 2D list representing the grid of `LightBulb` instances.
+        rows: The bit-packed board, bit ``c`` of ``rows[r]`` set when the
+            bulb at ``(r, c)`` is on.
+        grid: A 2D list representing the grid of `LightBulb` instances,
+            whose on/off state reads and writes `rows`.
         state: The current `GameState` of the puzzle.
         moves: The number of moves made by the player.
         total_time_seconds: The cumulative simulated time for all moves.
@@ -83,6 +114,7 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
         size: int = 5,
         *,
         scramble_moves: int | None = None,
+        min_moves: int | None = None,
         on_brightness: float = 1.0,
         ambient_reflection: float = 0.18,
         move_duration_seconds: float = 4.5,
@@ -96,6 +128,8 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
             size: The size of the square grid (e.g., 5 for a 5x5 board).
             scramble_moves: The number of random moves to make to scramble
                 the board. Defaults to size*size.
+            min_moves: If given, deal a board whose shortest solution takes
+                exactly this many moves instead of scrambling.
             on_brightness: The brightness of a bulb when it is fully on.
             ambient_reflection: The fraction of a neighbor's brightness
                 that reflects onto an off bulb.
@@ -104,9 +138,13 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
             standby_wattage: The power draw of a single 'off' bulb.
             lux_per_bulb: The estimated brightness in lux per unit of
                 bulb brightness.
+
+        Raises:
+            ValueError: If no board of this size needs `min_moves` moves.
         """
         self.size = size
         self.scramble_moves = scramble_moves if scramble_moves is not None else size**2
+        self.min_moves = min_moves
         self.on_brightness = on_brightness
         self.ambient_reflection = ambient_reflection
         self.move_duration_seconds = move_duration_seconds
@@ -114,6 +152,7 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
         self.standby_wattage = standby_wattage
         self.lux_per_bulb = lux_per_bulb
 
+        self.rows: List[int] = []
         self.grid: List[List[LightBulb]] = []
         self.state = GameState.NOT_STARTED
         self.moves = 0
@@ -129,9 +168,13 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
         self.moves = 0
         self.total_time_seconds = 0.0
         self.total_energy_kwh = 0.0
-        self.grid = [[LightBulb() for _ in range(self.size)] for _ in range(self.size)]
+        self.rows = [0] * self.size
+        self.grid = [[_GridBulb(self.rows, r, c) for c in range(self.size)] for r in range(self.size)]
 
-        self._scramble_grid()
+        if self.min_moves is not None:
+            self.rows[:] = solver_for(self.size).generate(self.min_moves)
+        else:
+            self._scramble_grid()
         self._recalculate_brightness()
         self._current_power_draw = self.calculate_power_draw()
 
@@ -167,34 +210,45 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
         if not (0 <= r < self.size and 0 <= c < self.size):
             return False
 
-        for dr, dc in _NEIGHBOR_DELTAS:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                self.grid[nr][nc].toggle()
+        # The target's row loses or gains three bulbs, the rows around it one.
+        bit = 1 << c
+        self.rows[r] ^= (bit | bit << 1 | bit >> 1) & ((1 << self.size) - 1)
+        if r > 0:
+            self.rows[r - 1] ^= bit
+        if r < self.size - 1:
+            self.rows[r + 1] ^= bit
+        for nr, nc in self._cross(r, c):
+            self.grid[nr][nc].toggle_count += 1
 
         return True
 
+    def _cross(self, r: int, c: int) -> List[Tuple[int, int]]:
+        """Return a bulb and its orthogonal neighbours that lie on the board."""
+        return [(r + dr, c + dc) for dr, dc in _NEIGHBOR_DELTAS if 0 <= r + dr < self.size and 0 <= c + dc < self.size]
+
     def _recalculate_brightness(self) -> None:
         """Update the brightness of all bulbs on the grid.
 
         A bulb's brightness depends on its on/off state and the light
         reflected from its neighbors (ambient light).
         """
-        for r, row in enumerate(self.grid):
-            for c, bulb in enumerate(row):
-                if bulb.is_on:
-                    target_brightness = self.on_brightness
-                else:
-                    # Calculate ambient light from neighbors.
-                    neighbors_on = sum(
-                        1 for dr, dc in _NEIGHBOR_DELTAS[1:] if 0 <= r + dr < self.size and 0 <= c + dc < self.size and self.grid[r + dr][c + dc].is_on
-                    )
-                    target_brightness = min(
-                        self.on_brightness,
-                        neighbors_on * self.ambient_reflection,
-                    )
-
-                bulb.brightness = max(0.0, min(self.on_brightness, target_brightness))
+        for r in range(self.size):
+            for c in range(self.size):
+                self._update_brightness(r, c)
+
+    def _update_brightness(self, r: int, c: int) -> None:
+        """Update the brightness of the bulb at (r, c) from its neighbours."""
+        if self.rows[r] >> c & 1:
+            target_brightness = self.on_brightness
+        else:
+            # Calculate ambient light from neighbors.
+            neighbors_on = sum(self.rows[nr] >> nc & 1 for nr, nc in self._cross(r, c)[1:])
+            target_brightness = min(
+                self.on_brightness,
+                neighbors_on * self.ambient_reflection,
+            )
+
+        self.grid[r][c].brightness = max(0.0, min(self.on_brightness, target_brightness))
 
     def is_game_over(self) -> bool:
         """Check if the game is over (all lights are off).
@@ -202,7 +256,7 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
         Returns:
             True if all bulbs are off, False otherwise.
         """
-        return all(not bulb.is_on for row in self.grid for bulb in row)
+        return not any(self.rows)
 
     def get_current_player(self) -> int:
         """Return the current player. In this single-player game, it is always 0.
@@ -244,7 +298,11 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
         self.total_energy_kwh += (previous_power / 1000.0) * (self.move_duration_seconds / 3600.0)
         self.moves += 1
 
-        self._recalculate_brightness()
+        # Toggles only change the light reaching bulbs within two steps.
+        r, c = move
+        for nr, nc in {(nr + dr, nc + dc) for nr, nc in self._cross(r, c) for dr, dc in _NEIGHBOR_DELTAS}:
+            if 0 <= nr < self.size and 0 <= nc < self.size:
+                self._update_brightness(nr, nc)
         self._current_power_draw = self.calculate_power_draw()
 
         if self.is_game_over():
@@ -258,11 +316,8 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
         Returns:
             The total power consumption in watts.
         """
-        power = 0.0
-        for row in self.grid:
-            for bulb in row:
-                power += self.bulb_wattage if bulb.is_on else self.standby_wattage
-        return power
+        lit = sum(bin(row).count("1") for row in self.rows)
+        return lit * self.bulb_wattage + (self.size * self.size - lit) * self.standby_wattage
 
     def calculate_room_brightness(self) -> float:
         """Estimate the total brightness of the room in lux.
@@ -272,6 +327,25 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
         """
         return sum(bulb.brightness for row in self.grid for bulb in row) * self.lux_per_bulb
 
+    def get_hint(self) -> Optional[Tuple[int, int]]:
+        """Return a move from a shortest solution of the current board.
+
+        Returns:
+            The first cell in reading order to toggle, or None if the board
+            is already dark or cannot be cleared.
+        """
+        solution = solver_for(self.size).solve(self.rows)
+        return solution[0] if solution else None
+
+    def get_min_moves(self) -> Optional[int]:
+        """Return the fewest moves that switch every light off from here.
+
+        Returns:
+            The move count, or None if the bulbs were set by hand into a
+            pattern that no sequence of toggles can clear.
+        """
+        return solver_for(self.size).minimum_moves(self.rows)
+
     def get_state_representation(self) -> Dict[str, object]:
         """Return a dictionary representing the full state of the game.
 
@@ -281,7 +355,7 @@ class LightsOutGame(GameEngine[Tuple[int, int], int]):
             A dictionary containing detailed state information.
         """
         return {
-            "grid": [[bulb.is_on for bulb in row] for row in self.grid],
+            "grid": [[bool(row >> c & 1) for c in range(self.size)] for row in self.rows],
             "brightness": [[bulb.brightness for bulb in row] for row in self.grid],
             "moves": self.moves,
             "power_draw_w": self._current_power_draw,
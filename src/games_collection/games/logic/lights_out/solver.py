@@ -0,0 +1,228 @@
+"""Lights Out solving by linear algebra over GF(2).
+
+Pressing a light twice undoes it and the order of presses does not matter,
+so a solution is a set of cells: a vector ``x`` with one bit per cell such that
+``A x = b``, where ``b`` holds the lit cells and column ``j`` of ``A`` is the
+cross of cells toggled by pressing cell ``j``, all arithmetic mod 2.
+
+Boards are bit-packed: a board is a list of row integers with bit ``c`` of
+row ``r`` set when the light at ``(r, c)`` is on, and internally the whole
+board is one integer with cell ``(r, c)`` at bit ``r * size + c``. Additions
+of vectors are XORs and a dot product is the parity of an AND, so elimination
+on a 25x25 board runs on 625-bit integers rather than nested lists.
+
+:func:`solver_for` reduces ``A`` once per board size and caches the result:
+the row operations that bring ``A`` to reduced row echelon form (the
+pseudo-inverse), the pivot columns, and a basis of the null space. Some sizes,
+including the classic 5x5, are singular: only boards orthogonal to the null
+space can be solved, and each solvable board has ``2 ** nullity`` solutions,
+all of which are checked to return the one with the fewest presses.
+"""
+
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+Board = List[int]
+
+# Null spaces beyond this dimension make checking every solution too slow.
+MAX_NULLITY = 20
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+def pack(board: Sequence[Sequence[bool]]) -> Board:
+    """Return the bit-packed rows of a board given as rows of booleans."""
+    return [sum(1 << column for column, lit in enumerate(row) if lit) for row in board]
+
+
+def unpack(rows: Sequence[int], size: int) -> List[List[bool]]:
+    """Return a bit-packed board as rows of booleans."""
+    return [[bool(row >> column & 1) for column in range(size)] for row in rows]
+
+
+def press_mask(size: int, row: int, column: int) -> int:
+    """Return the flattened board of lights toggled by pressing ``(row, column)``."""
+    cell = row * size + column
+    mask = 1 << cell
+    if row > 0:
+        mask |= 1 << (cell - size)
+    if row < size - 1:
+        mask |= 1 << (cell + size)
+    if column > 0:
+        mask |= 1 << (cell - 1)
+    if column < size - 1:
+        mask |= 1 << (cell + 1)
+    return mask
+
+
+class LightsOutSolver:
+    """Solutions of Lights Out on a ``size`` x ``size`` board.
+
+    Use :func:`solver_for` to share the reduction between callers.
+
+    Raises:
+        ValueError: If ``size`` is smaller than 1.
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError(f"board size must be at least 1, not {size}")
+        self.size = size
+        cells = size * size
+        # Row i pairs the equation for cell i with the combination of original
+        # equations it is built from; the matrix is symmetric, so press masks
+        # double as rows.
+        matrix = [press_mask(size, cell // size, cell % size) for cell in range(cells)]
+        combination = [1 << cell for cell in range(cells)]
+        pivots: List[int] = []
+        rank = 0
+        for column in range(cells):
+            bit = 1 << column
+            pivot = next((row for row in range(rank, cells) if matrix[row] & bit), None)
+            if pivot is None:
+                continue
+            matrix[rank], matrix[pivot] = matrix[pivot], matrix[rank]
+            combination[rank], combination[pivot] = combination[pivot], combination[rank]
+            for row in range(cells):
+                if row != rank and matrix[row] & bit:
+                    matrix[row] ^= matrix[rank]
+                    combination[row] ^= combination[rank]
+            pivots.append(column)
+            rank += 1
+        self.rank = rank
+        self._pivots = pivots
+        self._inverse = combination[:rank]
+        # Boards a solvable board must be orthogonal to.
+        self._checks = combination[rank:]
+        free = [column for column in range(cells) if column not in set(pivots)]
+        self.null_space: List[int] = []
+        for column in free:
+            vector = 1 << column
+            for row, pivot in enumerate(pivots):
+                if matrix[row] >> column & 1:
+                    vector |= 1 << pivot
+            self.null_space.append(vector)
+
+    @property
+    def nullity(self) -> int:
+        """Return the dimension of the null space; each solvable board has ``2 ** nullity`` solutions."""
+        return len(self.null_space)
+
+    def flatten(self, rows: Sequence[int]) -> int:
+        """Return the board as a single integer, cell ``(r, c)`` at bit ``r * size + c``."""
+        if len(rows) != self.size:
+            raise ValueError(f"expected {self.size} rows, got {len(rows)}")
+        board = 0
+        for row, bits in enumerate(rows):
+            board |= bits << (row * self.size)
+        return board
+
+    def cells(self, presses: int) -> List[Tuple[int, int]]:
+        """Return the ``(row, column)`` cells of a flattened press vector, in reading order."""
+        return [divmod(cell, self.size) for cell in range(self.size * self.size) if presses >> cell & 1]
+
+    def is_solvable(self, rows: Sequence[int]) -> bool:
+        """Return True if the lights can all be switched off."""
+        board = self.flatten(rows)
+        return not any(_popcount(check & board) & 1 for check in self._checks)
+
+    def particular_solution(self, rows: Sequence[int]) -> Optional[int]:
+        """Return one flattened press vector solving the board, or ``None`` if it is unsolvable."""
+        if not self.is_solvable(rows):
+            return None
+        board = self.flatten(rows)
+        presses = 0
+        for pivot, inverse in zip(self._pivots, self._inverse):
+            if _popcount(inverse & board) & 1:
+                presses |= 1 << pivot
+        return presses
+
+    def minimal_solution(self, rows: Sequence[int]) -> Optional[int]:
+        """Return the press vector with the fewest presses, or ``None`` if the board is unsolvable.
+
+        Raises:
+            ValueError: If the null space is too large to search.
+        """
+        presses = self.particular_solution(rows)
+        if presses is None:
+            return None
+        return self._minimise(presses)
+
+    def solve(self, rows: Sequence[int]) -> Optional[List[Tuple[int, int]]]:
+        """Return the cells of a shortest solution, or ``None`` if the board is unsolvable."""
+        presses = self.minimal_solution(rows)
+        return None if presses is None else self.cells(presses)
+
+    def minimum_moves(self, rows: Sequence[int]) -> Optional[int]:
+        """Return the fewest presses that switch every light off, or ``None`` if impossible."""
+        presses = self.minimal_solution(rows)
+        return None if presses is None else _popcount(presses)
+
+    def board_for(self, presses: int) -> Board:
+        """Return the bit-packed rows lit by pressing every cell in ``presses`` on a dark board."""
+        board = 0
+        for row, column in self.cells(presses):
+            board ^= press_mask(self.size, row, column)
+        row_mask = (1 << self.size) - 1
+        return [board >> (row * self.size) & row_mask for row in range(self.size)]
+
+    def generate(self, moves: int, rng: Optional[random.Random] = None) -> Board:
+        """Return a board whose shortest solution takes exactly ``moves`` presses.
+
+        Presses are added one at a time, each chosen so that the press set
+        stays the shortest solution of the board it lights; when no press can
+        be added the set is started again.
+
+        Raises:
+            ValueError: If ``moves`` is negative or more than the board allows.
+        """
+        cells = self.size * self.size
+        if not 0 <= moves <= cells:
+            raise ValueError(f"moves must be between 0 and {cells}, not {moves}")
+        generator = rng or random
+        for _ in range(100):
+            presses = 0
+            count = 0
+            while count < moves:
+                options = [cell for cell in range(cells) if not presses >> cell & 1]
+                generator.shuffle(options)
+                for cell in options:
+                    candidate = presses | 1 << cell
+                    if _popcount(self._minimise(candidate)) == count + 1:
+                        presses = candidate
+                        count += 1
+                        break
+                else:
+                    break
+            if count == moves:
+                return self.board_for(presses)
+        raise ValueError(f"no {self.size}x{self.size} board needs {moves} moves")
+
+    def _minimise(self, presses: int) -> int:
+        """Return the lightest vector in ``presses`` plus the null space."""
+        if self.nullity > MAX_NULLITY:
+            raise ValueError(f"a null space of dimension {self.nullity} is too large to search")
+        best = presses
+        best_count = _popcount(presses)
+        # Walk every combination of basis vectors in Gray code order, one XOR per step.
+        current = presses
+        for step in range(1, 1 << self.nullity):
+            current ^= self.null_space[(step & -step).bit_length() - 1]
+            count = _popcount(current)
+            if count < best_count:
+                best, best_count = current, count
+        return best
+
+
+@lru_cache(maxsize=None)
+def solver_for(size: int) -> LightsOutSolver:
+    """Return the shared solver for ``size`` x ``size`` boards."""
+    return LightsOutSolver(size)
+
+
+__all__ = ["LightsOutSolver", "MAX_NULLITY", "pack", "press_mask", "solver_for", "unpack"]
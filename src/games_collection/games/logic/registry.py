@@ -85,30 +85,38 @@ def _sliding_factory(params: Dict[str, Any]) -> SlidingPuzzleGame:
     """Factory function to create a `SlidingPuzzleGame` instance.
 
     Args:
-        params: A dictionary of parameters, including 'size' and the
-                number of 'shuffle_moves'.
+        params: A dictionary of parameters, including 'size', the
+                number of 'shuffle_moves' and an optional exact
+                'target_distance' from the solved board.
 
     Returns:
         An initialized `SlidingPuzzleGame` instance.
     """
     size = int(params.get("size", 4))
     shuffle_moves = int(params.get("shuffle_moves", size * size * 12))
-    return SlidingPuzzleGame(size=size, shuffle_moves=shuffle_moves)
+    target_distance = params.get("target_distance")
+    if target_distance is not None:
+        target_distance = int(target_distance)
+    return SlidingPuzzleGame(size=size, shuffle_moves=shuffle_moves, target_distance=target_distance)
 
 
 def _lights_out_factory(params: Dict[str, Any]) -> LightsOutGame:
     """Factory function to create a `LightsOutGame` instance.
 
     Args:
-        params: A dictionary of parameters, including 'size' and the
-                number of 'scramble_moves'.
+        params: A dictionary of parameters, including 'size' and either the
+                number of 'scramble_moves' or the exact 'min_moves' needed
+                to solve the board.
 
     Returns:
         An initialized `LightsOutGame` instance.
     """
     size = int(params.get("size", 5))
     scramble = int(params.get("scramble_moves", size**2))
-    return LightsOutGame(size=size, scramble_moves=scramble)
+    min_moves = params.get("min_moves")
+    if min_moves is not None:
+        min_moves = int(min_moves)
+    return LightsOutGame(size=size, scramble_moves=scramble, min_moves=min_moves)
 
 
 def _sokoban_factory(params: Dict[str, Any]) -> SokobanGame:
@@ -256,13 +264,13 @@ def register_default_logic_games() -> None:
                             key="3x3",
                             display_name="3x3",
                             generator=_sliding_factory,
-                            parameters={"size": 3, "shuffle_moves": 80},
+                            parameters={"size": 3, "target_distance": 20},
                         ),
                         PuzzleDifficulty(
                             key="4x4",
                             display_name="4x4",
                             generator=_sliding_factory,
-                            parameters={"size": 4, "shuffle_moves": 160},
+                            parameters={"size": 4, "target_distance": 34},
                             prerequisite_key="3x3",
                             unlock_after=3,
                         ),
@@ -289,22 +297,30 @@ def register_default_logic_games() -> None:
                 LevelPack(
                     key="studio",
                     display_name="Studio Fixtures",
-                    description="Default boards with increasing scramble lengths.",
+                    description="Boards with increasing minimum solution lengths.",
                     difficulties=[
                         PuzzleDifficulty(
                             key="5x5",
                             display_name="5x5",
                             generator=_lights_out_factory,
-                            parameters={"size": 5},
+                            parameters={"size": 5, "min_moves": 10},
                         ),
                         PuzzleDifficulty(
                             key="6x6",
                             display_name="6x6",
                             generator=_lights_out_factory,
-                            parameters={"size": 6, "scramble_moves": 60},
+                            parameters={"size": 6, "min_moves": 16},
                             prerequisite_key="5x5",
                             unlock_after=4,
                         ),
+                        PuzzleDifficulty(
+                            key="25x25",
+                            display_name="25x25",
+                            generator=_lights_out_factory,
+                            parameters={"size": 25, "min_moves": 150},
+                            prerequisite_key="6x6",
+                            unlock_after=4,
+                        ),
                     ],
                 ),
             ],
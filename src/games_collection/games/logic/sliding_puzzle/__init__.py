@@ -5,6 +5,8 @@ Number tile sliding game (15-puzzle)
 
 from __future__ import annotations
 
-__all__ = ["SlidingPuzzleGame"]
+__all__ = ["PatternDatabase", "SlidingPuzzleGame", "SlidingPuzzleSolver"]
 
+from .pdb import PatternDatabase
 from .sliding_puzzle import SlidingPuzzleGame
+from .solver import SlidingPuzzleSolver
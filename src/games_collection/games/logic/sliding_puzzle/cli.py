@@ -6,13 +6,20 @@ board size and interact with the puzzle by specifying which tile to move
 or the direction of the move.
 
 The main game loop handles user input, renders the board, and provides
-feedback on the validity of moves until the puzzle is solved.
+feedback on the validity of moves until the puzzle is solved. Players can
+ask for an optimal hint and are scored against par at the end.
 """
 
 from __future__ import annotations
 
 from .sliding_puzzle import SlidingPuzzleGame
 
+_DIRECTION_NAMES = {"u": "up", "d": "down", "l": "left", "r": "right"}
+
+# Boards are dealt this many optimal moves from solved, so that hints and par
+# stay within the solver's hint budget on every size the CLI offers.
+_DEAL_DISTANCES = {3: 20, 4: 34, 5: 30, 6: 30}
+
 
 def main() -> None:
     """Run the interactive sliding puzzle experience in the command line.
@@ -37,7 +44,7 @@ def main() -> None:
         print("Large boards can be unwieldy in the terminal. Using 6x6.")
         size = 6
 
-    game = SlidingPuzzleGame(size=size)
+    game = SlidingPuzzleGame(size=size, target_distance=_DEAL_DISTANCES[size])
 
     # Determine the width for formatting the tiles based on the largest number.
     tile_width = len(str(game.size * game.size - 1)) + 1
@@ -55,16 +62,24 @@ def main() -> None:
             print(" ".join(row_tiles))
 
         # Get the player's next move.
-        move = input("\nEnter tile number or direction (u/d/l/r), q to quit: ").strip().lower()
+        move = input("\nEnter tile number or direction (u/d/l/r), h for a hint, q to quit: ").strip().lower()
         if move == "q":
             print("Thanks for playing!")
             return
+        if move == "h":
+            hint = game.get_hint()
+            if hint:
+                print(f"Hint: move the blank {_DIRECTION_NAMES[hint]}.")
+            continue
 
         if not game.make_move(move):
             print("Invalid move. Choose a tile adjacent to the blank or a valid direction.")
 
-    # Print the final success message.
+    # Print the final success message, compared against par when it is known.
     print(f"\nSolved in {game.moves} moves! Great job!")
+    par = game.get_par()
+    if par is not None:
+        print(f"Par for this board was {par} moves ({game.moves - par:+d}).")
 
 
 if __name__ == "__main__":
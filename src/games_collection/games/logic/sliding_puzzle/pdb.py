@@ -0,0 +1,257 @@
+"""Additive pattern databases for the sliding puzzle.
+
+A pattern database splits the tiles into disjoint groups and stores, for
+every placement of one group's tiles, the fewest moves *of those tiles* needed
+to bring them home, the other tiles being treated as interchangeable blanks.
+Because each database only counts moves of its own tiles, the values of
+disjoint groups can be added and still never overestimate the true distance,
+which makes the sum a far stronger heuristic than Manhattan distance.
+
+:func:`generate_pattern` fills one database by a breadth-first search back
+from the solved board over (tile placement, blank cell) states: blank moves
+into cells outside the group are free, moves of a group tile cost one. A
+placement is indexed by ranking the group's cells as a partial permutation,
+so a group of ``k`` tiles on ``n`` cells needs ``n! / (n - k)!`` bytes.
+
+The 15-puzzle databases ship as ``resources/pattern_db.bin``:
+
+- an 8-byte header: the ``b"SLPD"`` magic, a ``uint16`` format version, a
+  ``uint8`` board size and a ``uint8`` group count;
+- per group, a ``uint8`` tile count followed by the tile numbers;
+- then each group's table of ``uint8`` move counts, in group order.
+
+:class:`PatternDatabase` memory-maps the file so that loading is free. The
+bundled file uses the 5-5-5 partition in :data:`DEFAULT_PARTITION`; a 6-6-3
+split is stronger but its two six-tile searches visit over 100 million states,
+too many to regenerate in pure Python. Regenerate the resource with::
+
+    python -m games_collection.games.logic.sliding_puzzle.pdb
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+DEFAULT_SIZE = 4
+DEFAULT_PARTITION: Tuple[Tuple[int, ...], ...] = ((1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15))
+
+_MAGIC = b"SLPD"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHBB")
+
+RESOURCE_PATH = Path(__file__).resolve().parent / "resources" / "pattern_db.bin"
+
+# Boards of up to 4x4, so that a set of cells fits the bit-count table.
+MAX_CELLS = 16
+_BIT_COUNT = bytes(bin(mask).count("1") for mask in range(1 << MAX_CELLS))
+
+
+def pattern_size(cells: int, tiles: int) -> int:
+    """Return the number of ways to place ``tiles`` distinct tiles on ``cells`` cells."""
+    total = 1
+    for offset in range(tiles):
+        total *= cells - offset
+    return total
+
+
+def rank(positions: Sequence[int], cells: int) -> int:
+    """Return the dense index of a placement among :func:`pattern_size` placements."""
+    index = 0
+    used = 0
+    for order, position in enumerate(positions):
+        # Cells already taken by earlier tiles are skipped when numbering this one.
+        index = index * (cells - order) + position - _BIT_COUNT[used & ((1 << position) - 1)]
+        used |= 1 << position
+    return index
+
+
+def _neighbours(size: int) -> List[Tuple[int, ...]]:
+    """Return the cells next to each cell of a ``size`` x ``size`` board."""
+    neighbours = []
+    for cell in range(size * size):
+        row, column = divmod(cell, size)
+        around = []
+        if row > 0:
+            around.append(cell - size)
+        if row < size - 1:
+            around.append(cell + size)
+        if column > 0:
+            around.append(cell - 1)
+        if column < size - 1:
+            around.append(cell + 1)
+        neighbours.append(tuple(around))
+    return neighbours
+
+
+def generate_pattern(size: int, tiles: Sequence[int]) -> bytearray:
+    """Return the move counts of one tile group, indexed by :func:`rank` of the tiles' cells."""
+    cells = size * size
+    if cells > MAX_CELLS:
+        raise ValueError(f"pattern databases cover boards of at most {MAX_CELLS} cells")
+    if not tiles or any(not 0 < tile < cells for tile in tiles) or len(set(tiles)) != len(tiles):
+        raise ValueError(f"pattern tiles must be distinct numbers from 1 to {cells - 1}")
+    neighbours = _neighbours(size)
+    unseen = 0xFF
+    table = bytearray([unseen]) * pattern_size(cells, len(tiles))
+    # States are keyed by placement rank and blank cell. Free blank moves are
+    # flooded within a layer; moving a group tile queues the next layer.
+    visited = bytearray(len(table) * cells)
+    queued = bytearray(len(table) * cells)
+    start = tuple(tile - 1 for tile in tiles)
+    layer = [(start, cells - 1, rank(start, cells))]
+    cost = 0
+    while layer:
+        stack = []
+        for positions, blank, index in layer:
+            key = index * cells + blank
+            if not visited[key]:
+                visited[key] = 1
+                stack.append((positions, blank, index))
+        following = []
+        while stack:
+            positions, blank, index = stack.pop()
+            if table[index] == unseen:
+                table[index] = cost
+            for target in neighbours[blank]:
+                if target in positions:
+                    moved = tuple(blank if position == target else position for position in positions)
+                    moved_index = rank(moved, cells)
+                    key = moved_index * cells + target
+                    if not visited[key] and not queued[key]:
+                        queued[key] = 1
+                        following.append((moved, target, moved_index))
+                else:
+                    key = index * cells + target
+                    if not visited[key]:
+                        visited[key] = 1
+                        stack.append((positions, target, index))
+        layer = following
+        cost += 1
+    return table
+
+
+def write_database(size: int, partition: Sequence[Sequence[int]], tables: Sequence[bytes], path: Path = RESOURCE_PATH) -> None:
+    """Serialise tables from :func:`generate_pattern` to ``path``."""
+    if len(partition) != len(tables):
+        raise ValueError(f"expected {len(partition)} tables, got {len(tables)}")
+    payload = bytearray(_HEADER.pack(_MAGIC, _VERSION, size, len(partition)))
+    for tiles in partition:
+        payload += bytes([len(tiles), *tiles])
+    for table in tables:
+        payload += table
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(bytes(payload))
+
+
+class PatternDatabase:
+    """Read-only, memory-mapped view over an additive pattern database file."""
+
+    def __init__(self, path: Path = RESOURCE_PATH) -> None:
+        """Map ``path`` into memory and validate its header.
+
+        Raises:
+            ValueError: If the file is not a pattern database.
+        """
+        with open(path, "rb") as handle:
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size, groups = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a version {_VERSION} pattern database")
+        cells = size * size
+        offset = _HEADER.size
+        partition = []
+        for _ in range(groups):
+            count = self._buffer[offset]
+            partition.append(tuple(self._buffer[offset + 1 : offset + 1 + count]))
+            offset += 1 + count
+        self._offsets = []
+        for tiles in partition:
+            self._offsets.append(offset)
+            offset += pattern_size(cells, len(tiles))
+        if len(self._buffer) != offset:
+            self._buffer.close()
+            raise ValueError(f"{path} is truncated")
+        self.size = size
+        self.partition: Tuple[Tuple[int, ...], ...] = tuple(partition)
+        # The group each tile belongs to, -1 for the blank.
+        self.group_of = [-1] * cells
+        for group, tiles in enumerate(partition):
+            for tile in tiles:
+                self.group_of[tile] = group
+
+    def group_value(self, group: int, where: Sequence[int]) -> int:
+        """Return one group's move count, given the cell of every tile in ``where``."""
+        positions = [where[tile] for tile in self.partition[group]]
+        return self._buffer[self._offsets[group] + rank(positions, self.size * self.size)]
+
+    def heuristic(self, board: Sequence[int]) -> int:
+        """Return the additive lower bound on the moves needed to solve ``board``."""
+        where = [0] * len(board)
+        for cell, tile in enumerate(board):
+            where[tile] = cell
+        return sum(self.group_value(group, where) for group in range(len(self.partition)))
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._buffer.close()
+
+
+_DEFAULT_DATABASE: Optional[PatternDatabase] = None
+_DEFAULT_LOADED = False
+
+
+def load_pattern_database() -> Optional[PatternDatabase]:
+    """Return the shared 15-puzzle database bundled with the package, or ``None`` if missing."""
+    global _DEFAULT_DATABASE, _DEFAULT_LOADED
+    if not _DEFAULT_LOADED:
+        _DEFAULT_LOADED = True
+        try:
+            _DEFAULT_DATABASE = PatternDatabase()
+        except (OSError, ValueError):
+            _DEFAULT_DATABASE = None
+    return _DEFAULT_DATABASE
+
+
+def _parse_partition(text: str) -> Tuple[Tuple[int, ...], ...]:
+    return tuple(tuple(int(tile) for tile in group.split(",")) for group in text.split("/"))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover - offline tool
+    """Regenerate the bundled pattern database."""
+    parser = argparse.ArgumentParser(description="Generate the additive sliding puzzle pattern database resource.")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    parser.add_argument(
+        "--partition",
+        type=_parse_partition,
+        default=DEFAULT_PARTITION,
+        help="Tile groups separated by '/', tiles by ',' (for example 1,2,3,5,6/4,7,8,11,12/9,10,13,14,15).",
+    )
+    parser.add_argument("--output", type=Path, default=RESOURCE_PATH)
+    args = parser.parse_args(argv)
+
+    tiles = sorted(tile for group in args.partition for tile in group)
+    if tiles != list(range(1, args.size * args.size)):
+        parser.error("the partition must cover every tile exactly once")
+    tables = [generate_pattern(args.size, group) for group in args.partition]
+    write_database(args.size, args.partition, tables, args.output)
+    print(f"Wrote {len(tables)} pattern tables for the {args.size}x{args.size} puzzle to {args.output}")
+
+
+__all__ = [
+    "DEFAULT_PARTITION",
+    "PatternDatabase",
+    "generate_pattern",
+    "load_pattern_database",
+    "pattern_size",
+    "rank",
+    "write_database",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    main()
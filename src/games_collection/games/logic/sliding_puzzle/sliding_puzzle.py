@@ -8,6 +8,9 @@ Players can interact with the puzzle by specifying either the direction to
 move the blank space or the number of the tile they wish to slide. This
 flexibility makes the engine suitable for various user interfaces.
 
+Optimal hints, par move counts and boards at an exact distance from solved
+come from the IDA* solver in :mod:`.solver`.
+
 Classes:
     SlidingPuzzleGame: The main logic engine for the sliding puzzle.
 """
@@ -15,10 +18,15 @@ Classes:
 from __future__ import annotations
 
 import random
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from games_collection.core.game_engine import GameEngine, GameState
 
+from .solver import SlidingPuzzleSolver
+
+# Nodes a hint or par search may expand before settling for a heuristic answer.
+HINT_NODE_LIMIT = 50_000
+
 
 class SlidingPuzzleGame(GameEngine[str, int]):
     """The logic engine for the sliding puzzle game.
@@ -39,7 +47,7 @@ class SlidingPuzzleGame(GameEngine[str, int]):
     }
     _OPPOSITE_DIRECTIONS: Dict[str, str] = {"u": "d", "d": "u", "l": "r", "r": "l"}
 
-    def __init__(self, size: int = 4, shuffle_moves: int = 200) -> None:
+    def __init__(self, size: int = 4, shuffle_moves: int = 200, *, target_distance: Optional[int] = None) -> None:
         """Create a new sliding puzzle instance.
 
         Args:
@@ -47,6 +55,8 @@ class SlidingPuzzleGame(GameEngine[str, int]):
                 15-puzzle uses size=4.
             shuffle_moves: The number of random moves to apply during the
                 shuffling process to create a solvable board.
+            target_distance: If given, deal a board exactly this many moves
+                from solved instead of shuffling; it becomes the par.
 
         Raises:
             ValueError: If the specified size is less than 3.
@@ -56,17 +66,33 @@ class SlidingPuzzleGame(GameEngine[str, int]):
 
         self.size = size
         self.shuffle_moves = shuffle_moves
+        self.target_distance = target_distance
         self.board: List[int] = []
+        self.initial_board: List[int] = []
         self.moves = 0
         self.state = GameState.NOT_STARTED
+        self._solver = SlidingPuzzleSolver(size, node_limit=HINT_NODE_LIMIT)
+        self._par: Optional[int] = None
+        # Whether par has been searched for, so a search that gave up is not repeated.
+        self._par_searched = False
         self.reset()
 
     def reset(self) -> None:
         """Reset the board to a new, freshly shuffled, and solvable state."""
-        self.board = self._create_solved_board()
         self.moves = 0
         self.state = GameState.NOT_STARTED
-        self._shuffle_board()
+        self._par = None
+        self._par_searched = False
+        if self.target_distance is not None:
+            self._solver.node_limit = None
+            self.board = self._solver.generate(self.target_distance)
+            self._solver.node_limit = HINT_NODE_LIMIT
+            self._par = self.target_distance
+            self._par_searched = True
+        else:
+            self.board = self._create_solved_board()
+            self._shuffle_board()
+        self.initial_board = list(self.board)
 
     def _create_solved_board(self) -> List[int]:
         """Return the solved configuration for the current board size.
@@ -208,6 +234,30 @@ class SlidingPuzzleGame(GameEngine[str, int]):
             self.state = GameState.FINISHED
         return True
 
+    def get_hint(self) -> Optional[str]:
+        """Return the blank move an optimal solver would play next, or None if solved.
+
+        Boards too deep to solve within the hint budget get the move that
+        improves the solver's distance estimate the most instead.
+        """
+        return self._solver.hint(self.board)
+
+    def get_par(self) -> Optional[int]:
+        """Return the fewest moves the starting board could be solved in.
+
+        Returns None when the board is too deep to solve within the hint
+        budget, as shuffled 15-puzzles often are.
+        """
+        if not self._par_searched:
+            self._par_searched = True
+            self._par = self._solver.distance(self.initial_board)
+        return self._par
+
+    def moves_over_par(self) -> Optional[int]:
+        """Return how many moves more than par the player has used, if par is known."""
+        par = self.get_par()
+        return None if par is None else self.moves - par
+
     def get_winner(self) -> int | None:
         """Return the winner of the game.
 
@@ -0,0 +1,304 @@
+"""Optimal sliding puzzle solving with IDA*.
+
+:class:`SlidingPuzzleSolver` runs iterative-deepening A* over boards in the
+:class:`~.sliding_puzzle.SlidingPuzzleGame` layout: a flat list read row by
+row with ``0`` for the blank, solved when the tiles run ``1 .. n*n - 1`` with
+the blank last. Moves are named after the direction the blank travels, as in
+the game.
+
+The heuristic is the larger of two admissible bounds, both kept up to date
+incrementally as tiles slide:
+
+- Manhattan distance plus linear conflicts. Tiles already in their goal row
+  (or column) but in the wrong order must leave it and come back; the bound
+  adds two moves for every tile outside the longest correctly ordered run.
+- For the 15-puzzle, the sum of the additive pattern databases in
+  :mod:`.pdb`, when the bundled resource is present. The solved board is
+  symmetric about its main diagonal, so the databases are also looked up on
+  the board reflected across it and the larger sum is used.
+"""
+
+from __future__ import annotations
+
+import random
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple
+
+from .pdb import PatternDatabase, load_pattern_database
+
+# Blank move -> (row step, column step), and the move that undoes it.
+DIRECTIONS = {"u": (-1, 0), "d": (1, 0), "l": (0, -1), "r": (0, 1)}
+OPPOSITE = {"u": "d", "d": "u", "l": "r", "r": "l"}
+
+_FOUND = -1
+
+
+def solved_board(size: int) -> List[int]:
+    """Return the solved board of a ``size`` x ``size`` puzzle."""
+    return list(range(1, size * size)) + [0]
+
+
+def is_solvable(board: Sequence[int], size: int) -> bool:
+    """Return True if ``board`` can be slid back to :func:`solved_board`."""
+    tiles = [tile for tile in board if tile]
+    inversions = sum(1 for index, tile in enumerate(tiles) for later in tiles[index + 1 :] if later < tile)
+    if size % 2:
+        return inversions % 2 == 0
+    blank_row = board.index(0) // size
+    return (inversions + size - 1 - blank_row) % 2 == 0
+
+
+def _conflicts(goals: Sequence[int]) -> int:
+    """Return two moves per tile outside the longest increasing run of ``goals``."""
+    tails: List[int] = []
+    for goal in goals:
+        position = bisect_left(tails, goal)
+        if position == len(tails):
+            tails.append(goal)
+        else:
+            tails[position] = goal
+    return 2 * (len(goals) - len(tails))
+
+
+class SlidingPuzzleSolver:
+    """IDA* search for shortest sliding puzzle solutions.
+
+    Args:
+        size: Side length of the board.
+        pattern_database: Additive pattern databases to use; defaults to
+            the bundled 15-puzzle tables when ``size`` matches them.
+        node_limit: Give up a search after expanding this many nodes.
+    """
+
+    def __init__(self, size: int = 4, *, pattern_database: Optional[PatternDatabase] = None, node_limit: Optional[int] = None) -> None:
+        if size < 2:
+            raise ValueError("Sliding puzzles require a board of at least 2x2.")
+        if pattern_database is None:
+            pattern_database = load_pattern_database()
+        self.size = size
+        self.pattern_database = pattern_database if pattern_database is not None and pattern_database.size == size else None
+        self.node_limit = node_limit
+        self.nodes = 0
+        cells = size * size
+        self._distance = [[0] * cells for _ in range(cells)]
+        for tile in range(1, cells):
+            goal_row, goal_column = divmod(tile - 1, size)
+            for cell in range(cells):
+                row, column = divmod(cell, size)
+                self._distance[tile][cell] = abs(row - goal_row) + abs(column - goal_column)
+        # Reflection across the main diagonal, for cells and for tile numbers.
+        self._mirror_cell = [(cell % size) * size + cell // size for cell in range(cells)]
+        self._mirror_tile = [0] + [self._mirror_cell[tile - 1] + 1 for tile in range(1, cells)]
+        self._moves: List[Tuple[Tuple[int, str], ...]] = []
+        for cell in range(cells):
+            row, column = divmod(cell, size)
+            options = []
+            for direction, (row_step, column_step) in DIRECTIONS.items():
+                if 0 <= row + row_step < size and 0 <= column + column_step < size:
+                    options.append((cell + row_step * size + column_step, direction))
+            self._moves.append(tuple(options))
+
+    def heuristic(self, board: Sequence[int]) -> int:
+        """Return a lower bound on the moves needed to solve ``board``."""
+        self._load(board)
+        return self._estimate()
+
+    def solve(self, board: Sequence[int]) -> Optional[List[str]]:
+        """Return a shortest list of blank moves solving ``board``.
+
+        Returns ``None`` if the node limit is reached first.
+
+        Raises:
+            ValueError: If the board is malformed or unsolvable.
+        """
+        if len(board) != self.size * self.size or sorted(board) != list(range(self.size * self.size)):
+            raise ValueError(f"board must hold each number from 0 to {self.size * self.size - 1} once")
+        if not is_solvable(board, self.size):
+            raise ValueError("board cannot be solved")
+        self.nodes = 0
+        self._load(board)
+        path: List[str] = []
+        bound = self._estimate()
+        while True:
+            result = self._search(0, bound, "", path)
+            if result == _FOUND:
+                return path
+            if result is None:
+                return None
+            bound = result
+
+    def distance(self, board: Sequence[int]) -> Optional[int]:
+        """Return the optimal number of moves for ``board``, or ``None`` past the node limit."""
+        path = self.solve(board)
+        return None if path is None else len(path)
+
+    def hint(self, board: Sequence[int]) -> Optional[str]:
+        """Return the first blank move of an optimal solution, or ``None`` if solved.
+
+        When the node limit cuts the search short, falls back to the move
+        that lowers the heuristic the most.
+        """
+        if list(board) == solved_board(self.size):
+            return None
+        path = self.solve(board)
+        if path is not None:
+            return path[0]
+        blank = board.index(0)
+        best: Optional[Tuple[int, str]] = None
+        for target, direction in self._moves[blank]:
+            child = list(board)
+            child[blank], child[target] = child[target], 0
+            estimate = self.heuristic(child)
+            if best is None or estimate < best[0]:
+                best = (estimate, direction)
+        return best[1] if best is not None else None
+
+    def generate(self, distance: int, rng: Optional[random.Random] = None) -> List[int]:
+        """Return a board exactly ``distance`` optimal moves from solved.
+
+        Random walks only bound the distance from above, so the walk is
+        solved optimally and, if it overshoots, followed back along its
+        optimal solution until exactly ``distance`` moves remain.
+
+        Raises:
+            ValueError: If ``distance`` is negative.
+        """
+        if distance < 0:
+            raise ValueError(f"distance must not be negative, not {distance}")
+        choice = (rng or random).choice
+        board = solved_board(self.size)
+        previous = ""
+        walk = distance
+        while True:
+            for _ in range(walk):
+                blank = board.index(0)
+                options = [(target, direction) for target, direction in self._moves[blank] if direction != OPPOSITE.get(previous)]
+                target, previous = choice(options)
+                board[blank], board[target] = board[target], 0
+            path = self.solve(board)
+            if path is None:
+                raise RuntimeError(f"search exceeded {self.node_limit} nodes")
+            if len(path) >= distance:
+                for direction in path[: len(path) - distance]:
+                    blank = board.index(0)
+                    row_step, column_step = DIRECTIONS[direction]
+                    target = blank + row_step * self.size + column_step
+                    board[blank], board[target] = board[target], 0
+                return board
+            walk = distance - len(path)
+
+    def _load(self, board: Sequence[int]) -> None:
+        """Set up the incremental search state for ``board``."""
+        size = self.size
+        self._board = list(board)
+        self._where = [0] * len(board)
+        for cell, tile in enumerate(board):
+            self._where[tile] = cell
+        self._blank = self._where[0]
+        self._manhattan = sum(self._distance[tile][cell] for cell, tile in enumerate(board) if tile)
+        self._row_conflicts = [self._row_conflict(row) for row in range(size)]
+        self._column_conflicts = [self._column_conflict(column) for column in range(size)]
+        self._conflict_total = sum(self._row_conflicts) + sum(self._column_conflicts)
+        database = self.pattern_database
+        if database is not None:
+            self._mirror_where = [0] * len(board)
+            for tile, cell in enumerate(self._where):
+                self._mirror_where[self._mirror_tile[tile]] = self._mirror_cell[cell]
+            self._groups = [database.group_value(group, self._where) for group in range(len(database.partition))]
+            self._mirror_groups = [database.group_value(group, self._mirror_where) for group in range(len(database.partition))]
+            self._group_total = sum(self._groups)
+            self._mirror_total = sum(self._mirror_groups)
+        else:
+            self._group_total = self._mirror_total = 0
+
+    def _row_conflict(self, row: int) -> int:
+        size = self.size
+        goals = []
+        for cell in range(row * size, (row + 1) * size):
+            tile = self._board[cell]
+            if tile and (tile - 1) // size == row:
+                goals.append((tile - 1) % size)
+        return _conflicts(goals)
+
+    def _column_conflict(self, column: int) -> int:
+        size = self.size
+        goals = []
+        for cell in range(column, size * size, size):
+            tile = self._board[cell]
+            if tile and (tile - 1) % size == column:
+                goals.append((tile - 1) // size)
+        return _conflicts(goals)
+
+    def _estimate(self) -> int:
+        return max(self._manhattan + self._conflict_total, self._group_total, self._mirror_total)
+
+    def _slide(self, target: int) -> None:
+        """Move the tile at ``target`` into the blank, updating every bound."""
+        size = self.size
+        board = self._board
+        blank = self._blank
+        tile = board[target]
+        board[blank], board[target] = tile, 0
+        self._where[tile] = blank
+        self._where[0] = target
+        self._blank = target
+        self._manhattan += self._distance[tile][blank] - self._distance[tile][target]
+        if blank % size == target % size:
+            # A vertical slide changes the tile's row.
+            for row in (blank // size, target // size):
+                value = self._row_conflict(row)
+                self._conflict_total += value - self._row_conflicts[row]
+                self._row_conflicts[row] = value
+        else:
+            for column in (blank % size, target % size):
+                value = self._column_conflict(column)
+                self._conflict_total += value - self._column_conflicts[column]
+                self._column_conflicts[column] = value
+        database = self.pattern_database
+        if database is not None:
+            group = database.group_of[tile]
+            value = database.group_value(group, self._where)
+            self._group_total += value - self._groups[group]
+            self._groups[group] = value
+            mirror = self._mirror_tile[tile]
+            self._mirror_where[mirror] = self._mirror_cell[blank]
+            group = database.group_of[mirror]
+            value = database.group_value(group, self._mirror_where)
+            self._mirror_total += value - self._mirror_groups[group]
+            self._mirror_groups[group] = value
+
+    def _search(self, cost: int, bound: int, previous: str, path: List[str]) -> Optional[int]:
+        """Depth-first search below ``bound``.
+
+        Returns ``_FOUND`` with ``path`` holding the solution, the smallest
+        estimate that exceeded ``bound``, or ``None`` once the node limit is hit.
+        """
+        estimate = self._estimate()
+        total = cost + estimate
+        if total > bound:
+            return total
+        if estimate == 0:
+            return _FOUND
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            return None
+        smallest = None
+        blank = self._blank
+        for target, direction in self._moves[blank]:
+            if direction == OPPOSITE.get(previous):
+                continue
+            self._slide(target)
+            path.append(direction)
+            result = self._search(cost + 1, bound, direction, path)
+            if result == _FOUND:
+                return _FOUND
+            path.pop()
+            self._slide(blank)
+            if result is None:
+                return None
+            if smallest is None or result < smallest:
+                smallest = result
+        return smallest if smallest is not None else bound + 1
+
+
+__all__ = ["DIRECTIONS", "SlidingPuzzleSolver", "is_solvable", "solved_board"]
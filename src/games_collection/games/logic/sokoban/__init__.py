@@ -5,6 +5,7 @@ Warehouse puzzle with box-pushing mechanics
 
 from __future__ import annotations
 
-__all__ = ["SokobanGame"]
+__all__ = ["SokobanGame", "SokobanSolver"]
 
 from .sokoban import SokobanGame
+from .solver import SokobanSolver
@@ -1,8 +1,8 @@
 """Command-line interface for the Sokoban puzzle game.
 
 This module provides an interactive, text-based version of the classic
-Sokoban puzzle. It supports level navigation, undo functionality, and a
-clear display of the game board and player statistics.
+Sokoban puzzle. It supports level navigation, undo functionality, solver
+hints, and a clear display of the game board and player statistics.
 
 The main game loop handles user commands for moving the worker, navigating
 between levels, and managing the game state, providing a complete and
@@ -28,6 +28,8 @@ def _render_board(game: SokobanGame) -> None:
     print(f"\nMoves: {game.moves} | Pushes: {game.pushes}")
     valid_moves = " ".join(game.get_valid_moves()) or "(none)"
     print(f"Valid moves: {valid_moves}")
+    if game.is_deadlocked():
+        print("A crate is stuck where it can never reach a goal - undo or restart.")
 
 
 def _print_help() -> None:
@@ -35,6 +37,7 @@ def _print_help() -> None:
     commands: Iterable[tuple[str, str]] = (
         ("u/d/l/r", "Move the warehouse worker up, down, left, or right"),
         ("undo", "Rewind the previous move"),
+        ("hint", "Suggest the next move of a solution with the fewest pushes"),
         ("restart", "Reset the current level to its initial state"),
         ("next / prev", "Cycle through the curated level set"),
         ("help", "Show this help text again"),
@@ -67,6 +70,9 @@ def main() -> None:
 
         # Check for win condition.
         if game.is_game_over():
+            par = game.get_par()
+            if par is not None:
+                print(f"Par for this level is {par} pushes ({game.pushes - par:+d}).")
             choice = input("Solved! Press Enter for the next level, type 'restart' to replay, or 'quit' to exit: ").strip().lower()
             if choice in {"quit", "q"}:
                 break
@@ -88,6 +94,10 @@ def main() -> None:
             if not game.undo_last_move():
                 print("Nothing to undo.")
             continue
+        if command == "hint":
+            hint = game.get_hint()
+            print(f"Hint: {hint}" if hint else "No hint available from this position.")
+            continue
         if command in {"restart", "reset"}:
             game.reset()
             print("Level restarted.")
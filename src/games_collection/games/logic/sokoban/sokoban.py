@@ -8,16 +8,26 @@ goal tracking, and detailed move statistics.
 This implementation is designed to be independent of the user interface,
 making it suitable for both command-line and graphical front-ends.
 
+Custom levels are checked for solvability, and push-optimal hints and par
+push counts come from the solver in :mod:`.solver`. The undo history records
+one move per entry in LURD notation (the direction letter, upper case when
+the move pushed a crate), so it no longer grows with the size of the grid.
+
 Classes:
     SokobanGame: The main game engine for Sokoban puzzles.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Sequence, Tuple, cast
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from games_collection.core.game_engine import GameEngine, GameState
 
+from .solver import SokobanSolver, validate_level
+
+# States a hint or par search may expand before giving up.
+HINT_NODE_LIMIT = 100_000
+
 
 class SokobanGame(GameEngine[str, int]):
     """The game engine for the Sokoban box-pushing puzzle.
@@ -39,6 +49,7 @@ class SokobanGame(GameEngine[str, int]):
         level_index: The index of the currently loaded built-in level.
             This is -1 for custom levels.
         level_name: The display name of the active level.
+        history: The moves made so far in LURD notation, for undo.
     """
 
     LEVELS: Tuple[Dict[str, Sequence[str]], ...] = (
@@ -71,11 +82,11 @@ class SokobanGame(GameEngine[str, int]):
             "layout": (
                 "    ######",
                 "#### #   #",
-                "#  ### # #",
+                "#   ## # #",
                 "# $  . . #",
                 "## # $ $##",
                 "#  .#@#. #",
-                "# $ $ # ##",
+                "# $ $ #  #",
                 "# . .  $ #",
                 "##########",
             ),
@@ -94,23 +105,27 @@ class SokobanGame(GameEngine[str, int]):
         Args:
             level_index: The index of the predefined level to load.
             custom_level: An optional custom level layout that overrides
-                the `level_index`.
+                the `level_index`. It is rejected if the solver proves it
+                cannot be solved.
 
         Raises:
             ValueError: If the provided `level_index` is invalid or the
-                level layout is malformed.
+                level layout is malformed or unsolvable.
         """
         self.moves = 0
         self.pushes = 0
-        self.history: List[Dict[str, object]] = []
+        self.history: List[str] = []
         self.goal_positions: set[Tuple[int, int]] = set()
         self.level_index = -1
         self.level_name = "Custom Level"
         self._base_layout: Sequence[str] = ()
+        self._solver: Optional[SokobanSolver] = None
+        self._par: Optional[int] = None
 
         if custom_level is not None:
             self._set_base_layout(tuple(custom_level))
             self.reset()
+            validate_level(self._base_layout, node_limit=HINT_NODE_LIMIT)
         else:
             self.load_level(level_index)
 
@@ -153,10 +168,50 @@ class SokobanGame(GameEngine[str, int]):
         if not self.history:
             return False
 
-        snapshot = self.history.pop()
-        self._apply_snapshot(snapshot)
+        move = self.history.pop()
+        direction = self.DIRECTIONS[move.lower()]
+        position = self.player_pos
+        self._move_player(self._offset_position(position, self._reverse(direction)))
+        if move.isupper():
+            self._move_box(self._offset_position(position, direction), position)
+            self.pushes -= 1
+        self.moves -= 1
+        if self.is_game_over():
+            self.state = GameState.FINISHED
+        else:
+            self.state = GameState.IN_PROGRESS if self.history else GameState.NOT_STARTED
         return True
 
+    def get_hint(self) -> Optional[str]:
+        """Return the next move of a solution with the fewest pushes.
+
+        Returns:
+            A direction, or None if the level is solved, deadlocked, or too
+            hard to search within the hint budget.
+        """
+        if self.is_game_over():
+            return None
+        return self._get_solver().hint(self.player_pos, self._box_positions())
+
+    def get_par(self) -> Optional[int]:
+        """Return the fewest pushes that solve the level from its start.
+
+        Returns:
+            The optimal push count, or None if the search budget ran out.
+        """
+        if self._par is None:
+            self._par = self._get_solver().push_count()
+        return self._par
+
+    def pushes_over_par(self) -> Optional[int]:
+        """Return how many more pushes than par have been made so far."""
+        par = self.get_par()
+        return None if par is None else self.pushes - par
+
+    def is_deadlocked(self) -> bool:
+        """Return True if a crate is stuck where it can never reach a goal."""
+        return not self.is_game_over() and self._get_solver().is_deadlocked(self._box_positions())
+
     def is_game_over(self) -> bool:
         """Return True if every goal tile is occupied by a crate."""
         return all(self.grid[r][c] == "*" for r, c in self.goal_positions)
@@ -201,9 +256,9 @@ class SokobanGame(GameEngine[str, int]):
         if self.state == GameState.NOT_STARTED:
             self.state = GameState.IN_PROGRESS
 
-        self.history.append(self._snapshot_state())
         pushed = self._prepare_box_move(target, direction)
         self._move_player(target)
+        self.history.append(move.upper() if pushed else move)
 
         self.moves += 1
         if pushed:
@@ -229,6 +284,18 @@ class SokobanGame(GameEngine[str, int]):
     def _set_base_layout(self, layout: Sequence[str]) -> None:
         """Store the base layout to be used for resetting the level."""
         self._base_layout = layout
+        self._solver = None
+        self._par = None
+
+    def _get_solver(self) -> SokobanSolver:
+        """Return the solver for the active level, building it on first use."""
+        if self._solver is None:
+            self._solver = SokobanSolver(self._base_layout, node_limit=HINT_NODE_LIMIT)
+        return self._solver
+
+    def _box_positions(self) -> List[Tuple[int, int]]:
+        """Return the positions of every crate on the board."""
+        return [(r, c) for r, row in enumerate(self.grid) for c, tile in enumerate(row) if tile in self.BOX_TILES]
 
     def _build_grid(self, layout: Sequence[str]) -> None:
         """Construct the internal grid from a textual level layout.
@@ -336,21 +403,6 @@ class SokobanGame(GameEngine[str, int]):
         """Calculate a new position by applying a directional offset."""
         return position[0] + direction[0], position[1] + direction[1]
 
-    def _snapshot_state(self) -> Dict[str, object]:
-        """Capture a snapshot of the mutable game state for the undo history."""
-        return {
-            "grid": [row.copy() for row in self.grid],
-            "player_pos": self.player_pos,
-            "moves": self.moves,
-            "pushes": self.pushes,
-            "state": self.state,
-        }
-
-    def _apply_snapshot(self, snapshot: Dict[str, object]) -> None:
-        """Restore the game state from a snapshot."""
-        grid_snapshot = cast(List[List[str]], snapshot["grid"])
-        self.grid = [row.copy() for row in grid_snapshot]
-        self.player_pos = cast(Tuple[int, int], snapshot["player_pos"])
-        self.moves = cast(int, snapshot["moves"])
-        self.pushes = cast(int, snapshot["pushes"])
-        self.state = cast(GameState, snapshot["state"])
+    def _reverse(self, direction: Tuple[int, int]) -> Tuple[int, int]:
+        """Return the opposite of a directional offset."""
+        return -direction[0], -direction[1]
@@ -0,0 +1,510 @@
+"""Push-optimal Sokoban solving and deadlock detection.
+
+:class:`SokobanSolver` runs A* over box configurations. A search state is the
+set of box cells together with the region the worker can walk to, found by a
+flood fill and identified by its smallest cell, so walking moves never appear
+in the search; only pushes do, and solutions are optimal in pushes. States
+are keyed by a Zobrist hash updated as boxes move, with a 64-bit key so that
+collisions are vanishingly rare.
+
+The search is pruned and shortened by:
+
+- A simple-deadlock table. Pulling a box back from every goal marks the cells
+  from which a box can still reach some goal; pushes onto any other cell are
+  never generated. The same pull distances give the admissible heuristic.
+- Freeze deadlocks. A box that can no longer move on either axis, blocked by
+  walls, dead cells or other frozen boxes, ends the branch unless every box
+  frozen with it sits on a goal.
+- Tunnel macros. A box pushed into a one-wide corridor with the worker
+  following is pushed straight through, since stopping inside only blocks it.
+- Goal-room macros (``goal_macros=True``). Goals behind a single entrance
+  are filled in a precomputed order, and a box pushed onto the entrance jumps
+  straight to the next goal. This prunes alternatives, so push counts may no
+  longer be optimal; it is meant for checking that a level can be solved.
+
+Positions are ``(row, column)`` pairs on the level layout and moves use the
+``"u"``, ``"d"``, ``"l"`` and ``"r"`` keys of
+:class:`~.sokoban.SokobanGame`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+Position = Tuple[int, int]
+# A push, as the cell of the box before it moves and the step it moves by.
+Push = Tuple[int, int]
+
+DIRECTIONS: Dict[str, Tuple[int, int]] = {"u": (-1, 0), "d": (1, 0), "l": (0, -1), "r": (0, 1)}
+
+_UNREACHABLE = 1 << 30
+
+
+class SokobanSolver:
+    """A* search for solutions with the fewest pushes.
+
+    Args:
+        layout: The level in the standard Sokoban symbols. The walls and goals
+            are fixed; the worker and crates give the default start.
+        node_limit: Give up a search after expanding this many states.
+        goal_macros: Fill goal rooms in a fixed order (faster, not optimal).
+
+    Raises:
+        ValueError: If the layout has no worker or no crates.
+    """
+
+    def __init__(self, layout: Sequence[str], *, node_limit: Optional[int] = None, goal_macros: bool = False) -> None:
+        if not layout:
+            raise ValueError("Level layout must contain at least one row.")
+        # A ring of wall cells around the layout removes every bounds check.
+        self._width = width = max(len(row) for row in layout) + 2
+        cells = width * (len(layout) + 2)
+        self._wall = bytearray([1]) * cells
+        self._goal = bytearray(cells)
+        boxes: Set[int] = set()
+        player: Optional[int] = None
+        for row, text in enumerate(layout):
+            for column, tile in enumerate(text):
+                cell = (row + 1) * width + column + 1
+                if tile != "#":
+                    self._wall[cell] = 0
+                if tile in ".+*":
+                    self._goal[cell] = 1
+                if tile in "$*":
+                    boxes.add(cell)
+                if tile in "@+":
+                    player = cell
+        if player is None:
+            raise ValueError("Level must define a player start position.")
+        if not boxes:
+            raise ValueError("Level must contain at least one crate.")
+        self.node_limit = node_limit
+        self.goal_macros = goal_macros
+        self.nodes = 0
+        self.limit_reached = False
+        self._start_player = player
+        self._start_boxes = frozenset(boxes)
+        self._steps = {direction: row_step * width + column_step for direction, (row_step, column_step) in DIRECTIONS.items()}
+        self._names = {step: direction for direction, step in self._steps.items()}
+        self._goals = [cell for cell in range(cells) if self._goal[cell]]
+        self._distance = self._pull_distances()
+        self._dead = bytearray(min(table[cell] for table in self._distance) == _UNREACHABLE if not self._wall[cell] else 0 for cell in range(cells))
+        generator = random.Random(0x50C0BA4)
+        self._box_keys = [generator.getrandbits(64) for _ in range(cells)]
+        self._player_keys = [generator.getrandbits(64) for _ in range(cells)]
+        self._rooms: List[Tuple[int, FrozenSet[int], List[List[int]]]] = self._goal_rooms() if goal_macros else []
+
+    # -- public API -----------------------------------------------------
+
+    @property
+    def start(self) -> Tuple[Position, List[Position]]:
+        """Return the worker and crate positions of the layout."""
+        return self._position(self._start_player), sorted(self._position(box) for box in self._start_boxes)
+
+    def is_dead_cell(self, position: Position) -> bool:
+        """Return True if a crate on ``position`` can never reach a goal."""
+        return bool(self._dead[self._cell(position)])
+
+    def is_deadlocked(self, boxes: Iterable[Position]) -> bool:
+        """Return True if the crates are provably stuck short of the goals."""
+        cells = frozenset(self._cell(box) for box in boxes)
+        return any(self._dead[box] or self._frozen(box, cells) for box in cells)
+
+    def reachable(self, player: Position, boxes: Iterable[Position]) -> Set[Position]:
+        """Return every cell the worker can walk to without pushing."""
+        region = self._flood(self._cell(player), frozenset(self._cell(box) for box in boxes))
+        return {self._position(cell) for cell, seen in enumerate(region) if seen}
+
+    def solve_pushes(self, player: Optional[Position] = None, boxes: Optional[Iterable[Position]] = None) -> Optional[List[Tuple[Position, str]]]:
+        """Return the pushes of a solution as ``(crate position, direction)`` pairs.
+
+        Returns ``None`` if the level cannot be solved from this position or
+        the node limit is reached first; :attr:`limit_reached` tells which.
+        """
+        start_player, start_boxes = self._start(player, boxes)
+        pushes = self._search(start_player, start_boxes)
+        if pushes is None:
+            return None
+        return [(self._position(box), self._names[step]) for box, step in pushes]
+
+    def solve(self, player: Optional[Position] = None, boxes: Optional[Iterable[Position]] = None) -> Optional[List[str]]:
+        """Return the worker moves of a solution with the fewest pushes.
+
+        Defaults to the start of the layout. Returns ``None`` when
+        :meth:`solve_pushes` does.
+        """
+        start_player, start_boxes = self._start(player, boxes)
+        pushes = self._search(start_player, start_boxes)
+        if pushes is None:
+            return None
+        return self._walk(start_player, start_boxes, pushes)
+
+    def push_count(self, player: Optional[Position] = None, boxes: Optional[Iterable[Position]] = None) -> Optional[int]:
+        """Return the fewest pushes that solve the level, or ``None`` as for :meth:`solve`."""
+        pushes = self.solve_pushes(player, boxes)
+        return None if pushes is None else len(pushes)
+
+    def hint(self, player: Optional[Position] = None, boxes: Optional[Iterable[Position]] = None) -> Optional[str]:
+        """Return the next worker move towards the nearest solution, or ``None``.
+
+        ``None`` means the crates are already home, the position cannot be
+        solved, or the node limit was reached.
+        """
+        start_player, start_boxes = self._start(player, boxes)
+        if all(self._goal[box] for box in start_boxes):
+            return None
+        pushes = self._search(start_player, start_boxes)
+        if not pushes:
+            return None
+        box, step = pushes[0]
+        return self._walk(start_player, start_boxes, [(box, step)])[0]
+
+    # -- level analysis -------------------------------------------------
+
+    def _cell(self, position: Position) -> int:
+        row, column = position
+        return (row + 1) * self._width + column + 1
+
+    def _position(self, cell: int) -> Position:
+        row, column = divmod(cell, self._width)
+        return row - 1, column - 1
+
+    def _start(self, player: Optional[Position], boxes: Optional[Iterable[Position]]) -> Tuple[int, FrozenSet[int]]:
+        start_player = self._start_player if player is None else self._cell(player)
+        start_boxes = self._start_boxes if boxes is None else frozenset(self._cell(box) for box in boxes)
+        if len(start_boxes) != len(self._goals):
+            raise ValueError("Number of crates must match number of goal tiles for a valid level.")
+        return start_player, start_boxes
+
+    def _pull_distances(self) -> List[List[int]]:
+        """Return, per goal, the fewest pushes bringing a lone box to it from each cell."""
+        tables = []
+        wall = self._wall
+        steps = tuple(self._steps.values())
+        for goal in self._goals:
+            table = [_UNREACHABLE] * len(wall)
+            table[goal] = 0
+            queue = deque([goal])
+            while queue:
+                box = queue.popleft()
+                for step in steps:
+                    # Pulling moves the box onto the worker's cell and the worker one further.
+                    target = box + step
+                    if not wall[target] and not wall[target + step] and table[target] == _UNREACHABLE:
+                        table[target] = table[box] + 1
+                        queue.append(target)
+            tables.append(table)
+        return tables
+
+    def _flood(self, player: int, boxes: FrozenSet[int], allowed: Optional[FrozenSet[int]] = None) -> bytearray:
+        """Mark the cells the worker can walk to from ``player``."""
+        wall = self._wall
+        steps = tuple(self._steps.values())
+        region = bytearray(len(wall))
+        region[player] = 1
+        stack = [player]
+        while stack:
+            cell = stack.pop()
+            for step in steps:
+                target = cell + step
+                if not region[target] and not wall[target] and target not in boxes and (allowed is None or target in allowed):
+                    region[target] = 1
+                    stack.append(target)
+        return region
+
+    def _frozen(self, box: int, boxes: FrozenSet[int], stuck: Optional[Set[int]] = None) -> bool:
+        """Return True if ``box`` is part of a frozen cluster holding a box off its goal."""
+        cluster: Set[int] = set()
+        if not self._freezes(box, boxes, frozenset(), cluster):
+            return False
+        if stuck is not None:
+            stuck |= cluster
+        return any(not self._goal[cell] for cell in cluster)
+
+    def _freezes(self, box: int, boxes: FrozenSet[int], walls: FrozenSet[int], cluster: Set[int]) -> bool:
+        """Return True if ``box`` cannot move on either axis; collect the frozen boxes."""
+        walls = walls | {box}
+        found: Set[int] = set()
+        for step in (1, self._width):
+            if not self._axis_blocked(box, step, boxes, walls, found):
+                return False
+        cluster.add(box)
+        cluster |= found
+        return True
+
+    def _axis_blocked(self, box: int, step: int, boxes: FrozenSet[int], walls: FrozenSet[int], cluster: Set[int]) -> bool:
+        before, after = box - step, box + step
+        if self._wall[before] or self._wall[after] or before in walls or after in walls:
+            return True
+        if self._dead[before] and self._dead[after]:
+            return True
+        # Boxes already under examination count as walls, which breaks cycles.
+        return any(neighbour in boxes and self._freezes(neighbour, boxes, walls, cluster) for neighbour in (before, after))
+
+    def _goal_rooms(self) -> List[Tuple[int, FrozenSet[int], List[List[int]]]]:
+        """Find areas of goals behind one entrance cell and plan how to fill them.
+
+        Returns ``(entrance, room cells, routes)`` triples, where route ``k``
+        is the box path from the entrance to the ``k``-th goal to fill.
+        """
+        floor = self._flood(self._start_player, frozenset())
+        floor_cells = [cell for cell, seen in enumerate(floor) if seen]
+        steps = tuple(self._steps.values())
+        candidates = []
+        for entrance in floor_cells:
+            if self._goal[entrance]:
+                continue
+            blocked = frozenset({entrance})
+            for step in steps:
+                start = entrance + step
+                if not floor[start]:
+                    continue
+                room = frozenset(cell for cell, seen in enumerate(self._flood(start, blocked)) if seen)
+                if self._start_player in room or room & self._start_boxes or not any(self._goal[cell] for cell in room):
+                    continue
+                candidates.append((entrance, room))
+        rooms = []
+        taken: Set[int] = set()
+        for entrance, room in sorted(candidates, key=lambda candidate: (-len(candidate[1]), candidate[0])):
+            if entrance in taken or room & taken:
+                continue
+            routes = self._packing_order(entrance, room)
+            if routes is not None:
+                rooms.append((entrance, room, routes))
+                taken |= room | {entrance}
+        return rooms
+
+    def _packing_order(self, entrance: int, room: FrozenSet[int]) -> Optional[List[List[int]]]:
+        """Return box routes filling the room's goals, or ``None`` if none exists.
+
+        Works backwards from the full room: any box that can be pulled out to
+        the entrance past the others is filled last, and removing a box only
+        frees space, so taking them greedily never gets stuck.
+        """
+        filled = {cell for cell in room if self._goal[cell]}
+        routes: List[List[int]] = []
+        while filled:
+            for goal in sorted(filled):
+                route = self._pull_out(goal, frozenset(filled - {goal}), entrance, room)
+                if route is not None:
+                    routes.append(route)
+                    filled.remove(goal)
+                    break
+            else:
+                return None
+        routes.reverse()
+        return routes
+
+    def _pull_out(self, goal: int, filled: FrozenSet[int], entrance: int, room: FrozenSet[int]) -> Optional[List[int]]:
+        """Return the box path from the entrance to ``goal``, found by pulling it out."""
+        inside = room | {entrance}
+        steps = tuple(self._steps.values())
+        parents: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+        queue: deque[Tuple[int, int]] = deque()
+        for step in steps:
+            player = goal + step
+            if player in inside and player not in filled and not self._wall[player]:
+                key = (goal, min(cell for cell, seen in enumerate(self._flood(player, filled | {goal}, inside)) if seen))
+                if key not in parents:
+                    parents[key] = None
+                    queue.append(key)
+        while queue:
+            key = queue.popleft()
+            box, player = key
+            region = self._flood(player, filled | {box}, inside)
+            for step in steps:
+                target, behind = box + step, box + 2 * step
+                if not region[target] or self._wall[behind] or behind in filled:
+                    continue
+                if target == entrance:
+                    if behind in room:
+                        continue
+                    path = [entrance, box]
+                    while parents[key] is not None:
+                        key = parents[key]  # type: ignore[assignment]
+                        path.append(key[0])
+                    return path
+                if behind not in inside:
+                    continue
+                after = self._flood(behind, filled | {target}, inside)
+                child = (target, min(cell for cell, seen in enumerate(after) if seen))
+                if child not in parents:
+                    parents[child] = key
+                    queue.append(child)
+        return None
+
+    # -- search ---------------------------------------------------------
+
+    def _estimate(self, boxes: FrozenSet[int]) -> int:
+        """Return a lower bound on the pushes left: every box needs to reach some goal, and vice versa."""
+        tables = self._distance
+        to_goal = sum(min(table[box] for table in tables) for box in boxes)
+        to_box = sum(min(table[box] for box in boxes) for table in tables)
+        return max(to_goal, to_box)
+
+    def _search(self, player: int, boxes: FrozenSet[int]) -> Optional[List[Push]]:
+        """Return the pushes of a solution, or ``None``."""
+        self.nodes = 0
+        self.limit_reached = False
+        if any(self._dead[box] for box in boxes) or any(self._frozen(box, boxes) for box in boxes):
+            return None
+        box_hash = 0
+        for box in boxes:
+            box_hash ^= self._box_keys[box]
+        region = self._flood(player, boxes)
+        start_key = box_hash ^ self._player_keys[region.index(1)]
+        best = {start_key: 0}
+        parents: Dict[int, Tuple[int, Tuple[Push, ...]]] = {}
+        counter = 0
+        open_list = [(self._estimate(boxes), 0, counter, start_key, boxes, player, box_hash, region)]
+        while open_list:
+            estimate, negative_cost, _, key, boxes, player, box_hash, region = heapq.heappop(open_list)
+            cost = -negative_cost
+            if best.get(key, _UNREACHABLE) < cost:
+                continue
+            if all(self._goal[box] for box in boxes):
+                return self._pushes(parents, key)
+            self.nodes += 1
+            if self.node_limit is not None and self.nodes > self.node_limit:
+                self.limit_reached = True
+                return None
+            for child in self._successors(boxes, box_hash, region):
+                child_boxes, child_player, child_hash, child_region, pushes = child
+                child_key = child_hash ^ self._player_keys[child_region.index(1)]
+                child_cost = cost + len(pushes)
+                if child_cost >= best.get(child_key, _UNREACHABLE):
+                    continue
+                best[child_key] = child_cost
+                parents[child_key] = (key, pushes)
+                counter += 1
+                heapq.heappush(
+                    open_list,
+                    (child_cost + self._estimate(child_boxes), -child_cost, counter, child_key, child_boxes, child_player, child_hash, child_region),
+                )
+        return None
+
+    def _successors(self, boxes: FrozenSet[int], box_hash: int, region: bytearray) -> Iterable[Tuple[FrozenSet[int], int, int, bytearray, Tuple[Push, ...]]]:
+        wall, dead, keys = self._wall, self._dead, self._box_keys
+        width = self._width
+        for box in boxes:
+            for step in self._steps.values():
+                target = box + step
+                if not region[box - step] or wall[target] or dead[target] or target in boxes:
+                    continue
+                pushes = [(box, step)]
+                player = box
+                side = width if abs(step) == 1 else 1
+                # Tunnel macro: keep pushing while worker and box are both boxed in sideways.
+                while (
+                    not self._goal[target]
+                    and wall[target - side]
+                    and wall[target + side]
+                    and wall[player - side]
+                    and wall[player + side]
+                    and not wall[target + step]
+                    and not dead[target + step]
+                    and target + step not in boxes
+                ):
+                    pushes.append((target, step))
+                    player, target = target, target + step
+                child_boxes = (boxes - {box}) | {target}
+                child_hash = box_hash ^ keys[box] ^ keys[target]
+                if self.goal_macros:
+                    jump = self._room_jump(child_boxes, target, player)
+                    if jump is not None:
+                        goal, player, route = jump
+                        child_boxes = (child_boxes - {target}) | {goal}
+                        child_hash ^= keys[target] ^ keys[goal]
+                        pushes.extend(route)
+                        target = goal
+                if self._frozen(target, child_boxes):
+                    continue
+                yield child_boxes, player, child_hash, self._flood(player, child_boxes), tuple(pushes)
+
+    def _room_jump(self, boxes: FrozenSet[int], box: int, player: int) -> Optional[Tuple[int, int, List[Push]]]:
+        """Return ``(goal, worker, pushes)`` if a box just reached a goal room's entrance."""
+        for entrance, room, routes in self._rooms:
+            if box != entrance:
+                continue
+            inside = boxes & room
+            filled = len(inside)
+            if filled >= len(routes) or inside != {route[-1] for route in routes[:filled]}:
+                return None
+            route = routes[filled]
+            first = route[1] - route[0]
+            if not self._flood(player, boxes)[entrance - first]:
+                return None
+            return route[-1], route[-2], [(cell, following - cell) for cell, following in zip(route, route[1:])]
+        return None
+
+    def _pushes(self, parents: Dict[int, Tuple[int, Tuple[Push, ...]]], key: int) -> List[Push]:
+        sequence: List[Push] = []
+        while key in parents:
+            key, pushes = parents[key]
+            sequence[:0] = pushes
+        return sequence
+
+    def _walk(self, player: int, boxes: FrozenSet[int], pushes: Sequence[Push]) -> List[str]:
+        """Expand pushes into worker moves, walking by shortest paths in between."""
+        moves: List[str] = []
+        current = set(boxes)
+        for box, step in pushes:
+            moves.extend(self._path(player, box - step, current))
+            moves.append(self._names[step])
+            current.remove(box)
+            current.add(box + step)
+            player = box
+        return moves
+
+    def _path(self, start: int, goal: int, boxes: Set[int]) -> List[str]:
+        """Return the worker moves of a shortest walk from ``start`` to ``goal``."""
+        if start == goal:
+            return []
+        parents: Dict[int, Tuple[int, int]] = {start: (start, 0)}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for step in self._steps.values():
+                target = cell + step
+                if target in parents or self._wall[target] or target in boxes:
+                    continue
+                parents[target] = (cell, step)
+                if target == goal:
+                    path = []
+                    while target != start:
+                        target, move = parents[target]
+                        path.append(self._names[move])
+                    path.reverse()
+                    return path
+                queue.append(target)
+        raise ValueError("worker cannot reach the pushing position")
+
+
+def validate_level(layout: Sequence[str], node_limit: Optional[int] = None) -> Optional[int]:
+    """Check that a level can be solved.
+
+    Searches with goal-room macros first, since they settle most levels
+    quickly, and only proves a level unsolvable with a full search.
+
+    Returns:
+        The number of pushes in the solution found (not necessarily the
+        fewest), or ``None`` if the node limit ran out before an answer.
+
+    Raises:
+        ValueError: If the level cannot be solved.
+    """
+    solver = SokobanSolver(layout, node_limit=node_limit, goal_macros=True)
+    pushes = solver.push_count()
+    if pushes is not None:
+        return pushes
+    solver = SokobanSolver(layout, node_limit=node_limit)
+    pushes = solver.push_count()
+    if pushes is None and not solver.limit_reached:
+        raise ValueError("Level cannot be solved.")
+    return pushes
+
+
+__all__ = ["DIRECTIONS", "SokobanSolver", "validate_level"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
-from .backgammon import BackgammonGame
+from .backgammon import BackgammonAI, BackgammonGame
+from .bearoff import BearoffTable
+from .search import BackgammonSearch
 
-__all__ = ["BackgammonGame"]
+__all__ = ["BackgammonGame", "BackgammonAI", "BackgammonSearch", "BearoffTable"]
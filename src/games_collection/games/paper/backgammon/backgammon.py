@@ -15,10 +15,14 @@ import random
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence, Tuple
 
+from games_collection.core.ai_strategy import check_backend
 from games_collection.core.game_engine import GameEngine, GameState
 
-NUM_POINTS = 24
-CHECKERS_PER_PLAYER = 15
+from . import position as compact
+from .bearoff import load_bearoff_table
+from .position import CHECKERS_PER_PLAYER, NUM_POINTS
+from .search import BackgammonSearch
+
 BAR = "bar"
 BEAR_OFF = "bear_off"
 
@@ -119,142 +123,69 @@ class BackgammonGame(GameEngine[Tuple[Move, ...], int]):
         self._dice = expanded
 
     def get_valid_moves(self) -> List[Tuple[Move, ...]]:
-        """Return sequences of moves that satisfy the current dice roll."""
+        """Return sequences of moves that satisfy the current dice roll.
+
+        Sequences that only differ in the order of their moves, or that
+        otherwise end in the same position, are returned once.
+        """
 
         if not self._dice:
             return []
-        sequences: List[Tuple[Move, ...]] = []
-        dice = list(self._dice)
-        self._generate_sequences(
-            board=self.points,
-            bars=self.bars,
-            bear_off=self.bear_off,
-            dice=dice,
-            player=self._current_player,
-            path=[],
-            sequences=sequences,
-        )
-        if not sequences:
-            return []
-        max_moves = max(len(sequence) for sequence in sequences)
-        best_sequences = [sequence for sequence in sequences if len(sequence) == max_moves]
-        if max_moves == 1 and best_sequences:
-            highest_die_played = max(move.die for sequence in best_sequences for move in sequence)
-            best_sequences = [sequence for sequence in best_sequences if sequence and sequence[0].die == highest_die_played]
-        return best_sequences
-
-    def _generate_sequences(
-        self,
-        board: List[PointState],
-        bars: Dict[int, int],
-        bear_off: Dict[int, int],
-        dice: List[int],
-        player: int,
-        path: List[Move],
-        sequences: List[Tuple[Move, ...]],
-    ) -> None:
-        """Recursively build all legal move sequences for the dice provided."""
-
-        any_move = False
-        for index, die in enumerate(dice):
-            remaining = dice[:index] + dice[index + 1 :]
-            single_moves = self._generate_single_die_moves(board, bars, player, die)
-            for move in single_moves:
-                any_move = True
-                new_board = [PointState(point.owner, point.count) for point in board]
-                new_bars = dict(bars)
-                new_bear_off = dict(bear_off)
-                self._apply_move_to_state(new_board, new_bars, new_bear_off, move, player)
-                path.append(move)
-                self._generate_sequences(new_board, new_bars, new_bear_off, remaining, player, path, sequences)
-                path.pop()
-        if not any_move:
-            sequences.append(tuple(path))
-
-    def _generate_single_die_moves(
-        self,
-        board: List[PointState],
-        bars: Dict[int, int],
-        player: int,
-        die: int,
-    ) -> List[Move]:
-        """Generate all single-die moves for the current player."""
-
-        moves: List[Move] = []
-        if bars[player] > 0:
-            target = self._entry_point(player, die)
-            if target is not None and not self._is_blocked(board[target], player):
-                hit = board[target].owner == -player and board[target].count == 1
-                moves.append(Move(BAR, target, die, hit))
-            return moves
-        direction = self._direction(player)
-        for index, point in enumerate(board):
-            if point.owner != player or point.count == 0:
-                continue
-            destination = index + direction * die
-            if self._can_bear_off(player, board, bars, index, die):
-                moves.append(Move(index, BEAR_OFF, die, False))
-            elif 0 <= destination < NUM_POINTS and not self._is_blocked(board[destination], player):
-                hit = board[destination].owner == -player and board[destination].count == 1
-                moves.append(Move(index, destination, die, hit))
-        return moves
-
-    def _entry_point(self, player: int, die: int) -> Optional[int]:
-        """Return the entry point index for a checker leaving the bar."""
-
-        if not 1 <= die <= 6:
-            return None
-        if player == 1:
-            return NUM_POINTS - die
-        return die - 1
-
-    def _direction(self, player: int) -> int:
-        """Return the movement direction for the player."""
-
-        return -1 if player == 1 else 1
-
-    def _is_blocked(self, point: PointState, player: int) -> bool:
-        """Return True if the point is blocked for the player."""
+        player = self._current_player
+        return [tuple(self._move_from_step(step, player) for step in steps) for steps, _ in compact.plays(self.compact_position(), self._dice)]
 
-        return point.owner == -player and point.count >= 2
+    def compact_position(self) -> List[int]:
+        """Return the board as a :mod:`.position` list seen from the player to move."""
 
-    def _can_bear_off(self, player: int, board: List[PointState], bars: Dict[int, int], index: int, die: int) -> bool:
-        """Return True if a checker can bear off from the given point."""
+        player = self._current_player
+        position = [0] * compact.SLOTS
+        for index, point in enumerate(self.points):
+            if point.count and point.owner is not None:
+                position[self._relative_point(index, player)] = point.count if point.owner == player else -point.count
+        position[compact.BAR_SLOT] = self.bars[player]
+        position[compact.OPPONENT_BAR_SLOT] = self.bars[-player]
+        position[compact.OFF_SLOT] = self.bear_off[player]
+        position[compact.OPPONENT_OFF_SLOT] = self.bear_off[-player]
+        return position
+
+    @staticmethod
+    def _relative_point(index: int, player: int) -> int:
+        """Convert between board indices and the mover's point numbers, which run towards home."""
+
+        return index if player == 1 else NUM_POINTS - 1 - index
+
+    def _move_from_step(self, step: compact.Step, player: int) -> Move:
+        """Convert a :mod:`.position` step into a :class:`Move`."""
+
+        source, target, hit, die = step
+        return Move(
+            BAR if source == compact.BAR_SLOT else self._relative_point(source, player),
+            BEAR_OFF if target == compact.OFF_TARGET else self._relative_point(target, player),
+            die,
+            hit,
+        )
 
-        if bars[player] > 0:
-            return False
-        if not self._all_in_home_board(player, board):
-            return False
-        direction = self._direction(player)
-        destination = index + direction * die
-        if player == 1 and destination < 0:
-            return index == self._furthest_checker_index(player, board)
-        if player == -1 and destination >= NUM_POINTS:
-            return index == self._furthest_checker_index(player, board)
-        return destination == -1 if player == 1 else destination == NUM_POINTS
-
-    def _all_in_home_board(self, player: int, board: List[PointState]) -> bool:
-        """Return True if all checkers for the player are in the home board."""
-
-        start, end = (0, 6) if player == 1 else (NUM_POINTS - 6, NUM_POINTS)
-        for index, point in enumerate(board):
-            if point.owner == player and point.count > 0:
-                if not start <= index < end:
-                    return False
-        return True
+    def _is_legal_sequence(self, sequence: Tuple[Move, ...]) -> bool:
+        """Return True if ``sequence`` plays the current dice legally.
 
-    def _furthest_checker_index(self, player: int, board: List[PointState]) -> int:
-        """Return the furthest checker index for oversize dice bearing off."""
+        Each move must be legal in turn, and the sequence must end in one of
+        the positions :meth:`get_valid_moves` can reach.
+        """
 
-        if player == 1:
-            for index in range(5, -1, -1):
-                if board[index].owner == player and board[index].count > 0:
-                    return index
-            return 0
-        for index in range(NUM_POINTS - 6, NUM_POINTS):
-            if board[index].owner == player and board[index].count > 0:
-                return index
-        return NUM_POINTS - 1
+        player = self._current_player
+        position = self.compact_position()
+        remaining = list(self._dice)
+        for move in sequence:
+            if move.die not in remaining:
+                return False
+            source = compact.BAR_SLOT if move.source == BAR else self._relative_point(int(move.source), player)
+            target = compact.OFF_TARGET if move.target == BEAR_OFF else self._relative_point(int(move.target), player)
+            step = compact.find_step(position, source, target, move.die)
+            if step is None or step[2] != move.hit:
+                return False
+            compact.apply_step(position, step)
+            remaining.remove(move.die)
+        return any(result == position for _, result in compact.plays(self.compact_position(), self._dice))
 
     def _apply_move_to_state(
         self,
@@ -291,8 +222,7 @@ class BackgammonGame(GameEngine[Tuple[Move, ...], int]):
 
         if self.pending_double_from is not None:
             raise RuntimeError("Cannot move while a doubling decision is pending.")
-        legal_moves = self.get_valid_moves()
-        if move not in legal_moves:
+        if not self._dice or not self._is_legal_sequence(move):
             return False
         for single in move:
             self._apply_move_to_state(self.points, self.bars, self.bear_off, single, self._current_player)
@@ -469,16 +399,62 @@ class BackgammonGame(GameEngine[Tuple[Move, ...], int]):
         self._dice = []
 
 
+# Cubeless winning chances at which the AI doubles and still accepts a double.
+DOUBLE_THRESHOLD = 0.70
+TAKE_THRESHOLD = 0.25
+
+
 class BackgammonAI:
-    """Simple heuristic-based AI for backgammon."""
+    """Backgammon AI choosing plays by expectiminimax.
 
-    def choose_move(self, game: BackgammonGame) -> Optional[Tuple[Move, ...]]:
-        """Select the highest scoring legal move sequence."""
+    The default ``"expectiminimax"`` backend runs
+    :class:`~.search.BackgammonSearch` to ``plies`` (1 or 2) over the distinct
+    results of the roll, scoring positions with :func:`~.search.evaluate` and
+    the bundled bearoff database. The ``"heuristic"`` backend ranks plays by
+    :meth:`BackgammonGame.evaluate_move` alone.
+
+    Cube decisions compare the cubeless winning chance of the player on roll,
+    averaged over their next roll, with :data:`DOUBLE_THRESHOLD` and
+    :data:`TAKE_THRESHOLD`.
+    """
+
+    def __init__(self, *, plies: int = 2, backend: str = "expectiminimax") -> None:
+        check_backend(backend, ("expectiminimax", "heuristic"), "Backgammon")
+        self.backend = backend
+        self._search = BackgammonSearch(load_bearoff_table(), plies=plies)
 
-        legal = game.get_valid_moves()
-        if not legal:
+    def choose_move(self, game: BackgammonGame) -> Optional[Tuple[Move, ...]]:
+        """Select the best legal move sequence for the current roll."""
+
+        if self.backend == "heuristic":
+            legal = game.get_valid_moves()
+            if not legal:
+                return None
+            return max(legal, key=game.evaluate_move)
+        steps = self._search.best_play(game.compact_position(), game.get_state_representation()["dice"])
+        if steps is None:
             return None
-        return max(legal, key=game.evaluate_move)
+        player = game.get_current_player()
+        return tuple(game._move_from_step(step, player) for step in steps)
+
+    def win_probability(self, game: BackgammonGame) -> float:
+        """Return the cubeless chance that the player on roll wins, before rolling."""
+
+        return self._search.win_probability(game.compact_position())
+
+    def should_offer_double(self, game: BackgammonGame) -> bool:
+        """Return True if the player on roll should double before rolling."""
+
+        if game.pending_double_from is not None or game.cube_owner not in (None, game.get_current_player()):
+            return False
+        return self.win_probability(game) >= DOUBLE_THRESHOLD
+
+    def should_accept_double(self, game: BackgammonGame) -> bool:
+        """Return True if the player facing the pending double should take it."""
+
+        if game.pending_double_from is None:
+            return False
+        return 1.0 - self.win_probability(game) >= TAKE_THRESHOLD
 
 
 class BackgammonCLI:
@@ -494,6 +470,10 @@ class BackgammonCLI:
         print("Backgammon - Interactive CLI")
         while not self.game.is_game_over():
             if not self.game.get_state_representation()["dice"]:
+                if self.game.get_current_player() == -1 and self.ai.should_offer_double(self.game):
+                    self._offer_double_to_human()
+                    if self.game.is_game_over():
+                        break
                 dice = self.game.roll_dice()
                 print(f"Player {self.game.get_current_player()} rolled {dice}.")
             self._render_board()
@@ -520,6 +500,16 @@ class BackgammonCLI:
         if winner is not None:
             print(f"Player {winner} wins! Current scores: {self.game.scores}")
 
+    def _offer_double_to_human(self) -> None:
+        """Let the AI double and ask the human to take or drop."""
+
+        self.game.offer_double()
+        answer = input(f"AI doubles to {self.game.cube_value * 2}. Take? [y/N]: ")
+        if answer.strip().lower().startswith("y"):
+            self.game.accept_double(1)
+        else:
+            self.game.decline_double(1)
+
     def _render_board(self) -> None:
         """Render the board in ASCII form."""
 
@@ -0,0 +1,237 @@
+"""One-sided bearoff database for backgammon races.
+
+Once a player's checkers are all in their home board, how many rolls they
+need to bear the rest off does not depend on the opponent. The database
+stores, for every way of placing up to :data:`MAX_CHECKERS` checkers on the six
+home points, the probability of finishing in exactly ``n`` rolls when each
+roll is played to minimise the expected number of rolls. Two lookups then
+give the exact winning chance of any pure bearoff, see
+:meth:`BearoffTable.win_probability`.
+
+A home board is indexed by ranking its six checker counts, with a seventh
+"slack" count making the total up to :data:`MAX_CHECKERS`, in the
+combinatorial number system. Every play moves checkers closer to home, so
+:func:`generate_table` scores boards in increasing pip count and each board
+only needs boards already scored.
+
+The table ships as ``resources/bearoff.bin``:
+
+- an 8-byte header: the ``b"BGBO"`` magic, a ``uint16`` format version, a
+  ``uint8`` holding the largest checker count covered and a ``uint8`` holding
+  the number of rolls stored per board;
+- followed, per board in rank order, by a ``uint8`` giving the fewest rolls
+  the board can need and that many ``uint16`` probabilities, scaled to
+  ``0..65535``, for it and the following rolls. Any probability beyond the
+  stored rolls is folded into the last one.
+
+:class:`BearoffTable` memory-maps the file so that loading is free.
+
+Regenerate the resource with::
+
+    python -m games_collection.games.paper.backgammon.bearoff --checkers 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from games_collection.core.combinatorics import CountRanking
+
+from .position import NUM_POINTS, ROLLS, SLOTS, plays
+
+HOME_POINTS = 6
+MAX_CHECKERS = 15
+ROLLS_STORED = 16
+
+_MAGIC = b"BGBO"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHBB")
+_SCALE = 0xFFFF
+
+RESOURCE_PATH = Path(__file__).resolve().parent / "resources" / "bearoff.bin"
+
+_RANKING = CountRanking(HOME_POINTS, MAX_CHECKERS)
+
+
+def board_count(max_checkers: int) -> int:
+    """Return the number of home boards holding at most ``max_checkers`` checkers."""
+    return _RANKING.count(max_checkers)
+
+
+def rank(home: Sequence[int], max_checkers: int) -> int:
+    """Return the dense index of a home board among those with at most ``max_checkers`` checkers."""
+    return _RANKING.rank(home, max_checkers)
+
+
+def _home_boards(max_checkers: int) -> List[tuple]:
+    """Return every home board with at most ``max_checkers`` checkers."""
+    boards = [()]
+    for _ in range(HOME_POINTS):
+        boards = [board + (count,) for board in boards for count in range(max_checkers + 1 - sum(board))]
+    return boards
+
+
+def generate_table(max_checkers: int = MAX_CHECKERS) -> List[List[float]]:
+    """Compute the distribution of rolls needed to bear off every home board.
+
+    Returns:
+        One list per board, in :func:`rank` order, whose ``n``-th entry is
+        the probability of bearing off in exactly ``n`` rolls.
+    """
+    if not 0 <= max_checkers <= MAX_CHECKERS:
+        raise ValueError(f"max_checkers must be between 0 and {MAX_CHECKERS}, not {max_checkers}")
+    boards = _home_boards(max_checkers)
+    boards.sort(key=lambda board: sum((point + 1) * count for point, count in enumerate(board)))
+    distributions: List[List[float]] = [[] for _ in boards]
+    means = [0.0] * len(boards)
+    for board in boards:
+        index = rank(board, max_checkers)
+        if not any(board):
+            distributions[index] = [1.0]
+            continue
+        position = list(board) + [0] * (SLOTS - HOME_POINTS)
+        distribution = [0.0]
+        mean = 1.0
+        for dice, weight in ROLLS:
+            best = None
+            for _, result in plays(position, dice):
+                child = rank(result[:HOME_POINTS], max_checkers)
+                if best is None or means[child] < means[best]:
+                    best = child
+            mean += weight * means[best]
+            for rolls, probability in enumerate(distributions[best], start=1):
+                if rolls == len(distribution):
+                    distribution.append(0.0)
+                distribution[rolls] += weight * probability
+        distributions[index] = distribution
+        means[index] = mean
+    return distributions
+
+
+def write_table(distributions: Sequence[Sequence[float]], max_checkers: int, path: Path = RESOURCE_PATH) -> None:
+    """Serialise distributions from :func:`generate_table` to ``path``."""
+    if len(distributions) != board_count(max_checkers):
+        raise ValueError(f"expected {board_count(max_checkers)} boards for {max_checkers} checkers, got {len(distributions)}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = struct.Struct(f"<B{ROLLS_STORED}H")
+    payload = bytearray(_HEADER.pack(_MAGIC, _VERSION, max_checkers, ROLLS_STORED))
+    for distribution in distributions:
+        first = next(rolls for rolls, probability in enumerate(distribution) if probability > 0)
+        window = list(distribution[first : first + ROLLS_STORED])
+        window[-1] += sum(distribution[first + ROLLS_STORED :])
+        window += [0.0] * (ROLLS_STORED - len(window))
+        payload += entry.pack(first, *(round(min(max(value, 0.0), 1.0) * _SCALE) for value in window))
+    path.write_bytes(bytes(payload))
+
+
+class BearoffTable:
+    """Read-only, memory-mapped view over a bearoff database file."""
+
+    def __init__(self, path: Path = RESOURCE_PATH) -> None:
+        """Map ``path`` into memory and validate its header.
+
+        Raises:
+            ValueError: If the file is not a bearoff database.
+        """
+        with open(path, "rb") as handle:
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_checkers, rolls_stored = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a version {_VERSION} bearoff database")
+        self._entry = struct.Struct(f"<B{rolls_stored}H")
+        if len(self._buffer) != _HEADER.size + board_count(max_checkers) * self._entry.size:
+            self._buffer.close()
+            raise ValueError(f"{path} is truncated")
+        self.max_checkers = max_checkers
+
+    def distribution(self, home: Sequence[int]) -> Optional[List[float]]:
+        """Return the probabilities of bearing ``home`` off in exactly 0, 1, 2, ... rolls.
+
+        Returns ``None`` when the board holds more checkers than the table.
+        """
+        if sum(home) > self.max_checkers:
+            return None
+        first, *scaled = self._entry.unpack_from(self._buffer, _HEADER.size + rank(home, self.max_checkers) * self._entry.size)
+        return [0.0] * first + [value / _SCALE for value in scaled]
+
+    def expected_rolls(self, home: Sequence[int]) -> Optional[float]:
+        """Return the mean number of rolls needed to bear ``home`` off."""
+        distribution = self.distribution(home)
+        if distribution is None:
+            return None
+        return sum(rolls * probability for rolls, probability in enumerate(distribution))
+
+    def win_probability(self, position: Sequence[int]) -> Optional[float]:
+        """Return the chance the player on roll wins a pure bearoff, or ``None`` if it is not one."""
+        if position[NUM_POINTS] or position[NUM_POINTS + 1]:
+            return None
+        own = [0] * HOME_POINTS
+        other = [0] * HOME_POINTS
+        for point in range(NUM_POINTS):
+            count = position[point]
+            if count > 0:
+                if point >= HOME_POINTS:
+                    return None
+                own[point] = count
+            elif count < 0:
+                if point < NUM_POINTS - HOME_POINTS:
+                    return None
+                other[NUM_POINTS - 1 - point] = -count
+        mine = self.distribution(own)
+        theirs = self.distribution(other)
+        if mine is None or theirs is None:
+            return None
+        # The player on roll wins if the opponent needs at least as many rolls.
+        win = 0.0
+        tail = 1.0
+        for rolls, probability in enumerate(mine):
+            tail -= theirs[rolls - 1] if 0 < rolls <= len(theirs) else 0.0
+            win += probability * tail
+        return min(max(win, 0.0), 1.0)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._buffer.close()
+
+
+@lru_cache(maxsize=1)
+def load_bearoff_table() -> Optional[BearoffTable]:
+    """Return the shared database bundled with the package, or ``None`` if missing."""
+    try:
+        return BearoffTable()
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover - offline tool
+    """Regenerate the bundled bearoff database."""
+    parser = argparse.ArgumentParser(description="Generate the one-sided bearoff database resource.")
+    parser.add_argument("--checkers", type=int, default=MAX_CHECKERS, help="Largest number of checkers left to bear off.")
+    parser.add_argument("--output", type=Path, default=RESOURCE_PATH)
+    args = parser.parse_args(argv)
+
+    distributions = generate_table(args.checkers)
+    write_table(distributions, args.checkers, args.output)
+    print(f"Wrote {len(distributions)} home boards with up to {args.checkers} checkers to {args.output}")
+
+
+__all__ = [
+    "HOME_POINTS",
+    "MAX_CHECKERS",
+    "BearoffTable",
+    "board_count",
+    "generate_table",
+    "load_bearoff_table",
+    "rank",
+    "write_table",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    main()
@@ -0,0 +1,189 @@
+"""Compact backgammon positions and deduplicated move generation.
+
+A position is a list of :data:`SLOTS` integers seen from the player to move.
+Slots 0–23 are the points, numbered by the mover's distance to bearing off
+minus one, so the mover's home board is 0–5 and they move towards 0; the
+mover's checkers count positive and the opponent's negative. Slots 24–27
+hold the mover's bar, the opponent's bar, the mover's borne-off checkers and
+the opponent's. :func:`flip` turns a position round to face the opponent.
+
+:func:`plays` enumerates a roll depth first, moving a single list in place
+and undoing each step, and keeps one play per distinct resulting position.
+Equal dice are tried once per value and intermediate positions already
+expanded with the same dice left are skipped, so doubles no longer explode
+into every ordering of the same four checker moves.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+NUM_POINTS = 24
+CHECKERS_PER_PLAYER = 15
+
+SLOTS = NUM_POINTS + 4
+BAR_SLOT = NUM_POINTS
+OPPONENT_BAR_SLOT = NUM_POINTS + 1
+OFF_SLOT = NUM_POINTS + 2
+OPPONENT_OFF_SLOT = NUM_POINTS + 3
+
+# A checker move: (source point or BAR_SLOT, target point or OFF_TARGET, hit, die).
+Step = Tuple[int, int, bool, int]
+OFF_TARGET = -1
+
+# The 21 distinct rolls with their probabilities.
+ROLLS: Tuple[Tuple[Tuple[int, ...], float], ...] = tuple(
+    ((first, first, first, first), 1 / 36) if first == second else ((first, second), 2 / 36) for first in range(1, 7) for second in range(first, 7)
+)
+
+
+def flip(position: Sequence[int]) -> List[int]:
+    """Return ``position`` seen from the opponent."""
+    flipped = [-count for count in reversed(position[:NUM_POINTS])]
+    flipped.extend((position[OPPONENT_BAR_SLOT], position[BAR_SLOT], position[OPPONENT_OFF_SLOT], position[OFF_SLOT]))
+    return flipped
+
+
+def is_finished(position: Sequence[int]) -> bool:
+    """Return True if the mover has borne off every checker."""
+    return position[OFF_SLOT] >= CHECKERS_PER_PLAYER
+
+
+def single_steps(position: Sequence[int], die: int) -> List[Step]:
+    """Return every legal single-checker move for one die.
+
+    A checker on the bar must enter first. Bearing off needs every checker
+    in the home board and, as in :class:`~.backgammon.BackgammonGame`, is
+    allowed only from the mover's furthest point.
+    """
+    if position[BAR_SLOT]:
+        target = NUM_POINTS - die
+        if position[target] >= -1:
+            return [(BAR_SLOT, target, position[target] == -1, die)]
+        return []
+    furthest = NUM_POINTS - 1
+    while furthest >= 0 and position[furthest] <= 0:
+        furthest -= 1
+    steps: List[Step] = []
+    for source in range(furthest + 1):
+        if position[source] <= 0:
+            continue
+        target = source - die
+        if target < 0:
+            if furthest < 6 and source == furthest:
+                steps.append((source, OFF_TARGET, False, die))
+        elif position[target] >= -1:
+            steps.append((source, target, position[target] == -1, die))
+    return steps
+
+
+def apply_step(position: List[int], step: Step) -> None:
+    """Play ``step`` for the mover, in place."""
+    source, target, hit, _ = step
+    position[source] -= 1
+    if target == OFF_TARGET:
+        position[OFF_SLOT] += 1
+        return
+    if hit:
+        position[target] = 0
+        position[OPPONENT_BAR_SLOT] += 1
+    position[target] += 1
+
+
+def undo_step(position: List[int], step: Step) -> None:
+    """Take back :func:`apply_step`."""
+    source, target, hit, _ = step
+    position[source] += 1
+    if target == OFF_TARGET:
+        position[OFF_SLOT] -= 1
+        return
+    position[target] -= 1
+    if hit:
+        position[target] = -1
+        position[OPPONENT_BAR_SLOT] -= 1
+
+
+def plays(position: Sequence[int], dice: Sequence[int]) -> List[Tuple[Tuple[Step, ...], List[int]]]:
+    """Return one ``(steps, resulting position)`` pair per distinct legal result of ``dice``.
+
+    As many dice as possible must be played; when only one die can be
+    played, it must be the highest one that can. A roll that cannot be
+    played at all gives the single empty play.
+    """
+    board = list(position)
+    results: Dict[Tuple[int, ...], Tuple[Tuple[Step, ...], List[int]]] = {}
+    seen = set()
+    path: List[Step] = []
+
+    def expand(remaining: List[int]) -> None:
+        moved = False
+        for die in sorted(set(remaining), reverse=True):
+            steps = single_steps(board, die)
+            if not steps:
+                continue
+            rest = list(remaining)
+            rest.remove(die)
+            for step in steps:
+                moved = True
+                apply_step(board, step)
+                key = tuple(board)
+                if rest and (key, tuple(rest)) in seen:
+                    undo_step(board, step)
+                    continue
+                seen.add((key, tuple(rest)))
+                path.append(step)
+                expand(rest)
+                path.pop()
+                undo_step(board, step)
+        if not moved:
+            key = tuple(board)
+            if key not in results:
+                results[key] = (tuple(path), list(board))
+
+    if dice:
+        expand(list(dice))
+    longest = max((len(steps) for steps, _ in results.values()), default=0)
+    found = [result for result in results.values() if len(result[0]) == longest]
+    if longest == 1:
+        highest = max(steps[0][3] for steps, _ in found)
+        found = [result for result in found if result[0][0][3] == highest]
+    return found
+
+
+def pip_count(position: Sequence[int]) -> int:
+    """Return the mover's pip count."""
+    total = position[BAR_SLOT] * (NUM_POINTS + 1)
+    for point in range(NUM_POINTS):
+        if position[point] > 0:
+            total += (point + 1) * position[point]
+    return total
+
+
+def find_step(position: Sequence[int], source: int, target: int, die: int) -> Optional[Step]:
+    """Return the legal step from ``source`` to ``target`` with ``die``, or ``None``."""
+    for step in single_steps(position, die):
+        if step[0] == source and step[1] == target:
+            return step
+    return None
+
+
+__all__ = [
+    "BAR_SLOT",
+    "CHECKERS_PER_PLAYER",
+    "NUM_POINTS",
+    "OFF_SLOT",
+    "OFF_TARGET",
+    "OPPONENT_BAR_SLOT",
+    "OPPONENT_OFF_SLOT",
+    "ROLLS",
+    "SLOTS",
+    "Step",
+    "apply_step",
+    "find_step",
+    "flip",
+    "is_finished",
+    "pip_count",
+    "plays",
+    "single_steps",
+    "undo_step",
+]
@@ -0,0 +1,162 @@
+"""Position evaluation and expectiminimax search for backgammon.
+
+:func:`evaluate` estimates the chance that the player on roll wins a
+:mod:`.position`. Pure bearoffs are looked up exactly in the one-sided
+bearoff database; other races use a normal approximation on the pip counts;
+positions with contact are scored from pip count, exposed blots, home board
+strength, primes and anchors, squashed into a probability. Gammons are not
+modelled.
+
+:class:`BackgammonSearch` picks plays by expectiminimax: one ply scores each
+distinct result of the roll, two plies average the opponent's best reply
+over all 21 rolls for the most promising few.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+from .bearoff import BearoffTable
+from .position import BAR_SLOT, NUM_POINTS, OPPONENT_BAR_SLOT, ROLLS, Step, flip, is_finished, pip_count, plays
+
+# Pips the player on roll is effectively ahead by in a race.
+_ON_ROLL_PIPS = 4.0
+
+# Weights of the contact evaluation, in logistic units.
+_PIP_WEIGHT = 0.03
+_TARGET_BLOT_WEIGHT = 0.35
+_EXPOSED_BLOT_WEIGHT = 0.2
+_HOME_POINT_WEIGHT = 0.08
+_CLOSEOUT_WEIGHT = 0.12
+_ANCHOR_WEIGHT = 0.1
+_PRIME_WEIGHT = 0.1
+
+
+def evaluate(position: Sequence[int], bearoff: Optional[BearoffTable] = None) -> float:
+    """Return the estimated chance that the player on roll wins ``position``."""
+    if is_finished(position):
+        return 1.0
+    if is_finished(flip(position)):
+        return 0.0
+    if bearoff is not None:
+        exact = bearoff.win_probability(position)
+        if exact is not None:
+            return exact
+    own_pips = pip_count(position)
+    other_pips = pip_count(flip(position))
+    if not _has_contact(position):
+        spread = 1.35 * math.sqrt(max(own_pips + other_pips, 1))
+        return 0.5 * (1.0 + math.erf((other_pips - own_pips + _ON_ROLL_PIPS) / (spread * math.sqrt(2.0))))
+    score = _PIP_WEIGHT * (other_pips - own_pips)
+    score += _TARGET_BLOT_WEIGHT * _exposed_blots(flip(position)) - _EXPOSED_BLOT_WEIGHT * _exposed_blots(position)
+    score += _board_strength(position) - _board_strength(flip(position))
+    return 1.0 / (1.0 + math.exp(-score))
+
+
+def _has_contact(position: Sequence[int]) -> bool:
+    """Return True if either side can still hit the other."""
+    if position[BAR_SLOT] or position[OPPONENT_BAR_SLOT]:
+        return True
+    back = max((point for point in range(NUM_POINTS) if position[point] > 0), default=-1)
+    other_back = min((point for point in range(NUM_POINTS) if position[point] < 0), default=NUM_POINTS)
+    return back > other_back
+
+
+def _exposed_blots(position: Sequence[int]) -> float:
+    """Return the mover's blots the opponent could hit, direct shots counting double."""
+    exposure = 0.0
+    for point in range(NUM_POINTS):
+        if position[point] != 1:
+            continue
+        # The opponent moves up the mover's numbering and enters from the bar at 0–5.
+        nearest = NUM_POINTS
+        if position[OPPONENT_BAR_SLOT] and point < 6:
+            nearest = point + 1
+        for distance in range(1, min(point, 12) + 1):
+            if position[point - distance] < 0:
+                nearest = min(nearest, distance)
+                break
+        if nearest <= 6:
+            exposure += 1.0
+        elif nearest <= 12:
+            exposure += 0.5
+    return exposure
+
+
+def _board_strength(position: Sequence[int]) -> float:
+    """Return the logistic score of the mover's made points, primes and anchors."""
+    home_points = sum(1 for point in range(6) if position[point] >= 2)
+    anchors = sum(1 for point in range(NUM_POINTS - 6, NUM_POINTS) if position[point] >= 2)
+    prime = run = 0
+    for point in range(NUM_POINTS):
+        run = run + 1 if position[point] >= 2 else 0
+        prime = max(prime, run)
+    score = _HOME_POINT_WEIGHT * home_points + _CLOSEOUT_WEIGHT * home_points * position[OPPONENT_BAR_SLOT]
+    score += _ANCHOR_WEIGHT * anchors + _PRIME_WEIGHT * max(prime - 2, 0)
+    return score
+
+
+# A scored play: (chance the mover wins, steps, resulting position).
+_Scored = Tuple[float, Tuple[Step, ...], List[int]]
+
+
+class BackgammonSearch:
+    """Expectiminimax over :mod:`.position` states.
+
+    Args:
+        bearoff: Optional bearoff database for exact race endings.
+        plies: 1 scores each play directly; 2 also averages the opponent's
+            best reply over every roll.
+        candidates: How many of the best one-ply plays the second ply
+            examines.
+    """
+
+    def __init__(self, bearoff: Optional[BearoffTable] = None, *, plies: int = 2, candidates: int = 4) -> None:
+        if plies not in (1, 2):
+            raise ValueError(f"plies must be 1 or 2, not {plies}")
+        self.bearoff = bearoff
+        self.plies = plies
+        self.candidates = candidates
+
+    def best_play(self, position: Sequence[int], dice: Sequence[int]) -> Optional[Tuple[Step, ...]]:
+        """Return the steps of the best play of ``dice``, or ``None`` if there is no play."""
+        scored = self._score_plays(position, dice)
+        if not scored:
+            return None
+        if self.plies > 1 and len(scored) > 1:
+            shortlist = scored[: self.candidates]
+            scored = sorted(((self._reply_average(result), steps, result) for _, steps, result in shortlist), key=lambda entry: -entry[0])
+        return scored[0][1]
+
+    def win_probability(self, position: Sequence[int]) -> float:
+        """Return the chance the player on roll wins, averaging their best play over every roll."""
+        if is_finished(flip(position)):
+            return 0.0
+        total = 0.0
+        for dice, weight in ROLLS:
+            scored = self._score_plays(position, dice)
+            total += weight * (scored[0][0] if scored else 1.0 - evaluate(flip(position), self.bearoff))
+        return total
+
+    def _score_plays(self, position: Sequence[int], dice: Sequence[int]) -> List[_Scored]:
+        """Return every distinct play scored one ply deep, best first."""
+        scored = []
+        for steps, result in plays(position, dice):
+            scored.append((1.0 - evaluate(flip(result), self.bearoff), steps, result))
+        scored.sort(key=lambda entry: -entry[0])
+        return scored
+
+    def _reply_average(self, result: Sequence[int]) -> float:
+        """Return the mover's chance after the opponent's best reply, averaged over their rolls."""
+        if is_finished(result):
+            return 1.0
+        opponent = flip(result)
+        total = 0.0
+        for dice, weight in ROLLS:
+            replies = self._score_plays(opponent, dice)
+            total += weight * (1.0 - replies[0][0])
+        return total
+
+
+__all__ = ["BackgammonSearch", "evaluate"]
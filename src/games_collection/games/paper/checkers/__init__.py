@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
-from .checkers import CheckersAI, CheckersGame, CheckersMove, CheckersPiece
+from .bitboard import CheckersSearch
+from .checkers import CHECKERS_DIFFICULTIES, CheckersAI, CheckersGame, CheckersMove, CheckersPiece
 
-__all__ = ["CheckersGame", "CheckersMove", "CheckersPiece", "CheckersAI"]
+__all__ = ["CheckersGame", "CheckersMove", "CheckersPiece", "CheckersAI", "CheckersSearch", "CHECKERS_DIFFICULTIES"]
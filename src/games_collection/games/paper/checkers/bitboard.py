@@ -0,0 +1,514 @@
+"""Bitboard checkers core: move generation, evaluation and search.
+
+Only the 32 dark squares are playable, so a position fits in three 32-bit
+integers: black pieces, white pieces and kings. Square ``index`` is the dark
+square ``index // 4`` rows down and ``index % 4`` across, which is standard
+(PDN) square ``index + 1``. Black starts on squares 0-11 and moves down the
+board, as in :class:`~.checkers.CheckersGame`.
+
+Steps and jumps come from tables precomputed per square and direction, and
+multi-jump sequences are followed by a depth-first walk over the integers,
+so nothing is copied while generating moves. :class:`CheckersSearch` runs
+iterative deepening alpha-beta on top, with Zobrist keys for its
+transposition table, capture quiescence at the horizon, a small opening book
+and an optional endgame lookup.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+BLACK, WHITE = 0, 1
+FULL = (1 << 32) - 1
+
+# The starting position: black on squares 0-11, white on 20-31, black to move.
+START = (0x00000FFF, 0xFFF00000, 0, BLACK)
+
+# Men promote on the far row: squares 28-31 for black, 0-3 for white.
+PROMOTION = (0xF0000000, 0x0000000F)
+# Each side's back row, which it guards against enemy promotion.
+BACK_ROW = (0x0000000F, 0xF0000000)
+# Men past each of these row masks (per side) earn the weight again, so
+# advancement grows from the third row to the seventh.
+_ADVANCEMENT = (
+    ((0xFFFFF000, 0x000FFFFF), 4),
+    ((0xFFFF0000, 0x0000FFFF), 4),
+    ((0x0FF00000, 0x00000FF0), 6),
+)
+# The eight squares of the two centre rows that are most often fought over.
+CENTRE = (1 << 13) | (1 << 14) | (1 << 17) | (1 << 18) | (1 << 9) | (1 << 10) | (1 << 21) | (1 << 22)
+
+# Directions in the order CheckersPiece.movement_directions lists them:
+# up-left, up-right, down-left, down-right.
+_DELTAS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+_MAN_DIRECTIONS = ((2, 3), (0, 1))
+_KING_DIRECTIONS = (0, 1, 2, 3)
+
+# A (path, captured mask) pair; path lists the squares visited.
+Move = Tuple[Tuple[int, ...], int]
+
+# Score of a won position, above any evaluation.
+WIN_SCORE = 100_000
+
+# Transposition table bound flags.
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+def square_index(row: int, column: int) -> Optional[int]:
+    """Return the index of the dark square at ``row``, ``column``, or ``None`` for a light square."""
+    if not (0 <= row < 8 and 0 <= column < 8) or (row + column) % 2 == 0:
+        return None
+    return row * 4 + column // 2
+
+
+def square_coordinate(index: int) -> Tuple[int, int]:
+    """Return the ``(row, column)`` of dark square ``index``."""
+    row = index // 4
+    return row, 2 * (index % 4) + (1 if row % 2 == 0 else 0)
+
+
+def _tables() -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[Tuple[Optional[Tuple[int, int]], ...], ...]]:
+    """Return the step target and the (jumped, landing) squares per square and direction."""
+    steps = []
+    jumps = []
+    for index in range(32):
+        row, column = square_coordinate(index)
+        square_steps = []
+        square_jumps: List[Optional[Tuple[int, int]]] = []
+        for delta_row, delta_column in _DELTAS:
+            step = square_index(row + delta_row, column + delta_column)
+            landing = square_index(row + 2 * delta_row, column + 2 * delta_column)
+            square_steps.append(-1 if step is None else step)
+            square_jumps.append(None if step is None or landing is None else (step, landing))
+        steps.append(tuple(square_steps))
+        jumps.append(tuple(square_jumps))
+    return tuple(steps), tuple(jumps)
+
+
+_STEPS, _JUMPS = _tables()
+
+
+def popcount(bits: int) -> int:
+    """Return the number of set bits in ``bits``."""
+    return bin(bits).count("1")
+
+
+def _squares(bits: int) -> List[int]:
+    """Return the indices of the set bits in ascending order."""
+    result = []
+    while bits:
+        low = bits & -bits
+        result.append(low.bit_length() - 1)
+        bits ^= low
+    return result
+
+
+def from_board(board: Sequence[Sequence[Optional[object]]]) -> Tuple[int, int, int]:
+    """Return ``(black, white, kings)`` masks for a grid of pieces with ``color`` and ``king``."""
+    black = white = kings = 0
+    for index in range(32):
+        row, column = square_coordinate(index)
+        piece = board[row][column]
+        if piece is None:
+            continue
+        bit = 1 << index
+        if piece.color == "black":  # type: ignore[attr-defined]
+            black |= bit
+        else:
+            white |= bit
+        if piece.king:  # type: ignore[attr-defined]
+            kings |= bit
+    return black, white, kings
+
+
+def generate_moves(black: int, white: int, kings: int, side: int) -> Tuple[List[Move], bool]:
+    """Return the legal moves for ``side`` and whether they are captures.
+
+    Captures are compulsory, so when any exists only capture sequences are
+    returned. A sequence continues while further jumps are available and
+    stops when a man reaches the far row and is crowned. Moves are ordered by
+    starting square, then by direction, as the board engine lists them.
+    """
+    own, other = (black, white) if side == BLACK else (white, black)
+    empty = ~(black | white) & FULL
+    promotion = PROMOTION[side]
+    man_directions = _MAN_DIRECTIONS[side]
+    captures: List[Move] = []
+    moves: List[Move] = []
+    while own:
+        low = own & -own
+        own ^= low
+        square = low.bit_length() - 1
+        is_king = kings & low
+        directions = _KING_DIRECTIONS if is_king else man_directions
+        jumps = _JUMPS[square]
+        for direction in directions:
+            jump = jumps[direction]
+            if jump is not None and other >> jump[0] & 1 and empty >> jump[1] & 1:
+                _extend_jumps(square, directions, 0 if is_king else promotion, other, empty | low, (square,), 0, captures)
+                break
+        if captures:
+            continue
+        steps = _STEPS[square]
+        for direction in directions:
+            target = steps[direction]
+            if target >= 0 and empty >> target & 1:
+                moves.append(((square, target), 0))
+    if captures:
+        return captures, True
+    return moves, False
+
+
+def _extend_jumps(
+    square: int,
+    directions: Tuple[int, ...],
+    promotion: int,
+    other: int,
+    empty: int,
+    path: Tuple[int, ...],
+    captured: int,
+    out: List[Move],
+) -> None:
+    """Append every jump sequence continuing from ``square`` to ``out``.
+
+    ``promotion`` is the crowning row for a man and 0 for a king; ``other``
+    and ``empty`` already reflect the jumps made so far.
+    """
+    for direction in directions:
+        jump = _JUMPS[square][direction]
+        if jump is None:
+            continue
+        middle, landing = jump
+        if not (other >> middle & 1 and empty >> landing & 1):
+            continue
+        middle_bit = 1 << middle
+        next_path = path + (landing,)
+        if promotion & (1 << landing):
+            out.append((next_path, captured | middle_bit))
+            continue
+        found = len(out)
+        _extend_jumps(
+            landing,
+            directions,
+            promotion,
+            other & ~middle_bit,
+            (empty | middle_bit | (1 << square)) & ~(1 << landing),
+            next_path,
+            captured | middle_bit,
+            out,
+        )
+        if len(out) == found:
+            out.append((next_path, captured | middle_bit))
+
+
+def has_moves(black: int, white: int, kings: int, side: int) -> bool:
+    """Return whether ``side`` has any step or jump, without building moves."""
+    own, other = (black, white) if side == BLACK else (white, black)
+    empty = ~(black | white) & FULL
+    man_directions = _MAN_DIRECTIONS[side]
+    for square in _squares(own):
+        for direction in _KING_DIRECTIONS if kings >> square & 1 else man_directions:
+            target = _STEPS[square][direction]
+            if target < 0:
+                continue
+            if empty >> target & 1:
+                return True
+            jump = _JUMPS[square][direction]
+            if jump is not None and other >> target & 1 and empty >> jump[1] & 1:
+                return True
+    return False
+
+
+def apply_move(black: int, white: int, kings: int, side: int, move: Move) -> Tuple[int, int, int]:
+    """Return ``(black, white, kings)`` after ``side`` plays ``move``."""
+    path, captured = move
+    start_bit = 1 << path[0]
+    end_bit = 1 << path[-1]
+    if side == BLACK:
+        black = (black & ~start_bit) | end_bit
+        white &= ~captured
+    else:
+        white = (white & ~start_bit) | end_bit
+        black &= ~captured
+    crowned = kings & start_bit or end_bit & PROMOTION[side]
+    kings &= ~(start_bit | captured)
+    if crowned:
+        kings |= end_bit
+    return black, white, kings
+
+
+def evaluate(black: int, white: int, kings: int, side: int) -> int:
+    """Return a heuristic score for the player to move.
+
+    Men are worth 100 and kings 150. Men also earn a little for every row
+    they have advanced, back-row men guard against enemy kings while the
+    opponent still has men, and centre squares are worth holding. When ahead
+    in material, fewer pieces on the board scores higher, which favours
+    trading down.
+    """
+    black_men = black & ~kings
+    white_men = white & ~kings
+    score = 100 * (popcount(black_men) - popcount(white_men)) + 150 * (popcount(black & kings) - popcount(white & kings))
+    for mask, weight in _ADVANCEMENT:
+        score += weight * (popcount(black_men & mask[BLACK]) - popcount(white_men & mask[WHITE]))
+    if white_men:
+        score += 12 * popcount(black_men & BACK_ROW[BLACK])
+    if black_men:
+        score -= 12 * popcount(white_men & BACK_ROW[WHITE])
+    score += 6 * (popcount(black & CENTRE) - popcount(white & CENTRE))
+    if score > 150:
+        score += 2 * (24 - popcount(black | white))
+    elif score < -150:
+        score -= 2 * (24 - popcount(black | white))
+    return score if side == BLACK else -score
+
+
+def _zobrist_table() -> Tuple[Tuple[int, ...], ...]:
+    """Return random keys for (black man, white man, black king, white king) per square."""
+    rng = random.Random(0xC8)
+    return tuple(tuple(rng.getrandbits(64) for _ in range(32)) for _ in range(4))
+
+
+_ZOBRIST = _zobrist_table()
+_ZOBRIST_SIDE = random.Random(0xC9).getrandbits(64)
+
+
+def zobrist_key(black: int, white: int, kings: int, side: int) -> int:
+    """Return the Zobrist hash of a position."""
+    key = _ZOBRIST_SIDE if side == WHITE else 0
+    for square in _squares(black):
+        key ^= _ZOBRIST[2 if kings >> square & 1 else 0][square]
+    for square in _squares(white):
+        key ^= _ZOBRIST[3 if kings >> square & 1 else 1][square]
+    return key
+
+
+def _move_key(key: int, kings: int, side: int, move: Move, crowned: bool) -> int:
+    """Return the Zobrist key after ``move``, given the kings mask before it."""
+    path, captured = move
+    start = path[0]
+    moving_king = kings >> start & 1
+    key ^= _ZOBRIST[side + 2 * moving_king][start]
+    key ^= _ZOBRIST[side + 2 * (moving_king or crowned)][path[-1]]
+    while captured:
+        low = captured & -captured
+        captured ^= low
+        square = low.bit_length() - 1
+        key ^= _ZOBRIST[(1 - side) + 2 * (kings >> square & 1)][square]
+    return key ^ _ZOBRIST_SIDE
+
+
+def parse_move(text: str) -> Tuple[int, ...]:
+    """Return the square indices of a PDN move such as ``"11-15"`` or ``"15x24x31"``."""
+    return tuple(int(square) - 1 for square in text.replace("x", "-").split("-"))
+
+
+# Well-known opening lines in PDN notation (black moves first). The book
+# offers every continuation listed for a position and picks one at random.
+OPENING_LINES: Tuple[str, ...] = (
+    "11-15 23-19 8-11 22-17",
+    "11-15 23-19 9-14 22-17",
+    "11-15 22-18 15x22 25x18",
+    "11-15 24-20 8-11 28-24",
+    "11-15 22-17 8-11 17-13",
+    "9-14 22-18 5-9 24-20",
+    "9-14 23-19 11-16 19-15",
+    "10-15 21-17 11-16 17-13",
+    "11-16 22-18 16-20 24-19",
+)
+
+
+def _build_book(lines: Sequence[str]) -> Dict[Tuple[int, int, int, int], List[Tuple[int, ...]]]:
+    """Replay ``lines`` from the start and index each book move by position."""
+    book: Dict[Tuple[int, int, int, int], List[Tuple[int, ...]]] = {}
+    for line in lines:
+        black, white, kings, side = START
+        for text in line.split():
+            path = parse_move(text)
+            moves, _ = generate_moves(black, white, kings, side)
+            move = next((candidate for candidate in moves if candidate[0] == path), None)
+            if move is None:
+                raise ValueError(f"Illegal book move {text!r} in line {line!r}")
+            paths = book.setdefault((black, white, kings, side), [])
+            if path not in paths:
+                paths.append(path)
+            black, white, kings = apply_move(black, white, kings, side, move)
+            side = 1 - side
+    return book
+
+
+# Returns an exact score for the player to move, or None when unknown.
+EndgameLookup = Callable[[int, int, int, int], Optional[int]]
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget is spent."""
+
+
+class CheckersSearch:
+    """Iterative deepening alpha-beta over bitboard positions.
+
+    Args:
+        table_size: Transposition table entries kept before it is cleared.
+        book: Use :data:`OPENING_LINES` for the first moves of the game.
+        endgame: Optional lookup returning an exact score (positive when the
+            player to move wins) for positions with at most
+            ``endgame_pieces`` pieces, such as a probe into an endgame
+            database.
+        endgame_pieces: Piece count at or below which ``endgame`` is asked.
+        rng: Random source for choosing between book moves.
+    """
+
+    def __init__(
+        self,
+        table_size: int = 500_000,
+        *,
+        book: bool = True,
+        endgame: Optional[EndgameLookup] = None,
+        endgame_pieces: int = 0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.table_size = table_size
+        self._book = _build_book(OPENING_LINES) if book else {}
+        self.endgame = endgame
+        self.endgame_pieces = endgame_pieces
+        self._rng = rng or random.Random()
+        # Zobrist key -> (depth, value, flag, best move)
+        self._table: Dict[int, Tuple[int, int, int, Optional[Move]]] = {}
+        # (from square, to square) -> history score, for quiet move ordering
+        self._history: Dict[Tuple[int, int], int] = {}
+        self._deadline: Optional[float] = None
+        self.nodes = 0
+        self.last_depth = 0
+
+    def best_move(
+        self,
+        black: int,
+        white: int,
+        kings: int,
+        side: int,
+        depth: int,
+        *,
+        time_budget: Optional[float] = None,
+    ) -> Optional[Move]:
+        """Return the best move for ``side``, or ``None`` when it has none.
+
+        Book positions are answered from the book. Otherwise the search
+        deepens one ply at a time to ``depth``; with a ``time_budget`` (in
+        seconds) it returns the best move of the deepest finished iteration,
+        and the first iteration always finishes.
+        """
+        moves, _ = generate_moves(black, white, kings, side)
+        if not moves:
+            return None
+        if len(moves) == 1:
+            return moves[0]
+        book_paths = self._book.get((black, white, kings, side))
+        if book_paths:
+            path = self._rng.choice(book_paths)
+            return next(move for move in moves if move[0] == path)
+        if len(self._table) > self.table_size:
+            self._table.clear()
+        self._history.clear()
+        self.nodes = 0
+        key = zobrist_key(black, white, kings, side)
+        start = time.perf_counter()
+        best = moves[0]
+        for iteration in range(1, max(depth, 1) + 1):
+            self._deadline = start + time_budget if time_budget is not None and iteration > 1 else None
+            try:
+                self._negamax(black, white, kings, side, key, iteration, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+            except _SearchTimeout:
+                break
+            entry = self._table.get(key)
+            if entry is not None and entry[3] is not None:
+                best = entry[3]
+            self.last_depth = iteration
+        self._deadline = None
+        return best
+
+    def _ordered(self, moves: List[Move], first: Optional[Move]) -> List[Move]:
+        """Return ``moves`` with the table move first, then longer captures, then by history."""
+        history = self._history
+        ordered = sorted(moves, key=lambda move: (-popcount(move[1]), -history.get((move[0][0], move[0][-1]), 0)))
+        if first is not None and first in moves:
+            ordered.remove(first)
+            ordered.insert(0, first)
+        return ordered
+
+    def _negamax(self, black: int, white: int, kings: int, side: int, key: int, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Alpha-beta from the point of view of ``side``; captures are searched past the horizon."""
+        self.nodes += 1
+        if self._deadline is not None and not self.nodes & 255 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        moves, capturing = generate_moves(black, white, kings, side)
+        if not moves:
+            return -WIN_SCORE + ply
+        if depth <= 0 and not capturing:
+            return evaluate(black, white, kings, side)
+        if self.endgame is not None and ply and popcount(black | white) <= self.endgame_pieces:
+            known = self.endgame(black, white, kings, side)
+            if known is not None:
+                return known
+
+        entry = self._table.get(key)
+        first = None
+        if entry is not None:
+            entry_depth, value, flag, first = entry
+            if entry_depth >= depth and ply:
+                if flag == _EXACT or (flag == _LOWER and value >= beta) or (flag == _UPPER and value <= alpha):
+                    return value
+
+        original_alpha = alpha
+        best = -WIN_SCORE - 1
+        best_move = None
+        # A capture at the horizon is forced, so it is searched without using up depth.
+        next_depth = depth - 1 if depth > 0 else 0
+        for move in self._ordered(moves, first) if len(moves) > 1 else moves:
+            next_black, next_white, next_kings = apply_move(black, white, kings, side, move)
+            crowned = not kings >> move[0][0] & 1 and next_kings >> move[0][-1] & 1
+            next_key = _move_key(key, kings, side, move, bool(crowned))
+            if best_move is None:
+                score = -self._negamax(next_black, next_white, next_kings, 1 - side, next_key, next_depth, -beta, -alpha, ply + 1)
+            else:
+                # Principal variation search: a null window proves most moves
+                # worse than the first, and only the rest are searched again.
+                score = -self._negamax(next_black, next_white, next_kings, 1 - side, next_key, next_depth, -alpha - 1, -alpha, ply + 1)
+                if alpha < score < beta:
+                    score = -self._negamax(next_black, next_white, next_kings, 1 - side, next_key, next_depth, -beta, -score, ply + 1)
+            if score > best:
+                best = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if not capturing:
+                            slot = (move[0][0], move[0][-1])
+                            self._history[slot] = self._history.get(slot, 0) + depth * depth
+                        break
+        flag = _UPPER if best <= original_alpha else _LOWER if best >= beta else _EXACT
+        self._table[key] = (depth, best, flag, best_move)
+        return best
+
+
+__all__ = [
+    "BLACK",
+    "WHITE",
+    "CheckersSearch",
+    "EndgameLookup",
+    "Move",
+    "OPENING_LINES",
+    "START",
+    "apply_move",
+    "evaluate",
+    "from_board",
+    "generate_moves",
+    "has_moves",
+    "parse_move",
+    "square_coordinate",
+    "square_index",
+    "zobrist_key",
+]
@@ -4,8 +4,10 @@ This module provides a complete Checkers game engine, an AI opponent, and a
 command-line interface. The game engine correctly implements all standard
 rules, including forced captures, multi-jump (king) moves, and promotion.
 
-The AI uses the minimax algorithm with alpha-beta pruning to determine the
-best move, providing a challenging opponent. The CLI allows for interactive
+Move generation runs on the 32-square bitboards of :mod:`.bitboard`. The AI
+searches those bitboards with iterative deepening alpha-beta, a Zobrist
+transposition table and capture quiescence; the original minimax over the
+piece grid remains available as a backend. The CLI allows for interactive
 gameplay in a terminal.
 
 Classes:
@@ -18,14 +20,20 @@ Classes:
 
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from games_collection.core.ai_strategy import check_backend, difficulty_preset
 from games_collection.core.game_engine import GameEngine, GameState
 
+from . import bitboard
+
 # Type aliases for clarity.
 Coordinate = Tuple[int, int]
 BoardType = List[List[Optional["CheckersPiece"]]]
+# (move, moved piece, captured pieces, player, winner, state) for a pushed move.
+UndoRecord = Tuple["CheckersMove", "CheckersPiece", List[Optional["CheckersPiece"]], str, Optional[str], GameState]
 
 
 @dataclass(frozen=True)
@@ -85,6 +93,7 @@ class CheckersGame(GameEngine[CheckersMove, str]):
         self._current_player = "black"
         self._winner: Optional[str] = None
         self._state = GameState.NOT_STARTED
+        self._undo_stack: List[UndoRecord] = []
         self.reset()
 
     def reset(self) -> None:
@@ -101,6 +110,7 @@ class CheckersGame(GameEngine[CheckersMove, str]):
         self._current_player = "black"
         self._winner = None
         self._state = GameState.IN_PROGRESS
+        self._undo_stack = []
 
     def is_game_over(self) -> bool:
         """Returns True if the game has finished."""
@@ -130,7 +140,36 @@ class CheckersGame(GameEngine[CheckersMove, str]):
         """
         if self.is_game_over() or move not in self.get_valid_moves():
             return False
-        next_player, winner, draw = self._apply_move_on_board(self._board, move, self._current_player)
+        self._finish_turn(*self._apply_move_on_board(self._board, move, self._current_player))
+        return True
+
+    def push_move(self, move: CheckersMove) -> None:
+        """Apply a move in place for search, recording the pieces it removes."""
+        board = self._board
+        start_row, start_col = move.path[0]
+        piece = board[start_row][start_col]
+        captured = [board[row][col] for row, col in move.captures]
+        outcome = self._apply_move_on_board(board, move, self._current_player)
+        self._undo_stack.append((move, piece, captured, self._current_player, self._winner, self._state))
+        self._finish_turn(*outcome)
+
+    def pop_move(self) -> CheckersMove:
+        """Undo the most recent :meth:`push_move`."""
+        move, piece, captured, player, winner, state = self._undo_stack.pop()
+        board = self._board
+        end_row, end_col = move.path[-1]
+        board[end_row][end_col] = None
+        start_row, start_col = move.path[0]
+        board[start_row][start_col] = piece
+        for (row, col), captured_piece in zip(move.captures, captured):
+            board[row][col] = captured_piece
+        self._current_player = player
+        self._winner = winner
+        self._state = state
+        return move
+
+    def _finish_turn(self, next_player: str, winner: Optional[str], draw: bool) -> None:
+        """Record the outcome of an applied move and pass the turn."""
         if draw:
             self._winner = None
             self._state = GameState.FINISHED
@@ -139,7 +178,6 @@ class CheckersGame(GameEngine[CheckersMove, str]):
             self._state = GameState.FINISHED
         else:
             self._current_player = next_player
-        return True
 
     def get_winner(self) -> Optional[str]:
         """Returns the color of the winning player, or None for a draw or ongoing game."""
@@ -173,76 +211,19 @@ class CheckersGame(GameEngine[CheckersMove, str]):
 
     def _collect_moves(self, board: BoardType, player: str) -> Tuple[List[CheckersMove], List[CheckersMove]]:
         """Collects all possible capturing and non-capturing moves for a player."""
-        capturing: List[CheckersMove] = []
-        normal: List[CheckersMove] = []
-        for row, col in self._iter_player_pieces(board, player):
-            piece = board[row][col]
-            # If any jump is found, we can ignore simple moves for this piece.
-            jumps = self._find_jump_sequences(board, (row, col), piece)
-            if jumps:
-                capturing.extend(jumps)
-            else:
-                normal.extend(self._find_simple_moves(board, (row, col), piece))
-        return capturing, normal
-
-    def _iter_player_pieces(self, board: BoardType, player: str) -> Iterable[Coordinate]:
-        """Yields the coordinates of all pieces belonging to a player."""
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-                piece = board[r][c]
-                if piece and piece.color == player:
-                    yield (r, c)
-
-    def _find_simple_moves(self, board: BoardType, pos: Coordinate, piece: CheckersPiece) -> List[CheckersMove]:
-        """Finds all simple (non-capturing) moves for a piece."""
-        moves: List[CheckersMove] = []
-        for dr, dc in piece.movement_directions():
-            target = (pos[0] + dr, pos[1] + dc)
-            if self._is_on_board(target) and board[target[0]][target[1]] is None:
-                moves.append(CheckersMove(path=(pos, target)))
-        return moves
-
-    def _find_jump_sequences(self, board: BoardType, pos: Coordinate, piece: CheckersPiece) -> List[CheckersMove]:
-        """Finds all possible jump sequences (including multi-jumps) for a piece."""
-        return self._search_captures(board, pos, piece, [pos], [])
-
-    def _search_captures(
-        self, board: BoardType, pos: Coordinate, piece: CheckersPiece, path: List[Coordinate], captures: List[Coordinate]
-    ) -> List[CheckersMove]:
-        """Recursively searches for all possible jump sequences from a given position."""
-        results: List[CheckersMove] = []
-        for dr, dc in piece.movement_directions():
-            middle = (pos[0] + dr, pos[1] + dc)
-            landing = (pos[0] + 2 * dr, pos[1] + 2 * dc)
-
-            if not (self._is_on_board(middle) and self._is_on_board(landing)):
-                continue
-
-            middle_piece = board[middle[0]][middle[1]]
-            if not (middle_piece and middle_piece.color != piece.color and board[landing[0]][landing[1]] is None):
-                continue
-
-            board_copy = self._clone_board(board)
-            board_copy[pos[0]][pos[1]] = None
-            board_copy[middle[0]][middle[1]] = None
-            promoted_piece = CheckersPiece(piece.color, True) if not piece.king and self._should_promote(piece.color, landing[0]) else piece
-            board_copy[landing[0]][landing[1]] = promoted_piece
-
-            extended_path = path + [landing]
-            extended_captures = captures + [middle]
-
-            # If the piece was just promoted, it cannot continue jumping in the same turn.
-            if promoted_piece.king and not piece.king:
-                results.append(CheckersMove(path=tuple(extended_path), captures=tuple(extended_captures)))
-                continue
-
-            # Recursively search for more captures from the landing position.
-            child_moves = self._search_captures(board_copy, landing, promoted_piece, extended_path, extended_captures)
-            if child_moves:
-                results.extend(child_moves)
-            else:
-                results.append(CheckersMove(path=tuple(extended_path), captures=tuple(extended_captures)))
-        return results
+        side = bitboard.BLACK if player == "black" else bitboard.WHITE
+        moves, capturing = bitboard.generate_moves(*bitboard.from_board(board), side)
+        converted = [self._to_move(path) for path, _ in moves]
+        return (converted, []) if capturing else ([], converted)
+
+    @staticmethod
+    def _to_move(path: Sequence[int]) -> CheckersMove:
+        """Builds a move from the bitboard squares it visits."""
+        coordinates = tuple(bitboard.square_coordinate(square) for square in path)
+        captures = tuple(
+            ((start[0] + end[0]) // 2, (start[1] + end[1]) // 2) for start, end in zip(coordinates, coordinates[1:]) if abs(start[0] - end[0]) == 2
+        )
+        return CheckersMove(path=coordinates, captures=captures)
 
     def _apply_move_on_board(self, board: BoardType, move: CheckersMove, player: str) -> Tuple[str, Optional[str], bool]:
         """Applies a move to a given board and determines the outcome."""
@@ -257,54 +238,80 @@ class CheckersGame(GameEngine[CheckersMove, str]):
 
         end_row, end_col = move.path[-1]
         promote = not piece.king and self._should_promote(piece.color, end_row)
-        board[end_row][end_col] = CheckersPiece(piece.color, king=piece.king or promote)
+        board[end_row][end_col] = CheckersPiece(piece.color, king=True) if promote else piece
 
         opponent = self._opponent(player)
-        if not self._has_pieces(board, opponent) or not self._collect_moves(board, opponent)[0] and not self._collect_moves(board, opponent)[1]:
+        if not self._has_any_move(board, opponent):
             return player, player, False  # Current player wins.
 
-        if not self._has_pieces(board, player) or not self._collect_moves(board, player)[0] and not self._collect_moves(board, player)[1]:
+        if not self._has_any_move(board, player):
             return opponent, opponent, False  # Opponent wins.
 
         return opponent, None, False  # Game continues.
 
+    def _has_any_move(self, board: BoardType, player: str) -> bool:
+        """Checks whether a player has a step or a jump, without building moves."""
+        side = bitboard.BLACK if player == "black" else bitboard.WHITE
+        return bitboard.has_moves(*bitboard.from_board(board), side)
+
     def _should_promote(self, color: str, row: int) -> bool:
         """Checks if a piece should be promoted to a king."""
         return (color == "black" and row == self.board_size - 1) or (color == "white" and row == 0)
 
-    def _has_pieces(self, board: BoardType, player: str) -> bool:
-        """Checks if a player has any pieces left on the board."""
-        return any(p for row in board for p in row if p and p.color == player)
-
-    def _is_on_board(self, pos: Coordinate) -> bool:
-        """Checks if a coordinate is within the board's boundaries."""
-        return 0 <= pos[0] < self.board_size and 0 <= pos[1] < self.board_size
-
     def _opponent(self, player: str) -> str:
         """Returns the opposing player's color."""
         return "white" if player == "black" else "black"
 
-    def _clone_board(self, board: BoardType) -> BoardType:
-        """Creates a deep copy of a board."""
-        return [[piece for piece in row] for row in board]
+
+# Search depth and time limit for each menu difficulty; the easy bot also skips the opening book.
+CHECKERS_DIFFICULTIES: Dict[str, Dict[str, Any]] = {
+    "easy": {"depth": 2, "book": False},
+    "medium": {"depth": 6},
+    "hard": {"depth": 10, "time_budget": 1.0},
+    "expert": {"depth": 14, "time_budget": 3.0},
+}
 
 
 class CheckersAI:
     """A minimax-based AI opponent for the Checkers game.
 
-    This AI uses alpha-beta pruning to efficiently search the game tree and
-    a heuristic evaluation function to score board states.
+    Moves are chosen by :class:`~.bitboard.CheckersSearch` unless ``backend``
+    is ``"board"``. That search deepens alpha-beta over 32-square bitboards
+    with a Zobrist transposition table, resolves forced captures past the
+    horizon, and consults an opening book and an optional endgame lookup;
+    ``time_budget`` caps it in seconds. The ``"board"`` backend is the
+    original minimax over the piece grid, searched in place with
+    ``push_move``/``pop_move``.
     """
 
-    def __init__(self, depth: int = 6) -> None:
+    def __init__(
+        self,
+        depth: int = 6,
+        *,
+        backend: str = "bitboard",
+        time_budget: Optional[float] = None,
+        book: bool = True,
+        endgame: Optional[bitboard.EndgameLookup] = None,
+        endgame_pieces: int = 0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        check_backend(backend, ("bitboard", "board"), "checkers")
         self.depth = depth
-        self._helper = CheckersGame()
+        self.backend = backend
+        self.time_budget = time_budget
+        self._search = bitboard.CheckersSearch(book=book, endgame=endgame, endgame_pieces=endgame_pieces, rng=rng)
+
+    @classmethod
+    def for_difficulty(cls, difficulty: str) -> "CheckersAI":
+        """Build an AI from the named :data:`CHECKERS_DIFFICULTIES` entry; unknown names raise ``ValueError``."""
+        return cls(**difficulty_preset(CHECKERS_DIFFICULTIES, difficulty, "checkers"))
 
     def choose_move(self, game: CheckersGame) -> CheckersMove:
         """Chooses the best move for the AI using the minimax algorithm.
 
         Args:
-            game (CheckersGame): The current game state.
+            game (CheckersGame): The current game state. It is searched in
+                place and left unchanged.
 
         Returns:
             CheckersMove: The best move found by the AI.
@@ -312,39 +319,57 @@ class CheckersAI:
         moves = game.get_valid_moves()
         if not moves:
             raise ValueError("No valid moves available for the AI.")
+        if self.backend == "bitboard":
+            return self._choose_bitboard_move(game, moves)
 
+        maximizing_player = game.get_current_player()
         best_score = float("-inf")
         best_move = moves[0]
         for move in moves:
-            board_copy, next_player, winner, draw = game.simulate_move(move)
-            score = self._minimax(board_copy, next_player, game.get_current_player(), self.depth - 1, -float("inf"), float("inf"), winner, draw)
+            score = self._search_child(game, move, maximizing_player, self.depth - 1, -float("inf"), float("inf"))
             if score > best_score:
                 best_score = score
                 best_move = move
         return best_move
 
-    def _minimax(
-        self, board: BoardType, current_player: str, maximizing_player: str, depth: int, alpha: float, beta: float, winner: Optional[str], draw: bool
-    ) -> float:
+    def _choose_bitboard_move(self, game: CheckersGame, moves: List[CheckersMove]) -> CheckersMove:
+        """Chooses a move with the bitboard search."""
+        side = bitboard.BLACK if game.get_current_player() == "black" else bitboard.WHITE
+        best = self._search.best_move(*bitboard.from_board(game._board), side, self.depth, time_budget=self.time_budget)
+        if best is not None:
+            path = tuple(bitboard.square_coordinate(square) for square in best[0])
+            for move in moves:
+                if move.path == path:
+                    return move
+        return moves[0]
+
+    def _search_child(self, game: CheckersGame, move: CheckersMove, maximizing_player: str, depth: int, alpha: float, beta: float) -> float:
+        """Scores a move by making it, searching the position and unmaking it."""
+        game.push_move(move)
+        try:
+            return self._minimax(game, maximizing_player, depth, alpha, beta)
+        finally:
+            game.pop_move()
+
+    def _minimax(self, game: CheckersGame, maximizing_player: str, depth: int, alpha: float, beta: float) -> float:
         """The minimax algorithm with alpha-beta pruning."""
-        if winner is not None:
+        if game.is_game_over():
+            winner = game.get_winner()
+            if winner is None:
+                return 0.0
             return 1000.0 if winner == maximizing_player else -1000.0
-        if draw:
-            return 0.0
         if depth == 0:
-            return self._evaluate(board, maximizing_player)
+            return self._evaluate(game._board, maximizing_player)
 
-        capturing, normal = self._helper._collect_moves(board, current_player)
-        moves = capturing if capturing else normal
+        moves = game.get_valid_moves()
+        current_player = game.get_current_player()
         if not moves:
             return -1000.0 if current_player == maximizing_player else 1000.0
 
         if current_player == maximizing_player:
             value = float("-inf")
             for move in moves:
-                board_copy = self._helper._clone_board(board)
-                next_player, new_winner, new_draw = self._helper._apply_move_on_board(board_copy, move, current_player)
-                value = max(value, self._minimax(board_copy, next_player, maximizing_player, depth - 1, alpha, beta, new_winner, new_draw))
+                value = max(value, self._search_child(game, move, maximizing_player, depth - 1, alpha, beta))
                 alpha = max(alpha, value)
                 if beta <= alpha:
                     break
@@ -352,9 +377,7 @@ class CheckersAI:
         else:
             value = float("inf")
             for move in moves:
-                board_copy = self._helper._clone_board(board)
-                next_player, new_winner, new_draw = self._helper._apply_move_on_board(board_copy, move, current_player)
-                value = min(value, self._minimax(board_copy, next_player, maximizing_player, depth - 1, alpha, beta, new_winner, new_draw))
+                value = min(value, self._search_child(game, move, maximizing_player, depth - 1, alpha, beta))
                 beta = min(beta, value)
                 if beta <= alpha:
                     break
@@ -368,7 +391,7 @@ class CheckersAI:
                 if piece:
                     multiplier = 1.0 if piece.color == player else -1.0
                     king_bonus = 1.5 if piece.king else 1.0
-                    advancement = (r if piece.color == "black" else (self.board_size - 1 - r)) / 10.0
+                    advancement = (r if piece.color == "black" else (CheckersGame.board_size - 1 - r)) / 10.0
                     score += multiplier * (king_bonus + advancement)
         return score
 
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass
-from typing import Iterable, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from games_collection.core.ai_strategy import MinimaxStrategy
-from games_collection.games.paper.connect_four.connect_four import ConnectFourMove
+from games_collection.core.architecture.events import EventBus
+from games_collection.games.paper.connect_four.connect_four import ConnectFourGame, ConnectFourMove
 
 
 BoardMatrix = Tuple[Tuple[int, ...], ...]
 
+# Fixed seed so Zobrist keys, and therefore search order, are reproducible.
+_ZOBRIST_SEED = 0xC4
+
 
 @dataclass(frozen=True)
 class ConnectFourPosition:
@@ -46,65 +51,109 @@ class ConnectFourPosition:
         return self._has_winner(1) or self._has_winner(2) or all(self.board[0][column] != 0 for column in range(self.columns))
 
     def score(self, player: int) -> float:
-        return self._line_score(player) - self._line_score(2 if player == 1 else 1)
-
-    def _line_score(self, player: int) -> float:
-        score = 0.0
-        for window in self._windows():
-            marks = window.count(player)
-            empties = window.count(0)
-            if marks and marks + empties == self.connect_length:
-                score += marks ** 2
-        return score
+        return board_score(self.board, player, self.connect_length)
 
     def _has_winner(self, player: int) -> bool:
-        return any(window.count(player) == self.connect_length for window in self._windows())
-
-    def _windows(self) -> Iterable[Sequence[int]]:
-        for row in range(self.rows):
-            for column in range(self.columns - self.connect_length + 1):
-                yield self.board[row][column : column + self.connect_length]
-        for column in range(self.columns):
-            for row in range(self.rows - self.connect_length + 1):
-                yield tuple(self.board[row + offset][column] for offset in range(self.connect_length))
-        for row in range(self.rows - self.connect_length + 1):
-            for column in range(self.columns - self.connect_length + 1):
-                yield tuple(self.board[row + offset][column + offset] for offset in range(self.connect_length))
-        for row in range(self.connect_length - 1, self.rows):
-            for column in range(self.columns - self.connect_length + 1):
-                yield tuple(self.board[row - offset][column + offset] for offset in range(self.connect_length))
-
-
-class ConnectFourMinimaxStrategy(MinimaxStrategy[ConnectFourMove, ConnectFourPosition]):
-    """Depth-limited minimax strategy tuned for Connect Four."""
-
-    def __init__(self, max_depth: int = 4) -> None:
+        return any(window.count(player) == self.connect_length for window in _windows(self.board, self.connect_length))
+
+
+def board_score(board: Sequence[Sequence[int]], player: int, connect_length: int = 4) -> float:
+    """Return the open-line score of ``board`` for ``player`` minus the opponent's."""
+    return _line_score(board, player, connect_length) - _line_score(board, 2 if player == 1 else 1, connect_length)
+
+
+def _line_score(board: Sequence[Sequence[int]], player: int, connect_length: int) -> float:
+    score = 0.0
+    for window in _windows(board, connect_length):
+        marks = window.count(player)
+        empties = window.count(0)
+        if marks and marks + empties == connect_length:
+            score += marks ** 2
+    return score
+
+
+def _windows(board: Sequence[Sequence[int]], connect_length: int) -> Iterable[Sequence[int]]:
+    rows = len(board)
+    columns = len(board[0]) if board else 0
+    for row in range(rows):
+        for column in range(columns - connect_length + 1):
+            yield board[row][column : column + connect_length]
+    for column in range(columns):
+        for row in range(rows - connect_length + 1):
+            yield tuple(board[row + offset][column] for offset in range(connect_length))
+    for row in range(rows - connect_length + 1):
+        for column in range(columns - connect_length + 1):
+            yield tuple(board[row + offset][column + offset] for offset in range(connect_length))
+    for row in range(connect_length - 1, rows):
+        for column in range(columns - connect_length + 1):
+            yield tuple(board[row - offset][column + offset] for offset in range(connect_length))
+
+
+class ConnectFourMinimaxStrategy(MinimaxStrategy[ConnectFourMove, ConnectFourGame]):
+    """Depth-limited minimax strategy tuned for Connect Four.
+
+    The search plays moves in place on one scratch :class:`ConnectFourGame`
+    with ``push_move``/``pop_move`` and keys the transposition table by a
+    Zobrist hash updated with each move, so no node copies the board.
+    """
+
+    def __init__(self, max_depth: int = 4, time_budget: Optional[float] = None) -> None:
         super().__init__(
             max_depth=max_depth,
+            time_budget=time_budget,
             alpha_beta=True,
-            transition_fn=self._transition,
+            transition_fn=self._push,
             move_generator=self._moves,
-            is_terminal_fn=lambda position: position.is_terminal(),
-            state_key_fn=lambda position: (position.board, position.current_player),
+            is_terminal_fn=lambda game: game.is_game_over(),
+            state_key_fn=lambda game: self._keys[-1],
+            undo_fn=self._pop,
         )
         self._root_player = 1
-
-    def _transition(self, position: ConnectFourPosition, move: ConnectFourMove) -> ConnectFourPosition:
-        next_position = position.drop(move.column)
-        if next_position is None:
-            return position
-        return next_position
-
-    def _moves(self, position: ConnectFourPosition) -> Iterable[ConnectFourMove]:
-        return tuple(position.valid_moves())
-
-    def select_move(
+        self._keys: List[int] = [0]
+        # (rows, columns) -> per-cell keys indexed [row][column][player - 1], and the side-to-move key
+        self._zobrist: Dict[Tuple[int, int], Tuple[List[List[Tuple[int, int]]], int]] = {}
+
+    def _zobrist_keys(self, rows: int, columns: int) -> Tuple[List[List[Tuple[int, int]]], int]:
+        keys = self._zobrist.get((rows, columns))
+        if keys is None:
+            rng = random.Random(_ZOBRIST_SEED)
+            cells = [[(rng.getrandbits(64), rng.getrandbits(64)) for _ in range(columns)] for _ in range(rows)]
+            keys = self._zobrist[(rows, columns)] = (cells, rng.getrandbits(64))
+        return keys
+
+    def _push(self, game: ConnectFourGame, move: ConnectFourMove) -> ConnectFourGame:
+        cells, side = self._zobrist_keys(game.rows, game.columns)
+        row = game._find_drop_row(move.column)
+        if row is None:
+            raise ValueError(f"Column {move.column} is full")
+        self._keys.append(self._keys[-1] ^ cells[row][move.column][game.get_current_player() - 1] ^ side)
+        game.push_move(move)
+        return game
+
+    def _pop(self, game: ConnectFourGame) -> None:
+        game.pop_move()
+        self._keys.pop()
+
+    def _moves(self, game: ConnectFourGame) -> Iterable[ConnectFourMove]:
+        return game.get_valid_moves()
+
+    def select_move(  # type: ignore[override]
         self,
         valid_moves: list[ConnectFourMove],
         game_state: ConnectFourPosition,
     ) -> ConnectFourMove:
         self._root_player = game_state.current_player
-        return super().select_move(valid_moves, game_state)
-
-    def _evaluate_state(self, position: ConnectFourPosition) -> float:  # type: ignore[override]
-        return position.score(self._root_player)
+        game = ConnectFourGame(game_state.rows, game_state.columns, game_state.connect_length, event_bus=EventBus())
+        game._board = [list(row) for row in game_state.board]
+        game._current_player = game_state.current_player
+        cells, side = self._zobrist_keys(game_state.rows, game_state.columns)
+        key = side if game_state.current_player == 2 else 0
+        for row, values in enumerate(game_state.board):
+            for column, cell in enumerate(values):
+                if cell:
+                    key ^= cells[row][column][cell - 1]
+        self._keys = [key]
+        return super().select_move(valid_moves, game)
+
+    def _evaluate_state(self, game: ConnectFourGame) -> float:  # type: ignore[override]
+        return board_score(game._board, self._root_player, game.connect_length)
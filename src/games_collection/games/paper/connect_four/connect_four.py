@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from games_collection.core.architecture.events import EventBus, GameEventType
 from games_collection.core.architecture.persistence import SaveLoadManager
@@ -40,6 +40,8 @@ class ConnectFourGame(GameEngine[ConnectFourMove, int]):
         self._current_player = 1
         self._winner: Optional[int] = None
         self._state = GameState.NOT_STARTED
+        # (row, column, player, winner, state) for each pushed move.
+        self._undo_stack: List[Tuple[int, int, int, Optional[int], GameState]] = []
         self.reset()
 
     def reset(self) -> None:
@@ -49,6 +51,7 @@ class ConnectFourGame(GameEngine[ConnectFourMove, int]):
         self._current_player = 1
         self._winner = None
         self._state = GameState.IN_PROGRESS
+        self._undo_stack = []
         self.emit_event(
             GameEventType.GAME_INITIALIZED,
             {
@@ -140,6 +143,34 @@ class ConnectFourGame(GameEngine[ConnectFourMove, int]):
             )
         return True
 
+    def push_move(self, move: ConnectFourMove) -> None:
+        """Drop a token in place for search, without validation or events."""
+
+        column = move.column
+        row = self._find_drop_row(column)
+        if row is None:
+            raise ValueError(f"Column {column} is full")
+        player = self._current_player
+        self._undo_stack.append((row, column, player, self._winner, self._state))
+        self._board[row][column] = player
+        if self._check_winner(row, column):
+            self._winner = player
+            self._state = GameState.FINISHED
+        elif 0 not in self._board[0]:
+            self._state = GameState.FINISHED
+        else:
+            self._current_player = 2 if player == 1 else 1
+
+    def pop_move(self) -> ConnectFourMove:
+        """Undo the most recent :meth:`push_move`."""
+
+        row, column, player, winner, state = self._undo_stack.pop()
+        self._board[row][column] = 0
+        self._current_player = player
+        self._winner = winner
+        self._state = state
+        return ConnectFourMove(column)
+
     def get_winner(self) -> Optional[int]:
         """Return the winner if the game is finished."""
 
@@ -189,6 +220,7 @@ class ConnectFourGame(GameEngine[ConnectFourMove, int]):
         game._winner = None if winner is None else int(winner)
         game_state_value = state.get("state", GameState.IN_PROGRESS.value)
         game._state = GameState(game_state_value)
+        game._undo_stack = []
 
         game.emit_event(
             GameEventType.GAME_INITIALIZED,
@@ -0,0 +1,439 @@
+"""Bitboard Connect Four position and perfect-play solver.
+
+A position is two integers, laid out column by column with one spare bit on
+top of each column (``height + 1`` bits per column):
+
+- ``mask`` has a bit for every occupied cell;
+- ``current`` has a bit for every stone of the player to move.
+
+Dropping a stone is ``mask | (mask + bottom bit of the column)``, and four in a
+row is detected with three shifts and ``&`` per direction, so both cost O(1)
+regardless of the board size. ``current + mask`` identifies a position
+uniquely and doubles as its hash.
+
+:class:`ConnectFourSolver` is a negamax search over these integers with
+alpha-beta, null-window iterative narrowing of the score, a fixed-size
+transposition table indexed by that key, and moves ordered by how many new
+threats they create, centre columns first. It only plays moves that do not hand
+the opponent an immediate win, which prunes most of the tree. Scores follow the
+usual convention: positive when the player to move wins, larger for quicker
+wins (the number of that player's stones still unplayed when the game ends),
+zero for a draw.
+
+:class:`ConnectFourSolverStrategy` wraps the solver as an
+:class:`~games_collection.core.ai_strategy.AIStrategy` over the same
+:class:`~games_collection.games.paper.connect_four.ai_minimax.ConnectFourPosition`
+states as :class:`ConnectFourMinimaxStrategy`, so either can be selected.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Optional, Sequence
+
+from games_collection.core.ai_strategy import AIStrategy
+from games_collection.games.paper.connect_four.ai_minimax import ConnectFourPosition
+from games_collection.games.paper.connect_four.connect_four import ConnectFourMove
+
+# Prime number of transposition table slots, so keys spread evenly.
+DEFAULT_TABLE_SIZE = (1 << 20) + 7
+
+# Score of a win found by the depth-limited threat search; above any threat count.
+_WIN_SCORE = 10_000
+
+
+def _popcount(bits: int) -> int:
+    """Return the number of set bits in ``bits``."""
+    return bin(bits).count("1")
+
+
+class _BudgetExceeded(Exception):
+    """Raised inside the solver when its node budget runs out."""
+
+
+class BitboardPosition:
+    """A Connect Four position packed into two integers.
+
+    Attributes:
+        width: Number of columns.
+        height: Number of rows.
+        current: Stones of the player to move.
+        mask: Every occupied cell.
+        moves: Number of stones played so far.
+    """
+
+    __slots__ = ("width", "height", "current", "mask", "moves")
+
+    def __init__(self, width: int = 7, height: int = 6, current: int = 0, mask: int = 0, moves: int = 0) -> None:
+        """Create a position; the defaults are the empty standard board."""
+        self.width = width
+        self.height = height
+        self.current = current
+        self.mask = mask
+        self.moves = moves
+
+    @classmethod
+    def from_board(cls, board: Sequence[Sequence[int]], current_player: int) -> "BitboardPosition":
+        """Build a position from rows listed top first, as the game engine stores them."""
+        height = len(board)
+        width = len(board[0]) if board else 0
+        position = cls(width, height)
+        for row_index, row in enumerate(board):
+            for column, cell in enumerate(row):
+                if cell:
+                    bit = 1 << (column * (height + 1) + height - 1 - row_index)
+                    position.mask |= bit
+                    position.moves += 1
+                    if cell == current_player:
+                        position.current |= bit
+        return position
+
+    @classmethod
+    def from_moves(cls, columns: Sequence[int], width: int = 7, height: int = 6) -> "BitboardPosition":
+        """Build a position by playing ``columns`` in order from the empty board."""
+        position = cls(width, height)
+        for column in columns:
+            if not position.can_play(column) or position.is_winning_move(column):
+                raise ValueError(f"Column {column} cannot be played in this sequence.")
+            position.play(column)
+        return position
+
+    def copy(self) -> "BitboardPosition":
+        """Return an independent copy of the position."""
+        return BitboardPosition(self.width, self.height, self.current, self.mask, self.moves)
+
+    def key(self) -> int:
+        """Return an integer that uniquely identifies the position."""
+        return self.current + self.mask
+
+    def can_play(self, column: int) -> bool:
+        """Return whether ``column`` has room for another stone."""
+        return 0 <= column < self.width and not self.mask & (1 << (self.height - 1 + column * (self.height + 1)))
+
+    def play(self, column: int) -> None:
+        """Drop a stone for the player to move; the other player moves next."""
+        self.current ^= self.mask
+        self.mask |= self.mask + (1 << column * (self.height + 1))
+        self.moves += 1
+
+    def is_winning_move(self, column: int) -> bool:
+        """Return whether playing ``column`` wins immediately."""
+        stone = (self.mask + (1 << column * (self.height + 1))) & (((1 << self.height) - 1) << column * (self.height + 1))
+        return _is_alignment(self.current | stone, self.height)
+
+    def valid_columns(self) -> List[int]:
+        """Return the playable columns in ascending order."""
+        return [column for column in range(self.width) if self.can_play(column)]
+
+    def is_full(self) -> bool:
+        """Return whether every cell is occupied."""
+        return self.moves == self.width * self.height
+
+    def last_player_won(self) -> bool:
+        """Return whether the player who just moved has four in a row."""
+        return _is_alignment(self.current ^ self.mask, self.height)
+
+
+def _is_alignment(stones: int, height: int) -> bool:
+    """Return whether ``stones`` contain four in a row in any direction."""
+    for shift in (1, height, height + 1, height + 2):
+        pairs = stones & (stones >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+class ConnectFourSolver:
+    """Exact negamax solver for Connect Four positions of any board size.
+
+    The transposition table is kept across calls, so solving successive
+    positions of one game reuses earlier work.
+
+    Example:
+        >>> solver = ConnectFourSolver()
+        >>> solver.solve(BitboardPosition.from_moves([3, 3, 3, 3, 2, 2, 4]))
+        -17
+    """
+
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE) -> None:
+        """Create a solver with ``table_size`` transposition table slots."""
+        self.table_size = table_size
+        self._keys: List[int] = []
+        self._values: List[int] = []
+        self._geometry: Optional[tuple[int, int]] = None
+        self.nodes = 0
+        self._node_limit: Optional[int] = None
+
+    def reset(self) -> None:
+        """Forget every transposition table entry."""
+        self._keys = [-1] * self.table_size
+        self._values = [0] * self.table_size
+
+    def _prepare(self, position: BitboardPosition) -> None:
+        """Precompute masks for the board size, resetting the table when it changes."""
+        geometry = (position.width, position.height)
+        if geometry == self._geometry:
+            return
+        self._geometry = geometry
+        width, height = geometry
+        stride = height + 1
+        self._width = width
+        self._height = height
+        self._cells = width * height
+        self._bottom = sum(1 << column * stride for column in range(width))
+        self._board = self._bottom * ((1 << height) - 1)
+        self._columns = [((1 << height) - 1) << column * stride for column in range(width)]
+        # Centre columns first: they take part in the most alignments.
+        self._order = sorted(range(width), key=lambda column: (abs(2 * column - (width - 1)), column))
+        self.reset()
+
+    def solve(self, position: BitboardPosition, *, weak: bool = False, node_limit: Optional[int] = None) -> int:
+        """Return the exact score of ``position`` for the player to move.
+
+        Args:
+            position: A position where the game is not already over.
+            weak: Only determine win (1), draw (0) or loss (-1).
+            node_limit: Optional maximum number of nodes to visit across this
+                call before raising :class:`RuntimeError`.
+
+        Raises:
+            RuntimeError: If ``node_limit`` is reached before the position is
+                solved.
+        """
+        self._prepare(position)
+        self.nodes = 0
+        self._node_limit = node_limit
+        try:
+            return self._solve(position.current, position.mask, position.moves, weak)
+        except _BudgetExceeded:
+            raise RuntimeError("Connect Four solver node limit reached") from None
+        finally:
+            self._node_limit = None
+
+    def analyze(self, position: BitboardPosition, *, node_limit: Optional[int] = None) -> Dict[int, int]:
+        """Return the exact score of playing each legal column, for the player to move.
+
+        Raises:
+            RuntimeError: If ``node_limit`` is reached before every move is solved.
+        """
+        self._prepare(position)
+        self.nodes = 0
+        self._node_limit = node_limit
+        scores: Dict[int, int] = {}
+        try:
+            for column in position.valid_columns():
+                if position.is_winning_move(column):
+                    scores[column] = (self._cells + 1 - position.moves) // 2
+                    continue
+                child = position.copy()
+                child.play(column)
+                scores[column] = 0 if child.is_full() else -self._solve(child.current, child.mask, child.moves, False)
+        except _BudgetExceeded:
+            raise RuntimeError("Connect Four solver node limit reached") from None
+        finally:
+            self._node_limit = None
+        return scores
+
+    def _solve(self, current: int, mask: int, moves: int, weak: bool) -> int:
+        """Narrow the score with null-window searches until it is exact."""
+        if self._winning_cells(current, mask) & self._possible(mask):
+            return 1 if weak else (self._cells + 1 - moves) // 2
+        low = -((self._cells - moves) // 2)
+        high = (self._cells + 1 - moves) // 2
+        if weak:
+            low, high = -1, 1
+        while low < high:
+            middle = low + (high - low) // 2
+            if middle <= 0 and int(low / 2) < middle:
+                middle = int(low / 2)
+            elif middle >= 0 and int(high / 2) > middle:
+                middle = int(high / 2)
+            result = self._negamax(current, mask, moves, middle, middle + 1)
+            if result <= middle:
+                high = result
+            else:
+                low = result
+        if weak:
+            # Fail-soft bounds can overshoot the narrowed window; keep only the sign.
+            return (low > 0) - (low < 0)
+        return low
+
+    def _possible(self, mask: int) -> int:
+        """Return the cell each non-full column would receive next."""
+        return (mask + self._bottom) & self._board
+
+    def _winning_cells(self, stones: int, mask: int) -> int:
+        """Return the empty cells that would complete four in a row for ``stones``."""
+        height = self._height
+        # Vertical: three stacked stones and the cell above them.
+        cells = (stones << 1) & (stones << 2) & (stones << 3)
+        for shift in (height + 1, height, height + 2):
+            # Horizontal and the two diagonals, filling either end or a gap.
+            pairs = (stones << shift) & (stones << 2 * shift)
+            cells |= pairs & (stones << 3 * shift)
+            cells |= pairs & (stones >> shift)
+            pairs = (stones >> shift) & (stones >> 2 * shift)
+            cells |= pairs & (stones << shift)
+            cells |= pairs & (stones >> 3 * shift)
+        return cells & (self._board ^ mask)
+
+    def _negamax(self, current: int, mask: int, moves: int, alpha: int, beta: int) -> int:
+        """Alpha-beta search assuming the player to move cannot win immediately."""
+        self.nodes += 1
+        if self._node_limit is not None and self.nodes > self._node_limit:
+            raise _BudgetExceeded
+
+        possible = self._possible(mask)
+        opponent_wins = self._winning_cells(current ^ mask, mask)
+        forced = possible & opponent_wins
+        if forced:
+            if forced & (forced - 1):
+                # Two threats to block at once: the opponent wins next move.
+                return -((self._cells - moves) // 2)
+            possible = forced
+        # Never play directly below an opponent's winning cell.
+        candidates = possible & ~(opponent_wins >> 1)
+        if not candidates:
+            return -((self._cells - moves) // 2)
+        if moves >= self._cells - 2:
+            return 0
+
+        lowest = -((self._cells - 2 - moves) // 2)
+        if alpha < lowest:
+            alpha = lowest
+            if alpha >= beta:
+                return alpha
+        highest = (self._cells - 1 - moves) // 2
+        key = current + mask
+        slot = key % self.table_size
+        if self._keys[slot] == key:
+            highest = self._values[slot] - self._cells
+        if beta > highest:
+            beta = highest
+            if alpha >= beta:
+                return beta
+
+        ordered = []
+        for column in self._order:
+            move = candidates & self._columns[column]
+            if move:
+                ordered.append((_popcount(self._winning_cells(current | move, mask)), move))
+        # The stable sort keeps centre-first order among equally threatening moves.
+        ordered.sort(key=lambda item: -item[0])
+
+        for _, move in ordered:
+            score = -self._negamax(current ^ mask, mask | move, moves + 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        # Every move failed low, so alpha is an upper bound; offset it to stay positive.
+        self._keys[slot] = key
+        self._values[slot] = alpha + self._cells
+        return alpha
+
+    def threat_scores(self, position: BitboardPosition, depth: int) -> Dict[int, float]:
+        """Score each legal column with a depth-limited search that counts open threats.
+
+        This is a cheap stand-in for :meth:`analyze` when a position is too far
+        from the end to solve: wins found within ``depth`` moves dominate, and
+        other leaves score the difference in cells each player could complete.
+        """
+        self._prepare(position)
+        scores: Dict[int, float] = {}
+        for column in position.valid_columns():
+            if position.is_winning_move(column):
+                scores[column] = _WIN_SCORE
+                continue
+            child = position.copy()
+            child.play(column)
+            scores[column] = -self._threat_negamax(child.current, child.mask, child.moves, depth - 1, -_WIN_SCORE, _WIN_SCORE)
+        return scores
+
+    def _threat_negamax(self, current: int, mask: int, moves: int, depth: int, alpha: float, beta: float) -> float:
+        """Depth-limited negamax scoring leaves by the difference in open threats."""
+        possible = self._possible(mask)
+        if self._winning_cells(current, mask) & possible:
+            return _WIN_SCORE - moves
+        if moves >= self._cells:
+            return 0
+        if depth <= 0:
+            return _popcount(self._winning_cells(current, mask)) - _popcount(self._winning_cells(current ^ mask, mask))
+        for column in self._order:
+            move = possible & self._columns[column]
+            if not move:
+                continue
+            score = -self._threat_negamax(current ^ mask, mask | move, moves + 1, depth - 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+
+class ConnectFourSolverStrategy(AIStrategy[ConnectFourMove, ConnectFourPosition]):
+    """Perfect-play Connect Four strategy backed by :class:`ConnectFourSolver`.
+
+    Positions are solved exactly when the solver finishes within
+    ``node_limit`` nodes; earlier in the game it falls back to a depth-limited
+    bitboard search that scores threats. With ``node_limit=None`` every move
+    is solved exactly, however long that takes.
+    """
+
+    def __init__(
+        self,
+        *,
+        node_limit: Optional[int] = 50_000,
+        fallback_depth: int = 7,
+        table_size: int = DEFAULT_TABLE_SIZE,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            node_limit: Maximum solver nodes per move before falling back, or
+                        ``None`` for perfect play at any cost.
+            fallback_depth: Depth of the threat-scoring fallback search.
+            table_size: Transposition table slots for the solver.
+            rng: An optional random number generator for tie-breaking.
+        """
+        super().__init__(rng)
+        self.node_limit = node_limit
+        self.fallback_depth = fallback_depth
+        self.solver = ConnectFourSolver(table_size)
+        self.last_solved = False
+
+    def select_move(
+        self,
+        valid_moves: List[ConnectFourMove],
+        game_state: ConnectFourPosition,
+    ) -> ConnectFourMove:
+        """Select the best move, exactly when the position can be solved in budget.
+
+        Raises:
+            ValueError: If `valid_moves` is empty or the board is not
+                        connect-four.
+        """
+        if not valid_moves:
+            raise ValueError("No valid moves available")
+        if game_state.connect_length != 4:
+            raise ValueError("ConnectFourSolverStrategy only supports four in a row")
+
+        position = BitboardPosition.from_board(game_state.board, game_state.current_player)
+        with self.profile_move("ConnectFourSolverStrategy.select_move"):
+            try:
+                scores = self.solver.analyze(position, node_limit=self.node_limit)
+                self.last_solved = True
+            except RuntimeError:
+                scores = self.solver.threat_scores(position, self.fallback_depth)
+                self.last_solved = False
+        candidates = [move for move in valid_moves if move.column in scores]
+        if not candidates:
+            return self.rng.choice(valid_moves)
+        best_score = max(scores[move.column] for move in candidates)
+        best_moves = [move for move in candidates if scores[move.column] == best_score]
+        return self.rng.choice(best_moves)
+
+
+__all__ = ["BitboardPosition", "ConnectFourSolver", "ConnectFourSolverStrategy", "DEFAULT_TABLE_SIZE"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
-from .mancala import MancalaAI, MancalaGame, MancalaMove
+from .endgame import EndgameTable
+from .mancala import MANCALA_DIFFICULTIES, MancalaAI, MancalaGame, MancalaMove
+from .search import MancalaSearch
 
-__all__ = ["MancalaGame", "MancalaAI", "MancalaMove"]
+__all__ = ["MancalaGame", "MancalaAI", "MancalaMove", "MancalaSearch", "EndgameTable", "MANCALA_DIFFICULTIES"]
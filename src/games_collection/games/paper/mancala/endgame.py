@@ -0,0 +1,247 @@
+"""Retrograde-analysis endgame database for Kalah.
+
+Once stones have gone into the stores they never come out, so what the rest
+of a game is worth depends only on the stones still in the pits. The database
+stores, for every arrangement of at most :data:`MAX_STONES` stones over the
+twelve pits, the best net number of stones the player to move can still bank
+over their opponent with perfect play.
+
+Positions are seen from the player to move: pits 0–5 are their own, 6–11 the
+opponent's, each counted from the player's left. An arrangement is packed into
+a dense index by ranking its pit counts (with a thirteenth "slack" count making
+the total up to :data:`MAX_STONES`) in the combinatorial number system.
+
+Stones only move forward around the board and any stone crossing to the other
+side drops one into the mover's store, so no arrangement can repeat: a move
+either empties stones into the stores or leaves the same number of stones
+further along. :func:`generate_table` therefore works backwards, from the
+fewest stones up and, within one stone count, from the stones furthest along
+back to the start, so every position it scores has all its successors
+scored already.
+
+The table ships as ``resources/endgame.bin``:
+
+- an 8-byte header: the ``b"KLAH"`` magic, a ``uint16`` format version and a
+  ``uint16`` holding the largest stone count covered;
+- followed by one signed byte per arrangement, in rank order.
+
+:class:`EndgameTable` memory-maps the file, so loading is free and every
+lookup is a rank computation and a single byte read.
+
+Regenerate the resource with::
+
+    python -m games_collection.games.paper.mancala.endgame --stones 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+from games_collection.core.combinatorics import CountRanking
+
+PITS = 6
+MAX_STONES = 10
+
+_MAGIC = b"KLAH"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+
+RESOURCE_PATH = Path(__file__).resolve().parent / "resources" / "endgame.bin"
+
+# Pit counts seen from the player to move: their six pits, then the opponent's.
+Pits = Tuple[int, ...]
+
+# Net gains are stored as signed bytes, so no table covers more than 127 stones.
+_RANKING = CountRanking(2 * PITS, 127)
+
+
+def table_size(max_stones: int) -> int:
+    """Return the number of arrangements of at most ``max_stones`` stones."""
+    return _RANKING.count(max_stones)
+
+
+def rank(pits: Sequence[int], max_stones: int) -> int:
+    """Return the dense index of ``pits`` among arrangements of at most ``max_stones`` stones."""
+    return _RANKING.rank(pits, max_stones)
+
+
+def sow(pits: Pits, pit: int) -> Tuple[int, Optional[Pits], bool]:
+    """Play ``pit`` for the player to move.
+
+    Returns:
+        ``(gain, child, again)``: the stones the move banks for the mover
+        minus those it hands the opponent, the pits afterwards (``None`` when
+        the game is over, the final sweep being included in ``gain``), and
+        whether the mover moves again. A child after an ordinary move is
+        turned round to face the opponent; after an extra turn it is not.
+    """
+    # One lap of the mover's pits, their store at 6 and the opponent's pits.
+    ring = list(pits[:PITS])
+    ring.append(0)
+    ring.extend(pits[PITS:])
+    stones = ring[pit]
+    ring[pit] = 0
+    laps, rest = divmod(stones, 2 * PITS + 1)
+    if laps:
+        ring = [count + laps for count in ring]
+    for index in range(pit + 1, pit + 1 + rest):
+        ring[index % (2 * PITS + 1)] += 1
+    last = (pit + stones) % (2 * PITS + 1)
+    gain = ring[PITS]
+    if last < PITS and ring[last] == 1 and ring[2 * PITS - last]:
+        gain += ring[2 * PITS - last] + 1
+        ring[last] = 0
+        ring[2 * PITS - last] = 0
+    own = ring[:PITS]
+    other = ring[PITS + 1 :]
+    if not any(own) or not any(other):
+        return gain + sum(own) - sum(other), None, False
+    if last == PITS:
+        return gain, tuple(own + other), True
+    return gain, tuple(other + own), False
+
+
+def generate_table(max_stones: int = MAX_STONES) -> array:
+    """Score every arrangement of at most ``max_stones`` stones by retrograde analysis.
+
+    Returns:
+        A signed-byte array of net gains for the player to move, indexed by
+        :func:`rank`.
+    """
+    if not 0 <= max_stones <= _RANKING.limit:
+        raise ValueError(f"max_stones must be between 0 and 127, not {max_stones}")
+    values = array("b", bytes(table_size(max_stones)))
+    for total in range(1, max_stones + 1):
+        layer = list(_arrangements(total, 2 * PITS))
+        # A move keeping every stone on the board pushes stones further along,
+        # so scoring the most advanced arrangements first scores successors first.
+        layer.sort(key=lambda pits: -sum(index * (pits[index] + pits[PITS + index]) for index in range(PITS)))
+        for pits in layer:
+            own = sum(pits[:PITS])
+            if not own or own == total:
+                values[rank(pits, max_stones)] = 2 * own - total
+                continue
+            best = -total
+            for pit in range(PITS):
+                if not pits[pit]:
+                    continue
+                gain, child, again = sow(pits, pit)
+                if child is not None:
+                    value = values[rank(child, max_stones)]
+                    gain = gain + value if again else gain - value
+                if gain > best:
+                    best = gain
+            values[rank(pits, max_stones)] = best
+    return values
+
+
+def _arrangements(total: int, slots: int):
+    """Yield every way to place ``total`` stones in ``slots`` pits."""
+    if slots == 1:
+        yield (total,)
+        return
+    for count in range(total, -1, -1):
+        for rest in _arrangements(total - count, slots - 1):
+            yield (count,) + rest
+
+
+def write_table(values: array, max_stones: int, path: Path = RESOURCE_PATH) -> None:
+    """Serialise a table from :func:`generate_table` to ``path``."""
+    if len(values) != table_size(max_stones):
+        raise ValueError(f"expected {table_size(max_stones)} values for {max_stones} stones, got {len(values)}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_HEADER.pack(_MAGIC, _VERSION, max_stones) + values.tobytes())
+
+
+class EndgameTable:
+    """Read-only, memory-mapped view over an endgame database file."""
+
+    def __init__(self, path: Path = RESOURCE_PATH) -> None:
+        """Map ``path`` into memory and validate its header.
+
+        Raises:
+            ValueError: If the file is not a Kalah endgame database.
+        """
+        with open(path, "rb") as handle:
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_stones = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION or max_stones > _RANKING.limit:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a version {_VERSION} Kalah endgame database")
+        if len(self._buffer) != _HEADER.size + table_size(max_stones):
+            self._buffer.close()
+            raise ValueError(f"{path} is truncated")
+        self.max_stones = max_stones
+        self._values = memoryview(self._buffer)[_HEADER.size :].cast("b")
+
+    def value(self, pits: Pits) -> Optional[int]:
+        """Return the net gain for the player to move, or ``None`` if ``pits`` hold too many stones."""
+        if sum(pits) > self.max_stones:
+            return None
+        return self._values[rank(pits, self.max_stones)]
+
+    def best_pit(self, pits: Pits) -> Optional[int]:
+        """Return the pit (0–5) that achieves :meth:`value`, or ``None`` outside the table."""
+        if sum(pits) > self.max_stones:
+            return None
+        best_pit = None
+        best = None
+        for pit in range(PITS):
+            if not pits[pit]:
+                continue
+            gain, child, again = sow(pits, pit)
+            if child is not None:
+                value = self._values[rank(child, self.max_stones)]
+                gain = gain + value if again else gain - value
+            if best is None or gain > best:
+                best_pit, best = pit, gain
+        return best_pit
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._values.release()
+        self._buffer.close()
+
+
+@lru_cache(maxsize=1)
+def load_endgame_table() -> Optional[EndgameTable]:
+    """Return the shared database bundled with the package, or ``None`` if missing."""
+    try:
+        return EndgameTable()
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover - offline tool
+    """Regenerate the bundled endgame database."""
+    parser = argparse.ArgumentParser(description="Generate the Kalah endgame database resource.")
+    parser.add_argument("--stones", type=int, default=MAX_STONES, help="Largest number of stones left in the pits.")
+    parser.add_argument("--output", type=Path, default=RESOURCE_PATH)
+    args = parser.parse_args(argv)
+
+    values = generate_table(args.stones)
+    write_table(values, args.stones, args.output)
+    print(f"Wrote {len(values)} positions with up to {args.stones} stones to {args.output}")
+
+
+__all__ = [
+    "MAX_STONES",
+    "PITS",
+    "EndgameTable",
+    "generate_table",
+    "load_endgame_table",
+    "rank",
+    "sow",
+    "table_size",
+    "write_table",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    main()
@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from games_collection.core.ai_strategy import check_backend, difficulty_preset
 from games_collection.core.game_engine import GameEngine, GameState
 
+from .endgame import Pits, load_endgame_table
+from .search import MancalaSearch
+
+# (move, stones sown, last pit sown, stones captured from the opposite pit or -1,
+# board before the end-of-game sweep or None, player, winner, state) for a pushed move.
+UndoRecord = Tuple["MancalaMove", int, int, int, Optional[Tuple[int, ...]], int, Optional[int], GameState]
+
 
 @dataclass(frozen=True)
 class MancalaMove:
@@ -27,6 +35,7 @@ class MancalaGame(GameEngine[MancalaMove, int]):
         self._current_player = 0
         self._winner: Optional[int] = None
         self._state = GameState.NOT_STARTED
+        self._undo_stack: List[UndoRecord] = []
         self.reset()
 
     def reset(self) -> None:
@@ -39,6 +48,7 @@ class MancalaGame(GameEngine[MancalaMove, int]):
         self._current_player = 0
         self._winner = None
         self._state = GameState.IN_PROGRESS
+        self._undo_stack = []
 
     def is_game_over(self) -> bool:
         return self._state == GameState.FINISHED
@@ -74,6 +84,51 @@ class MancalaGame(GameEngine[MancalaMove, int]):
     def get_state_representation(self) -> Sequence[int]:
         return tuple(self._board)
 
+    def push_move(self, move: MancalaMove) -> None:
+        """Sow a pit in place for search, recording enough to reverse it."""
+
+        board = self._board
+        player = self._current_player
+        pit_index = move.pit_index
+        stones = board[pit_index]
+        last_index = self._sow_stones(board, player, pit_index)
+        captured = self._capture_if_applicable(board, player, last_index)
+        swept = tuple(board) if self._side_empty(board, 0) or self._side_empty(board, 1) else None
+        finished, winner = self._check_game_end(board)
+        self._undo_stack.append((move, stones, last_index, captured, swept, player, self._winner, self._state))
+        if finished:
+            self._winner = winner
+            self._state = GameState.FINISHED
+        elif last_index != self._store_index(player):
+            self._current_player = self._opponent(player)
+
+    def pop_move(self) -> MancalaMove:
+        """Undo the most recent :meth:`push_move`."""
+
+        move, stones, last_index, captured, swept, player, winner, state = self._undo_stack.pop()
+        board = self._board
+        if swept is not None:
+            board[:] = swept
+        if captured >= 0:
+            board[self._store_index(player)] -= captured + 1
+            board[self._opposite_pit(last_index)] = captured
+            board[last_index] = 1
+        # Walk the sowing path again, taking back one stone per pit.
+        index = move.pit_index
+        skipped_store = self._store_index(self._opponent(player))
+        remaining = stones
+        while remaining > 0:
+            index = (index + 1) % len(board)
+            if index == skipped_store:
+                continue
+            board[index] -= 1
+            remaining -= 1
+        board[move.pit_index] = stones
+        self._current_player = player
+        self._winner = winner
+        self._state = state
+        return move
+
     def simulate_move(self, move: MancalaMove) -> Tuple[List[int], int, bool, Optional[int]]:
         board_copy = list(self._board)
         next_player, finished, winner = self._apply_move(board_copy, self._current_player, move.pit_index)
@@ -101,24 +156,31 @@ class MancalaGame(GameEngine[MancalaMove, int]):
             stones -= 1
         return index
 
-    def _capture_if_applicable(self, board: List[int], player: int, last_index: int) -> None:
+    def _capture_if_applicable(self, board: List[int], player: int, last_index: int) -> int:
+        """Capture into the store if the last stone landed alone on the mover's side.
+
+        Returns the number of stones taken from the opposite pit, or -1 when
+        nothing was captured.
+        """
         if last_index == self._store_index(player):
-            return
+            return -1
         if last_index not in self._player_pits(player):
-            return
+            return -1
         if board[last_index] != 1:
-            return
+            return -1
         opposite_index = self._opposite_pit(last_index)
-        if board[opposite_index] == 0:
-            return
+        captured = board[opposite_index]
+        if captured == 0:
+            return -1
         store_index = self._store_index(player)
-        board[store_index] += board[opposite_index] + 1
+        board[store_index] += captured + 1
         board[last_index] = 0
         board[opposite_index] = 0
+        return captured
 
     def _check_game_end(self, board: List[int]) -> Tuple[bool, Optional[int]]:
-        player_zero_empty = all(board[index] == 0 for index in self._player_pits(0))
-        player_one_empty = all(board[index] == 0 for index in self._player_pits(1))
+        player_zero_empty = self._side_empty(board, 0)
+        player_one_empty = self._side_empty(board, 1)
         if not (player_zero_empty or player_one_empty):
             return False, None
         if not player_zero_empty:
@@ -133,6 +195,9 @@ class MancalaGame(GameEngine[MancalaMove, int]):
             return True, 1
         return True, None
 
+    def _side_empty(self, board: List[int], player: int) -> bool:
+        return not any(board[index] for index in self._player_pits(player))
+
     def _collect_remaining(self, board: List[int], player: int) -> None:
         pits = self._player_pits(player)
         captured = sum(board[index] for index in pits)
@@ -157,77 +222,112 @@ class MancalaGame(GameEngine[MancalaMove, int]):
         return 1 - player
 
 
-class MancalaAI:
-    """Heuristic minimax AI for Mancala."""
+# Search settings for each named difficulty; see :meth:`MancalaAI.for_difficulty`.
+MANCALA_DIFFICULTIES: Dict[str, Dict[str, Any]] = {
+    "easy": {"depth": 2, "endgame": False},
+    "medium": {"depth": 4, "endgame": False},
+    "hard": {"depth": 8},
+    "expert": {"depth": 64, "time_budget": 2.0},
+}
+
 
-    def __init__(self, depth: int = 6) -> None:
+class MancalaAI:
+    """Minimax AI for Mancala.
+
+    The default ``"search"`` backend runs :class:`~.search.MancalaSearch`:
+    iterative deepening alpha-beta to ``depth`` plies over pit-count tuples
+    with a transposition table, capped at ``time_budget`` seconds. With
+    ``endgame`` it answers positions with few stones left from the bundled
+    retrograde database (:mod:`.endgame`), where its play is perfect. The
+    ``"minimax"`` backend is the original heuristic search in place on the
+    engine with push/pop.
+    """
+
+    def __init__(
+        self,
+        depth: int = 6,
+        *,
+        backend: str = "search",
+        time_budget: Optional[float] = None,
+        endgame: bool = True,
+    ) -> None:
+        check_backend(backend, ("search", "minimax"), "Mancala")
         self.depth = depth
+        self.backend = backend
+        self.time_budget = time_budget
+        self._search = MancalaSearch(load_endgame_table() if endgame else None)
+
+    @classmethod
+    def for_difficulty(cls, difficulty: str) -> "MancalaAI":
+        """Build an AI from a :data:`MANCALA_DIFFICULTIES` entry; the easier ones skip the endgame database."""
+        return cls(**difficulty_preset(MANCALA_DIFFICULTIES, difficulty, "Mancala"))
 
     def choose_move(self, game: MancalaGame) -> MancalaMove:
         moves = game.get_valid_moves()
         if not moves:
             raise ValueError("No valid Mancala moves available")
+        if self.backend == "search":
+            player = game.get_current_player()
+            pit = self._search.best_pit(self._pits(game, player), self.depth, time_budget=self.time_budget)
+            if pit is not None:
+                return MancalaMove(pit if player == 0 else pit + game.pits_per_side + 1)
+        maximizing_player = game.get_current_player()
         best_move = moves[0]
         best_score = float("-inf")
         for move in moves:
-            board_copy, next_player, finished, winner = game.simulate_move(move)
-            score = self._minimax(board_copy, next_player, game.get_current_player(), self.depth - 1, -float("inf"), float("inf"), finished, winner)
+            score = self._search_child(game, move, maximizing_player, self.depth - 1, -float("inf"), float("inf"))
             if score > best_score:
                 best_score = score
                 best_move = move
         return best_move
 
-    def _minimax(
-        self,
-        board: List[int],
-        current_player: int,
-        maximizing_player: int,
-        depth: int,
-        alpha: float,
-        beta: float,
-        finished: bool,
-        winner: Optional[int],
-    ) -> float:
-        if finished:
+    @staticmethod
+    def _pits(game: MancalaGame, player: int) -> Pits:
+        """Return the pit counts seen from ``player``: their pits, then the opponent's."""
+        board = game._board
+        own = [board[index] for index in game._player_pits(player)]
+        other = [board[index] for index in game._player_pits(1 - player)]
+        return tuple(own + other)
+
+    def _search_child(self, game: MancalaGame, move: MancalaMove, maximizing_player: int, depth: int, alpha: float, beta: float) -> float:
+        game.push_move(move)
+        try:
+            return self._minimax(game, maximizing_player, depth, alpha, beta)
+        finally:
+            game.pop_move()
+
+    def _minimax(self, game: MancalaGame, maximizing_player: int, depth: int, alpha: float, beta: float) -> float:
+        if game.is_game_over():
+            winner = game.get_winner()
             if winner is None:
                 return 0.0
             return 1000.0 if winner == maximizing_player else -1000.0
         if depth == 0:
-            return self._evaluate(board, maximizing_player)
-        helper = MancalaGame()
-        helper._board = list(board)
-        helper._current_player = current_player
-        moves = helper.get_valid_moves()
+            return self._evaluate(game, maximizing_player)
+        moves = game.get_valid_moves()
         if not moves:
-            return self._evaluate(board, maximizing_player)
-        if current_player == maximizing_player:
+            return self._evaluate(game, maximizing_player)
+        if game.get_current_player() == maximizing_player:
             value = float("-inf")
             for move in moves:
-                next_board, next_player, finished_state, winner_state = helper.simulate_move(move)
-                value = max(
-                    value,
-                    self._minimax(next_board, next_player, maximizing_player, depth - 1, alpha, beta, finished_state, winner_state),
-                )
+                value = max(value, self._search_child(game, move, maximizing_player, depth - 1, alpha, beta))
                 alpha = max(alpha, value)
                 if beta <= alpha:
                     break
             return value
         value = float("inf")
         for move in moves:
-            next_board, next_player, finished_state, winner_state = helper.simulate_move(move)
-            value = min(
-                value,
-                self._minimax(next_board, next_player, maximizing_player, depth - 1, alpha, beta, finished_state, winner_state),
-            )
+            value = min(value, self._search_child(game, move, maximizing_player, depth - 1, alpha, beta))
             beta = min(beta, value)
             if beta <= alpha:
                 break
         return value
 
-    def _evaluate(self, board: List[int], player: int) -> float:
+    def _evaluate(self, game: MancalaGame, player: int) -> float:
+        board = game._board
         opponent = 1 - player
-        store_diff = board[MancalaGame()._store_index(player)] - board[MancalaGame()._store_index(opponent)]
-        pit_diff = sum(board[index] for index in MancalaGame()._player_pits(player)) - sum(board[index] for index in MancalaGame()._player_pits(opponent))
+        store_diff = board[game._store_index(player)] - board[game._store_index(opponent)]
+        pit_diff = sum(board[index] for index in game._player_pits(player)) - sum(board[index] for index in game._player_pits(opponent))
         return store_diff * 3 + pit_diff
 
 
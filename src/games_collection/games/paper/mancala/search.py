@@ -0,0 +1,161 @@
+"""Transposition-table alpha-beta search for Kalah midgames.
+
+The search scores positions the way the endgame database does: as the net
+number of stones the player to move can still bank, which depends only on the
+pits. Positions are tuples of pit counts seen from the player to move (see
+:mod:`.endgame`), so the transposition table is keyed by the tuple alone and
+a position reached with different store totals is searched once.
+
+Positions with few enough stones are answered exactly from the endgame
+database. Elsewhere the search stops at its depth limit and guesses the
+remaining gain from the stones on each side. Results that never relied on a
+guess are stored as solved and reused at any depth, and once an iteration
+finishes without guessing the root is solved and deepening stops.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .endgame import PITS, EndgameTable, Pits, sow
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+# The depth recorded for table entries that are proven rather than estimated.
+_SOLVED = 1 << 30
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the wall-clock budget is exhausted."""
+
+
+class MancalaSearch:
+    """Iterative deepening alpha-beta search over pit-count tuples.
+
+    The transposition table is kept across calls until it grows past
+    ``table_size`` entries, when it is cleared.
+    """
+
+    def __init__(self, endgame: Optional[EndgameTable] = None, table_size: int = 500_000) -> None:
+        """Create a search backed by an optional ``endgame`` database."""
+        self.endgame = endgame
+        self.table_size = table_size
+        # pits -> (depth, value, flag, best pit)
+        self._table: Dict[Pits, Tuple[int, float, int, int]] = {}
+        self._deadline: Optional[float] = None
+        self._estimates = 0
+        self.nodes = 0
+        self.last_depth = 0
+        self.solved = False
+
+    def best_pit(self, pits: Pits, depth: int, *, time_budget: Optional[float] = None) -> Optional[int]:
+        """Return the pit (0–5) to play for the player to move, or ``None`` without a move.
+
+        The search deepens from one ply to ``depth`` and, when ``time_budget``
+        is set, returns the best pit of the deepest iteration finished in
+        time; the first iteration always completes. Positions inside the
+        endgame database are answered from it directly.
+        """
+        if not any(pits[:PITS]):
+            return None
+        self.nodes = 0
+        if self.endgame is not None and sum(pits) <= self.endgame.max_stones:
+            self.last_depth = 0
+            self.solved = True
+            return self.endgame.best_pit(pits)
+        if len(self._table) > self.table_size:
+            self._table.clear()
+        start = time.perf_counter()
+        best = next(pit for pit in range(PITS) if pits[pit])
+        total = sum(pits)
+        self.solved = False
+        for iteration in range(1, max(depth, 1) + 1):
+            self._deadline = start + time_budget if time_budget is not None and iteration > 1 else None
+            self._estimates = 0
+            try:
+                self._negamax(pits, iteration, -total - 1, total + 1)
+            except _SearchTimeout:
+                break
+            best = self._table[pits][3]
+            self.last_depth = iteration
+            if not self._estimates:
+                self.solved = True
+                break
+        self._deadline = None
+        return best
+
+    def _negamax(self, pits: Pits, depth: int, alpha: float, beta: float) -> float:
+        """Depth-limited alpha-beta from the point of view of the player to move."""
+        self.nodes += 1
+        if self._deadline is not None and not self.nodes & 255 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        endgame = self.endgame
+        if endgame is not None:
+            value = endgame.value(pits)
+            if value is not None:
+                return value
+
+        entry = self._table.get(pits)
+        table_pit = -1
+        if entry is not None:
+            entry_depth, value, flag, table_pit = entry
+            if entry_depth >= depth:
+                if entry_depth < _SOLVED:
+                    self._estimates += 1
+                if flag == _EXACT:
+                    return value
+                if flag == _LOWER and value >= beta:
+                    return value
+                if flag == _UPPER and value <= alpha:
+                    return value
+
+        if depth <= 0:
+            self._estimates += 1
+            # Stones still in the pits often change sides before they are
+            # banked, so they count for much less than stones in a store.
+            return (sum(pits[:PITS]) - sum(pits[PITS:])) / 4
+
+        estimates = self._estimates
+        original_alpha = alpha
+        best = None
+        best_pit = -1
+        for pit in self._ordered_pits(pits, table_pit):
+            gain, child, again = sow(pits, pit)
+            if child is None:
+                value = gain
+            elif again:
+                value = gain + self._negamax(child, depth - 1, alpha - gain, beta - gain)
+            else:
+                value = gain - self._negamax(child, depth - 1, gain - beta, gain - alpha)
+            if best is None or value > best:
+                best, best_pit = value, pit
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        if best <= original_alpha:
+            flag = _UPPER
+        elif best >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._table[pits] = (_SOLVED if self._estimates == estimates else depth, best, flag, best_pit)
+        return best
+
+    @staticmethod
+    def _ordered_pits(pits: Pits, first: int) -> List[int]:
+        """Return the playable pits: ``first``, then extra turns, then the rest from the right."""
+        ordered = [first] if first >= 0 else []
+        for pit in range(PITS - 1, -1, -1):
+            if pits[pit] == PITS - pit and pit != first:
+                ordered.append(pit)
+        for pit in range(PITS - 1, -1, -1):
+            if pits[pit] and pits[pit] != PITS - pit and pit != first:
+                ordered.append(pit)
+        return ordered
+
+
+__all__ = ["MancalaSearch"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
-from .othello import OthelloAI, OthelloGame, OthelloMove
+from .bitboard import OthelloSearch
+from .othello import OTHELLO_DIFFICULTIES, OthelloAI, OthelloGame, OthelloMove
 
-__all__ = ["OthelloGame", "OthelloAI", "OthelloMove"]
+__all__ = ["OthelloGame", "OthelloAI", "OthelloMove", "OthelloSearch", "OTHELLO_DIFFICULTIES"]
@@ -0,0 +1,460 @@
+"""Bitboard Othello core: move generation, evaluation and search.
+
+A position is two 64-bit integers, the discs of the player to move and the
+discs of the opponent, with square ``row * 8 + column`` stored in bit
+``row * 8 + column``. Legal moves and flipped discs are found for all eight
+directions at once with shifts and masks, so no square is visited one by one.
+
+:class:`OthelloSearch` searches these integers:
+
+- before the endgame, an iterative deepening negamax with alpha-beta, a
+  transposition table and corner-first move ordering, scored by
+  :func:`evaluate` (mobility, corners, stable discs and frontier discs);
+- once at most ``endgame_empties`` squares are empty, an exact solver that
+  maximises the final disc difference, trying first the replies that leave
+  the opponent the fewest moves.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+FULL = (1 << 64) - 1
+
+# Columns 1-6, which horizontal and diagonal runs may pass through.
+_INNER = 0x7E7E7E7E7E7E7E7E
+# Every square except column 0, and except column 7: shifted sets are masked
+# with these to drop the bits that wrapped onto the neighbouring row.
+_NOT_A = 0xFEFEFEFEFEFEFEFE
+_NOT_H = 0x7F7F7F7F7F7F7F7F
+
+# (shift, opponent mask) for the four lines; each is walked both ways. The
+# mask keeps horizontal and diagonal runs off the edge columns so they cannot
+# wrap onto the next row.
+_DIRECTIONS = ((1, _INNER), (8, FULL), (9, _INNER), (7, _INNER))
+
+CORNERS = (1 << 0) | (1 << 7) | (1 << 56) | (1 << 63)
+# Squares diagonally next to each corner, and the corner they belong to.
+_X_SQUARES = ((1 << 9, 1 << 0), (1 << 14, 1 << 7), (1 << 49, 1 << 56), (1 << 54, 1 << 63))
+# Squares orthogonally next to each corner, and the corner they belong to.
+_C_SQUARES = (
+    ((1 << 1) | (1 << 8), 1 << 0),
+    ((1 << 6) | (1 << 15), 1 << 7),
+    ((1 << 48) | (1 << 57), 1 << 56),
+    ((1 << 55) | (1 << 62), 1 << 63),
+)
+
+_EDGE_ROWS = 0xFF000000000000FF
+_EDGE_COLUMNS = 0x8181818181818181
+
+
+# Square visiting order for move ordering: corners, then edges and the
+# centre, with the squares next to corners last.
+_SQUARE_WEIGHTS = (
+    (100, -20, 10, 5, 5, 10, -20, 100),
+    (-20, -50, -2, -2, -2, -2, -50, -20),
+    (10, -2, 1, 1, 1, 1, -2, 10),
+    (5, -2, 1, 0, 0, 1, -2, 5),
+    (5, -2, 1, 0, 0, 1, -2, 5),
+    (10, -2, 1, 1, 1, 1, -2, 10),
+    (-20, -50, -2, -2, -2, -2, -50, -20),
+    (100, -20, 10, 5, 5, 10, -20, 100),
+)
+_SQUARE_ORDER = tuple(sorted(range(64), key=lambda square: -_SQUARE_WEIGHTS[square // 8][square % 8]))
+
+# Score offset of a finished game, above any heuristic evaluation.
+WIN_SCORE = 100_000
+
+# The exact solver caches positions with more empty squares than this.
+_SOLVE_TABLE_EMPTIES = 7
+
+# Transposition table bound flags.
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+def popcount(bits: int) -> int:
+    """Return the number of set bits in ``bits``."""
+    return bin(bits).count("1")
+
+
+def square_bit(row: int, column: int) -> int:
+    """Return the bit for the square at ``row``, ``column``."""
+    return 1 << (row * 8 + column)
+
+
+def squares(bits: int) -> List[Tuple[int, int]]:
+    """Return the ``(row, column)`` of every set bit, in row-major order."""
+    result = []
+    while bits:
+        low = bits & -bits
+        square = low.bit_length() - 1
+        result.append((square // 8, square % 8))
+        bits ^= low
+    return result
+
+
+def from_board(board: Sequence[Sequence[str]], player: str) -> Tuple[int, int]:
+    """Return ``(player discs, opponent discs)`` for a board of colour names and ``"."``."""
+    own = 0
+    other = 0
+    for row_index, row in enumerate(board):
+        for column_index, cell in enumerate(row):
+            if cell == ".":
+                continue
+            if cell == player:
+                own |= square_bit(row_index, column_index)
+            else:
+                other |= square_bit(row_index, column_index)
+    return own, other
+
+
+def _line_masks() -> Tuple[Tuple[int, ...], ...]:
+    """Return the square masks of every row, column and diagonal, grouped by axis."""
+    rows = tuple(0xFF << (8 * row) for row in range(8))
+    columns = tuple(0x0101010101010101 << column for column in range(8))
+    diagonals = tuple(sum(square_bit(row, row - offset) for row in range(8) if 0 <= row - offset < 8) for offset in range(-7, 8))
+    anti_diagonals = tuple(sum(square_bit(row, total - row) for row in range(8) if 0 <= total - row < 8) for total in range(15))
+    return rows, columns, diagonals, anti_diagonals
+
+
+# Rows, columns, diagonals and anti-diagonals, for spotting full lines.
+_LINES = _line_masks()
+
+
+def legal_moves(player: int, opponent: int) -> int:
+    """Return a mask of the squares where ``player`` may place a disc."""
+    empty = ~(player | opponent) & FULL
+    moves = 0
+    for shift, mask in _DIRECTIONS:
+        inner = opponent & mask
+        run = inner & (player << shift)
+        run |= inner & (run << shift)
+        run |= inner & (run << shift)
+        run |= inner & (run << shift)
+        run |= inner & (run << shift)
+        run |= inner & (run << shift)
+        moves |= run << shift
+        run = inner & (player >> shift)
+        run |= inner & (run >> shift)
+        run |= inner & (run >> shift)
+        run |= inner & (run >> shift)
+        run |= inner & (run >> shift)
+        run |= inner & (run >> shift)
+        moves |= run >> shift
+    return moves & empty
+
+
+def flips(player: int, opponent: int, move: int) -> int:
+    """Return the opponent discs flipped when ``player`` plays the single-bit ``move``."""
+    flipped = 0
+    for shift, mask in _DIRECTIONS:
+        inner = opponent & mask
+        run = 0
+        cursor = move << shift
+        while cursor & inner:
+            run |= cursor
+            cursor <<= shift
+        # Runs stay inside ``inner``, so the square past one never wraps.
+        if cursor & player:
+            flipped |= run
+        run = 0
+        cursor = move >> shift
+        while cursor & inner:
+            run |= cursor
+            cursor >>= shift
+        if cursor & player:
+            flipped |= run
+    return flipped
+
+
+def _full_lines(occupied: int) -> Tuple[int, int, int, int]:
+    """Return, per axis, the union of the lines that are completely filled."""
+    result = []
+    for lines in _LINES:
+        full = 0
+        for line in lines:
+            if occupied & line == line:
+                full |= line
+        result.append(full)
+    return result[0], result[1], result[2], result[3]
+
+
+def stable_discs(player: int, opponent: int) -> int:
+    """Return the ``player`` discs that can never be flipped.
+
+    A disc is stable when, along each of the four lines through it, the line
+    is full or one neighbour is the board edge or another stable disc of the
+    same colour. The set grows from the corners until it stops changing.
+    """
+    horizontal, vertical, diagonal, anti_diagonal = _full_lines(player | opponent)
+    stable = 0
+    while True:
+        grown = (
+            player
+            & (horizontal | _EDGE_COLUMNS | ((stable << 1) & _NOT_A) | ((stable >> 1) & _NOT_H))
+            & (vertical | _EDGE_ROWS | (stable << 8) | (stable >> 8))
+            & (diagonal | _EDGE_ROWS | _EDGE_COLUMNS | ((stable << 9) & _NOT_A) | ((stable >> 9) & _NOT_H))
+            & (anti_diagonal | _EDGE_ROWS | _EDGE_COLUMNS | ((stable << 7) & _NOT_H) | ((stable >> 7) & _NOT_A))
+            & FULL
+        )
+        if grown == stable:
+            return stable
+        stable = grown
+
+
+def _frontier(discs: int, empty: int) -> int:
+    """Return the ``discs`` next to at least one empty square."""
+    near = (
+        ((empty << 1) & _NOT_A)
+        | ((empty >> 1) & _NOT_H)
+        | (empty << 8)
+        | (empty >> 8)
+        | ((empty << 9) & _NOT_A)
+        | ((empty >> 9) & _NOT_H)
+        | ((empty << 7) & _NOT_H)
+        | ((empty >> 7) & _NOT_A)
+    )
+    return discs & near
+
+
+def evaluate(player: int, opponent: int) -> int:
+    """Return a heuristic score of the position for the player to move.
+
+    Terms, each as player minus opponent: corners, stable discs, mobility,
+    discs next to an empty corner (penalised), and frontier discs
+    (penalised). Disc count only matters near the end.
+    """
+    empty = ~(player | opponent) & FULL
+    own_moves = popcount(legal_moves(player, opponent))
+    other_moves = popcount(legal_moves(opponent, player))
+    score = 25 * (popcount(player & CORNERS) - popcount(opponent & CORNERS))
+    score += 12 * (popcount(stable_discs(player, opponent)) - popcount(stable_discs(opponent, player)))
+    score += 100 * (own_moves - other_moves) // (own_moves + other_moves + 2)
+    for x_square, corner in _X_SQUARES:
+        if corner & empty:
+            score -= 12 * ((player & x_square) != 0) - 12 * ((opponent & x_square) != 0)
+    for c_squares, corner in _C_SQUARES:
+        if corner & empty:
+            score -= 4 * (popcount(player & c_squares) - popcount(opponent & c_squares))
+    score -= 2 * (popcount(_frontier(player, empty)) - popcount(_frontier(opponent, empty)))
+    if popcount(empty) <= 20:
+        score += popcount(player) - popcount(opponent)
+    return score
+
+
+def final_score(player: int, opponent: int) -> int:
+    """Return the disc difference for ``player`` in a finished game."""
+    return popcount(player) - popcount(opponent)
+
+
+# Scores a root move from (mover discs, other discs, alpha, beta).
+_ChildScorer = Callable[[int, int, int, int], int]
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget is spent."""
+
+
+class OthelloSearch:
+    """Alpha-beta search and exact endgame solver over bitboard positions.
+
+    The transposition table is kept across calls until it grows past
+    ``table_size`` entries, when it is cleared.
+    """
+
+    def __init__(self, table_size: int = 200_000) -> None:
+        """Create a search with a transposition table of ``table_size`` entries."""
+        self.table_size = table_size
+        # (player, opponent) -> (depth, value, flag, best move bit)
+        self._table: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
+        # (player, opponent) -> (lower bound, upper bound) on the final disc difference
+        self._solved: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self._deadline: Optional[float] = None
+        self.nodes = 0
+        self.last_depth = 0
+
+    def best_move(
+        self,
+        player: int,
+        opponent: int,
+        depth: int,
+        *,
+        endgame_empties: int = 12,
+        time_budget: Optional[float] = None,
+    ) -> Optional[int]:
+        """Return the best move bit for the player to move, or ``None`` if it must pass.
+
+        Positions with at most ``endgame_empties`` empty squares are solved
+        exactly. Otherwise the search deepens from one ply to ``depth`` and,
+        when ``time_budget`` is set, returns the best move of the deepest
+        iteration finished in time; the first iteration always completes.
+        """
+        moves = legal_moves(player, opponent)
+        if not moves:
+            return None
+        if moves & (moves - 1) == 0:
+            return moves
+        if len(self._table) > self.table_size:
+            self._table.clear()
+        if len(self._solved) > self.table_size:
+            self._solved.clear()
+        self.nodes = 0
+        if popcount(~(player | opponent) & FULL) <= endgame_empties:
+            self.last_depth = 64
+            return self._best_root(player, opponent, self._solve_child)
+        start = time.perf_counter()
+        best = None
+        for iteration in range(1, max(depth, 1) + 1):
+            self._deadline = start + time_budget if time_budget is not None and iteration > 1 else None
+            try:
+                best = self._best_root(player, opponent, self._search_child(iteration - 1))
+            except _SearchTimeout:
+                break
+            self.last_depth = iteration
+        self._deadline = None
+        return best
+
+    def solve(self, player: int, opponent: int) -> int:
+        """Return the exact final disc difference for the player to move, with best play."""
+        self.nodes = 0
+        return self._solve(player, opponent, -64, 64, False)
+
+    def _best_root(self, player: int, opponent: int, score_child: _ChildScorer) -> int:
+        """Score every root move with ``score_child`` and return the best one."""
+        alpha = -WIN_SCORE * 2
+        best_move = 0
+        for move in self._ordered_moves(player, opponent, legal_moves(player, opponent)):
+            flipped = flips(player, opponent, move)
+            score = score_child(player | flipped | move, opponent & ~flipped, alpha, WIN_SCORE * 2)
+            if score > alpha or not best_move:
+                alpha = score
+                best_move = move
+        table_entry = self._table.get((player, opponent))
+        if table_entry is None or table_entry[0] < 0:
+            self._table[(player, opponent)] = (-1, alpha, _EXACT, best_move)
+        return best_move
+
+    def _search_child(self, depth: int) -> _ChildScorer:
+        """Return a root-move scorer that searches each child ``depth`` plies."""
+
+        def score(mover: int, other: int, alpha: int, beta: int) -> int:
+            return -self._negamax(other, mover, depth, -beta, -alpha)
+
+        return score
+
+    def _solve_child(self, mover: int, other: int, alpha: int, beta: int) -> int:
+        """Score a root move in the endgame: exact disc difference for the mover."""
+        return -self._solve(other, mover, -min(beta, 64), -max(alpha, -64), False)
+
+    def _ordered_moves(self, player: int, opponent: int, moves: int) -> List[int]:
+        """Return move bits with the table move first, then corners-first square order."""
+        entry = self._table.get((player, opponent))
+        first = entry[3] if entry is not None else 0
+        ordered = [first] if first & moves else []
+        for square in _SQUARE_ORDER:
+            bit = 1 << square
+            if moves & bit and bit != first:
+                ordered.append(bit)
+        return ordered
+
+    def _negamax(self, player: int, opponent: int, depth: int, alpha: int, beta: int) -> int:
+        """Depth-limited alpha-beta from the point of view of the player to move."""
+        self.nodes += 1
+        if self._deadline is not None and not self.nodes & 255 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        moves = legal_moves(player, opponent)
+        if not moves:
+            if not legal_moves(opponent, player):
+                difference = final_score(player, opponent)
+                return (WIN_SCORE if difference > 0 else -WIN_SCORE if difference < 0 else 0) + difference
+            return -self._negamax(opponent, player, depth, -beta, -alpha)
+        if depth <= 0:
+            return evaluate(player, opponent)
+
+        key = (player, opponent)
+        entry = self._table.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, value, flag, _ = entry
+            if flag == _EXACT or (flag == _LOWER and value >= beta) or (flag == _UPPER and value <= alpha):
+                return value
+
+        original_alpha = alpha
+        best = -WIN_SCORE * 2
+        best_move = 0
+        for move in self._ordered_moves(player, opponent, moves):
+            flipped = flips(player, opponent, move)
+            score = -self._negamax(opponent & ~flipped, player | flipped | move, depth - 1, -beta, -alpha)
+            if score > best:
+                best = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        flag = _UPPER if best <= original_alpha else _LOWER if best >= beta else _EXACT
+        self._table[key] = (depth, best, flag, best_move)
+        return best
+
+    def _solve(self, player: int, opponent: int, alpha: int, beta: int, passed: bool) -> int:
+        """Exact alpha-beta on the final disc difference, fastest-first move ordering."""
+        self.nodes += 1
+        moves = legal_moves(player, opponent)
+        if not moves:
+            if passed:
+                return final_score(player, opponent)
+            return -self._solve(opponent, player, -beta, -alpha, True)
+
+        empties = popcount(~(player | opponent) & FULL)
+        key = (player, opponent)
+        if empties > _SOLVE_TABLE_EMPTIES:
+            entry = self._solved.get(key)
+            if entry is not None:
+                lower, upper = entry
+                if lower >= beta:
+                    return lower
+                if upper <= alpha:
+                    return upper
+                alpha = max(alpha, lower)
+                beta = min(beta, upper)
+                if alpha >= beta:
+                    return alpha
+
+        children = []
+        while moves:
+            move = moves & -moves
+            moves ^= move
+            flipped = flips(player, opponent, move)
+            children.append((opponent & ~flipped, player | flipped | move))
+        if empties > 6 and len(children) > 1:
+            # Fastest first: replies that leave the opponent the fewest moves.
+            children.sort(key=lambda child: popcount(legal_moves(child[0], child[1])))
+
+        original_alpha = alpha
+        best = -64
+        for index, (next_player, next_opponent) in enumerate(children):
+            if index == 0:
+                score = -self._solve(next_player, next_opponent, -beta, -alpha, False)
+            else:
+                # Principal variation search: prove the move is no better with a
+                # null window, and only search it fully when that fails.
+                score = -self._solve(next_player, next_opponent, -alpha - 1, -alpha, False)
+                if alpha < score < beta:
+                    score = -self._solve(next_player, next_opponent, -beta, -score, False)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        if empties > _SOLVE_TABLE_EMPTIES:
+            lower, upper = self._solved.get(key, (-64, 64))
+            if best <= original_alpha:
+                upper = best
+            elif best >= beta:
+                lower = best
+            else:
+                lower = upper = best
+            self._solved[key] = (lower, upper)
+        return best
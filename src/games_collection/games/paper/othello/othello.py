@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from games_collection.core.ai_strategy import check_backend, difficulty_preset
 from games_collection.core.game_engine import GameEngine, GameState
 
+from . import bitboard
+
 Player = str
 
+# (move, flipped discs, player, pass count, state, winner) for a pushed move.
+UndoRecord = Tuple["OthelloMove", List[Tuple[int, int]], Player, int, GameState, Optional[Player]]
+
 
 @dataclass(frozen=True)
 class OthelloMove:
@@ -46,6 +52,7 @@ class OthelloGame(GameEngine[OthelloMove, Player]):
         self._winner: Optional[Player] = None
         self._state = GameState.NOT_STARTED
         self._consecutive_passes = 0
+        self._undo_stack: List[UndoRecord] = []
         self.reset()
 
     def reset(self) -> None:
@@ -59,6 +66,7 @@ class OthelloGame(GameEngine[OthelloMove, Player]):
         self._winner = None
         self._state = GameState.IN_PROGRESS
         self._consecutive_passes = 0
+        self._undo_stack = []
 
     def is_game_over(self) -> bool:
         return self._state == GameState.FINISHED
@@ -80,27 +88,55 @@ class OthelloGame(GameEngine[OthelloMove, Player]):
         valid_moves = self.get_valid_moves()
         if move not in valid_moves:
             return False
+        self._play(move)
+        return True
+
+    def push_move(self, move: OthelloMove) -> None:
+        """Play a move in place for search, recording the discs it flips."""
+
+        player, passes, state, winner = self._current_player, self._consecutive_passes, self._state, self._winner
+        flips = self._play(move)
+        self._undo_stack.append((move, flips, player, passes, state, winner))
+
+    def pop_move(self) -> OthelloMove:
+        """Undo the most recent :meth:`push_move`."""
+
+        move, flips, player, passes, state, winner = self._undo_stack.pop()
+        if not move.is_pass:
+            opponent = self._opponent(player)
+            self._board[move.row][move.column] = "."
+            for row, column in flips:
+                self._board[row][column] = opponent
+        self._current_player = player
+        self._consecutive_passes = passes
+        self._state = state
+        self._winner = winner
+        return move
+
+    def _play(self, move: OthelloMove) -> List[Tuple[int, int]]:
+        """Apply a legal move and advance the turn; return the flipped discs."""
+
         if move.is_pass:
             self._consecutive_passes += 1
             if self._consecutive_passes == 2:
                 self._finalize_game()
-                return True
+                return []
             self._current_player = self._opponent(self._current_player)
-            return True
-        self._apply_move(self._board, self._current_player, move)
+            return []
+        flips = self._apply_move(self._board, self._current_player, move)
         self._consecutive_passes = 0
         self._current_player = self._opponent(self._current_player)
         if not self._valid_moves_for(self._board, self._current_player):
             self._consecutive_passes += 1
             if self._consecutive_passes == 2:
                 self._finalize_game()
-                return True
+                return flips
             self._current_player = self._opponent(self._current_player)
             if not self._valid_moves_for(self._board, self._current_player):
                 self._finalize_game()
         if self._board_full(self._board):
             self._finalize_game()
-        return True
+        return flips
 
     def get_winner(self) -> Optional[Player]:
         return self._winner
@@ -119,21 +155,15 @@ class OthelloGame(GameEngine[OthelloMove, Player]):
         return board_copy, next_player, finished, winner, next_pass_count
 
     def _valid_moves_for(self, board: List[List[str]], player: Player) -> List[OthelloMove]:
-        moves: List[OthelloMove] = []
-        for row in range(self.board_size):
-            for column in range(self.board_size):
-                if board[row][column] != ".":
-                    continue
-                flips = self._discs_to_flip(board, player, row, column)
-                if flips:
-                    moves.append(OthelloMove(row, column))
-        return moves
+        own, other = bitboard.from_board(board, player)
+        return [OthelloMove(row, column) for row, column in bitboard.squares(bitboard.legal_moves(own, other))]
 
-    def _apply_move(self, board: List[List[str]], player: Player, move: OthelloMove) -> None:
+    def _apply_move(self, board: List[List[str]], player: Player, move: OthelloMove) -> List[Tuple[int, int]]:
         flips = self._discs_to_flip(board, player, move.row, move.column)
         board[move.row][move.column] = player
         for row, column in flips:
             board[row][column] = player
+        return flips
 
     def _apply_move_simulation(
         self,
@@ -204,8 +234,25 @@ class OthelloGame(GameEngine[OthelloMove, Player]):
         return "white" if player == "black" else "black"
 
 
+# Search depth per menu difficulty, and how many empty squares are left when the AI switches to an exact solve.
+OTHELLO_DIFFICULTIES: Dict[str, Dict[str, Any]] = {
+    "easy": {"depth": 1, "endgame_empties": 0},
+    "medium": {"depth": 3, "endgame_empties": 8},
+    "hard": {"depth": 5, "endgame_empties": 10},
+    "expert": {"depth": 8, "endgame_empties": 12, "time_budget": 2.0},
+}
+
+
 class OthelloAI:
-    """Heuristic-based minimax AI for Othello."""
+    """Heuristic-based minimax AI for Othello.
+
+    The default ``"bitboard"`` backend runs :class:`~.bitboard.OthelloSearch`:
+    iterative deepening alpha-beta scored by mobility, corners and stable
+    discs, and an exact solve once ``endgame_empties`` or fewer squares are
+    empty. ``time_budget`` caps the iterative deepening in seconds. The
+    ``"board"`` backend is the original search over the engine's board with a
+    square-weight evaluation.
+    """
 
     _weights: Tuple[Tuple[int, ...], ...] = (
         (120, -20, 20, 5, 5, 20, -20, 120),
@@ -218,98 +265,102 @@ class OthelloAI:
         (120, -20, 20, 5, 5, 20, -20, 120),
     )
 
-    def __init__(self, depth: int = 4) -> None:
+    def __init__(
+        self,
+        depth: int = 4,
+        *,
+        backend: str = "bitboard",
+        endgame_empties: int = 10,
+        time_budget: Optional[float] = None,
+    ) -> None:
+        check_backend(backend, ("bitboard", "board"), "Othello")
         self.depth = depth
+        self.backend = backend
+        self.endgame_empties = endgame_empties
+        self.time_budget = time_budget
+        self._search = bitboard.OthelloSearch()
+
+    @classmethod
+    def for_difficulty(cls, difficulty: str) -> "OthelloAI":
+        """Build an AI from an :data:`OTHELLO_DIFFICULTIES` entry; unknown names raise ``ValueError``."""
+        return cls(**difficulty_preset(OTHELLO_DIFFICULTIES, difficulty, "Othello"))
 
     def choose_move(self, game: OthelloGame) -> OthelloMove:
         moves = game.get_valid_moves()
         if not moves:
             raise ValueError("No available Othello moves")
+        if self.backend == "bitboard":
+            return self._choose_bitboard_move(game, moves)
+        maximizing_player = game.get_current_player()
         best_move = moves[0]
         best_score = float("-inf")
         for move in moves:
-            board_copy, next_player, finished, winner, pass_count = game.simulate_move(move)
-            score = self._minimax(
-                board_copy,
-                next_player,
-                game.get_current_player(),
-                self.depth - 1,
-                -float("inf"),
-                float("inf"),
-                finished,
-                winner,
-                pass_count,
-            )
+            score = self._search_child(game, move, maximizing_player, self.depth - 1, -float("inf"), float("inf"))
             if score > best_score:
                 best_score = score
                 best_move = move
         return best_move
 
+    def _choose_bitboard_move(self, game: OthelloGame, moves: List[OthelloMove]) -> OthelloMove:
+        """Pick a move with the bitboard search, passing when that is the only option."""
+        if moves[0].is_pass:
+            return moves[0]
+        own, other = bitboard.from_board(game.get_state_representation(), game.get_current_player())
+        best = self._search.best_move(
+            own,
+            other,
+            self.depth,
+            endgame_empties=self.endgame_empties,
+            time_budget=self.time_budget,
+        )
+        for move in moves:
+            if best == bitboard.square_bit(move.row, move.column):
+                return move
+        return moves[0]
+
+    def _search_child(
+        self,
+        game: OthelloGame,
+        move: OthelloMove,
+        maximizing_player: Player,
+        depth: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        """Score ``move`` by searching it in place on ``game``."""
+        game.push_move(move)
+        try:
+            return self._minimax(game, maximizing_player, depth, alpha, beta)
+        finally:
+            game.pop_move()
+
     def _minimax(
         self,
-        board: List[List[str]],
-        current_player: Player,
+        game: OthelloGame,
         maximizing_player: Player,
         depth: int,
         alpha: float,
         beta: float,
-        finished: bool,
-        winner: Optional[Player],
-        pass_count: int,
     ) -> float:
-        if finished:
+        if game.is_game_over():
+            winner = game.get_winner()
             if winner is None:
                 return 0.0
             return 1000.0 if winner == maximizing_player else -1000.0
         if depth == 0:
-            return self._evaluate(board, maximizing_player)
-        helper = OthelloGame()
-        helper._board = [row[:] for row in board]
-        helper._current_player = current_player
-        helper._consecutive_passes = pass_count
-        moves = helper.get_valid_moves()
-        if not moves:
-            winner = helper._determine_winner(board)
-            return 0.0 if winner is None else (1000.0 if winner == maximizing_player else -1000.0)
-        if current_player == maximizing_player:
+            return self._evaluate(game._board, maximizing_player)
+        moves = game.get_valid_moves()
+        if game.get_current_player() == maximizing_player:
             value = float("-inf")
             for move in moves:
-                next_board, next_player, finished_state, winner_state, pass_state = helper.simulate_move(move)
-                value = max(
-                    value,
-                    self._minimax(
-                        next_board,
-                        next_player,
-                        maximizing_player,
-                        depth - 1,
-                        alpha,
-                        beta,
-                        finished_state,
-                        winner_state,
-                        pass_state,
-                    ),
-                )
+                value = max(value, self._search_child(game, move, maximizing_player, depth - 1, alpha, beta))
                 alpha = max(alpha, value)
                 if beta <= alpha:
                     break
             return value
         value = float("inf")
         for move in moves:
-            next_board, next_player, finished_state, winner_state, pass_state = helper.simulate_move(move)
-            value = min(
-                value,
-                self._minimax(
-                    next_board,
-                    next_player,
-                    maximizing_player,
-                    depth - 1,
-                    alpha,
-                    beta,
-                    finished_state,
-                    winner_state,
-                    pass_state,
-                ),
-            )
+            value = min(value, self._search_child(game, move, maximizing_player, depth - 1, alpha, beta))
             beta = min(beta, value)
             if beta <= alpha:
                 break
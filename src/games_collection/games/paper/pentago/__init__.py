@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
-from .pentago import PentagoAI, PentagoCLI, PentagoGame, PentagoMove
+from .bitboard import PentagoSearch
+from .pentago import PENTAGO_DIFFICULTIES, PentagoAI, PentagoCLI, PentagoGame, PentagoMove
 
-__all__ = ["PentagoAI", "PentagoCLI", "PentagoGame", "PentagoMove"]
+__all__ = ["PentagoAI", "PentagoCLI", "PentagoGame", "PentagoMove", "PentagoSearch", "PENTAGO_DIFFICULTIES"]
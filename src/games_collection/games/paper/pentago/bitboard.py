@@ -0,0 +1,501 @@
+"""Bitboard Pentago core: rotations, win detection, evaluation and search.
+
+A position is two 36-bit integers, the marbles of the player to move and the
+marbles of the opponent, with cell ``row * 6 + column`` stored in bit
+``row * 6 + column``. Rotating a quadrant gathers its nine cells into a 9-bit
+index and looks the rotated cells up in a precomputed table, and five in a
+row is found for all lines of one direction at once with shifts and masks.
+
+A move is the integer ``cell * 8 + quadrant * 2 + (0 if clockwise else 1)``.
+
+:class:`PentagoSearch` runs an iterative deepening negamax with alpha-beta
+over these integers. Transposition keys are canonical under the eight
+symmetries of the board, and placements that lead to the same position (for
+example rotating an empty quadrant either way) are searched once.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CELLS = 36
+FULL = (1 << CELLS) - 1
+WIN_SCORE = 100_000
+
+# Bit index of the top-left cell of each quadrant.
+_QUADRANT_ORIGINS = (0, 3, 18, 21)
+QUADRANT_MASKS = tuple(sum(1 << (origin + row * 6 + column) for row in range(3) for column in range(3)) for origin in _QUADRANT_ORIGINS)
+# The cell at the middle of each quadrant, which no rotation moves.
+CENTRES = sum(1 << (origin + 7) for origin in _QUADRANT_ORIGINS)
+
+# (shift, start cells) for runs of five: along rows, columns, diagonals and
+# anti-diagonals. Runs may only start where five cells fit on the board.
+_FIVE_DIRECTIONS = (
+    (1, sum(1 << (row * 6 + column) for row in range(6) for column in range(2))),
+    (6, sum(1 << (row * 6 + column) for row in range(2) for column in range(6))),
+    (7, sum(1 << (row * 6 + column) for row in range(2) for column in range(2))),
+    (5, sum(1 << (row * 6 + column) for row in range(2) for column in range(4, 6))),
+)
+LINES = tuple(sum(1 << (start + step * shift) for step in range(5)) for shift, starts in _FIVE_DIRECTIONS for start in range(CELLS) if starts >> start & 1)
+# Score of an unblocked line by the number of marbles on it.
+_LINE_WEIGHTS = (0, 1, 4, 20, 120, WIN_SCORE)
+_CENTRE_WEIGHT = 3
+
+
+def square_bit(row: int, column: int) -> int:
+    return 1 << (row * 6 + column)
+
+
+def popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def from_board(board: Sequence[Sequence[int]], player: int) -> Tuple[int, int]:
+    """Return ``(player marbles, opponent marbles)`` for an engine board of 0/1/2 cells."""
+    own = other = 0
+    for row, cells in enumerate(board):
+        for column, cell in enumerate(cells):
+            if cell == player:
+                own |= square_bit(row, column)
+            elif cell:
+                other |= square_bit(row, column)
+    return own, other
+
+
+def encode_move(row: int, column: int, quadrant: int, clockwise: bool) -> int:
+    return (row * 6 + column) * 8 + quadrant * 2 + (0 if clockwise else 1)
+
+
+def decode_move(move: int) -> Tuple[int, int, int, bool]:
+    """Return ``(row, column, quadrant, clockwise)`` for a move integer."""
+    cell, rotation = divmod(move, 8)
+    return cell // 6, cell % 6, rotation >> 1, not rotation & 1
+
+
+def _quadrant_index(bits: int, quadrant: int) -> int:
+    """Gather the nine cells of ``quadrant`` into a 9-bit row-major index."""
+    origin = _QUADRANT_ORIGINS[quadrant]
+    return (bits >> origin & 7) | (bits >> (origin + 6) & 7) << 3 | (bits >> (origin + 12) & 7) << 6
+
+
+def _pattern_table(quadrant: int, transform) -> Tuple[int, ...]:
+    """Map every 9-bit pattern of ``quadrant`` to its cells on the board under ``transform``."""
+    origin_row, origin_column = divmod(_QUADRANT_ORIGINS[quadrant], 6)
+    images = [square_bit(*transform(origin_row + local // 3, origin_column + local % 3)) for local in range(9)]
+    table = [0] * 512
+    for index in range(1, 512):
+        # Each pattern is a smaller one plus its lowest cell.
+        low = index & -index
+        table[index] = table[index ^ low] | images[low.bit_length() - 1]
+    return tuple(table)
+
+
+def _rotation(quadrant: int, clockwise: bool):
+    """Return the cell map of rotating ``quadrant`` a quarter turn."""
+    origin_row, origin_column = divmod(_QUADRANT_ORIGINS[quadrant], 6)
+
+    def transform(row: int, column: int) -> Tuple[int, int]:
+        local_row, local_column = row - origin_row, column - origin_column
+        if clockwise:
+            return origin_row + local_column, origin_column + 2 - local_row
+        return origin_row + 2 - local_column, origin_column + local_row
+
+    return transform
+
+
+# _ROTATED[quadrant * 2 + direction][index]: the quadrant's cells after the turn.
+_ROTATED = tuple(_pattern_table(rotation >> 1, _rotation(rotation >> 1, not rotation & 1)) for rotation in range(8))
+# _MOVED[rotation][cell]: where a marble placed on ``cell`` ends up after the turn.
+_MOVED = tuple(
+    tuple(_ROTATED[rotation][_quadrant_index(1 << cell, rotation >> 1)] if QUADRANT_MASKS[rotation >> 1] >> cell & 1 else 1 << cell for cell in range(CELLS))
+    for rotation in range(8)
+)
+
+# The eight symmetries of the board as cell maps; the last four are reflections.
+_SYMMETRIES = (
+    lambda row, column: (row, column),
+    lambda row, column: (column, 5 - row),
+    lambda row, column: (5 - row, 5 - column),
+    lambda row, column: (5 - column, row),
+    lambda row, column: (row, 5 - column),
+    lambda row, column: (5 - row, column),
+    lambda row, column: (column, row),
+    lambda row, column: (5 - column, 5 - row),
+)
+# _SYMMETRIC[symmetry][quadrant][index]: a quadrant pattern's image on the board.
+_SYMMETRIC = tuple(tuple(_pattern_table(quadrant, transform) for quadrant in range(4)) for transform in _SYMMETRIES)
+
+
+def _symmetric_move(symmetry: int, move: int) -> int:
+    row, column, quadrant, clockwise = decode_move(move)
+    transform = _SYMMETRIES[symmetry]
+    image_row, image_column = transform(row, column)
+    centre_row, centre_column = transform(*divmod(_QUADRANT_ORIGINS[quadrant] + 7, 6))
+    image_quadrant = (centre_row // 3) * 2 + centre_column // 3
+    return encode_move(image_row, image_column, image_quadrant, clockwise == (symmetry < 4))
+
+
+_INVERSE_SYMMETRY = (0, 3, 2, 1, 4, 5, 6, 7)
+# _MOVE_IMAGES[symmetry][move]: the move as seen in the transformed position.
+_MOVE_IMAGES = tuple(tuple(_symmetric_move(symmetry, move) for move in range(CELLS * 8)) for symmetry in range(8))
+
+
+def rotate(bits: int, quadrant: int, clockwise: bool) -> int:
+    """Return ``bits`` with ``quadrant`` turned a quarter turn."""
+    rotation = quadrant * 2 + (0 if clockwise else 1)
+    return bits & ~QUADRANT_MASKS[quadrant] | _ROTATED[rotation][_quadrant_index(bits, quadrant)]
+
+
+def apply_move(player: int, opponent: int, move: int) -> Tuple[int, int]:
+    """Play ``move`` for ``player`` and return ``(player marbles, opponent marbles)``."""
+    cell, rotation = divmod(move, 8)
+    quadrant, clockwise = rotation >> 1, not rotation & 1
+    return rotate(player | 1 << cell, quadrant, clockwise), rotate(opponent, quadrant, clockwise)
+
+
+def has_five(bits: int) -> bool:
+    """Return whether ``bits`` contain five in a row."""
+    for shift, starts in _FIVE_DIRECTIONS:
+        run = bits & bits >> shift
+        run &= run >> 2 * shift
+        if run & bits >> 4 * shift & starts:
+            return True
+    return False
+
+
+def _window_score(own: int, other: int) -> int:
+    """Score one line of five from its marble masks."""
+    if own:
+        return 0 if other else _LINE_WEIGHTS[popcount(own)]
+    return -_LINE_WEIGHTS[popcount(other)] if other else 0
+
+
+# _ROW_SCORES[own << 6 | other]: the two windows of five along a line of six.
+_ROW_SCORES = tuple(_window_score(own & 31, other & 31) + _window_score(own >> 1, other >> 1) for own in range(64) for other in range(64))
+# Cells of column 0; multiplying a column by _COLUMN_GATHER moves its cells,
+# without carries, to bits 30-35.
+_COLUMN = sum(1 << (row * 6) for row in range(6))
+_COLUMN_GATHER = sum(1 << (30 - 5 * row) for row in range(6))
+# The eight lines of five that run diagonally.
+_DIAGONAL_LINES = LINES[24:]
+# _CELL_LINES[cell]: the lines of five through ``cell``.
+_CELL_LINES = tuple(tuple(line for line in LINES if line >> cell & 1) for cell in range(CELLS))
+
+
+def evaluate(player: int, opponent: int) -> int:
+    """Score a position for the player to move.
+
+    Each unblocked line of five scores by how many marbles are on it, and
+    the quadrant centres, which rotations never move, add a small bonus.
+    Rows and columns are scored six cells at a time from a lookup table.
+    """
+    score = _CENTRE_WEIGHT * (popcount(player & CENTRES) - popcount(opponent & CENTRES))
+    rows = _ROW_SCORES
+    for shift in (0, 6, 12, 18, 24, 30):
+        score += rows[(player >> shift & 63) << 6 | opponent >> shift & 63]
+    for column in range(6):
+        own = ((player >> column & _COLUMN) * _COLUMN_GATHER) >> 30 & 63
+        other = ((opponent >> column & _COLUMN) * _COLUMN_GATHER) >> 30 & 63
+        score += rows[own << 6 | other]
+    for line in _DIAGONAL_LINES:
+        own = player & line
+        if own:
+            if not opponent & line:
+                score += _LINE_WEIGHTS[popcount(own)]
+        elif opponent & line:
+            score -= _LINE_WEIGHTS[popcount(opponent & line)]
+    return score
+
+
+def canonical_key(player: int, opponent: int) -> Tuple[int, int]:
+    """Return ``(key, symmetry)``: the smallest key over the board's symmetries and the one giving it."""
+    own = [_quadrant_index(player, quadrant) for quadrant in range(4)]
+    other = [_quadrant_index(opponent, quadrant) for quadrant in range(4)]
+    best_key = -1
+    best_symmetry = 0
+    for symmetry, images in enumerate(_SYMMETRIC):
+        first, second, third, fourth = images
+        key = (first[own[0]] | second[own[1]] | third[own[2]] | fourth[own[3]]) << CELLS | (
+            first[other[0]] | second[other[1]] | third[other[2]] | fourth[other[3]]
+        )
+        if best_key < 0 or key < best_key:
+            best_key, best_symmetry = key, symmetry
+    return best_key, best_symmetry
+
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the wall-clock budget is exhausted."""
+
+
+# A searchable child: (move, mover's marbles, opponent's marbles) after the turn.
+_Child = Tuple[int, int, int]
+
+
+class PentagoSearch:
+    """Iterative deepening alpha-beta search over bitboard positions.
+
+    The transposition table is keyed by :func:`canonical_key`, so the eight
+    symmetric copies of a position share one entry; its best move is stored
+    in the canonical orientation and mapped back when it is read. The table
+    is kept across calls until it grows past ``table_size`` entries, when it
+    is cleared.
+    """
+
+    def __init__(self, table_size: int = 200_000) -> None:
+        """Create a search with a transposition table of ``table_size`` entries."""
+        self.table_size = table_size
+        # canonical key -> (depth, value, flag, best move in the canonical orientation)
+        self._table: Dict[int, Tuple[int, int, int, int]] = {}
+        self._history: Dict[int, int] = {}
+        self._deadline: Optional[float] = None
+        self.nodes = 0
+        self.last_depth = 0
+
+    def best_move(self, player: int, opponent: int, depth: int, *, time_budget: Optional[float] = None) -> Optional[int]:
+        """Return the best move for the player to move, or ``None`` if the board is full.
+
+        The search deepens from one ply to ``depth`` and, when ``time_budget``
+        is set, returns the best move of the deepest iteration finished in
+        time; the first iteration always completes.
+        """
+        children = self._children(player, opponent, -1)
+        if not children:
+            return None
+        # Moves leading to mirror images of one another score the same.
+        distinct: Dict[int, _Child] = {}
+        for child in children:
+            distinct.setdefault(canonical_key(child[2], child[1])[0], child)
+        children = list(distinct.values())
+        if len(self._table) > self.table_size:
+            self._table.clear()
+        self._history.clear()
+        self.nodes = 0
+        start = time.perf_counter()
+        best = children[0][0]
+        for iteration in range(1, max(depth, 1) + 1):
+            self._deadline = start + time_budget if time_budget is not None and iteration > 1 else None
+            try:
+                move, mover, other = children[0]
+                alpha = self._score_child(mover, other, iteration - 1, -2 * WIN_SCORE, 2 * WIN_SCORE)
+                scored = [(alpha, move, mover, other)]
+                for move, mover, other in children[1:]:
+                    # A null window first: most moves only need to be shown worse.
+                    score = self._score_child(mover, other, iteration - 1, alpha, alpha + 1)
+                    if score > alpha:
+                        score = self._score_child(mover, other, iteration - 1, alpha, 2 * WIN_SCORE)
+                        alpha = max(alpha, score)
+                    scored.append((score, move, mover, other))
+            except _SearchTimeout:
+                break
+            scored.sort(key=lambda entry: -entry[0])
+            children = [(move, mover, other) for _, move, mover, other in scored]
+            best = children[0][0]
+            self.last_depth = iteration
+            if abs(scored[0][0]) >= WIN_SCORE:
+                break
+        self._deadline = None
+        return best
+
+    def _score_child(self, mover: int, other: int, depth: int, alpha: int, beta: int) -> int:
+        """Score the position after a turn for the player who made it."""
+        terminal = _terminal_score(mover, other)
+        if terminal is not None:
+            # Prefer the quickest win and the slowest loss.
+            return terminal + depth if terminal > 0 else terminal - depth if terminal < 0 else 0
+        if depth <= 0:
+            return -evaluate(other, mover)
+        return -self._negamax(other, mover, depth, -beta, -alpha)
+
+    def _children(self, player: int, opponent: int, first: int) -> List[_Child]:
+        """Return one child per distinct resulting position, ``first`` (a move) leading."""
+        empty = ~(player | opponent) & FULL
+        if not empty:
+            return []
+        turned = []
+        for rotation in range(8):
+            quadrant = rotation >> 1
+            table = _ROTATED[rotation]
+            mask = ~QUADRANT_MASKS[quadrant]
+            turned.append(
+                (
+                    player & mask | table[_quadrant_index(player, quadrant)],
+                    opponent & mask | table[_quadrant_index(opponent, quadrant)],
+                )
+            )
+        children: List[_Child] = []
+        seen = set()
+        if first >= 0 and empty >> (first >> 3) & 1:
+            own, other = turned[first & 7]
+            own |= _MOVED[first & 7][first >> 3]
+            seen.add(own << CELLS | other)
+            children.append((first, own, other))
+        while empty:
+            low = empty & -empty
+            cell = low.bit_length() - 1
+            empty ^= low
+            for rotation in range(8):
+                own, other = turned[rotation]
+                own |= _MOVED[rotation][cell]
+                key = own << CELLS | other
+                if key not in seen:
+                    seen.add(key)
+                    children.append((cell * 8 + rotation, own, other))
+        return children
+
+    def _negamax(self, player: int, opponent: int, depth: int, alpha: int, beta: int) -> int:
+        """Depth-limited alpha-beta from the point of view of the player to move."""
+        self.nodes += 1
+        if self._deadline is not None and not self.nodes & 15 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        key, symmetry = canonical_key(player, opponent)
+        entry = self._table.get(key)
+        table_move = -1
+        if entry is not None:
+            entry_depth, value, flag, stored_move = entry
+            if entry_depth >= depth:
+                if flag == _EXACT:
+                    return value
+                if flag == _LOWER and value >= beta:
+                    return value
+                if flag == _UPPER and value <= alpha:
+                    return value
+            table_move = _MOVE_IMAGES[_INVERSE_SYMMETRY[symmetry]][stored_move]
+
+        if depth == 1:
+            best, best_move = self._horizon(player, opponent, beta)
+        else:
+            best, best_move = self._search_children(player, opponent, depth, alpha, beta, table_move)
+        if best_move < 0:
+            return best
+
+        if best <= alpha:
+            flag = _UPPER
+        elif best >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._table[key] = (depth, best, flag, _MOVE_IMAGES[symmetry][best_move])
+        return best
+
+    def _search_children(self, player: int, opponent: int, depth: int, alpha: int, beta: int, table_move: int) -> Tuple[int, int]:
+        """Return ``(value, best move)`` of an interior node; the move is -1 on a full board."""
+        children = self._children(player, opponent, table_move)
+        if not children:
+            return 0, -1
+        head = children[:1] if table_move >= 0 else []
+        rest = children[len(head) :]
+        if depth >= 3:
+            # Deep nodes try the moves that look best one ply down first.
+            rest.sort(key=lambda child: evaluate(child[2], child[1]))
+        else:
+            history = self._history
+            rest.sort(key=lambda child: -history.get(child[0], 0))
+        best = -2 * WIN_SCORE
+        best_move = -1
+        for index, (move, mover, other) in enumerate(head + rest):
+            if index:
+                score = self._score_child(mover, other, depth - 1, alpha, alpha + 1)
+                if alpha < score < beta:
+                    score = self._score_child(mover, other, depth - 1, score, beta)
+            else:
+                score = self._score_child(mover, other, depth - 1, alpha, beta)
+            if score > best:
+                best, best_move = score, move
+                if score > alpha:
+                    alpha = score
+            if alpha >= beta:
+                self._history[move] = self._history.get(move, 0) + depth * depth
+                break
+        return best, best_move
+
+    def _horizon(self, player: int, opponent: int, beta: int) -> Tuple[int, int]:
+        """Return ``(value, best move)`` of a node whose children are scored statically.
+
+        Each of the eight turned positions is evaluated once; a placement
+        then only changes the lines of five through the marble's final cell,
+        so its score is the turned position's plus that difference.
+        """
+        empty = ~(player | opponent) & FULL
+        if not empty:
+            return 0, -1
+        last = not empty & (empty - 1)
+        weights = _LINE_WEIGHTS
+        best = -2 * WIN_SCORE
+        best_move = -1
+        for rotation in range(8):
+            quadrant = rotation >> 1
+            table = _ROTATED[rotation]
+            mask = ~QUADRANT_MASKS[quadrant]
+            own = player & mask | table[_quadrant_index(player, quadrant)]
+            other = opponent & mask | table[_quadrant_index(opponent, quadrant)]
+            own_five = has_five(own)
+            other_five = has_five(other)
+            base = evaluate(own, other)
+            moved = _MOVED[rotation]
+            cells = empty
+            while cells:
+                low = cells & -cells
+                cells ^= low
+                cell = low.bit_length() - 1
+                marble = moved[cell]
+                five = own_five
+                score = base
+                if marble & CENTRES:
+                    score += _CENTRE_WEIGHT
+                for line in _CELL_LINES[marble.bit_length() - 1]:
+                    theirs = other & line
+                    if theirs:
+                        if not own & line:
+                            score += weights[popcount(theirs)]
+                    else:
+                        count = popcount(own & line)
+                        if count == 4:
+                            five = True
+                        score += weights[count + 1] - weights[count]
+                if five:
+                    score = 0 if other_five else WIN_SCORE
+                elif other_five:
+                    score = -WIN_SCORE
+                elif last:
+                    score = 0
+                if score > best:
+                    best, best_move = score, cell * 8 + rotation
+                    if best >= beta:
+                        self._history[best_move] = self._history.get(best_move, 0) + 1
+                        return best, best_move
+        return best, best_move
+
+
+def _terminal_score(mover: int, other: int) -> Optional[int]:
+    """Score a finished game for the player who just moved, or None if it goes on."""
+    mover_five = has_five(mover)
+    other_five = has_five(other)
+    if mover_five:
+        return 0 if other_five else WIN_SCORE
+    if other_five:
+        return -WIN_SCORE
+    if mover | other == FULL:
+        return 0
+    return None
+
+
+__all__ = [
+    "CELLS",
+    "FULL",
+    "LINES",
+    "PentagoSearch",
+    "WIN_SCORE",
+    "apply_move",
+    "canonical_key",
+    "decode_move",
+    "encode_move",
+    "evaluate",
+    "from_board",
+    "has_five",
+    "rotate",
+]
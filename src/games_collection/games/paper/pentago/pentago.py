@@ -11,11 +11,13 @@ players achieve five-in-a-row on the same turn the game ends in a draw.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Literal, Optional, Sequence, Tuple, TypedDict
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, TypedDict
 
-from games_collection.core.ai_strategy import HeuristicStrategy
+from games_collection.core.ai_strategy import HeuristicStrategy, check_backend, difficulty_preset
 from games_collection.core.game_engine import GameEngine, GameState
 
+from . import bitboard
+
 Board = List[List[int]]
 RotationDirection = Literal["CW", "CCW"]
 
@@ -26,6 +28,14 @@ ROTATIONS = ("CW", "CCW")
 LINE_VECTORS = ((0, 1), (1, 0), (1, 1), (1, -1))
 CENTER_CELLS = ((2, 2), (2, 3), (3, 2), (3, 3))
 
+# Clockwise rotation moves each cell's marble one step backwards along these
+# cycles (a <- b <- c <- d <- a): the corners and the edges of each quadrant.
+_LOCAL_CYCLES = (((0, 0), (2, 0), (2, 2), (0, 2)), ((0, 1), (1, 0), (2, 1), (1, 2)))
+_QUADRANT_CYCLES = tuple(
+    tuple(tuple(((quadrant // 2) * QUADRANT_SIZE + row, (quadrant % 2) * QUADRANT_SIZE + column) for row, column in cycle) for cycle in _LOCAL_CYCLES)
+    for quadrant in QUADRANTS
+)
+
 
 class PentagoState(TypedDict):
     """Serializable representation of the current game state."""
@@ -45,6 +55,10 @@ class PentagoMove:
     direction: RotationDirection
 
 
+# (move, player, winner, state, winning players) for a pushed move.
+UndoRecord = Tuple[PentagoMove, int, Optional[int], GameState, set[int]]
+
+
 class PentagoGame(GameEngine[PentagoMove, int]):
     """Game engine implementation for Pentago."""
 
@@ -54,6 +68,7 @@ class PentagoGame(GameEngine[PentagoMove, int]):
         self._winner: Optional[int] = None
         self._state = GameState.NOT_STARTED
         self._winning_players: set[int] = set()
+        self._undo_stack: List[UndoRecord] = []
         self.reset()
 
     def reset(self) -> None:
@@ -62,8 +77,9 @@ class PentagoGame(GameEngine[PentagoMove, int]):
         self._board = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
         self._current_player = 1
         self._winner = None
-        self._winning_players.clear()
+        self._winning_players = set()
         self._state = GameState.IN_PROGRESS
+        self._undo_stack = []
 
     def is_game_over(self) -> bool:
         """Return whether the game has finished."""
@@ -103,24 +119,47 @@ class PentagoGame(GameEngine[PentagoMove, int]):
             return False
 
         self.apply_move_to_board(self._board, move, self._current_player)
+        self._settle_turn()
+        return True
+
+    def push_move(self, move: PentagoMove) -> None:
+        """Place and rotate in place for search, without validation."""
+
+        self._undo_stack.append((move, self._current_player, self._winner, self._state, self._winning_players))
+        self.apply_move_to_board(self._board, move, self._current_player)
+        self._settle_turn()
+
+    def pop_move(self) -> PentagoMove:
+        """Undo the most recent :meth:`push_move` by rotating back and lifting the marble."""
+
+        move, player, winner, state, winning_players = self._undo_stack.pop()
+        self._rotate_quadrant_on_board(self._board, move.quadrant, "CCW" if move.direction == "CW" else "CW")
+        self._board[move.row][move.column] = 0
+        self._current_player = player
+        self._winner = winner
+        self._state = state
+        self._winning_players = winning_players
+        return move
+
+    def _settle_turn(self) -> None:
+        """Finish the game on a win or full board, otherwise pass the turn."""
+
         winners = self._detect_winners_on_board(self._board)
+        # A fresh set each turn, so undo records keep the previous one intact.
+        self._winning_players = winners
         if winners:
             self._state = GameState.FINISHED
-            self._winning_players = set(winners)
             if len(winners) == 1:
                 self._winner = next(iter(winners))
             else:
                 self._winner = None
-            return True
+            return
         if self._is_board_full(self._board):
             self._state = GameState.FINISHED
             self._winner = None
-            self._winning_players.clear()
-            return True
+            return
 
-        self._winning_players.clear()
         self._current_player = 2 if self._current_player == 1 else 1
-        return True
 
     def get_winner(self) -> Optional[int]:
         """Return the winning player identifier if the game has a single winner."""
@@ -164,18 +203,15 @@ class PentagoGame(GameEngine[PentagoMove, int]):
 
     @staticmethod
     def _rotate_quadrant_on_board(board: Board, quadrant: int, direction: RotationDirection) -> None:
-        """Rotate a 3x3 quadrant either clockwise or counter-clockwise."""
+        """Rotate a 3x3 quadrant either clockwise or counter-clockwise, in place."""
 
-        row_offset = (quadrant // 2) * QUADRANT_SIZE
-        column_offset = (quadrant % 2) * QUADRANT_SIZE
-        quadrant_cells = [row[column_offset : column_offset + QUADRANT_SIZE] for row in board[row_offset : row_offset + QUADRANT_SIZE]]
-        if direction == "CW":
-            rotated = [[quadrant_cells[QUADRANT_SIZE - 1 - column][row] for column in range(QUADRANT_SIZE)] for row in range(QUADRANT_SIZE)]
-        else:
-            rotated = [[quadrant_cells[column][QUADRANT_SIZE - 1 - row] for column in range(QUADRANT_SIZE)] for row in range(QUADRANT_SIZE)]
-        for local_row in range(QUADRANT_SIZE):
-            for local_column in range(QUADRANT_SIZE):
-                board[row_offset + local_row][column_offset + local_column] = rotated[local_row][local_column]
+        clockwise = direction == "CW"
+        for (a_row, a_col), (b_row, b_col), (c_row, c_col), (d_row, d_col) in _QUADRANT_CYCLES[quadrant]:
+            a, b, c, d = board[a_row][a_col], board[b_row][b_col], board[c_row][c_col], board[d_row][d_col]
+            if clockwise:
+                board[a_row][a_col], board[b_row][b_col], board[c_row][c_col], board[d_row][d_col] = b, c, d, a
+            else:
+                board[a_row][a_col], board[b_row][b_col], board[c_row][c_col], board[d_row][d_col] = d, a, b, c
 
     @staticmethod
     def _detect_winners_on_board(board: Board) -> set[int]:
@@ -250,39 +286,90 @@ class PentagoGame(GameEngine[PentagoMove, int]):
         return maximum
 
 
-class PentagoAI:
-    """Heuristic based AI opponent that evaluates full Pentago turns."""
+# Search settings for each named difficulty, passed to :class:`PentagoAI`.
+PENTAGO_DIFFICULTIES: Dict[str, Dict[str, Any]] = {
+    "easy": {"depth": 1},
+    "medium": {"depth": 2},
+    "hard": {"depth": 3, "time_budget": 1.0},
+    "expert": {"depth": 4, "time_budget": 3.0},
+}
+
 
-    def __init__(self, player: int = 2) -> None:
+class PentagoAI:
+    """AI opponent that evaluates full Pentago turns.
+
+    Each turn is a placement plus a quadrant twist, and
+    :class:`~.bitboard.PentagoSearch` looks ``depth`` such turns ahead on
+    36-bit boards, sharing table entries between mirrored positions and
+    scoring leaves by open lines of five; ``time_budget`` caps it in seconds.
+    Pass ``backend="heuristic"`` for the original one-turn
+    :class:`HeuristicStrategy` over the engine's board.
+    """
+
+    def __init__(
+        self,
+        player: int = 2,
+        *,
+        depth: int = 3,
+        backend: str = "bitboard",
+        time_budget: Optional[float] = 1.0,
+    ) -> None:
+        check_backend(backend, ("bitboard", "heuristic"), "Pentago")
         self.player = player
+        self.depth = depth
+        self.backend = backend
+        self.time_budget = time_budget
         self._strategy = HeuristicStrategy(self._evaluate_move)
+        self._search = bitboard.PentagoSearch()
+
+    @classmethod
+    def for_difficulty(cls, difficulty: str, player: int = 2) -> "PentagoAI":
+        """Build an AI for ``player`` from a :data:`PENTAGO_DIFFICULTIES` entry.
+
+        Presets without a ``time_budget`` search to their full depth.
+        """
+        return cls(player, **{"time_budget": None, **difficulty_preset(PENTAGO_DIFFICULTIES, difficulty, "Pentago")})
 
     def choose_move(self, game: PentagoGame) -> PentagoMove:
         """Return the highest scoring move for the current game state."""
 
         valid_moves = game.get_valid_moves()
-        return self._strategy.select_move(valid_moves, game)
+        if self.backend == "heuristic" or not valid_moves:
+            return self._strategy.select_move(valid_moves, game)
+        own, other = bitboard.from_board(game.get_board_snapshot(), game.get_current_player())
+        move = self._search.best_move(own, other, self.depth, time_budget=self.time_budget)
+        if move is None:
+            return valid_moves[0]
+        row, column, quadrant, clockwise = bitboard.decode_move(move)
+        return PentagoMove(row=row, column=column, quadrant=quadrant, direction="CW" if clockwise else "CCW")
 
     def _evaluate_move(self, move: PentagoMove, game: PentagoGame) -> float:
-        """Return a heuristic score for the provided move."""
-
-        board_copy = game.get_board_snapshot()
-        PentagoGame.apply_move_to_board(board_copy, move, game.get_current_player())
-        winners = PentagoGame._detect_winners_on_board(board_copy)
-        opponent = 1 if self.player == 2 else 2
-        if self.player in winners and opponent not in winners:
-            return 1_000_000.0
-        if opponent in winners and self.player not in winners:
-            return -1_000_000.0
-        if len(winners) == 2:
-            return 5_000.0
-        if PentagoGame._is_board_full(board_copy):
-            return 0.0
-
-        my_longest = PentagoGame._max_line_length(board_copy, self.player)
-        opponent_longest = PentagoGame._max_line_length(board_copy, opponent)
-        centre_control = sum(1 for row, column in CENTER_CELLS if board_copy[row][column] == self.player)
-        return (my_longest - opponent_longest) * 100.0 + centre_control * 5.0
+        """Return a heuristic score for the provided move.
+
+        The move is played in place with ``push_move`` and undone afterwards,
+        so ``game`` is left unchanged.
+        """
+
+        game.push_move(move)
+        try:
+            board = game._board
+            winners = game._winning_players
+            opponent = 1 if self.player == 2 else 2
+            if self.player in winners and opponent not in winners:
+                return 1_000_000.0
+            if opponent in winners and self.player not in winners:
+                return -1_000_000.0
+            if len(winners) == 2:
+                return 5_000.0
+            if PentagoGame._is_board_full(board):
+                return 0.0
+
+            my_longest = PentagoGame._max_line_length(board, self.player)
+            opponent_longest = PentagoGame._max_line_length(board, opponent)
+            centre_control = sum(1 for row, column in CENTER_CELLS if board[row][column] == self.player)
+            return (my_longest - opponent_longest) * 100.0 + centre_control * 5.0
+        finally:
+            game.pop_move()
 
 
 class PentagoCLI:
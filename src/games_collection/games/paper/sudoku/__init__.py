@@ -1,7 +1,21 @@
-"""Sudoku puzzle generation and hint system."""
+"""Sudoku puzzle generation, grading and hint system."""
 
 from __future__ import annotations
 
+from .bank import PuzzleBank, load_puzzle_bank
+from .grading import GRADES, GradeReport, grade_puzzle
+from .solver import count_solutions, has_unique_solution, solve
 from .sudoku import SudokuGenerator, SudokuPuzzle
 
-__all__ = ["SudokuGenerator", "SudokuPuzzle"]
+__all__ = [
+    "GRADES",
+    "GradeReport",
+    "PuzzleBank",
+    "SudokuGenerator",
+    "SudokuPuzzle",
+    "count_solutions",
+    "grade_puzzle",
+    "has_unique_solution",
+    "load_puzzle_bank",
+    "solve",
+]
@@ -0,0 +1,153 @@
+"""Precomputed bank of graded Sudoku puzzles.
+
+Generating a puzzle of a given logical grade means carving and re-seeding
+boards until one lands on it, which can take a second or more for the harder
+grades. The challenge packs and the daily challenge serve puzzles from this
+bank instead, so nothing is generated while a player waits.
+
+The bank ships as ``resources/puzzle_bank.json``::
+
+    {
+      "version": 1,
+      "grades": {
+        "easy": [{"puzzle": "<81 digits>", "solution": "<81 digits>", "score": 36}, ...],
+        ...
+      }
+    }
+
+Boards are written row by row with ``0`` for empty cells, and each grade's
+puzzles are sorted by score. Regenerate the resource with::
+
+    python -m games_collection.games.paper.sudoku.bank --count 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .grading import GRADES, grade_puzzle
+from .sudoku import Grid, SudokuGenerator, SudokuPuzzle
+
+BANK_SIZE = 64
+
+_VERSION = 1
+
+RESOURCE_PATH = Path(__file__).resolve().parent / "resources" / "puzzle_bank.json"
+
+# One bank entry: {"puzzle": str, "solution": str, "score": int}.
+BankEntry = Dict[str, object]
+
+
+def _encode(grid: Grid) -> str:
+    return "".join(str(value) for row in grid for value in row)
+
+
+def _decode(text: str) -> Grid:
+    return [[int(text[row * 9 + column]) for column in range(9)] for row in range(9)]
+
+
+def build_bank(count: int = BANK_SIZE, *, seed: Optional[int] = None, workers: Optional[int] = None) -> Dict[str, List[BankEntry]]:
+    """Generate ``count`` puzzles of every grade, spread over ``workers`` processes."""
+    generator = SudokuGenerator(rng=random.Random(seed))
+    bank: Dict[str, List[BankEntry]] = {}
+    for grade in GRADES:
+        entries = []
+        for puzzle in generator.generate_batch(count, grade, workers=workers):
+            report = grade_puzzle(puzzle.starting_board, puzzle.solution)
+            entries.append({"puzzle": _encode(puzzle.starting_board), "solution": _encode(puzzle.solution), "score": report.score})
+        bank[grade] = sorted(entries, key=lambda entry: (entry["score"], entry["puzzle"]))
+    return bank
+
+
+def write_bank(bank: Dict[str, List[BankEntry]], path: Path = RESOURCE_PATH) -> None:
+    """Serialise a bank from :func:`build_bank` to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": _VERSION, "grades": bank}
+    path.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+
+
+class PuzzleBank:
+    """Read-only view over a graded puzzle bank file."""
+
+    def __init__(self, path: Path = RESOURCE_PATH) -> None:
+        """Load ``path`` and validate its version.
+
+        Raises:
+            ValueError: If the file is not a puzzle bank.
+        """
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path} is not a puzzle bank") from exc
+        if not isinstance(payload, dict) or payload.get("version") != _VERSION or not isinstance(payload.get("grades"), dict):
+            raise ValueError(f"{path} is not a version {_VERSION} puzzle bank")
+        self._grades: Dict[str, List[BankEntry]] = payload["grades"]
+
+    @property
+    def grades(self) -> List[str]:
+        """Return the grades the bank holds puzzles for, easiest first."""
+        return [grade for grade in GRADES if self._grades.get(grade)]
+
+    def count(self, grade: str) -> int:
+        """Return how many puzzles of ``grade`` the bank holds."""
+        return len(self._grades.get(grade.lower(), ()))
+
+    def score(self, grade: str, index: int) -> int:
+        """Return the grading score of a puzzle, see :meth:`puzzle` for ``index``."""
+        return int(self._entry(grade, index)["score"])
+
+    def puzzle(self, grade: str, index: int) -> SudokuPuzzle:
+        """Return puzzle ``index`` of ``grade``; indexes wrap round the bank.
+
+        Raises:
+            ValueError: If the bank has no puzzles of ``grade``.
+        """
+        entry = self._entry(grade, index)
+        return SudokuPuzzle(starting_board=_decode(str(entry["puzzle"])), solution=_decode(str(entry["solution"])), difficulty=grade.lower())
+
+    def _entry(self, grade: str, index: int) -> BankEntry:
+        entries = self._grades.get(grade.lower())
+        if not entries:
+            raise ValueError(f"Unknown difficulty level: {grade}")
+        return entries[index % len(entries)]
+
+
+_DEFAULT_BANK: Optional[PuzzleBank] = None
+_DEFAULT_LOADED = False
+
+
+def load_puzzle_bank() -> Optional[PuzzleBank]:
+    """Return the shared bank bundled with the package, or ``None`` if missing."""
+    global _DEFAULT_BANK, _DEFAULT_LOADED
+    if not _DEFAULT_LOADED:
+        _DEFAULT_LOADED = True
+        try:
+            _DEFAULT_BANK = PuzzleBank()
+        except (OSError, ValueError):
+            _DEFAULT_BANK = None
+    return _DEFAULT_BANK
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover - offline tool
+    """Regenerate the bundled puzzle bank."""
+    parser = argparse.ArgumentParser(description="Generate the graded Sudoku puzzle bank resource.")
+    parser.add_argument("--count", type=int, default=BANK_SIZE, help="Puzzles to generate per grade.")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to the CPU count).")
+    parser.add_argument("--output", type=Path, default=RESOURCE_PATH)
+    args = parser.parse_args(argv)
+
+    bank = build_bank(args.count, seed=args.seed, workers=args.workers)
+    write_bank(bank, args.output)
+    print(f"Wrote {args.count} puzzles for each of {len(bank)} grades to {args.output}")
+
+
+__all__ = ["BANK_SIZE", "PuzzleBank", "build_bank", "load_puzzle_bank", "write_bank"]
+
+
+if __name__ == "__main__":  # pragma: no cover - script entry point
+    main()
@@ -0,0 +1,305 @@
+"""Human-style Sudoku solving and difficulty grading.
+
+:func:`grade_puzzle` solves a puzzle the way a person would, always reaching
+for the cheapest technique that makes progress: singles first, then pointing
+and box/line reductions, naked and hidden pairs and triples, X-wings,
+XY-wings and swordfish. When none applies it falls back to trial and error,
+placing the known solution digit in the cell with the fewest candidates.
+
+Every step is recorded in a trace. The score adds up the cost of each step,
+and the grade is set by the hardest technique the solve needed, so two
+"hard" puzzles need the same kind of insight rather than merely having the
+same number of givens.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .solver import solve
+
+GRADES = ("easy", "medium", "hard", "expert")
+
+# Technique name -> (cost per application, grade it implies), cheapest first.
+TECHNIQUES: Dict[str, Tuple[int, str]] = {
+    "naked_single": (1, "easy"),
+    "hidden_single": (2, "easy"),
+    "pointing": (10, "medium"),
+    "box_line": (12, "medium"),
+    "naked_pair": (15, "medium"),
+    "hidden_pair": (20, "medium"),
+    "naked_triple": (30, "hard"),
+    "hidden_triple": (35, "hard"),
+    "x_wing": (40, "hard"),
+    "xy_wing": (50, "hard"),
+    "swordfish": (60, "expert"),
+    "trial": (100, "expert"),
+}
+
+_FULL = 0x1FF
+_ROWS = [[row * 9 + column for column in range(9)] for row in range(9)]
+_COLUMNS = [[row * 9 + column for row in range(9)] for column in range(9)]
+_BOXES = [[(box // 3 * 3 + offset // 3) * 9 + box % 3 * 3 + offset % 3 for offset in range(9)] for box in range(9)]
+_UNITS = _ROWS + _COLUMNS + _BOXES
+_BOX_OF = [cell // 27 * 3 + cell % 9 // 3 for cell in range(81)]
+_PEERS = [frozenset(other for unit in (_ROWS[cell // 9], _COLUMNS[cell % 9], _BOXES[_BOX_OF[cell]]) for other in unit if other != cell) for cell in range(81)]
+_POPCOUNT = [bin(mask).count("1") for mask in range(_FULL + 1)]
+
+# A cell and digit: (row, column, value).
+Placement = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class TechniqueStep:
+    """One deduction in a logical solve.
+
+    Attributes:
+        technique: Key of :data:`TECHNIQUES` that was applied.
+        placed: Digit placed by the step, if any.
+        eliminated: Candidates the step ruled out.
+    """
+
+    technique: str
+    placed: Optional[Placement] = None
+    eliminated: Tuple[Placement, ...] = ()
+
+
+@dataclass(frozen=True)
+class GradeReport:
+    """Outcome of :func:`grade_puzzle`.
+
+    Attributes:
+        grade: One of :data:`GRADES`.
+        score: Sum of the cost of every step.
+        hardest: The most expensive technique used.
+        trace: Every step in the order it was applied.
+    """
+
+    grade: str
+    score: int
+    hardest: str
+    trace: Tuple[TechniqueStep, ...]
+
+    @property
+    def needs_trial(self) -> bool:
+        """Return True if the logical techniques alone could not finish the puzzle."""
+        return any(step.technique == "trial" for step in self.trace)
+
+
+def _digits(mask: int) -> List[int]:
+    return [digit for digit in range(1, 10) if mask >> (digit - 1) & 1]
+
+
+def _placement(cell: int, digit: int) -> Placement:
+    return cell // 9, cell % 9, digit
+
+
+class _LogicalSolver:
+    """Candidate grid that applies one technique at a time."""
+
+    def __init__(self, digits: Sequence[int], solution: Sequence[int]) -> None:
+        self.values = [0] * 81
+        self.candidates = [_FULL] * 81
+        self.solution = solution
+        for cell, digit in enumerate(digits):
+            if digit:
+                self._place(cell, digit)
+
+    def _place(self, cell: int, digit: int) -> None:
+        bit = 1 << (digit - 1)
+        self.values[cell] = digit
+        self.candidates[cell] = 0
+        for peer in _PEERS[cell]:
+            self.candidates[peer] &= ~bit
+
+    def _eliminate(self, technique: str, removals: Sequence[Tuple[int, int]]) -> Optional[TechniqueStep]:
+        """Remove ``(cell, bit)`` candidates, returning a step only if any were present."""
+        removed = []
+        for cell, bit in removals:
+            if self.candidates[cell] & bit:
+                self.candidates[cell] &= ~bit
+                removed.append(_placement(cell, bit.bit_length()))
+        if not removed:
+            return None
+        return TechniqueStep(technique, eliminated=tuple(sorted(set(removed))))
+
+    def solved(self) -> bool:
+        return all(self.values)
+
+    def step(self) -> TechniqueStep:
+        """Apply the cheapest technique that makes progress."""
+        for technique in (
+            self._naked_single,
+            self._hidden_single,
+            self._pointing,
+            self._box_line,
+            lambda: self._naked_subset(2, "naked_pair"),
+            lambda: self._hidden_subset(2, "hidden_pair"),
+            lambda: self._naked_subset(3, "naked_triple"),
+            lambda: self._hidden_subset(3, "hidden_triple"),
+            lambda: self._fish(2, "x_wing"),
+            self._xy_wing,
+            lambda: self._fish(3, "swordfish"),
+        ):
+            found = technique()
+            if found is not None:
+                return found
+        return self._trial()
+
+    def _naked_single(self) -> Optional[TechniqueStep]:
+        for cell in range(81):
+            mask = self.candidates[cell]
+            if not self.values[cell] and _POPCOUNT[mask] == 1:
+                digit = mask.bit_length()
+                self._place(cell, digit)
+                return TechniqueStep("naked_single", placed=_placement(cell, digit))
+        return None
+
+    def _hidden_single(self) -> Optional[TechniqueStep]:
+        for unit in _UNITS:
+            for digit in range(1, 10):
+                bit = 1 << (digit - 1)
+                cells = [cell for cell in unit if self.candidates[cell] & bit]
+                if len(cells) == 1:
+                    self._place(cells[0], digit)
+                    return TechniqueStep("hidden_single", placed=_placement(cells[0], digit))
+        return None
+
+    def _pointing(self) -> Optional[TechniqueStep]:
+        """A digit confined to one line inside a box leaves the rest of that line."""
+        for box in _BOXES:
+            for digit in range(1, 10):
+                bit = 1 << (digit - 1)
+                cells = [cell for cell in box if self.candidates[cell] & bit]
+                if len(cells) < 2:
+                    continue
+                for lines, index in ((_ROWS, lambda cell: cell // 9), (_COLUMNS, lambda cell: cell % 9)):
+                    if len({index(cell) for cell in cells}) == 1:
+                        line = lines[index(cells[0])]
+                        step = self._eliminate("pointing", [(cell, bit) for cell in line if cell not in box])
+                        if step is not None:
+                            return step
+        return None
+
+    def _box_line(self) -> Optional[TechniqueStep]:
+        """A digit confined to one box inside a line leaves the rest of that box."""
+        for line in _ROWS + _COLUMNS:
+            for digit in range(1, 10):
+                bit = 1 << (digit - 1)
+                cells = [cell for cell in line if self.candidates[cell] & bit]
+                if len(cells) < 2 or len({_BOX_OF[cell] for cell in cells}) != 1:
+                    continue
+                box = _BOXES[_BOX_OF[cells[0]]]
+                step = self._eliminate("box_line", [(cell, bit) for cell in box if cell not in line])
+                if step is not None:
+                    return step
+        return None
+
+    def _naked_subset(self, size: int, technique: str) -> Optional[TechniqueStep]:
+        """``size`` cells of a unit sharing ``size`` candidates own those digits."""
+        for unit in _UNITS:
+            open_cells = [cell for cell in unit if 2 <= _POPCOUNT[self.candidates[cell]] <= size]
+            for group in combinations(open_cells, size):
+                mask = 0
+                for cell in group:
+                    mask |= self.candidates[cell]
+                if _POPCOUNT[mask] != size:
+                    continue
+                removals = [(cell, bit) for cell in unit if cell not in group for bit in (1 << (d - 1) for d in _digits(mask))]
+                step = self._eliminate(technique, removals)
+                if step is not None:
+                    return step
+        return None
+
+    def _hidden_subset(self, size: int, technique: str) -> Optional[TechniqueStep]:
+        """``size`` digits confined to ``size`` cells of a unit clear those cells of other digits."""
+        for unit in _UNITS:
+            places = {}
+            for digit in range(1, 10):
+                bit = 1 << (digit - 1)
+                cells = frozenset(cell for cell in unit if self.candidates[cell] & bit)
+                if 2 <= len(cells) <= size:
+                    places[digit] = cells
+            for group in combinations(sorted(places), size):
+                cells = frozenset().union(*(places[digit] for digit in group))
+                if len(cells) != size:
+                    continue
+                keep = sum(1 << (digit - 1) for digit in group)
+                removals = [(cell, bit) for cell in cells for bit in (1 << (d - 1) for d in _digits(self.candidates[cell] & ~keep))]
+                step = self._eliminate(technique, removals)
+                if step is not None:
+                    return step
+        return None
+
+    def _fish(self, size: int, technique: str) -> Optional[TechniqueStep]:
+        """A digit confined to ``size`` columns across ``size`` rows leaves those columns elsewhere (and transposed)."""
+        for bases, covers in ((_ROWS, _COLUMNS), (_COLUMNS, _ROWS)):
+            for digit in range(1, 10):
+                bit = 1 << (digit - 1)
+                spots = {}
+                for index, base in enumerate(bases):
+                    positions = frozenset(offset for offset, cell in enumerate(base) if self.candidates[cell] & bit)
+                    if 2 <= len(positions) <= size:
+                        spots[index] = positions
+                for group in combinations(sorted(spots), size):
+                    positions = frozenset().union(*(spots[index] for index in group))
+                    if len(positions) != size:
+                        continue
+                    removals = [(cell, bit) for offset in positions for index, cell in enumerate(covers[offset]) if index not in group]
+                    step = self._eliminate(technique, removals)
+                    if step is not None:
+                        return step
+        return None
+
+    def _xy_wing(self) -> Optional[TechniqueStep]:
+        """A pivot {a, b} seeing pincers {a, c} and {b, c} clears c from cells seeing both pincers."""
+        pairs = [cell for cell in range(81) if _POPCOUNT[self.candidates[cell]] == 2]
+        for pivot in pairs:
+            pivot_mask = self.candidates[pivot]
+            wings = [cell for cell in pairs if cell in _PEERS[pivot] and _POPCOUNT[self.candidates[cell] & pivot_mask] == 1]
+            for first, second in combinations(wings, 2):
+                first_mask, second_mask = self.candidates[first], self.candidates[second]
+                shared = first_mask & second_mask & ~pivot_mask
+                if not shared or (first_mask | second_mask) & pivot_mask != pivot_mask or first_mask == second_mask:
+                    continue
+                targets = (_PEERS[first] & _PEERS[second]) - {pivot}
+                step = self._eliminate("xy_wing", [(cell, shared) for cell in targets])
+                if step is not None:
+                    return step
+        return None
+
+    def _trial(self) -> TechniqueStep:
+        """Place the solution digit in the cell with the fewest candidates."""
+        cell = min((cell for cell in range(81) if not self.values[cell]), key=lambda cell: _POPCOUNT[self.candidates[cell]])
+        digit = self.solution[cell]
+        self._place(cell, digit)
+        return TechniqueStep("trial", placed=_placement(cell, digit))
+
+
+def grade_puzzle(grid: Sequence[Sequence[int]], solution: Optional[Sequence[Sequence[int]]] = None) -> GradeReport:
+    """Solve ``grid`` with human techniques and grade it.
+
+    Args:
+        grid: Nine rows of nine digits, 0 marking an empty cell.
+        solution: The puzzle's solution, computed when omitted; trial steps
+            place its digits.
+
+    Raises:
+        ValueError: If the puzzle has no solution.
+    """
+    if solution is None:
+        solution = solve(grid)
+        if solution is None:
+            raise ValueError("Cannot grade a puzzle without a solution")
+    solver = _LogicalSolver([value for row in grid for value in row], [value for row in solution for value in row])
+    trace: List[TechniqueStep] = []
+    while not solver.solved():
+        trace.append(solver.step())
+    score = sum(TECHNIQUES[step.technique][0] for step in trace)
+    hardest = max((step.technique for step in trace), key=lambda name: TECHNIQUES[name][0], default="naked_single")
+    return GradeReport(grade=TECHNIQUES[hardest][1], score=score, hardest=hardest, trace=tuple(trace))
+
+
+__all__ = ["GRADES", "TECHNIQUES", "GradeReport", "TechniqueStep", "grade_puzzle"]
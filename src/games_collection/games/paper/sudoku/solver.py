@@ -0,0 +1,311 @@
+"""Fast Sudoku solving and solution counting.
+
+Two engines sit behind :func:`count_solutions`:
+
+- ``"bitmask"`` (the default) keeps a 9-bit mask of the digits used by every
+  row, column and box, so a cell's candidates are one ``OR`` away. It fills
+  naked and hidden singles until nothing more is forced, then branches on the
+  empty cell with the fewest candidates (minimum remaining values).
+- ``"dlx"`` casts the grid as an exact-cover problem, 729 placements against
+  324 constraints (each cell filled, each row, column and box holding each
+  digit once), and runs Knuth's Algorithm X. The dancing links are replaced by
+  dictionaries of sets, which give the same cover and uncover operations
+  without a node per matrix entry.
+
+Counting stops as soon as ``limit`` solutions are found, so uniqueness checks
+cost at most one extra solution.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+Grid = List[List[int]]
+
+SIZE = 9
+CELLS = SIZE * SIZE
+METHODS = ("bitmask", "dlx")
+
+_FULL = (1 << SIZE) - 1
+_ROW = [cell // SIZE for cell in range(CELLS)]
+_COLUMN = [cell % SIZE for cell in range(CELLS)]
+_BOX = [(cell // 27) * 3 + (cell % SIZE) // 3 for cell in range(CELLS)]
+_UNITS = (
+    [[cell for cell in range(CELLS) if _ROW[cell] == index] for index in range(SIZE)]
+    + [[cell for cell in range(CELLS) if _COLUMN[cell] == index] for index in range(SIZE)]
+    + [[cell for cell in range(CELLS) if _BOX[cell] == index] for index in range(SIZE)]
+)
+_POPCOUNT = [bin(mask).count("1") for mask in range(_FULL + 1)]
+_DIGIT = {1 << (digit - 1): digit for digit in range(1, SIZE + 1)}
+
+
+def _flatten(grid: Sequence[Sequence[int]]) -> List[int]:
+    """Return ``grid`` as 81 digits, 0 for empty cells."""
+    if len(grid) != SIZE or any(len(row) != SIZE for row in grid):
+        raise ValueError("Sudoku grids must be 9x9")
+    cells = [value for row in grid for value in row]
+    if any(not 0 <= value <= SIZE for value in cells):
+        raise ValueError("Sudoku cells must hold 0 (empty) or a digit from 1 to 9")
+    return cells
+
+
+def _unflatten(cells: Sequence[int]) -> Grid:
+    return [list(cells[row * SIZE : (row + 1) * SIZE]) for row in range(SIZE)]
+
+
+class _BitmaskSearch:
+    """Depth-first search over candidate bitmasks with singles propagation."""
+
+    def __init__(self, digits: Sequence[int]) -> None:
+        self.cells = [0] * CELLS
+        self.rows = [0] * SIZE
+        self.columns = [0] * SIZE
+        self.boxes = [0] * SIZE
+        self.empty: Set[int] = set()
+        self.valid = True
+        self.solutions: List[List[int]] = []
+        self._branch = -1
+        for cell, digit in enumerate(digits):
+            if not digit:
+                self.empty.add(cell)
+                continue
+            bit = 1 << (digit - 1)
+            if bit & (self.rows[_ROW[cell]] | self.columns[_COLUMN[cell]] | self.boxes[_BOX[cell]]):
+                self.valid = False
+            self._place(cell, bit)
+
+    def count(self, limit: int, keep: int) -> int:
+        """Return the number of solutions up to ``limit``, recording the first ``keep``."""
+        if not self.valid:
+            return 0
+        trail: List[int] = []
+        found = 0
+        if self._propagate(trail):
+            cell = self._branch
+            if cell < 0:
+                found = 1
+                if len(self.solutions) < keep:
+                    self.solutions.append([_DIGIT[bit] for bit in self.cells])
+            else:
+                mask = self._candidates(cell)
+                while mask and found < limit:
+                    bit = mask & -mask
+                    mask ^= bit
+                    self._place(cell, bit)
+                    found += self.count(limit - found, keep)
+                    self._remove(cell)
+        for cell in reversed(trail):
+            self._remove(cell)
+        return found
+
+    def _candidates(self, cell: int) -> int:
+        return ~(self.rows[_ROW[cell]] | self.columns[_COLUMN[cell]] | self.boxes[_BOX[cell]]) & _FULL
+
+    def _place(self, cell: int, bit: int) -> None:
+        self.cells[cell] = bit
+        self.rows[_ROW[cell]] |= bit
+        self.columns[_COLUMN[cell]] |= bit
+        self.boxes[_BOX[cell]] |= bit
+        self.empty.discard(cell)
+
+    def _remove(self, cell: int) -> None:
+        bit = self.cells[cell]
+        self.cells[cell] = 0
+        self.rows[_ROW[cell]] ^= bit
+        self.columns[_COLUMN[cell]] ^= bit
+        self.boxes[_BOX[cell]] ^= bit
+        self.empty.add(cell)
+
+    def _propagate(self, trail: List[int]) -> bool:
+        """Place forced digits until none are left.
+
+        Returns False on a contradiction. Otherwise ``_branch`` is left at the
+        empty cell with the fewest candidates, or -1 once the grid is full.
+        Every placement is pushed onto ``trail`` for the caller to undo.
+        """
+        while True:
+            forced: List[Tuple[int, int]] = []
+            best_cell = -1
+            best_count = SIZE + 1
+            for cell in self.empty:
+                mask = self._candidates(cell)
+                count = _POPCOUNT[mask]
+                if count == 0:
+                    return False
+                if count == 1:
+                    forced.append((cell, mask))
+                elif count < best_count:
+                    best_cell, best_count = cell, count
+            if not forced and best_cell >= 0:
+                hidden = self._hidden_singles(forced)
+                if hidden is None:
+                    return False
+            if not forced:
+                self._branch = best_cell
+                return True
+            for cell, bit in forced:
+                if self.cells[cell]:
+                    if self.cells[cell] != bit:
+                        return False
+                    continue
+                if not bit & self._candidates(cell):
+                    return False
+                self._place(cell, bit)
+                trail.append(cell)
+
+    def _hidden_singles(self, forced: List[Tuple[int, int]]) -> Optional[int]:
+        """Append digits with one possible cell in a unit to ``forced``; ``None`` on a contradiction."""
+        cells = self.cells
+        for unit in _UNITS:
+            once = twice = placed = 0
+            for cell in unit:
+                if cells[cell]:
+                    placed |= cells[cell]
+                else:
+                    mask = self._candidates(cell)
+                    twice |= once & mask
+                    once |= mask
+            if (once | placed) != _FULL:
+                return None
+            single = once & ~twice
+            if not single:
+                continue
+            for cell in unit:
+                if not cells[cell]:
+                    mask = self._candidates(cell) & single
+                    if mask & (mask - 1):
+                        return None
+                    if mask:
+                        forced.append((cell, mask))
+        return len(forced)
+
+
+def _exact_cover(digits: Sequence[int]) -> Tuple[Dict[Tuple, Set[Tuple[int, int]]], Dict[Tuple[int, int], List[Tuple]], List[Tuple[int, int]]]:
+    """Return the constraint columns, placement rows and given placements of a grid."""
+    rows: Dict[Tuple[int, int], List[Tuple]] = {}
+    for cell in range(CELLS):
+        for digit in range(1, SIZE + 1):
+            rows[(cell, digit)] = [
+                ("cell", cell),
+                ("row", _ROW[cell], digit),
+                ("column", _COLUMN[cell], digit),
+                ("box", _BOX[cell], digit),
+            ]
+    columns: Dict[Tuple, Set[Tuple[int, int]]] = {}
+    for placement, constraints in rows.items():
+        for constraint in constraints:
+            columns.setdefault(constraint, set()).add(placement)
+    givens = [(cell, digit) for cell, digit in enumerate(digits) if digit]
+    return columns, rows, givens
+
+
+def _cover(columns: Dict[Tuple, Set[Tuple[int, int]]], rows: Dict[Tuple[int, int], List[Tuple]], placement: Tuple[int, int]) -> List[Set[Tuple[int, int]]]:
+    """Choose ``placement``: remove its constraints and every placement clashing with it."""
+    removed = []
+    for constraint in rows[placement]:
+        for other in columns[constraint]:
+            for other_constraint in rows[other]:
+                if other_constraint != constraint:
+                    columns[other_constraint].remove(other)
+        removed.append(columns.pop(constraint))
+    return removed
+
+
+def _uncover(
+    columns: Dict[Tuple, Set[Tuple[int, int]]],
+    rows: Dict[Tuple[int, int], List[Tuple]],
+    placement: Tuple[int, int],
+    removed: List[Set[Tuple[int, int]]],
+) -> None:
+    """Undo :func:`_cover`."""
+    for constraint in reversed(rows[placement]):
+        columns[constraint] = removed.pop()
+        for other in columns[constraint]:
+            for other_constraint in rows[other]:
+                if other_constraint != constraint:
+                    columns[other_constraint].add(other)
+
+
+def _algorithm_x(
+    columns: Dict[Tuple, Set[Tuple[int, int]]],
+    rows: Dict[Tuple[int, int], List[Tuple]],
+    chosen: List[Tuple[int, int]],
+    limit: int,
+    solutions: List[List[Tuple[int, int]]],
+    keep: int,
+) -> int:
+    """Count exact covers up to ``limit``, recording the first ``keep``."""
+    if not columns:
+        if len(solutions) < keep:
+            solutions.append(list(chosen))
+        return 1
+    constraint = min(columns, key=lambda key: len(columns[key]))
+    found = 0
+    for placement in list(columns[constraint]):
+        chosen.append(placement)
+        removed = _cover(columns, rows, placement)
+        found += _algorithm_x(columns, rows, chosen, limit - found, solutions, keep)
+        _uncover(columns, rows, placement, removed)
+        chosen.pop()
+        if found >= limit:
+            break
+    return found
+
+
+def _count_dlx(digits: Sequence[int], limit: int, keep: int) -> Tuple[int, List[List[int]]]:
+    columns, rows, givens = _exact_cover(digits)
+    for placement in givens:
+        if any(constraint not in columns or placement not in columns[constraint] for constraint in rows[placement]):
+            return 0, []
+        _cover(columns, rows, placement)
+    covers: List[List[Tuple[int, int]]] = []
+    found = _algorithm_x(columns, rows, [], limit, covers, keep)
+    solutions = []
+    for cover in covers:
+        cells = list(digits)
+        for cell, digit in cover:
+            cells[cell] = digit
+        solutions.append(cells)
+    return found, solutions
+
+
+def _count(grid: Sequence[Sequence[int]], limit: int, method: str, keep: int) -> Tuple[int, List[List[int]]]:
+    if method not in METHODS:
+        raise ValueError(f"Unknown solver method: {method}")
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, not {limit}")
+    digits = _flatten(grid)
+    if method == "dlx":
+        return _count_dlx(digits, limit, keep)
+    search = _BitmaskSearch(digits)
+    found = search.count(limit, keep)
+    return found, search.solutions
+
+
+def count_solutions(grid: Sequence[Sequence[int]], limit: int = 2, *, method: str = "bitmask") -> int:
+    """Return how many solutions ``grid`` has, counting no further than ``limit``.
+
+    Args:
+        grid: Nine rows of nine digits, 0 marking an empty cell.
+        limit: Stop once this many solutions are found.
+        method: ``"bitmask"`` for candidate propagation or ``"dlx"`` for
+            Algorithm X over the exact-cover matrix.
+
+    Raises:
+        ValueError: If the grid is not 9x9 or ``method`` is unknown.
+    """
+    return _count(grid, limit, method, 0)[0]
+
+
+def has_unique_solution(grid: Sequence[Sequence[int]], *, method: str = "bitmask") -> bool:
+    """Return True if ``grid`` has exactly one solution."""
+    return count_solutions(grid, 2, method=method) == 1
+
+
+def solve(grid: Sequence[Sequence[int]], *, method: str = "bitmask") -> Optional[Grid]:
+    """Return a solution of ``grid``, or ``None`` if it has none."""
+    _, solutions = _count(grid, 1, method, 1)
+    return _unflatten(solutions[0]) if solutions else None
+
+
+__all__ = ["METHODS", "count_solutions", "has_unique_solution", "solve"]
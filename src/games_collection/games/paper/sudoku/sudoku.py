@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Generator, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .grading import GRADES, grade_puzzle
+from .solver import has_unique_solution
 
 Grid = List[List[int]]
 
@@ -84,15 +89,58 @@ class SudokuGenerator:
             "expert": 58,
         }
 
-    def generate(self, difficulty: str = "medium") -> SudokuPuzzle:
-        """Generate a Sudoku puzzle for the requested difficulty."""
+    def generate(self, difficulty: str = "medium", *, graded: bool = True, max_attempts: int = 500) -> SudokuPuzzle:
+        """Generate a Sudoku puzzle for the requested difficulty.
+
+        With ``graded`` the difficulty is the puzzle's logical grade (see
+        :func:`~.grading.grade_puzzle`): cells are carved while the solution
+        stays unique and the grade stays at or below the target, and boards
+        that never reach it are discarded for fresh ones. Without it the
+        difficulty only sets how many cells are removed.
+
+        Raises:
+            ValueError: If ``difficulty`` is unknown.
+            RuntimeError: If no board reaches the grade within ``max_attempts``.
+        """
+
+        difficulty_key = difficulty.lower()
+        if difficulty_key not in self._difficulty_map:
+            raise ValueError(f"Unknown difficulty level: {difficulty}")
+        if not graded:
+            solution = self._create_complete_board()
+            puzzle_board = self._carve_puzzle([row[:] for row in solution], self._difficulty_map[difficulty_key])
+            return SudokuPuzzle(starting_board=puzzle_board, solution=solution, difficulty=difficulty_key)
+        for _ in range(max_attempts):
+            solution = self._create_complete_board()
+            puzzle_board = self._carve_graded(solution, difficulty_key)
+            if puzzle_board is not None:
+                return SudokuPuzzle(starting_board=puzzle_board, solution=solution, difficulty=difficulty_key)
+        raise RuntimeError(f"No {difficulty_key} puzzle found in {max_attempts} attempts")
+
+    def generate_batch(
+        self,
+        count: int,
+        difficulty: str = "medium",
+        *,
+        workers: Optional[int] = None,
+        graded: bool = True,
+    ) -> List[SudokuPuzzle]:
+        """Generate ``count`` puzzles, spread over ``workers`` processes.
+
+        Each puzzle is generated from its own seed drawn from :attr:`rng`, so
+        a seeded generator returns the same batch whatever the worker count.
+        ``workers`` defaults to the CPU count; 1 generates in this process.
+        """
 
         difficulty_key = difficulty.lower()
         if difficulty_key not in self._difficulty_map:
             raise ValueError(f"Unknown difficulty level: {difficulty}")
-        solution = self._create_complete_board()
-        puzzle_board = self._carve_puzzle([row[:] for row in solution], self._difficulty_map[difficulty_key])
-        return SudokuPuzzle(starting_board=puzzle_board, solution=solution, difficulty=difficulty_key)
+        seeds = [self.rng.randrange(2**32) for _ in range(count)]
+        workers = min(count, workers if workers is not None else os.cpu_count() or 1)
+        if workers <= 1:
+            return [_generate_seeded(seed, difficulty_key, graded) for seed in seeds]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_generate_seeded, seeds, [difficulty_key] * count, [graded] * count))
 
     def _create_complete_board(self) -> Grid:
         base = 3
@@ -153,45 +201,43 @@ class SudokuGenerator:
             removed += 1
         return board
 
+    def _carve_graded(self, solution: Grid, grade: str) -> Optional[Grid]:
+        """Carve ``solution`` towards ``grade``, returning ``None`` if the grade is never reached."""
+
+        target = GRADES.index(grade)
+        board = [row[:] for row in solution]
+        positions = [(row, column) for row in range(9) for column in range(9)]
+        self.rng.shuffle(positions)
+        removed = 0
+        reached = False
+        for row, column in positions:
+            backup = board[row][column]
+            board[row][column] = 0
+            if not self._has_unique_solution(board):
+                board[row][column] = backup
+                continue
+            if target < len(GRADES) - 1:
+                # The hardest grade has no ceiling, so it is only checked once carving is done.
+                current = GRADES.index(grade_puzzle(board, solution).grade)
+                if current > target:
+                    board[row][column] = backup
+                    continue
+                reached = current == target
+            removed += 1
+            if reached and removed >= self._difficulty_map[grade]:
+                break
+        if not reached and grade_puzzle(board, solution).grade != grade:
+            return None
+        return board
+
     def _has_unique_solution(self, board: Grid) -> bool:
-        solutions_found = 0
-        for _ in self._solve_generator(board):
-            solutions_found += 1
-            if solutions_found > 1:
-                return False
-        return solutions_found == 1
-
-    def _solve_generator(self, board: Grid) -> Generator[Grid, None, None]:
-        empty = self._find_empty(board)
-        if empty is None:
-            yield [row[:] for row in board]
-            return
-        row, column = empty
-        for value in range(1, 10):
-            if self._is_valid(board, row, column, value):
-                board[row][column] = value
-                yield from self._solve_generator(board)
-                board[row][column] = 0
-
-    def _find_empty(self, board: Grid) -> Optional[Tuple[int, int]]:
-        for row in range(9):
-            for column in range(9):
-                if board[row][column] == 0:
-                    return row, column
-        return None
+        return has_unique_solution(board)
 
-    def _is_valid(self, board: Grid, row: int, column: int, value: int) -> bool:
-        if any(board[row][index] == value for index in range(9)):
-            return False
-        if any(board[index][column] == value for index in range(9)):
-            return False
-        start_row = (row // 3) * 3
-        start_column = (column // 3) * 3
-        for r in range(start_row, start_row + 3):
-            for c in range(start_column, start_column + 3):
-                if board[r][c] == value:
-                    return False
-        return True
+
+def _generate_seeded(seed: int, difficulty: str, graded: bool) -> SudokuPuzzle:
+    """Generate one puzzle from its own seed; runs in :meth:`SudokuGenerator.generate_batch` workers."""
+
+    return SudokuGenerator(rng=random.Random(seed)).generate(difficulty, graded=graded)
 
 
 class SudokuCLI:
@@ -6,6 +6,7 @@ both the game engine and the CLI.
 """
 
 from .cli import play
+from .solver import TicTacToeSolver
 from .tic_tac_toe import COORDINATES, INDEX_TO_COORD, TicTacToeGame
 
-__all__ = ["TicTacToeGame", "COORDINATES", "INDEX_TO_COORD", "play"]
+__all__ = ["TicTacToeGame", "COORDINATES", "INDEX_TO_COORD", "play", "TicTacToeSolver"]
@@ -27,6 +27,7 @@ from typing import Dict, List
 
 from games_collection.core.profile_service import get_profile_service
 
+from .solver import DEFAULT_CACHE_DIR
 from .stats import GameStats
 from .themes import get_theme, list_themes
 from .tic_tac_toe import TicTacToeGame
@@ -112,6 +113,7 @@ def play() -> None:
         starting_symbol=starting_symbol,
         board_size=board_size,
         win_length=win_length,
+        solver_cache_dir=DEFAULT_CACHE_DIR,
     )
 
     session = profile_service.start_session("tic_tac_toe")
@@ -0,0 +1,326 @@
+"""Memoized tic-tac-toe solver with symmetry-reduced position keys.
+
+A position is encoded as a base-3 integer, one digit per cell: 0 for empty,
+1 and 2 for the two players. The board's eight rotations and reflections
+permute the digits, so the smallest of the eight encodings is a canonical
+key shared by every symmetric position. The key also records which digit
+is to move, so lopsided boards set up by hand are handled too.
+
+:class:`TicTacToeSolver` runs negamax with alpha-beta over these keys and
+keeps each proven bound in a table. Boards of up to 16 cells are searched
+to the end: 3×3 and 4×4 play is perfect, and once the table has been
+filled, later moves are answered from it. The table can be saved to disk
+and loaded again, so a finished solve is not repeated. Larger boards, whose
+game trees cannot be exhausted, get the same table-backed search cut off at
+a depth limit and scored by counting open lines.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Boards with at most this many cells are always searched to the end.
+EXACT_CELLS = 16
+
+# Where CLIs keep solved tables between sessions.
+DEFAULT_CACHE_DIR = pathlib.Path.home() / ".games" / "tic_tac_toe"
+
+# A win scores this plus the number of empty cells left, so faster wins
+# score higher; every heuristic score stays below it.
+WIN_SCORE = 1000
+
+# Save the table once it has grown by this many entries since the last save.
+_SAVE_EVERY = 5000
+
+
+def _lines(board_size: int, win_length: int) -> List[int]:
+    """Return a bitmask for every run of ``win_length`` cells in a row, column or diagonal."""
+    masks = []
+    for row in range(board_size):
+        for column in range(board_size):
+            for delta_row, delta_column in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_row = row + delta_row * (win_length - 1)
+                end_column = column + delta_column * (win_length - 1)
+                if 0 <= end_row < board_size and 0 <= end_column < board_size:
+                    mask = 0
+                    for step in range(win_length):
+                        mask |= 1 << ((row + delta_row * step) * board_size + column + delta_column * step)
+                    masks.append(mask)
+    return masks
+
+
+def _symmetries(board_size: int) -> List[List[int]]:
+    """Return the cell permutation of each of the eight rotations and reflections."""
+    permutations = []
+    for transform in range(8):
+        permutation = []
+        for cell in range(board_size * board_size):
+            row, column = divmod(cell, board_size)
+            if transform & 4:
+                row, column = column, row
+            if transform & 1:
+                row = board_size - 1 - row
+            if transform & 2:
+                column = board_size - 1 - column
+            permutation.append(row * board_size + column)
+        permutations.append(permutation)
+    return permutations
+
+
+class TicTacToeSolver:
+    """Alpha-beta solver for square tic-tac-toe boards with a canonical position table.
+
+    Args:
+        board_size: Width and height of the board.
+        win_length: Cells in a row needed to win; defaults to ``board_size``.
+        cache_path: Optional JSON file the table is loaded from on first use
+            and saved to as it grows.
+        max_depth: Search depth for boards too large to solve exactly;
+            defaults to 5 plies up to 5×5 and 4 beyond.
+    """
+
+    def __init__(
+        self,
+        board_size: int = 3,
+        win_length: Optional[int] = None,
+        *,
+        cache_path: Optional[pathlib.Path] = None,
+        max_depth: Optional[int] = None,
+    ) -> None:
+        self.board_size = board_size
+        self.win_length = win_length or board_size
+        self.cells = board_size * board_size
+        self.exact = self.cells <= EXACT_CELLS
+        self.max_depth = max_depth or (5 if self.cells <= 25 else 4)
+        self.cache_path = cache_path
+        self._lines = _lines(board_size, self.win_length)
+        self._lines_through = [[line for line in self._lines if line >> cell & 1] for cell in range(self.cells)]
+        # Weight of each cell's digit under each symmetry.
+        self._weights = [[3**target for target in permutation] for permutation in _symmetries(board_size)]
+        # Cells touching the most lines first: the centre, then corners on small boards.
+        self._order = sorted(range(self.cells), key=lambda cell: -len(self._lines_through[cell]))
+        # canonical key -> (depth searched, lower bound, upper bound) for the player to move
+        self._table: Dict[int, Tuple[int, int, int]] = {}
+        self._loaded = False
+        self._saved_size = 0
+        self.nodes = 0
+
+    def canonical_key(self, board: Sequence[str], player: str) -> int:
+        """Return the symmetry-reduced key of ``board`` with ``player`` to move.
+
+        Cells are compared by symbol: ``player`` is digit 1, any other
+        non-blank symbol is digit 2.
+        """
+        own, other = self._masks(board, player)
+        return self._key(self._encode(own, other), 0)
+
+    def best_move(self, board: Sequence[str], player: str, max_depth: Optional[int] = None) -> Tuple[int, Optional[int]]:
+        """Return ``(score, cell)`` for ``player`` to move on ``board``.
+
+        The score is from ``player``'s point of view: above :data:`WIN_SCORE`
+        for a forced win (higher when faster), below ``-WIN_SCORE`` for a
+        forced loss, 0 for a draw, and a line-count estimate when a large
+        board is cut off. The cell is ``None`` when the game is already over.
+        ``max_depth`` overrides the solver's depth limit for large boards;
+        boards small enough to solve exactly ignore it.
+        """
+        self._load()
+        own, other = self._masks(board, player)
+        if self._winner(own) or self._winner(other):
+            return 0, None
+        occupied = own | other
+        empties = self.cells - bin(occupied).count("1")
+        if empties == 0:
+            return 0, None
+        depth = empties if self.exact else min(empties, max_depth or self.max_depth)
+        keys = self._encode(own, other)
+        alpha = -WIN_SCORE - self.cells - 1
+        beta = WIN_SCORE + self.cells + 1
+        best_cell = None
+        self.nodes = 0
+        for cell in self._order:
+            if occupied >> cell & 1:
+                continue
+            if best_cell is None:
+                score = self._score_move(own, other, keys, cell, 0, depth, alpha, beta)
+            else:
+                # Only a move that beats the best so far needs an exact score.
+                score = self._score_move(own, other, keys, cell, 0, depth, alpha, alpha + 1)
+                if score > alpha:
+                    score = self._score_move(own, other, keys, cell, 0, depth, alpha, beta)
+            if best_cell is None or score > alpha:
+                alpha = score
+                best_cell = cell
+        self._maybe_save()
+        return alpha, best_cell
+
+    def solve(self, board: Sequence[str], player: str) -> int:
+        """Return the score of ``board`` for ``player`` to move (see :meth:`best_move`)."""
+        score, _ = self.best_move(board, player)
+        return score
+
+    def save(self) -> None:
+        """Write the exact part of the table to ``cache_path``, if one is set."""
+        if self.cache_path is None or not self.exact:
+            return
+        entries = {str(key): [lower, upper] for key, (_, lower, upper) in self._table.items()}
+        payload = {"board_size": self.board_size, "win_length": self.win_length, "entries": entries}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        self._saved_size = len(self._table)
+
+    def _load(self) -> None:
+        """Read ``cache_path`` into the table the first time the solver is used."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.cache_path is None or not self.exact or not self.cache_path.exists():
+            return
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("board_size") != self.board_size or payload.get("win_length") != self.win_length:
+            return
+        for key, (lower, upper) in payload.get("entries", {}).items():
+            self._table[int(key)] = (self.cells, lower, upper)
+        self._saved_size = len(self._table)
+
+    def _maybe_save(self) -> None:
+        if self.cache_path is not None and len(self._table) - self._saved_size >= _SAVE_EVERY:
+            try:
+                self.save()
+            except OSError:
+                pass
+
+    def _masks(self, board: Sequence[str], player: str) -> Tuple[int, int]:
+        own = other = 0
+        for cell, symbol in enumerate(board):
+            if symbol == player:
+                own |= 1 << cell
+            elif symbol != " ":
+                other |= 1 << cell
+        return own, other
+
+    def _encode(self, own: int, other: int) -> List[int]:
+        """Return the base-3 encoding under each symmetry, with ``own`` as digit 1."""
+        keys = []
+        for weights in self._weights:
+            key = 0
+            for cell in range(self.cells):
+                if own >> cell & 1:
+                    key += weights[cell]
+                elif other >> cell & 1:
+                    key += 2 * weights[cell]
+            keys.append(key)
+        return keys
+
+    @staticmethod
+    def _key(keys: List[int], mover_digit: int) -> int:
+        """Return the table key: the smallest encoding plus which digit is to move."""
+        return min(keys) * 2 + mover_digit
+
+    def _winner(self, mask: int) -> bool:
+        return any(mask & line == line for line in self._lines)
+
+    def _score_move(self, own: int, other: int, keys: List[int], cell: int, mover_digit: int, depth: int, alpha: int, beta: int) -> int:
+        """Return the score for the mover of playing ``cell``."""
+        bit = 1 << cell
+        placed = own | bit
+        if any(placed & line == line for line in self._lines_through[cell]):
+            return WIN_SCORE + self.cells - bin(placed | other).count("1")
+        weight = mover_digit + 1
+        next_keys = [key + weight * weights[cell] for key, weights in zip(keys, self._weights)]
+        return -self._negamax(other, placed, next_keys, 1 - mover_digit, depth - 1, -beta, -alpha)
+
+    def _negamax(self, own: int, other: int, keys: List[int], mover_digit: int, depth: int, alpha: int, beta: int) -> int:
+        """Alpha-beta for the player holding ``own``, whose cells carry digit ``mover_digit + 1``."""
+        self.nodes += 1
+        occupied = own | other
+        empties = self.cells - bin(occupied).count("1")
+        if empties == 0:
+            return 0
+        if depth <= 0:
+            return self._heuristic(own, other)
+
+        key = self._key(keys, mover_digit)
+        entry = self._table.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, lower, upper = entry
+            if lower >= beta:
+                return lower
+            if upper <= alpha:
+                return upper
+            alpha = max(alpha, lower)
+            beta = min(beta, upper)
+            if alpha >= beta:
+                return alpha
+
+        # Winning at once beats anything else, so look for it before searching.
+        for cell in self._order:
+            if not occupied >> cell & 1:
+                placed = own | (1 << cell)
+                if any(placed & line == line for line in self._lines_through[cell]):
+                    score = WIN_SCORE + empties - 1
+                    self._table[key] = (depth, score, score)
+                    return score
+
+        original_alpha = alpha
+        best = -WIN_SCORE - self.cells - 1
+        for cell in self._order:
+            if occupied >> cell & 1:
+                continue
+            score = self._score_move(own, other, keys, cell, mover_digit, depth, alpha, beta)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        lower, upper = -WIN_SCORE - self.cells - 1, WIN_SCORE + self.cells + 1
+        if entry is not None and entry[0] == depth:
+            lower, upper = entry[1], entry[2]
+        if best <= original_alpha:
+            upper = best
+        elif best >= beta:
+            lower = best
+        else:
+            lower = upper = best
+        self._table[key] = (depth, lower, upper)
+        return best
+
+    def _heuristic(self, own: int, other: int) -> int:
+        """Score open lines: each line held by one side only counts by its length squared."""
+        score = 0
+        for line in self._lines:
+            mine = own & line
+            theirs = other & line
+            if mine and not theirs:
+                score += bin(mine).count("1") ** 2
+            elif theirs and not mine:
+                score -= bin(theirs).count("1") ** 2
+        return max(-WIN_SCORE + 1, min(WIN_SCORE - 1, score))
+
+
+_SOLVERS: Dict[Tuple[int, int, Optional[pathlib.Path]], TicTacToeSolver] = {}
+
+
+def get_solver(board_size: int, win_length: int, cache_dir: Optional[pathlib.Path] = None) -> TicTacToeSolver:
+    """Return the shared solver for a board shape, so its table outlives a single game.
+
+    With ``cache_dir`` set, the table of an exactly solved board is kept in
+    ``tic_tac_toe_<size>x<size>_<win>.json`` inside it.
+    """
+    slot = (board_size, win_length, cache_dir)
+    solver = _SOLVERS.get(slot)
+    if solver is None:
+        cache_path = cache_dir / f"tic_tac_toe_{board_size}x{board_size}_{win_length}.json" if cache_dir is not None else None
+        solver = TicTacToeSolver(board_size, win_length, cache_path=cache_path)
+        _SOLVERS[slot] = solver
+    return solver
+
+
+__all__ = ["DEFAULT_CACHE_DIR", "EXACT_CELLS", "TicTacToeSolver", "WIN_SCORE", "get_solver"]
@@ -13,8 +13,8 @@ features like game replay and undo functionality.
 Key Features:
 - **Variable Board Size**: Play on boards larger than the classic 3x3.
 - **Custom Win Length**: Define the number of symbols in a row needed to win.
-- **Optimal AI**: The computer opponent uses minimax with alpha-beta pruning
-  concepts to ensure it plays optimally.
+- **Optimal AI**: The computer opponent uses the memoized alpha-beta solver in
+  :mod:`.solver`, which plays 3x3 and 4x4 boards perfectly.
 - **Replay and Undo**: The game tracks move history, allowing for undoing
   moves and replaying games.
 - **Coordinate System**: A human-readable coordinate system (e.g., A1, B2)
@@ -30,12 +30,15 @@ Constants:
 
 from __future__ import annotations
 
+import pathlib
 import time
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from games_collection.core.architecture.replay import ReplayManager
 
+from .solver import TicTacToeSolver, get_solver
+
 # A mapping of human-readable coordinates to board indices for a standard 3x3 board.
 # This is used for quick lookups and validation.
 COORDINATES: Dict[str, int] = {
@@ -73,6 +76,9 @@ class TicTacToeGame:
         replay_manager (ReplayManager): An object that manages the game's move history
                                         for undo and replay functionality.
         current_turn (str): The symbol of the player whose turn it is.
+        solver_cache_dir (Optional[pathlib.Path]): Directory where solved positions
+                                                   are kept between sessions, or None
+                                                   to keep them in memory only.
     """
 
     human_symbol: str = "X"
@@ -80,6 +86,7 @@ class TicTacToeGame:
     starting_symbol: Optional[str] = None
     board_size: int = 3
     win_length: Optional[int] = None
+    solver_cache_dir: Optional[pathlib.Path] = None
 
     def __post_init__(self) -> None:
         """Validates the initial game state and initializes the board.
@@ -255,132 +262,47 @@ class TicTacToeGame:
         return self.winner() is not None or self.is_draw()
 
     def minimax(self, is_maximizing: bool, depth: int = 0, max_depth: Optional[int] = None) -> Tuple[int, Optional[int]]:
-        """The minimax algorithm for finding the optimal move.
+        """Finds the best move and its score for the player to move.
 
-        This method recursively explores the game tree to find the best possible
-        move for the current player. It uses a scoring system to evaluate board
-        states and prunes the search space for efficiency.
+        The search is delegated to the shared :class:`~.solver.TicTacToeSolver`
+        for this board shape. It memoizes every position it proves, keyed by a
+        symmetry-reduced base-3 encoding, so boards up to 4x4 are solved
+        exactly and repeated positions are not searched again.
 
         Args:
-            is_maximizing (bool): True if the current player is the computer (maximizer),
-                                  False if the current player is the human (minimizer).
-            depth (int): The current depth of the recursion.
-            max_depth (Optional[int]): The maximum depth to search. This is used to
-                                       limit the search on larger boards for performance.
+            is_maximizing (bool): True to move for the computer, False for the human.
+            depth (int): Unused; kept for compatibility with earlier callers.
+            max_depth (Optional[int]): The maximum depth to search on boards too
+                                       large to solve exactly (5x5 and up).
 
         Returns:
-            Tuple[int, Optional[int]]: A tuple containing the best score and the
-                                       corresponding best move (as a board index).
+            Tuple[int, Optional[int]]: The score from the computer's point of view
+                                       (positive when it is winning) and the best
+                                       move for the player to move, or None if the
+                                       game is over.
         """
-        # Set a default max_depth based on the board size to manage performance.
-        if max_depth is None:
-            if self.board_size <= 3:
-                max_depth = 100  # No practical limit for a 3x3 board.
-            elif self.board_size == 4:
-                max_depth = 6  # A reasonable depth for a 4x4 board.
-            else:  # 5x5 and larger boards.
-                max_depth = 4
-
-        winner = self.winner()
-        # Base cases for the recursion: check for a win, loss, or draw.
-        if winner == self.computer_symbol:
-            return 10 - depth, None
-        if winner == self.human_symbol:
-            return depth - 10, None
-        if self.is_draw():
-            return 0, None
-        if depth >= max_depth:
-            # Return a neutral score if the max depth is reached.
-            return 0, None
-
-        best_score = float("-inf") if is_maximizing else float("inf")
-        best_move: Optional[int] = None
         symbol = self.computer_symbol if is_maximizing else self.human_symbol
+        score, move = self.solver().best_move(self.board, symbol, max_depth)
+        return (score if is_maximizing else -score), move
 
-        # Iterate through all available moves to find the best one.
-        for move in self.available_moves():
-            self.board[move] = symbol
-            score, _ = self.minimax(not is_maximizing, depth + 1, max_depth)
-            self.board[move] = " "  # Backtrack to undo the move.
-            # Update the best score and move based on whether we are maximizing or minimizing.
-            if is_maximizing:
-                if score > best_score:
-                    best_score = score
-                    best_move = move
-            else:
-                if score < best_score:
-                    best_score = score
-                    best_move = move
-        return int(best_score), best_move
+    def solver(self) -> TicTacToeSolver:
+        """Returns the solver shared by all games with this board size and win length."""
+        return get_solver(self.board_size, self.win_length or self.board_size, self.solver_cache_dir)
 
     def computer_move(self) -> int:
         """Determines and applies the computer's optimal move.
 
-        This method uses either a fast heuristic for 3x3 boards or the minimax
-        algorithm for larger boards to select the best move for the computer.
-
         Returns:
             int: The (row, col) tuple of the computer's move.
         """
-        if self.board_size == 3 and self.win_length == 3:
-            # Use a faster, heuristic-based approach for the classic 3x3 game.
-            move_index = self._select_fast_move()
-        else:
-            # Use the minimax algorithm for larger or more complex boards.
-            _, move_index = self.minimax(True)
-            if move_index is None:
-                move_index = self.available_moves()[0]
+        _, move_index = self.minimax(True)
+        if move_index is None:
+            move_index = self.available_moves()[0]
 
         row, col = divmod(move_index, self.board_size)
         self.make_move(move_index, self.computer_symbol)
         return row, col
 
-    def _select_fast_move(self) -> int:
-        """Returns a strong move for a 3x3 board using lightweight heuristics.
-
-        This method provides a faster alternative to the full minimax search for
-        the standard 3x3 game. It checks for winning moves, blocks opponent's
-        winning moves, and prioritizes strategic positions like the center and corners.
-
-        Returns:
-            int: The board index of the selected move.
-        """
-        available = self.available_moves()
-
-        def _winning_move(symbol: str) -> Optional[int]:
-            for candidate in available:
-                self.board[candidate] = symbol
-                has_won = self.winner() == symbol
-                self.board[candidate] = " "
-                if has_won:
-                    return candidate
-            return None
-
-        # 1. Check if the computer can win in the next move.
-        win_now = _winning_move(self.computer_symbol)
-        if win_now is not None:
-            return win_now
-
-        # 2. Check if the human is about to win, and block them.
-        block_human = _winning_move(self.human_symbol)
-        if block_human is not None:
-            return block_human
-
-        # 3. Prefer the center square if it's available.
-        if self.board_size % 2 == 1:
-            center_index = (self.board_size * self.board_size) // 2
-            if self.board[center_index] == " ":
-                return center_index
-
-        # 4. Next, favor the corners for stronger board control.
-        corners = [row * self.board_size + col for row in (0, self.board_size - 1) for col in (0, self.board_size - 1)]
-        for corner in corners:
-            if 0 <= corner < len(self.board) and self.board[corner] == " ":
-                return corner
-
-        # 5. Finally, fall back to the first available square as a default.
-        return available[0]
-
     def human_move(self, position: int) -> bool:
         """Makes a move for the human player.
 
@@ -9,7 +9,7 @@ The `UltimateTicTacToeGame` class manages the overall game state, including:
 - A grid of 9 `TicTacToeGame` instances for the small boards.
 - A "meta-board" to track which player has won each small board.
 - The logic for determining the active board for the next move.
-- A simple AI for the computer opponent.
+- A Monte Carlo tree search AI for the computer opponent.
 
 Key Game Rules:
 1. To win the game, a player must win three small boards in a row on the
@@ -31,6 +31,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 from .tic_tac_toe import TicTacToeGame
+from .ultimate_ai import UltimateMCTSStrategy
 
 
 @dataclass
@@ -51,11 +52,21 @@ class UltimateTicTacToeGame:
         active_board (Optional[int]): The index of the board where the next move
                                       must be played. If None, any board is valid.
         current_turn (str): The symbol of the current player.
+        ai_iterations (Optional[int]): Playouts the computer runs per move, or
+                                       None to search until its time budget
+                                       runs out.
+        ai_time_budget (Optional[float]): Seconds the computer may think per move.
+        ai_workers (int): Processes for root-parallel search; 1 searches in
+                          this process. The processes are kept for the whole
+                          game; call :meth:`close` to stop them.
     """
 
     human_symbol: str = "X"
     computer_symbol: str = "O"
     starting_symbol: Optional[str] = None
+    ai_iterations: Optional[int] = 2000
+    ai_time_budget: Optional[float] = None
+    ai_workers: int = 1
 
     def __post_init__(self) -> None:
         """Initializes the Ultimate Tic-Tac-Toe game and its components.
@@ -94,6 +105,10 @@ class UltimateTicTacToeGame:
             raise ValueError("Starting symbol must belong to one of the players.")
         self.current_turn = self.starting_symbol
 
+        # Built on the first computer move and kept so parallel searches reuse
+        # their worker processes.
+        self._strategy: Optional[UltimateMCTSStrategy] = None
+
     def reset(self) -> None:
         """Resets the game to its initial state.
 
@@ -316,15 +331,12 @@ class UltimateTicTacToeGame:
         return self.make_move(board_index, cell_index, self.human_symbol)
 
     def computer_move(self) -> Tuple[int, int]:
-        """Makes a simple, heuristic-based move for the computer.
-
-        This AI uses a basic strategy:
-        1. Prioritize the center cell of the center board.
-        2. Prioritize the center cell of any other active board.
-        3. Default to the first available move.
+        """Makes a move for the computer using Monte Carlo tree search.
 
-        A more sophisticated AI (e.g., using minimax) could be implemented for
-        stronger gameplay.
+        The search plays thousands of quick games from the current position
+        on a compact bitmask copy of the board (see
+        :class:`~.ultimate_ai.UltimateMCTSStrategy`) and picks the move that
+        the UCT rule explored most.
 
         Returns:
             Tuple[int, int]: The (board_index, cell_index) where the move was made.
@@ -332,27 +344,19 @@ class UltimateTicTacToeGame:
         Raises:
             RuntimeError: If there are no available moves for the computer to make.
         """
-        moves = self.available_moves()
-        if not moves:
+        if not self.available_moves():
             raise RuntimeError("No available moves!")
 
-        # Simple strategy: prioritize center cells and boards.
-        # The highest priority is the center of the center board (board 4, cell 4).
-        center_board = 4
-        center_cell = 4
-
-        # 1. Try to take the center of the center board.
-        if (center_board, center_cell) in moves:
-            self.make_move(center_board, center_cell, self.computer_symbol)
-            return (center_board, center_cell)
-
-        # 2. Try to take the center cell of any other active board.
-        for board_idx, cell_idx in moves:
-            if cell_idx == center_cell:
-                self.make_move(board_idx, cell_idx, self.computer_symbol)
-                return (board_idx, cell_idx)
-
-        # 3. If no strategic moves are available, take the first available move.
-        board_idx, cell_idx = moves[0]
+        strategy = self._strategy
+        if strategy is None or (strategy.iterations, strategy.time_budget, strategy.workers) != (self.ai_iterations, self.ai_time_budget, self.ai_workers):
+            self.close()
+            strategy = self._strategy = UltimateMCTSStrategy(self.ai_iterations, time_budget=self.ai_time_budget, workers=self.ai_workers)
+        board_idx, cell_idx = strategy.choose_move(self, self.computer_symbol)
         self.make_move(board_idx, cell_idx, self.computer_symbol)
         return (board_idx, cell_idx)
+
+    def close(self) -> None:
+        """Stops the computer's search worker processes, if any are running."""
+        if self._strategy is not None:
+            self._strategy.shutdown()
+            self._strategy = None
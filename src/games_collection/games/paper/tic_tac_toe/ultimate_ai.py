@@ -0,0 +1,237 @@
+"""Monte Carlo tree search AI for Ultimate Tic-Tac-Toe.
+
+The search runs on :class:`UltimatePosition`, a compact copy of the game held
+in a handful of integers: one 9-bit mask of cells per small board and player,
+a 9-bit mask of won boards per player and a mask of closed (won or drawn)
+boards. Wins are looked up in a 512-entry table, so a playout updates a few
+integers per move and allocates nothing after its one scratch copy.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Hashable, List, Optional, Tuple
+
+from games_collection.core.ai_strategy import MCTSStrategy
+
+if TYPE_CHECKING:
+    from .ultimate import UltimateTicTacToeGame
+
+FULL = 0x1FF
+LINES = (0x007, 0x038, 0x1C0, 0x049, 0x092, 0x124, 0x111, 0x054)
+
+# Lookup tables indexed by a 9-bit cell mask.
+_WINS = tuple(any(mask & line == line for line in LINES) for mask in range(512))
+_BITS = tuple(tuple(cell for cell in range(9) if mask >> cell & 1) for mask in range(512))
+# Empty cells that would complete a line for the marks in the mask.
+_THREATS = tuple(sum(1 << cell for cell in range(9) if not mask >> cell & 1 and _WINS[mask | 1 << cell]) for mask in range(512))
+
+PLAYOUT_POLICIES = ("random", "heuristic")
+
+
+class UltimatePosition:
+    """Mutable bitmask state of an Ultimate Tic-Tac-Toe game.
+
+    Players are 0 and 1 and moves are ``board * 9 + cell`` integers. The
+    ``winner`` is the winning player, or None while the game is undecided or
+    drawn.
+    """
+
+    __slots__ = ("cells", "won", "closed", "active", "player", "winner")
+
+    def __init__(self, cells: List[int], won: List[int], closed: int, active: int, player: int, winner: Optional[int] = None) -> None:
+        self.cells = cells
+        self.won = won
+        self.closed = closed
+        self.active = active
+        self.player = player
+        self.winner = winner
+
+    @classmethod
+    def new(cls, player: int = 0) -> "UltimatePosition":
+        """Returns the empty board with ``player`` to move."""
+        return cls([0] * 18, [0, 0], 0, -1, player)
+
+    @classmethod
+    def from_game(cls, game: "UltimateTicTacToeGame", symbol: str) -> "UltimatePosition":
+        """Encodes ``game`` with ``symbol`` to move as player 0."""
+        other = game.human_symbol if symbol == game.computer_symbol else game.computer_symbol
+        position = cls.new()
+        for board_index, board in enumerate(game.small_boards):
+            for cell, mark in enumerate(board.board):
+                if mark == symbol:
+                    position.cells[board_index] |= 1 << cell
+                elif mark == other:
+                    position.cells[9 + board_index] |= 1 << cell
+            status = game.meta_board[board_index]
+            if status is not None:
+                position.closed |= 1 << board_index
+                if status in (symbol, other):
+                    position.won[status != symbol] |= 1 << board_index
+        for player in (0, 1):
+            if _WINS[position.won[player]]:
+                position.winner = player
+        active = game.active_board
+        position.active = active if active is not None and not position.closed >> active & 1 else -1
+        return position
+
+    def copy(self) -> "UltimatePosition":
+        return UltimatePosition(self.cells[:], self.won[:], self.closed, self.active, self.player, self.winner)
+
+    def is_terminal(self) -> bool:
+        return self.winner is not None or self.closed == FULL
+
+    def moves(self) -> List[int]:
+        """Returns every legal move."""
+        cells = self.cells
+        boards = (self.active,) if self.active >= 0 else _BITS[~self.closed & FULL]
+        return [board * 9 + cell for board in boards for cell in _BITS[~(cells[board] | cells[9 + board]) & FULL]]
+
+    def winning_moves(self) -> List[int]:
+        """Returns the moves that win the whole game at once."""
+        cells = self.cells
+        player = self.player
+        boards = (self.active,) if self.active >= 0 else _BITS[~self.closed & FULL]
+        targets = _THREATS[self.won[player]]
+        return [
+            board * 9 + cell
+            for board in boards
+            if targets >> board & 1
+            for cell in _BITS[_THREATS[cells[player * 9 + board]] & ~cells[(1 - player) * 9 + board]]
+        ]
+
+    def play(self, move: int) -> None:
+        """Plays ``move`` for the player to move, in place."""
+        board, cell = divmod(move, 9)
+        player = self.player
+        index = player * 9 + board
+        own = self.cells[index] | 1 << cell
+        self.cells[index] = own
+        if _WINS[own]:
+            self.closed |= 1 << board
+            self.won[player] |= 1 << board
+            if _WINS[self.won[player]]:
+                self.winner = player
+        elif own | self.cells[index + 9 - 18 * player] == FULL:
+            self.closed |= 1 << board
+        self.active = -1 if self.closed >> cell & 1 else cell
+        self.player = 1 - player
+
+    def playout_move(self, rng: random.Random, heuristic: bool = False) -> int:
+        """Picks a playout move without building the move list.
+
+        A random legal move is drawn; with ``heuristic`` the move is then
+        replaced, within its small board, by a cell that wins the board or,
+        failing that, one that blocks the opponent from winning it.
+        """
+        cells = self.cells
+        board = self.active
+        if board >= 0:
+            empty = ~(cells[board] | cells[9 + board]) & FULL
+            cell = _BITS[empty][rng.randrange(len(_BITS[empty]))]
+        else:
+            total = 0
+            for open_board in _BITS[~self.closed & FULL]:
+                total += len(_BITS[~(cells[open_board] | cells[9 + open_board]) & FULL])
+            pick = rng.randrange(total)
+            for board in _BITS[~self.closed & FULL]:
+                empty = ~(cells[board] | cells[9 + board]) & FULL
+                count = len(_BITS[empty])
+                if pick < count:
+                    cell = _BITS[empty][pick]
+                    break
+                pick -= count
+        if heuristic:
+            own = cells[self.player * 9 + board]
+            theirs = cells[(1 - self.player) * 9 + board]
+            empty = ~(own | theirs) & FULL
+            wins = _THREATS[own] & empty
+            if wins:
+                return board * 9 + _BITS[wins][0]
+            blocks = _THREATS[theirs] & empty
+            if blocks:
+                return board * 9 + _BITS[blocks][0]
+        return board * 9 + cell
+
+    def reward(self, player: Hashable) -> float:
+        """Scores a finished game for ``player``: 1 win, 0.5 draw, 0 loss."""
+        if self.winner is None:
+            return 0.5
+        return 1.0 if self.winner == player else 0.0
+
+
+class UltimateMCTSStrategy(MCTSStrategy[int, UltimatePosition]):
+    """MCTS over :class:`UltimatePosition` with in-place playouts.
+
+    Tree nodes where the player to move can win the game offer only the
+    winning moves, so forced wins and losses one move deep are always seen.
+
+    The ``"random"`` playout policy plays uniformly random moves; the
+    ``"heuristic"`` policy takes small-board wins and blocks when it sees
+    them, which gives more realistic playouts at some cost in speed.
+    """
+
+    def __init__(
+        self,
+        iterations: Optional[int] = 2000,
+        *,
+        time_budget: Optional[float] = None,
+        policy: str = "heuristic",
+        exploration: float = 1.0,
+        workers: int = 1,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            iterations: The number of playouts per decision, or None to run
+                        until ``time_budget`` expires.
+            time_budget: Optional wall-clock limit in seconds per decision.
+            policy: The playout policy, one of :data:`PLAYOUT_POLICIES`.
+            exploration: The UCT exploration constant.
+            workers: The number of processes for root-parallel search.
+            rng: An optional random number generator.
+
+        Raises:
+            ValueError: If the policy is unknown or the search limits are invalid.
+        """
+        if policy not in PLAYOUT_POLICIES:
+            raise ValueError(f"Unknown playout policy {policy!r}; choose from {', '.join(PLAYOUT_POLICIES)}")
+        super().__init__(iterations, time_budget=time_budget, exploration=exploration, workers=workers, rng=rng)
+        self.policy = policy
+
+    def choose_move(self, game: "UltimateTicTacToeGame", symbol: str) -> Tuple[int, int]:
+        """Returns the ``(board_index, cell_index)`` to play for ``symbol``.
+
+        Raises:
+            ValueError: If ``symbol`` has no legal move.
+        """
+        position = UltimatePosition.from_game(game, symbol)
+        return divmod(self.select_move(self._moves(position), position), 9)
+
+    def _transition(self, state: UltimatePosition, move: int) -> UltimatePosition:
+        child = state.copy()
+        child.play(move)
+        return child
+
+    def _moves(self, state: UltimatePosition) -> List[int]:
+        # A node with a game-winning move needs no other children, so the
+        # tree never has to sample its way to a decisive reply.
+        return state.winning_moves() or state.moves()
+
+    def _is_terminal(self, state: UltimatePosition) -> bool:
+        return state.is_terminal()
+
+    def _player(self, state: UltimatePosition) -> int:
+        return state.player
+
+    def _rollout(self, state: UltimatePosition, player: Hashable) -> float:
+        scratch = state.copy()
+        rng = self.rng
+        heuristic = self.policy == "heuristic"
+        while scratch.winner is None and scratch.closed != FULL:
+            scratch.play(scratch.playout_move(rng, heuristic))
+        return scratch.reward(player)
+
+
+__all__ = ["PLAYOUT_POLICIES", "UltimateMCTSStrategy", "UltimatePosition"]
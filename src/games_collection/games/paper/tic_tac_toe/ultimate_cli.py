@@ -56,6 +56,8 @@ def play_ultimate() -> None:
         human_symbol=human_symbol,
         computer_symbol=computer_symbol,
         starting_symbol=starting_symbol,
+        ai_iterations=None,
+        ai_time_budget=1.0,
     )
 
     print("\n" + game.render())
@@ -111,6 +113,8 @@ def play_ultimate() -> None:
 
         game.swap_turn()
 
+    game.close()
+
     # Announce the final result of the game.
     print("\n=== Game Over ===")
     winner = game.winner()
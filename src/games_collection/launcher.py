@@ -1343,12 +1343,11 @@ def _run_sudoku_daily_challenge(
     """Launch the Sudoku CLI configured for the selected challenge."""
 
     challenge = selection.challenge
-    builder = challenge.metadata.get("build_puzzle")
-    if not callable(builder):
+    puzzle = selection.build_puzzle()
+    if puzzle is None:
         print("This Sudoku challenge is missing puzzle configuration.")
         return
 
-    puzzle = builder()
     try:
         from games_collection.games.paper.sudoku.sudoku import SudokuCLI, SudokuPuzzle
     except ImportError as exc:  # pragma: no cover - optional dependency guard
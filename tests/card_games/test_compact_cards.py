@@ -0,0 +1,70 @@
+"""Tests for the compact integer card representation."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from games_collection.games.card.common.cards import (
+    CARD_TABLE,
+    COMPACT_CARDS,
+    RANKS,
+    Card,
+    CompactCard,
+    Deck,
+    Suit,
+    card_from_id,
+    card_id,
+    from_compact,
+    to_compact,
+)
+
+
+def test_card_ids_round_trip_and_encode_rank_and_suit() -> None:
+    assert len(CARD_TABLE) == len(COMPACT_CARDS) == 52
+    for rank in RANKS:
+        for suit_index, suit in enumerate(Suit):
+            card = Card(rank, suit)
+            identifier = card_id(card)
+            assert identifier == card.id
+            assert identifier >> 2 == card.value
+            assert identifier & 3 == suit_index
+            assert card_from_id(identifier) == card
+
+
+def test_compact_cards_are_interned_and_precomputed() -> None:
+    card = Card("Q", Suit.HEARTS)
+    compact = CompactCard.from_card(card)
+    assert compact is COMPACT_CARDS[card.id] is CompactCard.from_id(card.id)
+    assert (compact.rank, compact.suit, compact.value) == ("Q", Suit.HEARTS, card.value)
+    assert compact.bit == 1 << card.id
+    assert compact.card is card_from_id(card.id)
+    assert pickle.loads(pickle.dumps(compact)) is compact
+    with pytest.raises(AttributeError):
+        compact.extra = 1  # type: ignore[attr-defined]
+
+
+def test_adapters_convert_between_representations() -> None:
+    cards = [Card("A", Suit.SPADES), Card("2", Suit.CLUBS), Card("T", Suit.DIAMONDS)]
+    compact = to_compact(cards)
+    assert [card.id for card in compact] == [card_id(card) for card in cards]
+    assert from_compact(compact) == cards
+
+
+def test_default_deck_reuses_shared_cards_in_suit_order() -> None:
+    deck = Deck()
+    assert [card.suit for card in deck.cards[:13]] == [Suit.CLUBS] * 13
+    assert [card.rank for card in deck.cards[:13]] == list(RANKS)
+    assert all(card is CARD_TABLE[card.id] for card in deck.cards)
+
+
+def test_deck_builds_from_and_deals_card_ids() -> None:
+    deck = Deck.from_ids([51, 0, 17])
+    assert deck.ids() == [51, 0, 17]
+    assert deck.deal_ids(2) == [51, 0]
+    assert deck.cards == [card_from_id(17)]
+    with pytest.raises(ValueError):
+        deck.deal_ids(2)
+    with pytest.raises(ValueError):
+        Deck.from_ids([])
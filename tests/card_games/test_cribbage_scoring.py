@@ -0,0 +1,70 @@
+"""Tests for table-driven cribbage scoring and exact discard expectations."""
+
+from __future__ import annotations
+
+import random
+from itertools import combinations
+
+import pytest
+
+from games_collection.games.card.common.cards import Deck, parse_card
+from games_collection.games.card.cribbage import ai, scoring
+from games_collection.games.card.cribbage.game import CribbageGame
+
+
+def _cards(codes: str):
+    return [parse_card(code) for code in codes.split()]
+
+
+def _direct_score(hand, starter, is_crib):
+    cards = list(hand) + [starter]
+    return (
+        CribbageGame._score_fifteens(cards)
+        + CribbageGame._score_pairs(cards)
+        + CribbageGame._score_runs(cards)
+        + CribbageGame._score_flush(hand, starter, is_crib)
+        + CribbageGame._score_nobs(hand, starter)
+    )
+
+
+def test_rank_table_covers_every_five_card_multiset() -> None:
+    assert len(scoring.rank_scores()) == 6175
+
+
+def test_table_scores_match_direct_counting() -> None:
+    rng = random.Random(0)
+    cards = Deck().cards
+    for _ in range(2000):
+        five = rng.sample(cards, 5)
+        is_crib = rng.random() < 0.5
+        assert scoring.show_score(five[:4], five[4], is_crib) == _direct_score(five[:4], five[4], is_crib)
+
+
+def test_perfect_hand_scores_twenty_nine() -> None:
+    assert CribbageGame.score_hand_static(_cards("5H 5D 5C JS"), parse_card("5S")) == 29
+
+
+def test_crib_flush_needs_matching_starter() -> None:
+    crib = _cards("2H 4H 8H TH")
+    assert CribbageGame.score_hand_static(crib, parse_card("KS"), is_crib=True) == _direct_score(crib, parse_card("KS"), True)
+    assert scoring.flush_points(crib, parse_card("KS"), is_crib=True) == 0
+    assert scoring.flush_points(crib, parse_card("KH"), is_crib=True) == 5
+
+
+@pytest.mark.parametrize("discard", ["JH 5H", "3C 9D", "KS KD"])
+def test_expected_crib_score_is_exact(discard: str) -> None:
+    cards = _cards(discard)
+    deck = [card for card in Deck().cards if card not in cards][::3]
+    outcomes = [
+        CribbageGame.score_hand_static(cards + list(pair), starter, is_crib=True)
+        for starter in deck
+        for pair in combinations([card for card in deck if card != starter], 2)
+    ]
+    assert ai._expected_crib_score(cards, deck) == pytest.approx(sum(outcomes) / len(outcomes))
+
+
+def test_expected_hand_score_averages_every_starter() -> None:
+    hand = _cards("5H 5D 6S 7C")
+    deck = [card for card in Deck().cards if card not in hand]
+    expected = sum(CribbageGame.score_hand_static(hand, starter) for starter in deck) / len(deck)
+    assert ai._expected_hand_score(hand, deck) == pytest.approx(expected)
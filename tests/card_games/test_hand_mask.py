@@ -0,0 +1,71 @@
+"""Tests for bitmask hand sets and their use by trick-taking engines."""
+
+from __future__ import annotations
+
+from games_collection.games.card.common.cards import Card, Suit, parse_card
+from games_collection.games.card.common.hand_mask import SUIT_MASKS, HandMask
+from games_collection.games.card.euchre.game import EuchreGame, GamePhase
+from games_collection.games.card.hearts.game import HeartsGame, HeartsPlayer
+
+
+def _cards(codes: str) -> list[Card]:
+    return [parse_card(code) for code in codes.split()]
+
+
+def test_suit_masks_partition_the_deck() -> None:
+    combined = 0
+    for mask in SUIT_MASKS.values():
+        assert bin(mask).count("1") == 13
+        assert not combined & mask
+        combined |= mask
+    assert combined == (1 << 52) - 1
+
+
+def test_suit_queries_and_extremes() -> None:
+    hand = HandMask.from_cards(_cards("2C KC 9H AH TS"))
+    assert len(hand) == 5
+    assert hand.has_suit(Suit.HEARTS) and not hand.has_suit(Suit.DIAMONDS)
+    assert hand.count_suit(Suit.CLUBS) == 2
+    assert hand.highest(Suit.CLUBS) == parse_card("KC")
+    assert hand.lowest(Suit.HEARTS) == parse_card("9H")
+    assert hand.highest() == parse_card("AH")
+    assert hand.lowest() == parse_card("2C")
+    assert hand.highest(Suit.DIAMONDS) is None
+    assert list(hand.suit(Suit.HEARTS)) == _cards("9H AH")
+
+
+def test_follow_suit_falls_back_to_whole_hand() -> None:
+    hand = HandMask.from_cards(_cards("2C KC 9H"))
+    assert set(hand.follow_suit(Suit.CLUBS)) == set(_cards("2C KC"))
+    assert hand.follow_suit(Suit.SPADES) == hand
+    assert hand.follow_suit(None) == hand
+
+
+def test_filter_keeps_order_and_duplicates() -> None:
+    hand = _cards("KC 9H KC 2C")
+    assert HandMask.from_cards(hand).suit(Suit.CLUBS).filter(hand) == _cards("KC KC 2C")
+    assert parse_card("KC") in HandMask.from_cards(hand)
+    assert HandMask.from_cards(hand).without_card(parse_card("KC")).filter(hand) == _cards("9H 2C")
+
+
+def test_hearts_valid_plays_follow_first_trick_rules() -> None:
+    players = [HeartsPlayer(name=f"P{index}") for index in range(4)]
+    game = HeartsGame(players)
+    leader, follower = players[0], players[1]
+    leader.hand = _cards("2C 5D")
+    follower.hand = _cards("QS AH 3D")
+    game.play_card(leader, parse_card("2C"))
+    # Void in clubs on the first trick: penalty cards are off limits while a safe card exists.
+    assert game.get_valid_plays(follower) == _cards("3D")
+    follower.hand = _cards("QS AH")
+    assert game.get_valid_plays(follower) == _cards("QS AH")
+
+
+def test_euchre_left_bower_follows_trump() -> None:
+    game = EuchreGame()
+    game.phase = GamePhase.PLAY
+    game.trump = Suit.HEARTS
+    game.current_player = 1
+    game.current_trick = [(0, parse_card("9H"))]
+    game.hands[1] = _cards("JD AD KS")
+    assert game.get_legal_cards(1) == _cards("JD")
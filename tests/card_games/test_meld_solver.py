@@ -0,0 +1,100 @@
+"""Tests for the shared bitmask meld solver."""
+
+from __future__ import annotations
+
+import random
+from itertools import combinations
+
+import pytest
+
+from games_collection.games.card.common.cards import RANK_TO_VALUE, Deck, parse_card
+from games_collection.games.card.common.melds import MeldSolver, cards_to_mask
+from games_collection.games.card.gin_rummy.game import GinRummyGame, GinRummyPlayer, MeldType
+from games_collection.games.card.rummy500.game import Rummy500Game
+
+GIN_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1)
+
+
+def _cards(codes: str):
+    return [parse_card(code) for code in codes.split()]
+
+
+def _is_meld(cards) -> bool:
+    if all(card.rank == cards[0].rank for card in cards):
+        return True
+    values = sorted(RANK_TO_VALUE[card.rank] for card in cards)
+    return all(card.suit == cards[0].suit for card in cards) and values == list(range(values[0], values[0] + len(values)))
+
+
+def _brute_force_deadwood(cards, values) -> int:
+    melds = [frozenset(combo) for size in range(3, 6) for combo in combinations(cards, size) if _is_meld(combo)]
+    best = sum(values[RANK_TO_VALUE[card.rank]] for card in cards)
+
+    def search(index: int, used: frozenset) -> None:
+        nonlocal best
+        if index == len(melds):
+            best = min(best, sum(values[RANK_TO_VALUE[card.rank]] for card in cards if card not in used))
+            return
+        search(index + 1, used)
+        if not melds[index] & used:
+            search(index + 1, used | melds[index])
+
+    search(0, frozenset())
+    return best
+
+
+def test_solver_matches_brute_force_on_clustered_hands() -> None:
+    rng = random.Random(4)
+    # A narrow slice of the deck makes sets and overlapping runs common.
+    pool = [card for card in Deck().cards if card.rank in "56789T"]
+    solver = MeldSolver(GIN_VALUES)
+    for _ in range(150):
+        hand = rng.sample(pool, rng.randint(6, 11))
+        plan = solver.solve(hand)
+        assert plan.deadwood_points == _brute_force_deadwood(hand, GIN_VALUES)
+        used = plan.deadwood
+        for meld in plan.meld_cards:
+            assert _is_meld(meld)
+            assert not cards_to_mask(meld) & used
+            used |= cards_to_mask(meld)
+        assert used == cards_to_mask(hand)
+
+
+def test_four_of_a_kind_can_lend_a_card_to_a_run() -> None:
+    game = GinRummyGame([GinRummyPlayer("A"), GinRummyPlayer("B")])
+    analysis = game.analyze_hand(_cards("7C 7D 7H 7S 5H 6H"))
+    assert analysis.deadwood_total == 0
+    assert sorted(meld.meld_type.name for meld in analysis.melds) == ["RUN", "SET"]
+
+
+def test_solver_rejects_duplicate_cards() -> None:
+    with pytest.raises(ValueError):
+        MeldSolver(GIN_VALUES).solve(_cards("7C 7C 7D"))
+
+
+def test_cache_is_bounded() -> None:
+    solver = MeldSolver(GIN_VALUES, cache_size=8)
+    rng = random.Random(1)
+    for _ in range(20):
+        solver.solve(rng.sample(Deck().cards, 10))
+    assert len(solver._cache) <= 8
+
+
+def test_gin_ai_helpers_use_solver() -> None:
+    players = [GinRummyPlayer("A", is_ai=True), GinRummyPlayer("B", is_ai=True)]
+    game = GinRummyGame(players)
+    players[0].hand = _cards("4H 5H 6H 7C 7D 9S KS 2C 2D 3S KD")
+    assert game.suggest_discard(players[0]) in _cards("KS KD")
+
+    players[0].hand = _cards("4H 5H 6H 7C 7D 9S KS 2C 2D 3S")
+    assert game.should_draw_discard(players[0], parse_card("7S"))
+    assert not game.should_draw_discard(players[0], parse_card("QC"))
+    assert all(meld.meld_type in (MeldType.SET, MeldType.RUN) for meld in game.analyze_hand(players[0].hand).melds)
+
+
+def test_rummy500_summary_uses_solver() -> None:
+    game = Rummy500Game(num_players=2)
+    summary = game.summarize_cards(_cards("AH KH QH 7C 7D 7S 2C 9D"))
+    assert summary["deadwood_points"] == 11
+    assert summary["meld_points"] == 35 + 21
+    assert sorted(len(meld) for meld in summary["melds"]) == [3, 3]
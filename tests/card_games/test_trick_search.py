@@ -0,0 +1,117 @@
+"""Tests for determinized Monte Carlo card-play search."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from games_collection.games.card.common.cards import Suit, card_id, parse_card
+from games_collection.games.card.common.hand_mask import SUIT_MASKS, HandMask
+from games_collection.games.card.common.trick_search import (
+    SEARCH_DIFFICULTIES,
+    Observation,
+    SearchSettings,
+    deal_hidden,
+    mask_cards,
+    popcount,
+)
+from games_collection.games.card.hearts.game import HeartsGame, HeartsPlayer
+from games_collection.games.card.hearts.search import build_search_position as hearts_position
+from games_collection.games.card.spades.game import SpadesGame, SpadesPlayer
+from games_collection.games.card.spades.search import build_search_position as spades_position
+
+FAST_SEARCH = SearchSettings(samples=4, time_budget=5.0)
+
+
+def test_deal_hidden_respects_sizes_voids_and_known_cards() -> None:
+    own = HandMask.from_cards([parse_card(code) for code in "2C 3C 4C".split()]).bits
+    unseen = ((1 << 52) - 1) & ~own
+    unseen_cards = mask_cards(unseen)[:9]
+    unseen = sum(1 << card for card in unseen_cards)
+    known_card = unseen_cards[-1]
+    clubs = list(Suit).index(Suit.CLUBS)
+    observation = Observation(unseen=unseen, hand_sizes=[3, 3, 3, 3], voids=[0, 1 << clubs, 0, 0], known=[0, 0, 1 << known_card, 0])
+
+    rng = random.Random(0)
+    for _ in range(50):
+        hands = deal_hidden(observation, 0, own, rng)
+        assert hands[0] == own
+        assert [popcount(hand) for hand in hands] == [3, 3, 3, 3]
+        assert hands[1] | hands[2] | hands[3] == unseen
+        assert not hands[1] & SUIT_MASKS[Suit.CLUBS]
+        assert hands[2] >> known_card & 1
+
+
+def _play_hearts_round(game: HeartsGame, searcher: HeartsPlayer) -> None:
+    game.deal_cards()
+    game.pass_cards({player: game.select_cards_to_pass(player) for player in game.players})
+    leader = game.find_starting_player()
+    for _ in range(13):
+        start = game.players.index(leader)
+        for offset in range(4):
+            player = game.players[(start + offset) % 4]
+            rules, state, _ = hearts_position(game, player)
+            assert sorted(mask_cards(rules.legal(state, state.to_play))) == sorted(card_id(card) for card in game.get_valid_plays(player))
+            if player is searcher:
+                card = game.select_card_to_play(player)
+            else:
+                search, game.card_search = game.card_search, None
+                card = game.select_card_to_play(player)
+                game.card_search = search
+            game.play_card(player, card)
+        leader = game.complete_trick()
+
+
+def test_hearts_search_plays_legal_round_with_matching_rules() -> None:
+    players = [HeartsPlayer(name=f"P{index}", is_ai=True) for index in range(4)]
+    game = HeartsGame(players, rng=random.Random(7), search=FAST_SEARCH)
+    _play_hearts_round(game, players[0])
+    assert sum(game.calculate_scores().values()) in (26, 78)
+
+
+def test_hearts_search_knows_where_passed_cards_went() -> None:
+    players = [HeartsPlayer(name=f"P{index}", is_ai=True) for index in range(4)]
+    game = HeartsGame(players, rng=random.Random(3), search=FAST_SEARCH)
+    game.deal_cards()
+    passes = {player: game.select_cards_to_pass(player) for player in game.players}
+    game.pass_cards(passes)
+    _, _, observation = hearts_position(game, players[0])
+    # Round 0 passes left, so seat 1 holds what seat 0 passed.
+    assert observation.known[1] == HandMask.from_cards(passes[players[0]]).bits
+
+
+def test_hearts_search_is_reproducible_with_seeded_rng() -> None:
+    choices = []
+    for _ in range(2):
+        players = [HeartsPlayer(name=f"P{index}", is_ai=True) for index in range(4)]
+        game = HeartsGame(players, rng=random.Random(11), search=FAST_SEARCH)
+        game.deal_cards()
+        leader = game.find_starting_player()
+        game.play_card(leader, game.select_card_to_play(leader))
+        follower = game.players[(game.players.index(leader) + 1) % 4]
+        choices.append(game.select_card_to_play(follower))
+    assert choices[0] == choices[1]
+
+
+def test_spades_search_plays_legal_round() -> None:
+    players = [SpadesPlayer(name=f"P{index}", is_ai=True) for index in range(4)]
+    game = SpadesGame(players, rng=random.Random(5), search=FAST_SEARCH)
+    game.start_new_round()
+    for player in players:
+        game.register_bid(player, game.suggest_bid(player))
+    for _ in range(13):
+        for _ in range(4):
+            player = game.players[game.current_player_index]
+            rules, state, _ = spades_position(game, player)
+            assert sorted(mask_cards(rules.legal(state, state.to_play))) == sorted(card_id(card) for card in game.get_valid_plays(player))
+            game.play_card(player, game.select_card_to_play(player))
+        game.complete_trick()
+    assert sum(player.tricks_won for player in players) == 13
+
+
+def test_search_difficulty_presets() -> None:
+    assert SearchSettings.for_difficulty("Hard") == SearchSettings(samples=128, time_budget=1.0, workers=None)
+    assert SEARCH_DIFFICULTIES["easy"]["time_budget"] < SEARCH_DIFFICULTIES["hard"]["time_budget"]
+    with pytest.raises(ValueError):
+        SearchSettings.for_difficulty("impossible")
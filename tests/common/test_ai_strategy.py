@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import random
+import time
+from typing import Dict, List, Tuple
 
 import pytest
 
-from games_collection.core.ai_strategy import HeuristicStrategy
+from games_collection.core.ai_strategy import HeuristicStrategy, MCTSStrategy, MinimaxStrategy, check_backend, difficulty_preset
 
 
 class CallCountingHeuristic:
@@ -74,3 +76,220 @@ def test_select_move_uses_cached_scores() -> None:
     assert best_move_first == "A"
     assert best_move_second == "A"
     assert heuristic.count == 2, "Each unique move should be evaluated only once"
+
+
+State = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+
+class RandomTree:
+    """A deterministic game tree with pseudo-random leaf scores and transpositions."""
+
+    def __init__(self, branching: int, seed: int) -> None:
+        self.branching = branching
+        self.seed = seed
+
+    def moves(self, state: State) -> List[int]:
+        return list(range(self.branching))
+
+    def play(self, state: State, move: int) -> State:
+        # Each side's moves are kept sorted, so move orders transpose.
+        first, second = state
+        if len(first) == len(second):
+            return tuple(sorted(first + (move,))), second
+        return first, tuple(sorted(second + (move,)))
+
+    def evaluate(self, state: State) -> float:
+        return float(random.Random(hash((self.seed, state))).randint(-20, 20))
+
+
+def _minimax_value(tree: RandomTree, state: State, depth: int, maximizing: bool) -> float:
+    if depth == 0:
+        return tree.evaluate(state)
+    values = [_minimax_value(tree, tree.play(state, move), depth - 1, not maximizing) for move in tree.moves(state)]
+    return max(values) if maximizing else min(values)
+
+
+def _minimax_strategy(tree: RandomTree, **kwargs) -> MinimaxStrategy:
+    return MinimaxStrategy(
+        evaluation_fn=tree.evaluate,
+        transition_fn=tree.play,
+        move_generator=tree.moves,
+        is_terminal_fn=lambda state: False,
+        state_key_fn=lambda state: state,
+        rng=random.Random(0),
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_minimax_matches_plain_minimax(seed: int) -> None:
+    """Alpha-beta with a bounded table and move ordering must not change the result."""
+
+    tree = RandomTree(branching=4, seed=seed)
+    strategy = _minimax_strategy(tree, max_depth=4, table_size=64)
+    root: State = ((), ())
+    for _ in range(3):
+        values = {move: _minimax_value(tree, tree.play(root, move), 3, False) for move in tree.moves(root)}
+        best = max(values.values())
+        move = strategy.select_move(tree.moves(root), root)
+        assert values[move] == best
+        assert len(strategy._table) <= 64
+        root = tree.play(tree.play(root, move), seed % 4)
+
+
+def test_minimax_respects_time_budget() -> None:
+    """A deep search under a budget returns the deepest completed iteration in time."""
+
+    tree = RandomTree(branching=6, seed=1)
+    strategy = _minimax_strategy(tree, max_depth=40, time_budget=0.05)
+
+    start = time.perf_counter()
+    move = strategy.select_move(tree.moves(((), ())), ((), ()))
+    duration = time.perf_counter() - start
+
+    assert move in tree.moves(((), ()))
+    assert 1 <= strategy.last_depth < 40
+    assert duration < 0.5, f"Budgeted search took {duration:.3f}s"
+
+
+def test_minimax_table_persists_across_moves() -> None:
+    """The transposition table survives between decisions until cleared."""
+
+    tree = RandomTree(branching=3, seed=2)
+    strategy = _minimax_strategy(tree, max_depth=3)
+    strategy.select_move(tree.moves(((), ())), ((), ()))
+    assert strategy._table
+    strategy.select_move(tree.moves(((), ())), ((), ()))
+    assert strategy._table
+    strategy.clear_cache()
+    assert not strategy._table
+
+
+class InPlaceTree:
+    """Mutable wrapper that walks a :class:`RandomTree` with make/unmake."""
+
+    def __init__(self, tree: RandomTree) -> None:
+        self.tree = tree
+        self.path: List[State] = [((), ())]
+
+    def push(self, state: "InPlaceTree", move: int) -> "InPlaceTree":
+        self.path.append(self.tree.play(self.path[-1], move))
+        return self
+
+    def pop(self, state: "InPlaceTree") -> None:
+        self.path.pop()
+
+
+@pytest.mark.parametrize("time_budget", [None, 0.02])
+def test_minimax_make_unmake_matches_copying_search(time_budget: float | None) -> None:
+    """Searching one mutable state with an undo_fn matches the copying search and unwinds fully."""
+
+    tree = RandomTree(branching=4, seed=3)
+    walker = InPlaceTree(tree)
+    strategy = MinimaxStrategy(
+        max_depth=4 if time_budget is None else 40,
+        evaluation_fn=lambda state: tree.evaluate(state.path[-1]),
+        transition_fn=walker.push,
+        move_generator=lambda state: tree.moves(state.path[-1]),
+        is_terminal_fn=lambda state: False,
+        state_key_fn=lambda state: state.path[-1],
+        undo_fn=walker.pop,
+        time_budget=time_budget,
+        rng=random.Random(0),
+    )
+    move = strategy.select_move(tree.moves(((), ())), walker)
+    assert walker.path == [((), ())]
+    if time_budget is None:
+        values = {option: _minimax_value(tree, tree.play(((), ()), option), 3, False) for option in tree.moves(((), ()))}
+        assert values[move] == max(values.values())
+
+
+# Subtraction game: take one to three counters; whoever takes the last wins.
+# States are (counters left, player to move); module-level so they pickle.
+NimState = Tuple[int, int]
+
+
+def _nim_moves(state: NimState) -> List[int]:
+    return [take for take in (1, 2, 3) if take <= state[0]]
+
+
+def _nim_play(state: NimState, take: int) -> NimState:
+    return state[0] - take, 1 - state[1]
+
+
+def _nim_over(state: NimState) -> bool:
+    return state[0] == 0
+
+
+def _nim_player(state: NimState) -> int:
+    return state[1]
+
+
+def _nim_reward(state: NimState, player: int) -> float:
+    # The player to move at the end did not take the last counter.
+    return 0.0 if state[1] == player else 1.0
+
+
+def _mcts_strategy(**kwargs) -> MCTSStrategy:
+    return MCTSStrategy(
+        transition_fn=_nim_play,
+        move_generator=_nim_moves,
+        is_terminal_fn=_nim_over,
+        player_fn=_nim_player,
+        reward_fn=_nim_reward,
+        rng=random.Random(1),
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("counters", [5, 6, 7, 9, 10, 11])
+def test_mcts_finds_winning_subtraction_move(counters: int) -> None:
+    """Leaving a multiple of four counters is the only winning move."""
+
+    strategy = _mcts_strategy(iterations=3000)
+    move = strategy.select_move(_nim_moves((counters, 0)), (counters, 0))
+    assert (counters - move) % 4 == 0
+    assert strategy.last_iterations == 3000
+
+
+def test_mcts_time_budget_and_root_parallel_search() -> None:
+    """A budgeted search stops in time, and worker trees are merged."""
+
+    strategy = _mcts_strategy(iterations=None, time_budget=0.05)
+    start = time.perf_counter()
+    strategy.select_move(_nim_moves((30, 0)), (30, 0))
+    assert time.perf_counter() - start < 0.5
+    assert strategy.last_iterations >= 1
+
+    with _mcts_strategy(iterations=1500, workers=2) as parallel:
+        assert parallel.select_move(_nim_moves((7, 0)), (7, 0)) == 3
+        assert parallel.last_iterations == 3000
+        executor = parallel._executor
+        assert executor is not None
+        # Later decisions reuse the same worker processes.
+        assert parallel.select_move(_nim_moves((6, 0)), (6, 0)) == 2
+        assert parallel._executor is executor
+    assert parallel._executor is None
+
+
+def test_mcts_rejects_unbounded_search() -> None:
+    with pytest.raises(ValueError):
+        MCTSStrategy(iterations=None)
+    with pytest.raises(ValueError):
+        MCTSStrategy(workers=0)
+
+
+def test_difficulty_presets_and_backends_are_validated() -> None:
+    """Preset names ignore case and return a copy; unknown names and backends raise."""
+
+    presets = {"easy": {"depth": 1}, "hard": {"depth": 5, "time_budget": 1.0}}
+    settings = difficulty_preset(presets, "Hard", "Example")
+    assert settings == {"depth": 5, "time_budget": 1.0}
+    settings["depth"] = 9
+    assert presets["hard"]["depth"] == 5
+    with pytest.raises(ValueError, match="'easy', 'hard'"):
+        difficulty_preset(presets, "nightmare", "Example")
+
+    check_backend("board", ("bitboard", "board"), "Example")
+    with pytest.raises(ValueError, match="Example AI backend 'gpu'"):
+        check_backend("gpu", ("bitboard", "board"), "Example")
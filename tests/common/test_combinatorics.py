@@ -0,0 +1,17 @@
+"""Tests for the shared count-vector ranking."""
+
+from __future__ import annotations
+
+from itertools import product
+
+from games_collection.core.combinatorics import CountRanking
+
+
+def test_ranks_are_dense_and_ordered_by_bound() -> None:
+    """Every vector within a bound gets a distinct index below the count for that bound."""
+
+    ranking = CountRanking(slots=4, limit=6)
+    for bound in range(7):
+        vectors = [counts for counts in product(range(bound + 1), repeat=4) if sum(counts) <= bound]
+        assert ranking.count(bound) == len(vectors)
+        assert sorted(ranking.rank(counts, bound) for counts in vectors) == list(range(len(vectors)))
@@ -0,0 +1,67 @@
+"""Cross-checks for the table-driven poker hand evaluator."""
+
+from __future__ import annotations
+
+import random
+from itertools import combinations
+
+import pytest
+
+from games_collection.games.card.common.cards import Card, Deck, Suit
+from games_collection.games.card.poker import hand_strength
+from games_collection.games.card.poker.poker_core import HandCategory, best_hand, rank_five_card_hand
+
+
+def _reference_best(cards: list[Card]):
+    return max(rank_five_card_hand(combo) for combo in combinations(cards, 5))
+
+
+@pytest.mark.parametrize("hand_size", [5, 6, 7])
+def test_best_hand_matches_reference_enumeration(hand_size: int) -> None:
+    """The lookup evaluator must agree with exhaustive five-card scoring."""
+
+    rng = random.Random(hand_size)
+    deck = Deck().cards
+    for _ in range(400):
+        cards = rng.sample(deck, hand_size)
+        expected = _reference_best(cards)
+        ranked = best_hand(cards)
+
+        assert ranked == expected
+        assert rank_five_card_hand(ranked.cards) == ranked
+        assert ranked.strength == hand_strength.evaluate_cards(cards)
+
+
+def test_strength_ordering_matches_hand_rank() -> None:
+    """Integer strengths must sort exactly like ``HandRank`` objects."""
+
+    rng = random.Random(99)
+    deck = Deck().cards
+    hands = [rng.sample(deck, 7) for _ in range(300)]
+    ranks = [_reference_best(hand) for hand in hands]
+    strengths = [hand_strength.evaluate_cards(hand) for hand in hands]
+
+    for left, right in combinations(range(len(hands)), 2):
+        assert (ranks[left] < ranks[right]) == (strengths[left] < strengths[right])
+        assert (ranks[left] == ranks[right]) == (strengths[left] == strengths[right])
+
+
+def test_wheel_straight_flush_and_card_selection() -> None:
+    """The wheel ranks below a six-high straight flush and keeps its cards."""
+
+    wheel = [Card(rank, Suit.HEARTS) for rank in "A2345"] + [Card("K", Suit.CLUBS), Card("K", Suit.SPADES)]
+    six_high = [Card(rank, Suit.CLUBS) for rank in "23456"]
+
+    ranked = best_hand(wheel)
+    assert ranked.category == HandCategory.STRAIGHT_FLUSH
+    assert ranked.tiebreaker == (3,)
+    assert {card.suit for card in ranked.cards} == {Suit.HEARTS}
+    assert best_hand(six_high) > ranked
+
+
+def test_card_ids_round_trip() -> None:
+    """Every card maps to a unique id in ``0..51`` and back."""
+
+    ids = {hand_strength.card_id(card) for card in Deck().cards}
+    assert ids == set(range(52))
+    assert all(hand_strength.card_id(hand_strength.card_from_id(identifier)) == identifier for identifier in ids)
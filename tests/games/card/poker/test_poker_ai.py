@@ -8,8 +8,10 @@ import time
 
 import pytest
 
-from games_collection.games.card.common.cards import Card, Suit
-from games_collection.games.card.poker.poker import Player, estimate_win_rate
+from games_collection.games.card.common.cards import Card, Deck, Suit
+from games_collection.games.card.poker import equity, hand_strength
+from games_collection.games.card.poker.poker import DIFFICULTIES, Player, PokerMatch, estimate_win_rate
+from games_collection.games.card.poker.simulation_pool import SimulationPool
 
 
 @pytest.fixture
@@ -26,7 +28,8 @@ def sample_players() -> tuple[Player, list[Player]]:
     return hero, opponents
 
 
-def test_parallel_matches_serial(sample_players: tuple[Player, list[Player]]) -> None:
+@pytest.mark.parametrize("backend", ["python", "auto"])
+def test_parallel_matches_serial(sample_players: tuple[Player, list[Player]], backend: str) -> None:
     """Parallel estimation must match the serial estimator when seeded."""
 
     hero, opponents = sample_players
@@ -44,6 +47,7 @@ def test_parallel_matches_serial(sample_players: tuple[Player, list[Player]]) ->
         simulations=256,
         rng=serial_rng,
         max_workers=1,
+        backend=backend,
     )
 
     parallel_equity = estimate_win_rate(
@@ -53,6 +57,7 @@ def test_parallel_matches_serial(sample_players: tuple[Player, list[Player]]) ->
         simulations=256,
         rng=parallel_rng,
         max_workers=4,
+        backend=backend,
     )
 
     assert parallel_equity == pytest.approx(serial_equity, abs=1e-9)
@@ -80,6 +85,7 @@ def test_parallel_speedup(sample_players: tuple[Player, list[Player]]) -> None:
         simulations=simulations,
         rng=serial_rng,
         max_workers=1,
+        backend="python",
     )
     serial_duration = time.perf_counter() - serial_start
 
@@ -91,8 +97,180 @@ def test_parallel_speedup(sample_players: tuple[Player, list[Player]]) -> None:
         simulations=simulations,
         rng=parallel_rng,
         max_workers=worker_cap,
+        backend="python",
     )
     parallel_duration = time.perf_counter() - parallel_start
 
     assert parallel_equity == pytest.approx(serial_equity, abs=1e-9)
     assert parallel_duration < serial_duration * 0.9
+
+
+@pytest.mark.skipif(not equity.NUMPY_AVAILABLE, reason="vectorised equity requires NumPy")
+def test_vectorised_evaluator_matches_scalar() -> None:
+    """Batched array scoring must agree with the scalar lookup evaluator."""
+
+    import numpy as np
+
+    rng = random.Random(7)
+    deck = [hand_strength.card_id(card) for card in Deck().cards]
+    hands = np.array([rng.sample(deck, 7) for _ in range(500)])
+
+    expected = [hand_strength.evaluate(list(hand)) for hand in hands]
+    assert equity.evaluate_batch(hands).tolist() == expected
+
+
+@pytest.mark.skipif(not equity.NUMPY_AVAILABLE, reason="vectorised equity requires NumPy")
+def test_vectorised_backend_is_seeded_and_close_to_python(sample_players: tuple[Player, list[Player]]) -> None:
+    """The NumPy backend is deterministic per seed and agrees with the Python estimate."""
+
+    hero, opponents = sample_players
+    players = [hero] + opponents
+
+    def run(backend: str, seed: int, simulations: int) -> float:
+        return estimate_win_rate(
+            hero=hero,
+            players=players,
+            community_cards=[],
+            simulations=simulations,
+            rng=random.Random(seed),
+            max_workers=1,
+            backend=backend,
+        )
+
+    assert run("numpy", 11, 512) == run("numpy", 11, 512)
+    assert run("numpy", 3, 20_000) == pytest.approx(run("python", 3, 4_000), abs=0.03)
+
+
+def test_omaha_hands_stay_on_the_python_evaluator(sample_players: tuple[Player, list[Player]]) -> None:
+    """Four hole cards exceed the seven-card tables, so they are always scored in Python."""
+
+    _, opponents = sample_players
+    hero = Player(name="Omaha")
+    hero.hole_cards = [Card("A", Suit.SPADES), Card("A", Suit.HEARTS), Card("K", Suit.SPADES), Card("K", Suit.HEARTS)]
+    players = [hero] + opponents
+    community_cards = [Card("2", Suit.DIAMONDS), Card("7", Suit.CLUBS), Card("9", Suit.HEARTS)]
+
+    def run(backend: str) -> float:
+        return estimate_win_rate(
+            hero=hero,
+            players=players,
+            community_cards=community_cards,
+            simulations=300,
+            rng=random.Random(5),
+            max_workers=1,
+            backend=backend,
+        )
+
+    assert run("auto") == run("python")
+    assert 0.0 < run("python") < 1.0
+    if equity.NUMPY_AVAILABLE:
+        with pytest.raises(ValueError):
+            run("numpy")
+
+
+def test_shared_pool_matches_in_process_and_starts_lazily(sample_players: tuple[Player, list[Player]]) -> None:
+    """Seeded sub-streams give the same equity on a warm pool as in-process."""
+
+    hero, opponents = sample_players
+    players = [hero] + opponents
+
+    def run(pool, max_workers: int) -> float:
+        return estimate_win_rate(
+            hero=hero,
+            players=players,
+            community_cards=[],
+            simulations=300,
+            rng=random.Random(21),
+            max_workers=max_workers,
+            backend="python",
+            pool=pool,
+        )
+
+    with SimulationPool(2, min_parallel_simulations=10_000) as pool:
+        assert run(pool, 2) == run(None, 1)
+        assert not pool.started
+
+    with SimulationPool(2, min_parallel_simulations=0) as pool:
+        pooled = [pool.run((0, 1), (), 2, [(seed, 50) for seed in range(4)], backend="python") for _ in range(2)]
+        assert pool.started
+    assert not pool.started
+    assert pooled[0] == pooled[1]
+
+
+def test_match_close_shuts_down_shared_pool() -> None:
+    """Every bot shares the table pool, which stops when the match closes."""
+
+    with PokerMatch(DIFFICULTIES["Hard"], rng=random.Random(5)) as match:
+        pool = match.table.simulation_pool
+        pool._ensure_executor()
+        assert pool.started
+    assert not pool.started
+
+
+def test_preflop_table_lookup_is_used_by_bots(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pre-flop decisions read the bundled table instead of simulating."""
+
+    from games_collection.games.card.poker import poker, preflop
+
+    table = preflop.load_preflop_table()
+    assert table is not None
+    aces = [Card("A", Suit.SPADES), Card("A", Suit.HEARTS)]
+    trash = [Card("7", Suit.CLUBS), Card("2", Suit.DIAMONDS)]
+    assert table.equity(aces, 1) == pytest.approx(0.85, abs=0.02)
+    assert table.equity(trash, 1) == pytest.approx(0.35, abs=0.02)
+    assert table.equity(aces, 1) > table.equity(aces, 3) > table.equity(aces, 9)
+    assert table.equity(aces, 10) is None
+    assert {preflop.class_label(preflop.hand_class(*aces)), preflop.class_label(preflop.hand_class(*trash))} == {"AA", "72o"}
+
+    def fail_simulation(**_kwargs):
+        raise AssertionError("pre-flop decisions should not simulate")
+
+    monkeypatch.setattr(poker, "estimate_win_rate", fail_simulation)
+    with PokerMatch(DIFFICULTIES["Insane"], rng=random.Random(3)) as match:
+        match.table.start_hand()
+        for controller in match.bot_controllers:
+            controller.decide(match.table)
+
+
+def test_exact_enumeration_matches_brute_force() -> None:
+    """River equity from the enumerator equals a brute-force count."""
+
+    from itertools import combinations
+
+    from games_collection.games.card.poker.exact_equity import exact_equity
+
+    hero = tuple(hand_strength.card_id(card) for card in (Card("A", Suit.SPADES), Card("K", Suit.SPADES)))
+    board_cards = (Card("2", Suit.DIAMONDS), Card("7", Suit.CLUBS), Card("9", Suit.HEARTS), Card("Q", Suit.SPADES), Card("3", Suit.CLUBS))
+    board = tuple(hand_strength.card_id(card) for card in board_cards)
+    unseen = [card for card in range(52) if card not in hero + board]
+    hero_strength = hand_strength.evaluate(hero + board)
+    opponent_strengths = [hand_strength.evaluate(hole + board) for hole in combinations(unseen, 2)]
+
+    wins = sum(strength < hero_strength for strength in opponent_strengths)
+    ties = sum(strength == hero_strength for strength in opponent_strengths)
+    assert exact_equity(hero, board, 1) == (wins, ties, len(opponent_strengths))
+
+
+def test_turn_and_river_use_exact_equity(sample_players: tuple[Player, list[Player]]) -> None:
+    """Small search spaces are enumerated exactly, so the seed no longer matters."""
+
+    hero, opponents = sample_players
+    turn = [Card("2", Suit.DIAMONDS), Card("7", Suit.CLUBS), Card("9", Suit.HEARTS), Card("Q", Suit.SPADES)]
+
+    def run(players: list[Player], board: list[Card], seed: int, exact_threshold) -> float:
+        return estimate_win_rate(
+            hero=hero,
+            players=players,
+            community_cards=board,
+            simulations=200,
+            rng=random.Random(seed),
+            max_workers=1,
+            exact_threshold=exact_threshold,
+        )
+
+    heads_up = [hero, opponents[0]]
+    assert run(heads_up, turn, 1, 50_000) == run(heads_up, turn, 2, 50_000)
+    assert run(heads_up, turn, 1, 50_000) == pytest.approx(run(heads_up, turn, 1, None), abs=0.08)
+    assert run([hero] + opponents, turn, 1, 50_000) == run([hero] + opponents, turn, 2, 50_000)
+    # The flop is far too large for this budget and is still sampled.
+    assert run(heads_up, turn[:3], 1, 50_000) != run(heads_up, turn[:3], 2, 50_000)
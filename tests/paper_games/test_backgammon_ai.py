@@ -0,0 +1,132 @@
+"""Tests for backgammon move deduplication, the bearoff database and the expectiminimax AI."""
+
+from __future__ import annotations
+
+import random
+
+from games_collection.games.paper.backgammon.backgammon import BEAR_OFF, BackgammonAI, BackgammonGame, Move
+from games_collection.games.paper.backgammon.bearoff import BearoffTable, generate_table, load_bearoff_table, write_table
+from games_collection.games.paper.backgammon.position import flip, plays
+from games_collection.games.paper.backgammon.search import BackgammonSearch, evaluate
+
+
+def _blank_board() -> list[tuple[int | None, int]]:
+    return [(None, 0) for _ in range(24)]
+
+
+def test_plays_are_unique_per_resulting_position() -> None:
+    game = BackgammonGame()
+    for dice in ([1, 1], [6, 6], [3, 1], [6, 5]):
+        game.set_dice(dice)
+        results = [tuple(result) for _, result in plays(game.compact_position(), game._dice)]
+        assert len(results) == len(set(results)) == len(game.get_valid_moves())
+    # 6-6 from the start has a few hundred orderings but only 11 distinct results.
+    game.set_dice([6, 6])
+    assert len(game.get_valid_moves()) == 11
+
+
+def test_make_move_accepts_any_order_of_a_legal_play() -> None:
+    game = BackgammonGame()
+    game.set_dice([3, 1])
+    first, second = Move(7, 4, 3, False), Move(5, 4, 1, False)
+    assert (first, second) in game.get_valid_moves() or (second, first) in game.get_valid_moves()
+    assert game.make_move((second, first))
+    assert game.points[4].owner == 1 and game.points[4].count == 2
+
+    game.set_dice([3, 1])
+    assert not game.make_move((Move(0, 3, 3, False),))
+
+
+def test_positions_flip_back_and_forth() -> None:
+    game = BackgammonGame()
+    position = game.compact_position()
+    assert flip(flip(position)) == position
+    # The opening position is symmetric, so the contact evaluation is even.
+    assert evaluate(position) == evaluate(flip(position)) == 0.5
+
+
+def test_bundled_bearoff_table_matches_generation(tmp_path) -> None:
+    distributions = generate_table(3)
+    path = tmp_path / "bearoff.bin"
+    write_table(distributions, 3, path)
+    small = BearoffTable(path)
+    bundled = load_bearoff_table()
+    assert bundled is not None and bundled.max_checkers == 15
+    try:
+        for home in ([1, 0, 0, 0, 0, 0], [0, 0, 2, 0, 0, 1], [0, 0, 0, 0, 0, 3], [1, 1, 1, 0, 0, 0]):
+            expected = small.distribution(home)
+            assert abs(sum(expected) - 1.0) < 1e-3
+            assert bundled.distribution(home)[: len(expected)] == expected
+        assert small.expected_rolls([1, 0, 0, 0, 0, 0]) == 1.0
+        assert small.distribution([0] * 5 + [4]) is None
+    finally:
+        small.close()
+
+
+def test_pure_bearoffs_are_scored_exactly() -> None:
+    table = load_bearoff_table()
+    game = BackgammonGame()
+    points = _blank_board()
+    points[0] = (1, 2)
+    points[20] = (-1, 1)
+    game.load_position(points, bear_off={1: 13, -1: 14}, current_player=1)
+    # Two checkers on the ace point come off with any roll.
+    assert table.win_probability(game.compact_position()) == 1.0
+    # With the opponent on roll instead, only 2-1 fails to bring their checker home from the 4-point.
+    flipped = flip(game.compact_position())
+    assert evaluate(flipped, table) == table.win_probability(flipped)
+    assert abs(table.win_probability(flipped) - (1.0 - 2 / 36)) < 1e-4
+
+
+def test_search_bears_off_and_hits() -> None:
+    game = BackgammonGame()
+    points = _blank_board()
+    points[0] = (1, 1)
+    points[3] = (1, 1)
+    points[23] = (-1, 2)
+    game.load_position(points, bear_off={1: 13, -1: 13}, current_player=1)
+    game.set_dice([4, 1])
+    move = BackgammonAI(plies=1).choose_move(game)
+    assert all(single.target == BEAR_OFF for single in move)
+    assert game.make_move(move) and game.get_winner() == 1
+
+    # Hitting the opponent's last straggler turns a lost race round.
+    game = BackgammonGame()
+    points = _blank_board()
+    points[22] = (1, 2)
+    points[20] = (-1, 1)
+    points[23] = (-1, 14)
+    game.load_position(points, current_player=1)
+    game.set_dice([2, 1])
+    assert any(single.hit for single in BackgammonAI(plies=2).choose_move(game))
+
+
+def test_cube_decisions_follow_winning_chances() -> None:
+    ai = BackgammonAI(plies=1)
+    game = BackgammonGame()
+    assert not ai.should_offer_double(game)
+
+    points = _blank_board()
+    points[0] = (1, 2)
+    points[23] = (-1, 15)
+    game.load_position(points, bear_off={1: 13, -1: 0}, current_player=1)
+    assert ai.should_offer_double(game)
+    game.offer_double()
+    assert not ai.should_accept_double(game)
+    assert not ai.should_offer_double(game)
+
+
+def test_expectiminimax_plays_complete_games() -> None:
+    random.seed(2)
+    game = BackgammonGame()
+    ai = BackgammonAI(plies=1)
+    search = BackgammonSearch(plies=1)
+    for _ in range(400):
+        if game.is_game_over():
+            break
+        game.roll_dice()
+        assert search.best_play(game.compact_position(), game._dice) is not None
+        move = ai.choose_move(game)
+        assert move in game.get_valid_moves()
+        assert game.make_move(move)
+    assert game.is_game_over()
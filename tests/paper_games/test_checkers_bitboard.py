@@ -0,0 +1,169 @@
+"""Tests for the bitboard checkers core and the AI backend built on it."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from games_collection.core.game_engine import GameState
+from games_collection.games.paper.checkers import CheckersAI, CheckersGame, CheckersPiece, CheckersSearch, bitboard
+
+
+def _empty_game(player: str = "black") -> CheckersGame:
+    game = CheckersGame()
+    game._board = [[None for _ in range(game.board_size)] for _ in range(game.board_size)]
+    game._current_player = player
+    game._state = GameState.IN_PROGRESS
+    return game
+
+
+def _side(game: CheckersGame) -> int:
+    return bitboard.BLACK if game.get_current_player() == "black" else bitboard.WHITE
+
+
+def test_square_numbering_round_trips() -> None:
+    """Every dark square maps to an index and back; light squares have none."""
+
+    for index in range(32):
+        row, column = bitboard.square_coordinate(index)
+        assert bitboard.square_index(row, column) == index
+    assert bitboard.square_index(0, 0) is None
+    assert bitboard.square_index(8, 1) is None
+    assert bitboard.from_board(CheckersGame()._board) == bitboard.START[:3]
+
+
+def test_king_multi_jump_collects_every_branch() -> None:
+    """A king should follow each capture branch to its end."""
+
+    game = _empty_game()
+    game._board[4][3] = CheckersPiece("black", king=True)
+    game._board[3][2] = CheckersPiece("white")
+    game._board[3][4] = CheckersPiece("white")
+    game._board[1][4] = CheckersPiece("white")
+    game._board[1][2] = CheckersPiece("white")
+    paths = sorted(move.path for move in game.get_valid_moves())
+    assert paths == [
+        ((4, 3), (2, 1), (0, 3), (2, 5), (4, 3)),
+        ((4, 3), (2, 5), (0, 3), (2, 1), (4, 3)),
+    ]
+    assert all(len(move.captures) == 4 for move in game.get_valid_moves())
+
+
+def test_crowning_ends_a_jump_sequence() -> None:
+    """A man that is crowned mid-sequence stops jumping."""
+
+    game = _empty_game()
+    game._board[5][2] = CheckersPiece("black")
+    game._board[6][3] = CheckersPiece("white")
+    game._board[6][5] = CheckersPiece("white")
+    (move,) = game.get_valid_moves()
+    assert move.path == ((5, 2), (7, 4))
+    assert move.captures == ((6, 3),)
+
+
+def test_incremental_zobrist_matches_full_hash() -> None:
+    """Keys updated move by move must equal keys computed from scratch."""
+
+    rng = random.Random(4)
+    for _ in range(20):
+        black, white, kings, side = bitboard.START
+        key = bitboard.zobrist_key(black, white, kings, side)
+        while True:
+            moves, _ = bitboard.generate_moves(black, white, kings, side)
+            if not moves:
+                break
+            move = rng.choice(moves)
+            next_black, next_white, next_kings = bitboard.apply_move(black, white, kings, side, move)
+            crowned = not kings >> move[0][0] & 1 and bool(next_kings >> move[0][-1] & 1)
+            key = bitboard._move_key(key, kings, side, move, crowned)
+            black, white, kings, side = next_black, next_white, next_kings, 1 - side
+            assert key == bitboard.zobrist_key(black, white, kings, side)
+
+
+def test_opening_book_lines_are_legal() -> None:
+    """Building the book replays every line, so an illegal move would raise."""
+
+    search = CheckersSearch(rng=random.Random(0))
+    move = search.best_move(*bitboard.START, depth=6)
+    first_moves = {line.split()[0] for line in bitboard.OPENING_LINES}
+    assert move is not None and move[0] in {bitboard.parse_move(text) for text in first_moves}
+    assert search.nodes == 0
+
+
+def _plain_negamax(black: int, white: int, kings: int, side: int, depth: int, ply: int = 0) -> int:
+    """Negamax without pruning or tables, extending captures like the search."""
+
+    moves, capturing = bitboard.generate_moves(black, white, kings, side)
+    if not moves:
+        return -bitboard.WIN_SCORE + ply
+    if depth <= 0 and not capturing:
+        return bitboard.evaluate(black, white, kings, side)
+    return max(-_plain_negamax(*bitboard.apply_move(black, white, kings, side, move), 1 - side, max(depth - 1, 0), ply + 1) for move in moves)
+
+
+def test_search_value_matches_plain_negamax() -> None:
+    """Pruning, the table and null windows must not change the root value."""
+
+    rng = random.Random(8)
+    for _ in range(6):
+        black, white, kings, side = bitboard.START
+        for _ in range(rng.randrange(6, 30)):
+            moves, _ = bitboard.generate_moves(black, white, kings, side)
+            if not moves:
+                break
+            black, white, kings = bitboard.apply_move(black, white, kings, side, rng.choice(moves))
+            side = 1 - side
+        moves, _ = bitboard.generate_moves(black, white, kings, side)
+        if len(moves) < 2:
+            continue
+        search = CheckersSearch(book=False)
+        search.best_move(black, white, kings, side, depth=4)
+        depth, value, _, _ = search._table[bitboard.zobrist_key(black, white, kings, side)]
+        assert depth == 4
+        assert value == _plain_negamax(black, white, kings, side, 4)
+
+
+def test_endgame_lookup_is_consulted() -> None:
+    """Positions at or below the piece threshold use the lookup's score."""
+
+    probes = []
+
+    def lookup(black: int, white: int, kings: int, side: int) -> int:
+        probes.append((black, white, kings, side))
+        return 0
+
+    game = _empty_game()
+    game._board[0][1] = CheckersPiece("black", king=True)
+    game._board[7][6] = CheckersPiece("white", king=True)
+    search = CheckersSearch(book=False, endgame=lookup, endgame_pieces=2)
+    assert search.best_move(*bitboard.from_board(game._board), _side(game), depth=4) is not None
+    assert probes
+
+
+def test_time_budget_returns_a_finished_iteration() -> None:
+    search = CheckersSearch(book=False)
+    moves, _ = bitboard.generate_moves(*bitboard.START)
+    move = search.best_move(*bitboard.START, depth=40, time_budget=0.05)
+    assert move in moves
+    assert 1 <= search.last_depth < 40
+
+
+def test_ai_backends_agree_on_forced_capture() -> None:
+    """Both backends must take the only capture, and presets play legal moves."""
+
+    game = _empty_game()
+    game._board[2][1] = CheckersPiece("black")
+    game._board[3][2] = CheckersPiece("white")
+    game._board[6][5] = CheckersPiece("white")
+    for ai in (CheckersAI(depth=4), CheckersAI(depth=4, backend="board")):
+        assert ai.choose_move(game).is_jump
+    fresh = CheckersGame()
+    assert CheckersAI.for_difficulty("Medium").choose_move(fresh) in fresh.get_valid_moves()
+
+
+def test_ai_rejects_unknown_settings() -> None:
+    with pytest.raises(ValueError):
+        CheckersAI(backend="gpu")
+    with pytest.raises(ValueError):
+        CheckersAI.for_difficulty("grandmaster")
@@ -0,0 +1,143 @@
+"""Tests for the bitboard Connect Four solver."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from games_collection.games.paper.connect_four import ConnectFourGame, ConnectFourMove
+from games_collection.games.paper.connect_four.ai_minimax import ConnectFourPosition
+from games_collection.games.paper.connect_four.solver import (
+    BitboardPosition,
+    ConnectFourSolver,
+    ConnectFourSolverStrategy,
+)
+
+
+def _sequence(moves: str) -> BitboardPosition:
+    """Build a position from a string of one-based column numbers."""
+
+    return BitboardPosition.from_moves([int(column) - 1 for column in moves])
+
+
+def _played(moves: str) -> BitboardPosition:
+    """Play one-based columns without checking for wins along the way."""
+
+    position = BitboardPosition()
+    for column in moves:
+        position.play(int(column) - 1)
+    return position
+
+
+def _brute_force(position: BitboardPosition) -> int:
+    """Score a position by plain negamax, for comparison with the solver."""
+
+    if position.is_full():
+        return 0
+    columns = position.valid_columns()
+    for column in columns:
+        if position.is_winning_move(column):
+            return (position.width * position.height + 1 - position.moves) // 2
+    best = -position.width * position.height
+    for column in columns:
+        child = position.copy()
+        child.play(column)
+        best = max(best, -_brute_force(child))
+    return best
+
+
+def test_bitboard_detects_all_four_directions() -> None:
+    """Vertical, horizontal and both diagonal lines should be found."""
+
+    assert _played("1212121").last_player_won()
+    assert _played("1122334").last_player_won()
+    assert _played("12233434464").last_player_won()
+    assert _played("76655454424").last_player_won()
+    assert _sequence("1212121"[:-1]).is_winning_move(0)
+    assert not _played("1234567").last_player_won()
+
+
+def test_from_board_matches_move_sequence() -> None:
+    """Positions built from an engine board should equal the replayed sequence."""
+
+    game = ConnectFourGame()
+    for column in (3, 3, 2, 4, 2):
+        game.make_move(ConnectFourMove(column))
+    position = BitboardPosition.from_board(game.get_state_representation(), game.get_current_player())
+    expected = BitboardPosition.from_moves([3, 3, 2, 4, 2])
+    assert position.key() == expected.key()
+    assert position.moves == expected.moves
+
+
+def test_from_moves_rejects_finished_sequences() -> None:
+    """Sequences that overfill a column or play past a win are invalid."""
+
+    with pytest.raises(ValueError):
+        _sequence("1111111")
+    with pytest.raises(ValueError):
+        _sequence("12121212")
+
+
+def test_solver_scores_double_threat_as_loss() -> None:
+    """Three in a row open at both ends loses for the player to move."""
+
+    assert ConnectFourSolver().solve(_sequence("4444335")) == -17
+
+
+def test_solver_matches_brute_force_on_late_positions() -> None:
+    """The pruned search should agree with exhaustive negamax."""
+
+    rng = random.Random(7)
+    solver = ConnectFourSolver(table_size=4099)
+    checked = 0
+    while checked < 10:
+        position = BitboardPosition()
+        for _ in range(34):
+            columns = [column for column in position.valid_columns() if not position.is_winning_move(column)]
+            if not columns:
+                break
+            position.play(rng.choice(columns))
+        else:
+            if any(position.is_winning_move(column) for column in position.valid_columns()):
+                continue
+            expected = _brute_force(position)
+            assert solver.solve(position) == expected
+            assert solver.solve(position, weak=True) == (expected > 0) - (expected < 0)
+            assert max(solver.analyze(position).values()) == expected
+            checked += 1
+
+
+def test_solver_respects_node_limit() -> None:
+    """Exhausting the node budget should raise instead of returning a guess."""
+
+    with pytest.raises(RuntimeError):
+        ConnectFourSolver().solve(BitboardPosition(), node_limit=100)
+
+
+def test_solver_strategy_blocks_immediate_threat() -> None:
+    """The strategy must block an open three on the bottom row."""
+
+    board = (
+        (0, 0, 0, 0, 0, 0, 0),
+        (0, 0, 0, 0, 0, 0, 0),
+        (0, 0, 0, 0, 0, 0, 0),
+        (0, 0, 0, 0, 0, 0, 0),
+        (0, 0, 0, 2, 0, 0, 0),
+        (0, 0, 1, 1, 1, 2, 0),
+    )
+    position = ConnectFourPosition(board=board, current_player=2)
+    strategy = ConnectFourSolverStrategy(node_limit=5_000, rng=random.Random(0))
+    move = strategy.select_move(list(position.valid_moves()), position)
+    assert move == ConnectFourMove(1)
+
+
+def test_solver_strategy_falls_back_when_over_budget() -> None:
+    """An unsolvable early position should still produce a legal move."""
+
+    game = ConnectFourGame()
+    position = ConnectFourPosition(board=game.get_state_representation(), current_player=1)
+    strategy = ConnectFourSolverStrategy(node_limit=200, fallback_depth=3, rng=random.Random(0))
+    move = strategy.select_move(game.get_valid_moves(), position)
+    assert move in game.get_valid_moves()
+    assert not strategy.last_solved
@@ -0,0 +1,64 @@
+"""Tests for the push_move/pop_move protocol of the board game engines."""
+
+from __future__ import annotations
+
+import copy
+import random
+from typing import Any, Callable, List
+
+import pytest
+
+from games_collection.core.architecture.events import EventBus
+from games_collection.core.game_engine import GameEngine
+from games_collection.games.paper.checkers import CheckersGame
+from games_collection.games.paper.connect_four import ConnectFourGame
+from games_collection.games.paper.mancala import MancalaGame
+from games_collection.games.paper.othello import OthelloGame
+from games_collection.games.paper.pentago import PentagoGame
+from games_collection.games.paper.sprouts import SproutsGame
+
+ENGINES: List[Callable[[], GameEngine]] = [
+    CheckersGame,
+    lambda: ConnectFourGame(event_bus=EventBus()),
+    MancalaGame,
+    # Larger pits make sowing lap the board, which pop_move must retrace.
+    lambda: MancalaGame(stones_per_pit=9),
+    OthelloGame,
+    PentagoGame,
+]
+
+
+def _snapshot(game: GameEngine) -> Any:
+    """Return everything about the game except its undo stack and event bus."""
+
+    return {key: copy.deepcopy(value) for key, value in vars(game).items() if key not in {"_undo_stack", "_event_bus"}}
+
+
+@pytest.mark.parametrize("factory", ENGINES)
+def test_push_matches_make_and_pop_restores(factory: Callable[[], GameEngine]) -> None:
+    """Pushing a move equals making it, and popping every move restores each earlier state."""
+
+    rng = random.Random(11)
+    for _ in range(5):
+        game = factory()
+        reference = factory()
+        history = []
+        while not game.is_game_over() and len(history) < 120:
+            move = rng.choice(game.get_valid_moves())
+            assert reference.make_move(move)
+            history.append(_snapshot(game))
+            game.push_move(move)
+            assert _snapshot(game) == _snapshot(reference)
+        while history:
+            game.pop_move()
+            assert _snapshot(game) == history.pop()
+
+
+def test_engines_report_push_pop_support() -> None:
+    """Engines without the protocol raise instead of silently mutating."""
+
+    assert CheckersGame().supports_push_pop()
+    game = SproutsGame()
+    assert not game.supports_push_pop()
+    with pytest.raises(NotImplementedError):
+        game.push_move(game.get_valid_moves()[0])
@@ -0,0 +1,134 @@
+"""Tests for the Kalah endgame database and transposition-table search."""
+
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+
+import pytest
+
+from games_collection.games.paper.mancala import MancalaAI, MancalaGame, MancalaSearch
+from games_collection.games.paper.mancala.endgame import EndgameTable, generate_table, load_endgame_table, rank, sow, table_size, write_table
+
+
+def _relative(board: list, player: int) -> tuple:
+    return tuple(board[0:6] + board[7:13]) if player == 0 else tuple(board[7:13] + board[0:6])
+
+
+@lru_cache(maxsize=None)
+def _solve(pits: tuple) -> int:
+    """Plain memoized negamax over the remaining stones."""
+    own = sum(pits[:6])
+    if not own or own == sum(pits):
+        return 2 * own - sum(pits)
+    best = None
+    for pit in range(6):
+        if pits[pit]:
+            gain, child, again = sow(pits, pit)
+            if child is not None:
+                gain = gain + _solve(child) if again else gain - _solve(child)
+            best = gain if best is None else max(best, gain)
+    return best
+
+
+def _random_pits(rng: random.Random, stones: int) -> tuple:
+    while True:
+        pits = [0] * 12
+        for _ in range(stones):
+            pits[rng.randrange(12)] += 1
+        if any(pits[:6]) and any(pits[6:]):
+            return tuple(pits)
+
+
+def test_sowing_matches_the_engine() -> None:
+    """Gains and successors of :func:`sow` agree with :class:`MancalaGame`."""
+
+    rng = random.Random(5)
+    for _ in range(200):
+        game = MancalaGame(stones_per_pit=rng.choice([1, 3, 4, 6]))
+        while not game.is_game_over():
+            player = game.get_current_player()
+            before = list(game._board)
+            move = rng.choice(game.get_valid_moves())
+            gain, child, again = sow(_relative(before, player), move.pit_index - 7 * player)
+            game.make_move(move)
+            after = game._board
+            own_store, other_store = (6, 13) if player == 0 else (13, 6)
+            assert gain == (after[own_store] - before[own_store]) - (after[other_store] - before[other_store])
+            if child is None:
+                assert game.is_game_over()
+            else:
+                assert game.get_current_player() == (player if again else 1 - player)
+                assert child == _relative(list(after), game.get_current_player())
+
+
+def test_retrograde_table_matches_exhaustive_search(tmp_path) -> None:
+    values = generate_table(5)
+    path = tmp_path / "endgame.bin"
+    write_table(values, 5, path)
+    table = EndgameTable(path)
+    try:
+        assert table.max_stones == 5
+        rng = random.Random(11)
+        for _ in range(300):
+            pits = _random_pits(rng, rng.randint(2, 5))
+            assert table.value(pits) == _solve(pits)
+        assert table.value((1,) * 12) is None
+    finally:
+        table.close()
+    assert len({rank(pits, 3) for pits in _all_pits(3)}) == table_size(3)
+
+
+def _all_pits(stones: int):
+    """Every arrangement of at most ``stones`` stones."""
+
+    def place(slots: int, left: int):
+        if slots == 0:
+            yield ()
+            return
+        for count in range(left + 1):
+            for rest in place(slots - 1, left - count):
+                yield (count,) + rest
+
+    return place(12, stones)
+
+
+def test_search_solves_positions_exactly_without_the_table() -> None:
+    rng = random.Random(3)
+    search = MancalaSearch()
+    for _ in range(30):
+        pits = _random_pits(rng, rng.randint(4, 9))
+        pit = search.best_pit(pits, 60)
+        assert search.solved
+        gain, child, again = sow(pits, pit)
+        if child is not None:
+            gain = gain + _solve(child) if again else gain - _solve(child)
+        assert gain == _solve(pits)
+
+
+def test_bundled_table_answers_late_positions_without_searching() -> None:
+    table = load_endgame_table()
+    assert table is not None and table.max_stones >= 8
+    search = MancalaSearch(table)
+    pits = (0, 2, 0, 1, 0, 3, 1, 0, 0, 2, 0, 0)
+    pit = search.best_pit(pits, 10)
+    assert search.nodes == 0 and search.solved
+    gain, child, again = sow(pits, pit)
+    assert gain + (table.value(child) if again else -table.value(child)) == _solve(pits)
+
+
+def test_expert_does_not_lose_to_random_play() -> None:
+    with pytest.raises(ValueError):
+        MancalaAI.for_difficulty("grandmaster")
+    assert MancalaAI.for_difficulty("Expert").time_budget is not None
+
+    rng = random.Random(8)
+    for stones in (3, 4):
+        game = MancalaGame(stones_per_pit=stones)
+        ai = MancalaAI(depth=64, time_budget=0.05)
+        while not game.is_game_over():
+            if game.get_current_player() == 0:
+                game.make_move(rng.choice(game.get_valid_moves()))
+            else:
+                assert game.make_move(ai.choose_move(game))
+        assert game.get_winner() == 1
@@ -0,0 +1,153 @@
+"""Tests for the bitboard Othello core and the AI backend built on it."""
+
+from __future__ import annotations
+
+import random
+from typing import Iterator, Tuple
+
+import pytest
+
+from games_collection.games.paper.othello import OthelloAI, OthelloGame, OthelloMove, OthelloSearch, bitboard
+
+
+def _random_positions(seed: int, games: int) -> Iterator[OthelloGame]:
+    """Yield the engine at every turn of ``games`` random games."""
+
+    rng = random.Random(seed)
+    for _ in range(games):
+        game = OthelloGame()
+        while not game.is_game_over():
+            yield game
+            game.make_move(rng.choice(game.get_valid_moves()))
+
+
+def _position(game: OthelloGame) -> Tuple[int, int]:
+    return bitboard.from_board(game.get_state_representation(), game.get_current_player())
+
+
+def _brute_force(player: int, opponent: int, passed: bool = False) -> int:
+    """Exact final disc difference by plain negamax."""
+
+    moves = bitboard.legal_moves(player, opponent)
+    if not moves:
+        if passed:
+            return bitboard.final_score(player, opponent)
+        return -_brute_force(opponent, player, True)
+    best = -64
+    for row, column in bitboard.squares(moves):
+        move = bitboard.square_bit(row, column)
+        flipped = bitboard.flips(player, opponent, move)
+        best = max(best, -_brute_force(opponent & ~flipped, player | flipped | move))
+    return best
+
+
+def test_moves_and_flips_match_board_scan() -> None:
+    """Shift-based generation should agree with walking each direction on the board."""
+
+    for game in _random_positions(seed=3, games=20):
+        board = [list(row) for row in game.get_state_representation()]
+        player = game.get_current_player()
+        own, other = _position(game)
+        moves = bitboard.legal_moves(own, other)
+        for row in range(8):
+            for column in range(8):
+                expected = game._discs_to_flip(board, player, row, column) if board[row][column] == "." else []
+                bit = bitboard.square_bit(row, column)
+                assert bool(moves & bit) == bool(expected)
+                if expected:
+                    assert bitboard.flips(own, other, bit) == sum(bitboard.square_bit(r, c) for r, c in expected)
+
+
+def test_stable_discs_grow_from_corners() -> None:
+    """A filled corner row is stable; discs off the edge next to empties are not."""
+
+    own = 0xFF | bitboard.square_bit(1, 0) | bitboard.square_bit(3, 3)
+    other = bitboard.square_bit(1, 1)
+    stable = bitboard.stable_discs(own, other)
+    assert stable == 0xFF | bitboard.square_bit(1, 0)
+    assert bitboard.stable_discs(0, 0) == 0
+
+
+def test_stable_discs_are_never_flipped() -> None:
+    """Discs reported stable must keep their colour for the rest of the game."""
+
+    rng = random.Random(11)
+    for _ in range(10):
+        game = OthelloGame()
+        tracked = []
+        while not game.is_game_over():
+            player = game.get_current_player()
+            own, other = _position(game)
+            tracked.append((player, bitboard.stable_discs(own, other)))
+            game.make_move(rng.choice(game.get_valid_moves()))
+        board = game.get_state_representation()
+        for player, stable in tracked:
+            own, _ = bitboard.from_board(board, player)
+            assert stable & ~own == 0
+
+
+def test_solver_matches_brute_force() -> None:
+    """The pruned exact solver should agree with plain negamax near the end."""
+
+    rng = random.Random(5)
+    checked = 0
+    while checked < 8:
+        game = OthelloGame()
+        while sum(row.count(".") for row in game.get_state_representation()) > 8 and not game.is_game_over():
+            game.make_move(rng.choice(game.get_valid_moves()))
+        if game.is_game_over():
+            continue
+        own, other = _position(game)
+        assert OthelloSearch().solve(own, other) == _brute_force(own, other)
+        checked += 1
+
+
+def test_endgame_best_move_achieves_solved_score() -> None:
+    """In the endgame the chosen move should keep the exact best result."""
+
+    rng = random.Random(9)
+    search = OthelloSearch()
+    game = OthelloGame()
+    while sum(row.count(".") for row in game.get_state_representation()) > 9:
+        game.make_move(rng.choice(game.get_valid_moves()))
+    own, other = _position(game)
+    best = search.best_move(own, other, depth=1, endgame_empties=10)
+    flipped = bitboard.flips(own, other, best)
+    assert -search.solve(other & ~flipped, own | flipped | best) == search.solve(own, other)
+
+
+def test_search_returns_legal_move_within_budget() -> None:
+    """A timed search still completes one iteration and returns a legal move."""
+
+    own, other = _position(OthelloGame())
+    search = OthelloSearch()
+    move = search.best_move(own, other, depth=30, endgame_empties=0, time_budget=0.05)
+    assert move is not None and move & bitboard.legal_moves(own, other)
+    assert 1 <= search.last_depth < 30
+    assert search.best_move(0, 0, depth=3) is None
+
+
+def test_ai_backends_choose_valid_moves() -> None:
+    """Both backends and a difficulty preset should play legal moves."""
+
+    game = OthelloGame()
+    for ai in (OthelloAI(depth=2), OthelloAI(depth=2, backend="board"), OthelloAI.for_difficulty("Hard")):
+        assert ai.choose_move(game) in game.get_valid_moves()
+
+
+def test_ai_passes_when_it_has_no_move() -> None:
+    """The bitboard backend must hand back the engine's pass move."""
+
+    game = OthelloGame()
+    game._board = [["black"] * 8 for _ in range(8)]
+    game._board[0][0] = "."
+    game._board[2][1] = "white"
+    game._current_player = "white"
+    assert OthelloAI().choose_move(game) == OthelloMove(-1, -1, is_pass=True)
+
+
+def test_ai_rejects_unknown_settings() -> None:
+    with pytest.raises(ValueError):
+        OthelloAI(backend="gpu")
+    with pytest.raises(ValueError):
+        OthelloAI.for_difficulty("impossible")
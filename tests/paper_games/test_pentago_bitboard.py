@@ -0,0 +1,181 @@
+"""Tests for the bitboard Pentago core and the AI backend built on it."""
+
+from __future__ import annotations
+
+import random
+from typing import Iterator, List
+
+import pytest
+
+from games_collection.games.paper.pentago import PentagoAI, PentagoGame, PentagoMove, PentagoSearch, bitboard
+
+
+def _random_positions(seed: int, games: int) -> Iterator[PentagoGame]:
+    """Yield the engine at every turn of ``games`` random games."""
+
+    rng = random.Random(seed)
+    for _ in range(games):
+        game = PentagoGame()
+        while not game.is_game_over():
+            yield game
+            game.make_move(rng.choice(game.get_valid_moves()))
+
+
+def _transformed(board: List[List[int]], symmetry: int) -> List[List[int]]:
+    image = [[0] * 6 for _ in range(6)]
+    for row in range(6):
+        for column in range(6):
+            image_row, image_column = bitboard._SYMMETRIES[symmetry](row, column)
+            image[image_row][image_column] = board[row][column]
+    return image
+
+
+def _move_code(move: PentagoMove) -> int:
+    return bitboard.encode_move(move.row, move.column, move.quadrant, move.direction == "CW")
+
+
+def test_moves_and_fives_match_the_engine() -> None:
+    """Applying a move to the bitboards must match the engine's placement and rotation."""
+
+    rng = random.Random(1)
+    for game in _random_positions(seed=2, games=15):
+        player = game.get_current_player()
+        own, other = bitboard.from_board(game.get_board_snapshot(), player)
+        move = rng.choice(game.get_valid_moves())
+        expected = game.get_board_snapshot()
+        PentagoGame.apply_move_to_board(expected, move, player)
+        assert bitboard.apply_move(own, other, _move_code(move)) == bitboard.from_board(expected, player)
+        for mark in (1, 2):
+            assert bitboard.has_five(bitboard.from_board(expected, mark)[0]) == PentagoGame._has_five_in_a_row(expected, mark)
+
+
+def test_symmetric_positions_share_keys_and_moves() -> None:
+    """Mirrored boards have one canonical key, and moves map between the copies."""
+
+    rng = random.Random(3)
+    for game in _random_positions(seed=4, games=5):
+        board = game.get_board_snapshot()
+        player = game.get_current_player()
+        position = bitboard.from_board(board, player)
+        choice = rng.choice(game.get_valid_moves())
+        move = _move_code(choice)
+        after = game.get_board_snapshot()
+        PentagoGame.apply_move_to_board(after, choice, player)
+        for symmetry in range(8):
+            image = bitboard.from_board(_transformed(board, symmetry), player)
+            assert bitboard.canonical_key(*image)[0] == bitboard.canonical_key(*position)[0]
+            moved = bitboard.apply_move(*image, bitboard._MOVE_IMAGES[symmetry][move])
+            assert moved == bitboard.from_board(_transformed(after, symmetry), player)
+
+
+def test_incremental_evaluation_matches_line_scan() -> None:
+    """Table-driven scoring must equal summing every line of five."""
+
+    rng = random.Random(5)
+    for _ in range(500):
+        cells = rng.sample(range(36), rng.randrange(36))
+        split = rng.randrange(len(cells) + 1)
+        own = sum(1 << cell for cell in cells[:split])
+        other = sum(1 << cell for cell in cells[split:])
+        expected = bitboard._CENTRE_WEIGHT * (bitboard.popcount(own & bitboard.CENTRES) - bitboard.popcount(other & bitboard.CENTRES))
+        expected += sum(bitboard._window_score(own & line, other & line) for line in bitboard.LINES)
+        assert bitboard.evaluate(own, other) == expected == -bitboard.evaluate(other, own)
+
+
+def _plain_negamax(own: int, other: int, depth: int) -> int:
+    """Negamax without pruning, tables or symmetry, scored like the search."""
+
+    best = None
+    empty = ~(own | other) & bitboard.FULL
+    for move in range(bitboard.CELLS * 8):
+        if not empty >> (move >> 3) & 1:
+            continue
+        mover, rest = bitboard.apply_move(own, other, move)
+        terminal = bitboard._terminal_score(mover, rest)
+        if terminal is not None:
+            score = terminal + (depth - 1) if terminal > 0 else terminal - (depth - 1) if terminal < 0 else 0
+        elif depth == 1:
+            score = -bitboard.evaluate(rest, mover)
+        else:
+            score = -_plain_negamax(rest, mover, depth - 1)
+        best = score if best is None else max(best, score)
+    return 0 if best is None else best
+
+
+def test_search_value_matches_plain_negamax() -> None:
+    """Pruning, the symmetric table and incremental leaves must not change the value."""
+
+    rng = random.Random(6)
+    checked = 0
+    while checked < 4:
+        game = PentagoGame()
+        for _ in range(rng.randrange(24, 30)):
+            if game.is_game_over():
+                break
+            game.make_move(rng.choice(game.get_valid_moves()))
+        if game.is_game_over():
+            continue
+        own, other = bitboard.from_board(game.get_board_snapshot(), game.get_current_player())
+        search = PentagoSearch()
+        assert search._negamax(own, other, 2, -2 * bitboard.WIN_SCORE, 2 * bitboard.WIN_SCORE) == _plain_negamax(own, other, 2)
+        checked += 1
+
+
+def test_horizon_matches_static_evaluation() -> None:
+    """Incremental leaf scores must equal evaluating every child, centres included."""
+
+    rng = random.Random(7)
+    search = PentagoSearch()
+    for _ in range(300):
+        cells = rng.sample(range(36), rng.randrange(1, 12))
+        split = len(cells) // 2
+        own = sum(1 << cell for cell in cells[:split])
+        other = sum(1 << cell for cell in cells[split:])
+        expected = None
+        for move in range(bitboard.CELLS * 8):
+            if (own | other) >> (move >> 3) & 1:
+                continue
+            mover, rest = bitboard.apply_move(own, other, move)
+            terminal = bitboard._terminal_score(mover, rest)
+            score = bitboard.evaluate(mover, rest) if terminal is None else terminal
+            expected = score if expected is None else max(expected, score)
+        assert search._horizon(own, other, 2 * bitboard.WIN_SCORE)[0] == expected
+
+
+def test_ai_takes_an_immediate_win() -> None:
+    """Whenever some turn wins outright, the AI must play a winning turn."""
+
+    found = 0
+    for game in _random_positions(seed=8, games=40):
+        if found == 5:
+            break
+        player = game.get_current_player()
+        if not any(_wins(game, move, player) for move in game.get_valid_moves()):
+            continue
+        found += 1
+        assert _wins(game, PentagoAI(depth=2, time_budget=None).choose_move(game), player)
+    assert found == 5
+
+
+def _wins(game: PentagoGame, move: PentagoMove, player: int) -> bool:
+    board = game.get_board_snapshot()
+    PentagoGame.apply_move_to_board(board, move, player)
+    return PentagoGame._detect_winners_on_board(board) == {player}
+
+
+def test_ai_backends_play_legal_moves() -> None:
+    """Both backends return a legal turn, and the hard preset completes a depth-three search."""
+
+    game = PentagoGame()
+    game.make_move(PentagoMove(2, 2, 0, "CW"))
+    hard = PentagoAI.for_difficulty("Hard")
+    for ai in (hard, PentagoAI(backend="heuristic")):
+        assert ai.choose_move(game) in game.get_valid_moves()
+    assert hard._search.last_depth == 3
+
+
+def test_ai_rejects_unknown_settings() -> None:
+    with pytest.raises(ValueError):
+        PentagoAI(backend="gpu")
+    with pytest.raises(ValueError):
+        PentagoAI.for_difficulty("impossible")
@@ -0,0 +1,98 @@
+"""Tests for logical Sudoku grading, graded generation and the puzzle bank."""
+
+from __future__ import annotations
+
+import random
+from datetime import date
+
+import pytest
+
+from games_collection.core.challenges import DifficultyLevel, get_default_challenge_manager
+from games_collection.core.daily_challenges import DailyChallengeSelection
+from games_collection.games.paper.sudoku.bank import BANK_SIZE, PuzzleBank, build_bank, load_puzzle_bank, write_bank
+from games_collection.games.paper.sudoku.grading import GRADES, TECHNIQUES, grade_puzzle
+from games_collection.games.paper.sudoku.solver import has_unique_solution, solve
+from games_collection.games.paper.sudoku.sudoku import SudokuGenerator
+
+# Needs trial and error once every pattern is exhausted.
+HARD = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+
+def _grid(text: str) -> list[list[int]]:
+    return [[int(text[row * 9 + column]) for column in range(9)] for row in range(9)]
+
+
+def test_trace_only_makes_sound_deductions() -> None:
+    generator = SudokuGenerator(rng=random.Random(4))
+    for _ in range(12):
+        puzzle = generator.generate("expert", graded=False)
+        report = grade_puzzle(puzzle.starting_board)
+        assert report.score == sum(TECHNIQUES[step.technique][0] for step in report.trace)
+        for step in report.trace:
+            if step.placed is not None:
+                row, column, value = step.placed
+                assert puzzle.solution[row][column] == value
+            assert all(puzzle.solution[row][column] != value for row, column, value in step.eliminated)
+        placed = {step.placed[:2] for step in report.trace if step.placed is not None}
+        assert len(placed) == sum(cell == 0 for row in puzzle.starting_board for cell in row)
+
+
+def test_grades_follow_the_hardest_technique() -> None:
+    report = grade_puzzle(_grid(HARD))
+    assert report.grade == "expert" and report.needs_trial
+    assert report.hardest == "trial"
+
+    nearly_full = solve(_grid(HARD))
+    for row, column in ((0, 0), (4, 4), (8, 8)):
+        nearly_full[row][column] = 0
+    easy = grade_puzzle(nearly_full)
+    assert easy.grade == "easy" and easy.hardest == "naked_single" and easy.score == 3
+
+    with pytest.raises(ValueError):
+        grade_puzzle([[1] * 9 for _ in range(9)])
+
+
+@pytest.mark.parametrize("grade", GRADES)
+def test_generation_hits_the_target_grade(grade: str) -> None:
+    puzzle = SudokuGenerator(rng=random.Random(21)).generate(grade)
+    assert puzzle.difficulty == grade
+    assert has_unique_solution(puzzle.starting_board)
+    assert grade_puzzle(puzzle.starting_board, puzzle.solution).grade == grade
+
+
+def test_bundled_bank_serves_every_grade(tmp_path) -> None:
+    bank = load_puzzle_bank()
+    assert bank is not None and bank.grades == list(GRADES)
+    for grade in GRADES:
+        assert bank.count(grade) == BANK_SIZE
+        puzzle = bank.puzzle(grade, 7)
+        assert grade_puzzle(puzzle.starting_board, puzzle.solution).grade == grade
+        assert bank.puzzle(grade, 7 + BANK_SIZE).starting_board == puzzle.starting_board
+        assert bank.score(grade, 0) <= bank.score(grade, BANK_SIZE - 1)
+
+    path = tmp_path / "bank.json"
+    write_bank(build_bank(1, seed=3, workers=1), path)
+    small = PuzzleBank(path)
+    assert [small.count(grade) for grade in GRADES] == [1, 1, 1, 1]
+    with pytest.raises(ValueError):
+        small.puzzle("impossible", 0)
+    path.write_text("{}", encoding="utf-8")
+    with pytest.raises(ValueError):
+        PuzzleBank(path)
+
+
+def test_daily_sudoku_is_fixed_for_the_day() -> None:
+    pack = get_default_challenge_manager().get_pack("Sudoku Mastery")
+    assert pack is not None
+    graded = pack.get_challenge("sudoku_graded_hard")
+    assert graded is not None and graded.difficulty == DifficultyLevel.ADVANCED
+
+    first = DailyChallengeSelection(date(2024, 3, 1), pack, graded).build_puzzle()
+    again = DailyChallengeSelection(date(2024, 3, 1), pack, graded).build_puzzle()
+    other = DailyChallengeSelection(date(2024, 3, 2), pack, graded).build_puzzle()
+    assert first.starting_board == again.starting_board != other.starting_board
+    assert grade_puzzle(first.starting_board, first.solution).grade == "hard"
+    assert not graded.validate(first)
+
+    curated = pack.get_challenge("sudoku_corner_cross")
+    assert DailyChallengeSelection(date(2024, 3, 1), pack, curated).build_puzzle().difficulty == "easy"
@@ -0,0 +1,81 @@
+"""Tests for the bitmask and exact-cover Sudoku solvers and batch generation."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from games_collection.core.challenges import generate_sudoku_builders
+from games_collection.games.paper.sudoku.solver import METHODS, count_solutions, has_unique_solution, solve
+from games_collection.games.paper.sudoku.sudoku import SudokuGenerator
+
+# A puzzle that defeats singles and needs deep branching.
+HARD = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+
+def _grid(text: str) -> list[list[int]]:
+    return [[int(text[row * 9 + column]) for column in range(9)] for row in range(9)]
+
+
+def _is_valid_solution(grid: list[list[int]]) -> bool:
+    units = [row for row in grid]
+    units += [[grid[row][column] for row in range(9)] for column in range(9)]
+    units += [[grid[row][column] for row in range(box // 3 * 3, box // 3 * 3 + 3) for column in range(box % 3 * 3, box % 3 * 3 + 3)] for box in range(9)]
+    return all(sorted(unit) == list(range(1, 10)) for unit in units)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_solvers_find_the_unique_solution(method: str) -> None:
+    grid = _grid(HARD)
+    solution = solve(grid, method=method)
+    assert solution is not None and _is_valid_solution(solution)
+    assert all(grid[row][column] in (0, solution[row][column]) for row in range(9) for column in range(9))
+    assert has_unique_solution(grid, method=method)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_counting_respects_the_limit_and_conflicts(method: str) -> None:
+    assert count_solutions([[0] * 9 for _ in range(9)], 25, method=method) == 25
+    grid = _grid(HARD)
+    grid[0][1] = 8
+    assert count_solutions(grid, method=method) == 0
+    assert solve(grid, method=method) is None
+
+
+def test_methods_agree_on_partial_grids() -> None:
+    rng = random.Random(7)
+    solution = SudokuGenerator(rng=rng).generate("easy").solution
+    for _ in range(40):
+        grid = [row[:] for row in solution]
+        for cell in rng.sample(range(81), rng.randint(50, 70)):
+            grid[cell // 9][cell % 9] = 0
+        assert count_solutions(grid, 8) == count_solutions(grid, 8, method="dlx")
+
+
+def test_invalid_input_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        count_solutions([[0] * 9 for _ in range(8)])
+    with pytest.raises(ValueError):
+        count_solutions(_grid(HARD), method="guess")
+
+
+def test_generated_puzzles_are_unique() -> None:
+    generator = SudokuGenerator(rng=random.Random(3))
+    for difficulty in ("easy", "expert"):
+        puzzle = generator.generate(difficulty)
+        assert has_unique_solution(puzzle.starting_board, method="dlx")
+        assert solve(puzzle.starting_board) == puzzle.solution
+
+
+def test_batches_do_not_depend_on_worker_count() -> None:
+    serial = SudokuGenerator(rng=random.Random(11)).generate_batch(4, "hard", workers=1)
+    parallel = SudokuGenerator(rng=random.Random(11)).generate_batch(4, "hard", workers=2)
+    assert [puzzle.starting_board for puzzle in serial] == [puzzle.starting_board for puzzle in parallel]
+    assert len({str(puzzle.starting_board) for puzzle in serial}) == 4
+    with pytest.raises(ValueError):
+        SudokuGenerator().generate_batch(2, "impossible")
+
+    builders = generate_sudoku_builders(2, "medium", seed=5, workers=1)
+    puzzle = builders[0]()
+    assert puzzle.difficulty == "medium" and solve(puzzle.starting_board) == puzzle.solution
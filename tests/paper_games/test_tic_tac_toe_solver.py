@@ -0,0 +1,73 @@
+"""Tests for the memoized tic-tac-toe solver."""
+
+from __future__ import annotations
+
+import random
+
+from games_collection.games.paper.tic_tac_toe import TicTacToeGame
+from games_collection.games.paper.tic_tac_toe.solver import WIN_SCORE, TicTacToeSolver
+
+
+def _rotate(board: list, size: int) -> list:
+    return [board[(size - 1 - column) * size + row] for row in range(size) for column in range(size)]
+
+
+def test_symmetric_positions_share_a_key() -> None:
+    """Rotations and reflections of a position map to the same canonical key."""
+
+    solver = TicTacToeSolver(4)
+    board = list("X  O" "  X " "O   " "   X")
+    rotated = _rotate(board, 4)
+    mirrored = [board[row * 4 + 3 - column] for row in range(4) for column in range(4)]
+    key = solver.canonical_key(board, "O")
+    assert solver.canonical_key(rotated, "O") == key
+    assert solver.canonical_key(mirrored, "O") == key
+    assert solver.canonical_key(board, "X") != key
+
+
+def test_classic_board_is_a_draw_and_forks_are_found() -> None:
+    solver = TicTacToeSolver(3)
+    assert solver.solve([" "] * 9, "X") == 0
+    # X completes the diagonal at once rather than settling for a slower win.
+    score, move = solver.best_move(list("X O" "   " "  X"), "X")
+    assert move == 4 and score > WIN_SCORE
+    # O to move must block the fork threat by taking an edge, not a corner.
+    assert solver.best_move(list("X  " " O " "  X"), "O")[1] in (1, 3, 5, 7)
+
+
+def test_four_by_four_computer_never_loses() -> None:
+    """The exact 4×4 solver should hold at least a draw against random play."""
+
+    rng = random.Random(3)
+    for _ in range(3):
+        game = TicTacToeGame(board_size=4, starting_symbol="X")
+        while not game.is_over():
+            game.make_move(rng.choice(game.available_moves()), "X")
+            if game.is_over():
+                break
+            game.computer_move()
+        assert game.winner() != "X"
+
+
+def test_table_round_trips_through_cache_file(tmp_path) -> None:
+    """A saved table should let a fresh solver answer without searching."""
+
+    cache = tmp_path / "ttt.json"
+    board = list("X   " " O  " "    " "    ")
+    first = TicTacToeSolver(4, cache_path=cache)
+    expected = first.best_move(board, "X")
+    first.save()
+    assert cache.exists()
+
+    second = TicTacToeSolver(4, cache_path=cache)
+    assert second.best_move(board, "X") == expected
+    assert second.nodes < first.nodes
+
+
+def test_large_boards_use_depth_limited_search() -> None:
+    game = TicTacToeGame(board_size=5, win_length=4)
+    for cell in (6, 7, 8):
+        game.make_move(cell, "X")
+    score, move = game.minimax(False, max_depth=2)
+    assert move in (5, 9) and score < -WIN_SCORE
+    assert not game.solver().exact
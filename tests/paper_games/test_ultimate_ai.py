@@ -0,0 +1,92 @@
+"""Tests for the bitmask Ultimate Tic-Tac-Toe position and its MCTS AI."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from games_collection.games.paper.tic_tac_toe.ultimate import UltimateTicTacToeGame
+from games_collection.games.paper.tic_tac_toe.ultimate_ai import UltimateMCTSStrategy, UltimatePosition
+
+
+def test_position_tracks_the_game_engine() -> None:
+    """Legal moves and results must match the engine throughout random games."""
+
+    rng = random.Random(2)
+    for _ in range(30):
+        game = UltimateTicTacToeGame()
+        position = UltimatePosition.from_game(game, "X")
+        symbol = "X"
+        while not (game.winner() or game.is_draw()):
+            expected = sorted(board * 9 + cell for board, cell in game.available_moves())
+            assert sorted(position.moves()) == expected
+            assert sorted(UltimatePosition.from_game(game, symbol).moves()) == expected
+            winning = []
+            for candidate in expected:
+                trial = position.copy()
+                trial.play(candidate)
+                if trial.winner is not None:
+                    winning.append(candidate)
+            assert sorted(position.winning_moves()) == winning
+            move = rng.choice(expected)
+            game.make_move(*divmod(move, 9), symbol)
+            position.play(move)
+            symbol = "O" if symbol == "X" else "X"
+        assert position.is_terminal()
+        winner = game.winner()
+        assert position.winner == (None if winner is None else "XO".index(winner))
+
+
+def test_playout_moves_are_legal() -> None:
+    rng = random.Random(5)
+    for heuristic in (False, True):
+        position = UltimatePosition.new()
+        while not position.is_terminal():
+            move = position.playout_move(rng, heuristic)
+            assert move in position.moves()
+            position.play(move)
+
+
+def test_computer_takes_the_winning_board() -> None:
+    """With two boards won in a row, the AI completes the third."""
+
+    game = UltimateTicTacToeGame(starting_symbol="O", ai_iterations=200)
+    game.meta_board[0] = game.meta_board[1] = "O"
+    for cell in (0, 1):
+        game.small_boards[2].make_move(cell, "O")
+    game.active_board = 2
+    assert game.computer_move() == (2, 2)
+    assert game.winner() == "O"
+
+
+def test_computer_avoids_an_immediate_loss() -> None:
+    """The search must not send the opponent where it wins the meta-board."""
+
+    game = UltimateTicTacToeGame(ai_iterations=2000)
+    game.meta_board[3] = game.meta_board[4] = "X"
+    for cell in (0, 1):
+        game.small_boards[5].make_move(cell, "X")
+    # Cells 3 and 4 free X's choice of board and cell 5 sends X to board 5,
+    # where cell 2 wins it; every other cell keeps the game going.
+    game.active_board = 5
+    board_index, cell_index = game.computer_move()
+    assert board_index == 5 and cell_index not in (3, 4, 5)
+
+
+def test_mcts_beats_random_play() -> None:
+    wins = 0
+    for seed in range(4):
+        rng = random.Random(seed)
+        strategy = UltimateMCTSStrategy(300, rng=random.Random(seed))
+        position = UltimatePosition.new(player=seed % 2)
+        while not position.is_terminal():
+            moves = position.moves()
+            position.play(strategy.select_move(moves, position) if position.player == 0 else rng.choice(moves))
+        wins += position.winner == 0
+    assert wins >= 3
+
+
+def test_strategy_rejects_unknown_policy() -> None:
+    with pytest.raises(ValueError):
+        UltimateMCTSStrategy(policy="greedy")
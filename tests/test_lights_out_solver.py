@@ -0,0 +1,88 @@
+"""Tests for the GF(2) Lights Out solver and the bit-packed game board."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from games_collection.games.logic import LightsOutGame
+from games_collection.games.logic.lights_out.solver import LightsOutSolver, pack, press_mask, solver_for, unpack
+
+
+def _shortest(size: int) -> dict[int, int]:
+    """Return the fewest presses for every reachable flattened board, by brute force."""
+    cells = size * size
+    best: dict[int, int] = {}
+    for presses in range(1 << cells):
+        board = 0
+        for cell in range(cells):
+            if presses >> cell & 1:
+                board ^= press_mask(size, *divmod(cell, size))
+        count = bin(presses).count("1")
+        if count < best.get(board, cells + 1):
+            best[board] = count
+    return best
+
+
+@pytest.mark.parametrize("size", [3, 4])
+def test_minimal_solutions_match_brute_force(size: int) -> None:
+    solver = LightsOutSolver(size)
+    best = _shortest(size)
+    row_mask = (1 << size) - 1
+    for board in range(1 << (size * size)):
+        rows = [board >> (row * size) & row_mask for row in range(size)]
+        assert solver.minimum_moves(rows) == best.get(board)
+
+
+def test_null_space_dimensions() -> None:
+    # Known nullities of the n x n Lights Out matrix.
+    assert [solver_for(size).nullity for size in (4, 5, 6, 9, 19, 25)] == [4, 2, 0, 8, 16, 0]
+    assert solver_for(5) is solver_for(5)
+
+    solver = solver_for(5)
+    single = pack([[row == 0 and column == 0 for column in range(5)] for row in range(5)])
+    assert not solver.is_solvable(single) and solver.solve(single) is None
+    assert unpack(single, 5)[0][:2] == [True, False]
+
+
+def test_generated_boards_need_exactly_the_requested_moves() -> None:
+    rng = random.Random(7)
+    solver = solver_for(5)
+    for moves in (0, 1, 8, 15):
+        rows = solver.generate(moves, rng)
+        assert solver.minimum_moves(rows) == moves
+        solution = solver.solve(rows)
+        for row, column in solution:
+            board = solver.flatten(rows) ^ press_mask(5, row, column)
+            rows = [board >> (r * 5) & 31 for r in range(5)]
+        assert not any(rows)
+    with pytest.raises(ValueError):
+        solver.generate(16, rng)
+
+
+def test_game_hints_clear_large_boards_in_par() -> None:
+    random.seed(11)
+    game = LightsOutGame(size=25, min_moves=40)
+    assert game.get_min_moves() == 40
+    while not game.is_game_over():
+        hint = game.get_hint()
+        assert hint is not None and game.make_move(hint)
+    assert game.moves == 40
+    assert game.get_hint() is None and game.get_min_moves() == 0
+
+
+def test_bulbs_share_the_packed_rows() -> None:
+    game = LightsOutGame(size=4, scramble_moves=0)
+    assert game.rows == [0, 0, 0, 0] and game.is_game_over()
+    game.grid[2][1].is_on = True
+    assert game.rows[2] == 0b10
+    game._recalculate_brightness()
+
+    assert game.make_move((0, 0))
+    assert game.rows[:2] == [0b11, 0b01]
+    assert [game.grid[0][0].toggle_count, game.grid[1][1].toggle_count] == [1, 0]
+    expected = [row.copy() for row in game.get_state_representation()["brightness"]]
+    game._recalculate_brightness()
+    assert game.get_state_representation()["brightness"] == expected
+    assert game.calculate_power_draw() == pytest.approx(4 * game.bulb_wattage + 12 * game.standby_wattage)
@@ -0,0 +1,98 @@
+"""Tests for the IDA* sliding puzzle solver and its pattern databases."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from games_collection.games.logic import SlidingPuzzleGame
+from games_collection.games.logic.sliding_puzzle.pdb import DEFAULT_PARTITION, PatternDatabase, generate_pattern, load_pattern_database, write_database
+from games_collection.games.logic.sliding_puzzle.solver import DIRECTIONS, SlidingPuzzleSolver, is_solvable, solved_board
+
+# One of the two hardest 8-puzzle positions.
+HARDEST_EIGHT = [8, 6, 7, 2, 5, 4, 3, 0, 1]
+
+
+def _play(board: list[int], size: int, path: list[str]) -> list[int]:
+    board = list(board)
+    for direction in path:
+        blank = board.index(0)
+        row_step, column_step = DIRECTIONS[direction]
+        target = blank + row_step * size + column_step
+        board[blank], board[target] = board[target], 0
+    return board
+
+
+def test_eight_puzzle_is_solved_optimally() -> None:
+    solver = SlidingPuzzleSolver(3)
+    path = solver.solve(HARDEST_EIGHT)
+    assert path is not None and len(path) == 31
+    assert _play(HARDEST_EIGHT, 3, path) == solved_board(3)
+    assert solver.heuristic(HARDEST_EIGHT) <= 31
+    assert solver.solve(solved_board(3)) == []
+
+
+def test_unsolvable_boards_are_rejected() -> None:
+    board = solved_board(4)
+    board[0], board[1] = board[1], board[0]
+    assert not is_solvable(board, 4)
+    with pytest.raises(ValueError):
+        SlidingPuzzleSolver(4).solve(board)
+    with pytest.raises(ValueError):
+        SlidingPuzzleSolver(3).solve([1, 2, 3])
+
+
+def test_pattern_databases_are_additive_lower_bounds(tmp_path) -> None:
+    partition = ((1, 2, 3, 4), (5, 6, 7, 8))
+    path = tmp_path / "eight.bin"
+    write_database(3, partition, [generate_pattern(3, tiles) for tiles in partition], path)
+    database = PatternDatabase(path)
+    try:
+        assert database.heuristic(solved_board(3)) == 0
+        solver = SlidingPuzzleSolver(3, pattern_database=database)
+        rng = random.Random(5)
+        for distance in (4, 12, 20, 26):
+            board = solver.generate(distance, rng)
+            assert database.heuristic(board) <= distance
+            assert len(solver.solve(board)) == distance
+        assert len(solver.solve(HARDEST_EIGHT)) == 31
+    finally:
+        database.close()
+
+    bundled = load_pattern_database()
+    assert bundled is not None and bundled.partition == DEFAULT_PARTITION
+    assert bundled.heuristic(solved_board(4)) == 0
+
+
+def test_fifteen_puzzle_boards_at_an_exact_distance() -> None:
+    solver = SlidingPuzzleSolver(4)
+    board = solver.generate(30, random.Random(8))
+    path = solver.solve(board)
+    assert path is not None and len(path) == 30
+    assert _play(board, 4, path) == solved_board(4)
+    assert solver.heuristic(board) <= 30
+    unguided = SlidingPuzzleSolver(4, node_limit=10)
+    assert unguided.solve(board) is None and unguided.hint(board) in DIRECTIONS
+
+
+def test_game_hints_reach_the_goal_in_par() -> None:
+    random.seed(3)
+    game = SlidingPuzzleGame(size=4, target_distance=18)
+    assert game.get_par() == 18
+    while not game.is_game_over():
+        hint = game.get_hint()
+        assert hint is not None and game.make_move(hint)
+    assert game.moves == 18 and game.moves_over_par() == 0
+    assert game.get_hint() is None
+
+    shuffled = SlidingPuzzleGame(size=3, shuffle_moves=40)
+    assert shuffled.get_par() is not None and shuffled.get_par() <= 40
+
+
+def test_failed_par_search_is_not_repeated(monkeypatch: pytest.MonkeyPatch) -> None:
+    game = SlidingPuzzleGame(size=4, shuffle_moves=200)
+    searches = []
+    monkeypatch.setattr(game._solver, "distance", lambda board: searches.append(board))
+    assert game.get_par() is None and game.get_par() is None
+    assert len(searches) == 1
@@ -0,0 +1,91 @@
+"""Tests for the push-optimal Sokoban solver and its deadlock detection."""
+
+from __future__ import annotations
+
+import pytest
+
+from games_collection.games.logic import SokobanGame
+from games_collection.games.logic.sokoban.solver import SokobanSolver, validate_level
+
+# Four goals at the end of a corridor behind the cell at (1, 6).
+GOAL_ROOM = (
+    "#########",
+    "#....   #",
+    "######  #",
+    "#  $ $  #",
+    "# $ @$  #",
+    "#       #",
+    "#########",
+)
+
+# The crate at (3, 6) is against the east wall with no goal in its column.
+STUCK = (
+    "########",
+    "#..#   #",
+    "#..  $ #",
+    "##### $#",
+    "#  $ $ #",
+    "#  @   #",
+    "########",
+)
+
+
+@pytest.mark.parametrize("level_index", range(len(SokobanGame.LEVELS)))
+def test_builtin_levels_are_solved_optimally(level_index: int) -> None:
+    layout = SokobanGame.LEVELS[level_index]["layout"]
+    solver = SokobanSolver(layout)
+    moves = solver.solve()
+    assert moves is not None
+    game = SokobanGame(level_index=level_index)
+    assert all(game.make_move(move) for move in moves)
+    assert game.is_game_over()
+    assert game.pushes == solver.push_count() == game.get_par()
+    assert game.pushes_over_par() == 0
+
+
+def test_goal_room_macros_keep_solutions_valid() -> None:
+    exact = SokobanSolver(GOAL_ROOM)
+    assert exact.push_count() == 33
+    macro = SokobanSolver(GOAL_ROOM, goal_macros=True)
+    pushes = macro.solve_pushes()
+    assert pushes is not None and len(pushes) >= 33
+    assert macro.nodes < exact.nodes
+    game = SokobanGame(custom_level=GOAL_ROOM)
+    assert all(game.make_move(move) for move in macro.solve())
+    assert game.is_game_over()
+
+
+def test_deadlocks_and_unsolvable_levels() -> None:
+    solver = SokobanSolver(STUCK)
+    assert solver.is_dead_cell((3, 6)) and not solver.is_dead_cell((2, 4))
+    assert solver.is_deadlocked(solver.start[1])
+    with pytest.raises(ValueError):
+        validate_level(STUCK)
+    with pytest.raises(ValueError):
+        SokobanGame(custom_level=STUCK)
+
+    # Two crates side by side against a wall freeze each other.
+    frozen = SokobanSolver(("######", "#@   #", "# $$ #", "# .. #", "######"))
+    assert not frozen.is_deadlocked([(2, 2), (2, 3)])
+    assert frozen.is_deadlocked([(1, 2), (1, 3)])
+    assert frozen.reachable((1, 1), [(2, 2), (2, 3)]) >= {(1, 4), (3, 1), (3, 4)}
+
+
+def test_hints_and_compact_undo() -> None:
+    game = SokobanGame(level_index=2)
+    start = game.get_board()
+    while not game.is_game_over():
+        hint = game.get_hint()
+        assert hint is not None and game.make_move(hint)
+    assert game.pushes == game.get_par() == 15
+    assert game.get_hint() is None
+    assert all(isinstance(move, str) and len(move) == 1 for move in game.history)
+    assert sum(move.isupper() for move in game.history) == game.pushes
+
+    while game.undo_last_move():
+        pass
+    assert game.get_board() == start
+    assert game.moves == game.pushes == 0
+
+    game.make_move("u")
+    assert not game.is_deadlocked()